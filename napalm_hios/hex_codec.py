@@ -0,0 +1,215 @@
+"""
+Hex codec — MOPS octet-string values and PortList bitmaps.
+
+MOPS carries every OCTET STRING as space-separated hex pairs
+("48 69 4f 53"), so display strings, MACs, IPs and PortLists all pass
+through a hex decode per attribute. On FDB, ARP and LLDP tables that is
+one call per row per column, so these helpers take a C-level fast path
+for the canonical "xx xx xx" form (bytes.fromhex + a slice check) and
+only fall back to token-by-token parsing for anything else. Results are
+identical to the original per-value helpers in both cases.
+
+PortLists use a 256-entry table of set-bit offsets per byte, so decoding
+costs one lookup per non-zero byte instead of eight mask tests per byte.
+
+The batch functions (decode_strings, decode_macs, decode_ips,
+decode_portlists) decode a whole column in one call; decode_portlists
+also memoises repeated bitmaps, which are the norm in VLAN tables.
+
+Micro-benchmarks against the original helpers:
+    PYTHONPATH=. python tests/benchmarks/bench_hex_codec.py
+"""
+
+import ipaddress
+
+# _PORTLIST_BITS[b] = 1-based positions of the set bits in byte b, MSB first
+_PORTLIST_BITS = tuple(
+    tuple(bit + 1 for bit in range(8) if byte & (0x80 >> bit))
+    for byte in range(256)
+)
+
+
+def _canonical(value, raw):
+    """True if value is exactly raw.hex(' ') up to case ("xx xx ... xx")."""
+    n = len(raw)
+    return len(value) == 3 * n - 1 and value[2::3] == " " * (n - 1)
+
+
+def _fromhex(value):
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Single values
+# ---------------------------------------------------------------------------
+
+def decode_string(value):
+    """Decode MOPS hex-encoded string to text. Returns original if not hex."""
+    if not value:
+        return ""
+    raw = _fromhex(value)
+    if raw is not None and raw and _canonical(value, raw):
+        return raw.decode("utf-8", errors="replace")
+    # Non-canonical spacing (or not hex at all): token-by-token check
+    if not value.strip():
+        return ""
+    parts = value.strip().split()
+    if all(len(p) == 2 for p in parts):
+        try:
+            raw = bytes.fromhex(value.replace(" ", ""))
+            return raw.decode("utf-8", errors="replace")
+        except ValueError:
+            pass
+    return value
+
+
+def decode_mac(value):
+    """Decode hex bytes to MAC address format.
+
+    Handles two input forms:
+    1. Raw hex string from MOPS: "64 60 38 3f 4a a6" (before decode_string)
+    2. Already-decoded bytes: 6-char binary string (after decode_string mangled it)
+    """
+    if not value:
+        return ""
+    if len(value) == 17:
+        raw = _fromhex(value)
+        if raw is not None and len(raw) == 6 and _canonical(value, raw):
+            return raw.hex(":")
+    # Form 1 with irregular whitespace
+    parts = value.strip().split()
+    if len(parts) == 6 and all(len(p) == 2 for p in parts):
+        try:
+            bytes.fromhex("".join(parts))
+            return ":".join(p.lower() for p in parts)
+        except ValueError:
+            pass
+    # Form 2: 6-char binary string (anything without separators)
+    if len(value) == 6 and (
+            not value.isascii()
+            or any(ord(c) < 32 for c in value)
+            or (" " not in value and ":" not in value)):
+        return ":".join(f"{ord(c):02x}" for c in value)
+    return value
+
+
+def decode_ip(value):
+    """Decode hex-encoded IP address from MOPS.
+
+    IPv4: "c0 a8 03 01" (4 bytes) → "192.168.3.1"
+    IPv6: 16 bytes → compressed IPv6 notation
+    Returns empty string if not a valid IP.
+    """
+    if not value:
+        return ""
+    raw = _fromhex(value)
+    if raw is not None and raw and _canonical(value, raw):
+        if len(raw) == 4:
+            return "%d.%d.%d.%d" % tuple(raw)
+        if len(raw) == 16:
+            return str(ipaddress.IPv6Address(raw))
+        return value
+    if not value.strip():
+        return ""
+    # Tokens of any width are accepted, as int(p, 16) always did
+    try:
+        octets = [int(p, 16) for p in value.strip().split()]
+    except ValueError:
+        return value
+    if len(octets) == 4:
+        return ".".join(str(o) for o in octets)
+    if len(octets) == 16:
+        return str(ipaddress.IPv6Address(bytes(octets)))
+    return value
+
+
+def encode_string(text):
+    """Encode a Python string to MOPS hex format (space-separated bytes)."""
+    return text.encode("utf-8").hex(" ")
+
+
+def encode_hex(octets):
+    """Encode bytes to MOPS hex format. b'\\xc0\\x00' -> 'c0 00'"""
+    return bytes(octets).hex(" ")
+
+
+# ---------------------------------------------------------------------------
+# PortList bitmaps
+# ---------------------------------------------------------------------------
+
+def portlist_ports(octets):
+    """Return the 1-based port numbers set in a PortList bitmap (bytes)."""
+    ports = []
+    bits = _PORTLIST_BITS
+    base = 0
+    for byte in octets:
+        if byte:
+            ports.extend([base + p for p in bits[byte]])
+        base += 8
+    return ports
+
+
+def decode_portlist(value, port_map):
+    """Decode a hex PortList ("c0 00 00 00") to interface names.
+
+    port_map maps str(bridge port) → name; unknown ports are 'port<N>'.
+    Returns [] for empty or malformed values.
+    """
+    if not value:
+        return []
+    raw = _fromhex(value)
+    if raw is None:
+        raw = _fromhex(value.replace(" ", ""))
+        if raw is None:
+            return []
+    return [port_map.get(str(p), f'port{p}') for p in portlist_ports(raw)]
+
+
+def encode_portlist(ports, total_ports=None):
+    """Encode 1-based port numbers to a PortList bitmap (bytes).
+
+    The bitmap is sized for total_ports, or for the highest port given.
+    """
+    ports = [int(p) for p in ports]
+    max_port = total_ports or (max(ports) if ports else 0)
+    bitmap = bytearray((max_port + 7) // 8 if max_port else 0)
+    for p in ports:
+        bitmap[(p - 1) >> 3] |= 0x80 >> ((p - 1) & 7)
+    return bytes(bitmap)
+
+
+# ---------------------------------------------------------------------------
+# Batch (whole column)
+# ---------------------------------------------------------------------------
+
+def decode_strings(values):
+    """decode_string() over a column of values; returns a list."""
+    return list(map(decode_string, values))
+
+
+def decode_macs(values):
+    """decode_mac() over a column of values; returns a list."""
+    return list(map(decode_mac, values))
+
+
+def decode_ips(values):
+    """decode_ip() over a column of values; returns a list."""
+    return list(map(decode_ip, values))
+
+
+def decode_portlists(values, port_map):
+    """decode_portlist() over a column; identical bitmaps are decoded once.
+
+    Each result is a fresh list, so callers may mutate them.
+    """
+    seen = {}
+    out = []
+    for value in values:
+        names = seen.get(value)
+        if names is None:
+            names = seen[value] = decode_portlist(value, port_map)
+        out.append(list(names))
+    return out
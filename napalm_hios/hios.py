@@ -3,17 +3,41 @@ from napalm.base.exceptions import ConnectionException, MergeConfigException, Co
 
 from napalm_hios.netconf_hios import NetconfHIOS
 from napalm_hios.ssh_hios import SSHHIOS
-from napalm_hios.snmp_hios import SNMPHIOS
+from napalm_hios.snmp_hios import SNMPHIOS, DEFAULT_MAX_IN_FLIGHT, DEFAULT_MAX_PPS
 from napalm_hios.mops_hios import MOPSHIOS
 from napalm_hios.offline_hios import OfflineHIOS
 from napalm_hios.mock_hios_device import MockHIOSDevice
+from napalm_hios.port_map_cache import resolve_port_map_cache
 from napalm_hios.utils import log_error
 
+import asyncio
+import contextvars
+import copy
+import functools
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+
+class _Prefetched:
+    """Stand-in connection returning one getter's already-fetched result."""
+
+    def __init__(self, owner, name, result):
+        self.owner = owner
+        self._name = name
+        self._result = result
+
+    def __getattr__(self, attr):
+        if attr != self._name:
+            raise AttributeError(attr)
+        return lambda *args, **kwargs: self._result
+
+
+# _Prefetched of the aget_* call running in the current task, if any
+_PREFETCHED = contextvars.ContextVar('napalm_hios_prefetched', default=None)
+
+
 class HIOSDriver(NetworkDriver):
     """
     NAPALM driver implementation for HIOS devices.
@@ -41,6 +65,9 @@ class HIOSDriver(NetworkDriver):
         self.password = password
         self.timeout = timeout
         self.optional_args = optional_args or {}
+        # ifIndex/bridge-port maps kept across sessions (True, path or object)
+        self.port_map_cache = resolve_port_map_cache(
+            self.optional_args.get('port_map_cache'))
         
         # Initialize connection handlers for different protocols
         self.netconf = None
@@ -51,6 +78,7 @@ class HIOSDriver(NetworkDriver):
         self.mock_device = None
         self._is_alive = False
         self.active_protocol = None
+        self._getter_lock = None  # (loop, asyncio.Lock) for blocking aget_*
 
         # Candidate config state (in-memory staging)
         self._merge_candidate = ''
@@ -114,19 +142,29 @@ class HIOSDriver(NetworkDriver):
             elif protocol == 'ssh':
                 # Try SSH connection
                 ssh_port = self.optional_args.get('ssh_port', 22)
-                self.ssh = SSHHIOS(self.hostname, self.username, self.password, self.timeout, port=ssh_port)
+                self.ssh = SSHHIOS(self.hostname, self.username, self.password, self.timeout, port=ssh_port,
+                                   channels=self.optional_args.get('ssh_channels', 1))
                 self.ssh.open()
                 return True
             elif protocol == 'snmp':
                 # Try SNMPv3 connection
                 snmp_port = self.optional_args.get('snmp_port', 161)
-                self.snmp = SNMPHIOS(self.hostname, self.username, self.password, self.timeout, port=snmp_port)
+                self.snmp = SNMPHIOS(self.hostname, self.username, self.password, self.timeout, port=snmp_port,
+                                     port_map_cache=self.port_map_cache,
+                                     auth_protocol=self.optional_args.get('snmp_auth_protocol', 'md5'),
+                                     priv_protocol=self.optional_args.get('snmp_priv_protocol', 'des'),
+                                     max_repetitions=self.optional_args.get('snmp_max_repetitions'),
+                                     walk_cache_ttls=self.optional_args.get('snmp_walk_cache_ttls'),
+                                     max_in_flight=self.optional_args.get('snmp_max_in_flight', DEFAULT_MAX_IN_FLIGHT),
+                                     max_pps=self.optional_args.get('snmp_max_pps', DEFAULT_MAX_PPS))
                 self.snmp.open()
                 return True
             elif protocol == 'mops':
                 # Try MOPS (HTTPS/XML) connection
                 mops_port = self.optional_args.get('mops_port', 443)
-                self.mops = MOPSHIOS(self.hostname, self.username, self.password, self.timeout, port=mops_port)
+                mops_compress = self.optional_args.get('mops_compress', False)
+                self.mops = MOPSHIOS(self.hostname, self.username, self.password, self.timeout, port=mops_port,
+                                     compress=mops_compress, port_map_cache=self.port_map_cache)
                 self.mops.open()
                 return True
             elif protocol == 'offline':
@@ -166,6 +204,9 @@ class HIOSDriver(NetworkDriver):
         return {"is_alive": self._is_alive}
 
     def _get_active_connection(self):
+        prefetched = _PREFETCHED.get()
+        if prefetched is not None and prefetched.owner is self:
+            return prefetched
         if self.mock_device:
             return self.mock_device
         elif self.active_protocol == 'netconf':
@@ -424,14 +465,37 @@ class HIOSDriver(NetworkDriver):
                         entry[key] = '' if key in ['interface', 'mac', 'ip'] else 0.0
             return arp_table
         raise NotImplementedError("get_arp_table is not implemented for this protocol")
+
+    def iter_mac_address_table(self):
+        """Yield MAC table entries one at a time.
+
+        MOPS streams and decodes the FDB row by row (constant memory).
+        Other protocols fetch the whole table and yield from it.
+        """
+        if self.active_protocol in ('mops', 'offline'):
+            return self._get_active_connection().iter_mac_address_table()
+        return iter(self.get_mac_address_table())
+
+    def iter_arp_table(self, vrf=""):
+        """Yield ARP entries one at a time (streamed via MOPS)."""
+        if self.active_protocol in ('mops', 'offline'):
+            return self._get_active_connection().iter_arp_table(vrf)
+        return iter(self.get_arp_table(vrf))
     
     def get_config(self, retrieve='all', full=False, sanitized=False, format='text',
-                   **kwargs):
-        if self.active_protocol in ('mops', 'offline'):
+                   stream_to=None, **kwargs):
+        """Retrieve the device config (NAPALM dict of running/startup/candidate).
+
+        stream_to (file path or callable) streams the config over SSH,
+        chunk by chunk, instead of returning it; SSH is lazy-connected
+        if the active protocol is MOPS or SNMP.
+        """
+        if stream_to is None and self.active_protocol in ('mops', 'offline'):
             config = self._get_active_connection().get_config(
                 retrieve, full, sanitized, format, **kwargs)
         elif self.active_protocol == 'ssh' or self._ensure_ssh():
-            config = self.ssh.get_config(retrieve, full, sanitized, format)
+            config = self.ssh.get_config(retrieve, full, sanitized, format,
+                                         stream_to=stream_to)
         else:
             raise NotImplementedError("get_config requires SSH or MOPS")
         for config_type in ['running', 'startup', 'candidate']:
@@ -546,9 +610,8 @@ class HIOSDriver(NetworkDriver):
             self.ssh._config_mode()
             lines = [l.strip() for l in self._merge_candidate.splitlines() if l.strip()]
             errors = []
-            for line in lines:
-                result = self.ssh.cli(line)
-                output = list(result.values())[0]
+            # One channel write per chunk of lines, not a round-trip per line
+            for line, output in zip(lines, self.ssh.cli_batch(lines)):
                 if output.startswith('Error:'):
                     errors.append(f"{line}: {output}")
             self.ssh._exit_config_mode()
@@ -1042,35 +1105,295 @@ class HIOSDriver(NetworkDriver):
         VLAN CRUD (create/update/delete_vlan) always fires immediately
         regardless of staging mode.
 
-        Raises NotImplementedError for SNMP/SSH (use load_merge_candidate
+        Via SNMP the interface and VLAN port setters are staged and sent
+        in as few SET PDUs as the agent allows (see SNMPHIOS.start_staging).
+
+        Raises NotImplementedError for SSH (use load_merge_candidate
         for SSH CLI staging).
         """
-        if self.active_protocol in ('mops', 'offline'):
+        if self.active_protocol in ('mops', 'offline', 'snmp'):
             return self._get_active_connection().start_staging()
         raise NotImplementedError(
-            "start_staging is only available via MOPS/offline. "
+            "start_staging is only available via MOPS/SNMP/offline. "
             "Use load_merge_candidate() for SSH CLI staging.")
 
-    def commit_staging(self):
+    def commit_staging(self, chunk_size=None):
         """Fire all queued mutations in one atomic batch.
 
         Does NOT save to NVM — call save_config() separately when ready.
+
+        Args:
+            chunk_size: split large batches into requests of at most this
+                many attributes (MOPS POSTs) or varbinds (SNMP SETs); not
+                atomic. Returns a per-mutation result list of
+                {'mutation', 'status', 'errors'} dicts on MOPS, SNMP and
+                offline.
         """
-        if self.active_protocol in ('mops', 'offline'):
+        if self.active_protocol in ('mops', 'offline', 'snmp'):
+            if chunk_size:
+                return self._get_active_connection().commit_staging(
+                    chunk_size=chunk_size)
             return self._get_active_connection().commit_staging()
-        raise NotImplementedError("commit_staging is only available via MOPS/offline")
+        raise NotImplementedError("commit_staging is only available via MOPS/SNMP/offline")
 
     def discard_staging(self):
         """Clear queued mutations without applying."""
-        if self.active_protocol in ('mops', 'offline'):
+        if self.active_protocol in ('mops', 'offline', 'snmp'):
             return self._get_active_connection().discard_staging()
-        raise NotImplementedError("discard_staging is only available via MOPS/offline")
+        raise NotImplementedError("discard_staging is only available via MOPS/SNMP/offline")
 
     def get_staged_mutations(self):
         """Return list of staged mutation tuples for inspection."""
-        if self.active_protocol in ('mops', 'offline'):
+        if self.active_protocol in ('mops', 'offline', 'snmp'):
             return self._get_active_connection().get_staged_mutations()
-        raise NotImplementedError("get_staged_mutations is only available via MOPS")
+        raise NotImplementedError("get_staged_mutations is only available via MOPS/SNMP/offline")
+
+    # ------------------------------------------------------------------
+    # Batched getters
+    # ------------------------------------------------------------------
+
+    def get_many(self, getters):
+        """Run several getters in one go, e.g. ['get_facts', 'get_mrp'].
+
+        Via MOPS all getters are served from a single merged get-config
+        POST. Via SNMP they run concurrently on the session, so their
+        scalar GETs share one PDU. Via SSH with the ssh_channels option
+        above 1 they run concurrently on extra shell channels of the same
+        SSH session. Other protocols call each getter in turn. Results go
+        through the same driver-level normalisation as the individual
+        getters.
+
+        Returns: dict of {getter_name: getter_result}.
+        """
+        getters = list(getters)
+        for name in getters:
+            if not name.startswith('get_') or not callable(getattr(self, name, None)):
+                raise ValueError(f"Unknown getter '{name}'")
+        if self.active_protocol == 'mops':
+            with self.mops._prefetch(getters):
+                return {name: getattr(self, name)() for name in getters}
+        if self.active_protocol == 'snmp' and not self.mock_device:
+            return asyncio.run(self._aget_many(getters))
+        if (self.active_protocol == 'ssh' and not self.mock_device
+                and self.ssh.channels > 1):
+            results = self.ssh.run_parallel(
+                [lambda ssh, name=name: getattr(self._with_ssh(ssh), name)()
+                 for name in getters])
+            return dict(zip(getters, results))
+        return {name: getattr(self, name)() for name in getters}
+
+    def _with_ssh(self, ssh):
+        """Shallow copy of this driver whose getters use SSH worker `ssh`."""
+        if ssh is self.ssh:
+            return self
+        driver = copy.copy(self)
+        driver.ssh = ssh
+        return driver
+
+    # ------------------------------------------------------------------
+    # Async getters
+    # ------------------------------------------------------------------
+
+    async def _aget(self, name, *args):
+        """Await getter `name` without blocking the running event loop.
+
+        Via SNMP the data is fetched with SNMPHIOS.aget_*, then the sync
+        getter runs on that result (like the MOPS prefetch in get_many),
+        so the driver-level normalisation is the same. Other protocols
+        are blocking and run in a worker thread, as do getters the SNMP
+        backend does not implement. Blocking getters of one driver run
+        one at a time, as they share its SSH channel or HTTP session.
+
+        The prefetched result is handed to the sync getter through a
+        context variable, so concurrent aget_* tasks each see their own.
+        """
+        if (self.active_protocol != 'snmp' or self.mock_device
+                or not hasattr(self.snmp, 'a' + name)):
+            loop = asyncio.get_running_loop()
+            async with self._blocking_lock(loop):
+                return await loop.run_in_executor(
+                    None, functools.partial(getattr(self, name), *args))
+        result = await getattr(self.snmp, 'a' + name)(*args)
+        token = _PREFETCHED.set(_Prefetched(self, name, result))
+        try:
+            return getattr(self, name)(*args)
+        finally:
+            _PREFETCHED.reset(token)
+
+    def _blocking_lock(self, loop):
+        """asyncio.Lock serialising blocking getters, one per event loop."""
+        if self._getter_lock is None or self._getter_lock[0] is not loop:
+            self._getter_lock = (loop, asyncio.Lock())
+        return self._getter_lock[1]
+
+    async def _aget_many(self, getters):
+        results = await asyncio.gather(*(self._aget(name) for name in getters))
+        return dict(zip(getters, results))
+
+    async def aget_facts(self):
+        return await self._aget('get_facts')
+
+    async def aget_interfaces_counters(self):
+        return await self._aget('get_interfaces_counters')
+
+    async def aget_interfaces_ip(self):
+        return await self._aget('get_interfaces_ip')
+
+    async def aget_lldp_neighbors(self):
+        return await self._aget('get_lldp_neighbors')
+
+    async def aget_lldp_neighbors_detail(self, interface=""):
+        return await self._aget('get_lldp_neighbors_detail', interface)
+
+    async def aget_lldp_neighbors_detail_extended(self, interface=""):
+        return await self._aget('get_lldp_neighbors_detail_extended', interface)
+
+    async def aget_mac_address_table(self):
+        return await self._aget('get_mac_address_table')
+
+    async def aget_ntp_servers(self):
+        return await self._aget('get_ntp_servers')
+
+    async def aget_ntp_stats(self):
+        return await self._aget('get_ntp_stats')
+
+    async def aget_optics(self):
+        return await self._aget('get_optics')
+
+    async def aget_users(self):
+        return await self._aget('get_users')
+
+    async def aget_vlans(self):
+        return await self._aget('get_vlans')
+
+    async def aget_vlan_ingress(self, *ports):
+        return await self._aget('get_vlan_ingress', *ports)
+
+    async def aget_vlan_egress(self, *ports):
+        return await self._aget('get_vlan_egress', *ports)
+
+    async def aget_environment(self):
+        return await self._aget('get_environment')
+
+    async def aget_arp_table(self, vrf=""):
+        return await self._aget('get_arp_table', vrf)
+
+    async def aget_interfaces(self):
+        return await self._aget('get_interfaces')
+
+    async def aget_mrp(self):
+        return await self._aget('get_mrp')
+
+    async def aget_hidiscovery(self):
+        return await self._aget('get_hidiscovery')
+
+    async def aget_config_status(self):
+        return await self._aget('get_config_status')
+
+    async def aget_config_remote(self):
+        return await self._aget('get_config_remote')
+
+    async def aget_mrp_sub_ring(self):
+        return await self._aget('get_mrp_sub_ring')
+
+    async def aget_sflow(self):
+        return await self._aget('get_sflow')
+
+    async def aget_sflow_port(self, interfaces=None, type=None):
+        return await self._aget('get_sflow_port', interfaces, type)
+
+    async def aget_snmp_information(self):
+        return await self._aget('get_snmp_information')
+
+    async def aget_profiles(self, storage='nvm'):
+        return await self._aget('get_profiles', storage)
+
+    async def aget_config_fingerprint(self):
+        return await self._aget('get_config_fingerprint')
+
+    async def aget_rstp(self):
+        return await self._aget('get_rstp')
+
+    async def aget_rstp_port(self, interface=None):
+        return await self._aget('get_rstp_port', interface)
+
+    async def aget_auto_disable(self):
+        return await self._aget('get_auto_disable')
+
+    async def aget_loop_protection(self):
+        return await self._aget('get_loop_protection')
+
+    async def aget_storm_control(self):
+        return await self._aget('get_storm_control')
+
+    async def aget_qos(self):
+        return await self._aget('get_qos')
+
+    async def aget_qos_mapping(self):
+        return await self._aget('get_qos_mapping')
+
+    async def aget_management_priority(self):
+        return await self._aget('get_management_priority')
+
+    async def aget_management(self):
+        return await self._aget('get_management')
+
+    async def aget_login_policy(self):
+        return await self._aget('get_login_policy')
+
+    async def aget_watchdog_status(self):
+        return await self._aget('get_watchdog_status')
+
+    async def aget_syslog(self):
+        return await self._aget('get_syslog')
+
+    async def aget_ntp(self):
+        return await self._aget('get_ntp')
+
+    async def aget_services(self, *fields):
+        return await self._aget('get_services', *fields)
+
+    async def aget_snmp_config(self):
+        return await self._aget('get_snmp_config')
+
+    async def aget_signal_contact(self):
+        return await self._aget('get_signal_contact')
+
+    async def aget_device_monitor(self):
+        return await self._aget('get_device_monitor')
+
+    async def aget_devsec_status(self):
+        return await self._aget('get_devsec_status')
+
+    async def aget_banner(self):
+        return await self._aget('get_banner')
+
+    async def aget_session_config(self):
+        return await self._aget('get_session_config')
+
+    async def aget_ip_restrict(self):
+        return await self._aget('get_ip_restrict')
+
+    async def aget_dns(self):
+        return await self._aget('get_dns')
+
+    async def aget_poe(self):
+        return await self._aget('get_poe')
+
+    async def aget_remote_auth(self):
+        return await self._aget('get_remote_auth')
+
+    async def aget_port_security(self, interface=None):
+        return await self._aget('get_port_security', interface)
+
+    async def aget_dhcp_snooping(self, interface=None):
+        return await self._aget('get_dhcp_snooping', interface)
+
+    async def aget_arp_inspection(self, interface=None):
+        return await self._aget('get_arp_inspection', interface)
+
+    async def aget_ip_source_guard(self, interface=None):
+        return await self._aget('get_ip_source_guard', interface)
 
     # ------------------------------------------------------------------
     # Signal Contact / Device Monitor / Device Security / Banner
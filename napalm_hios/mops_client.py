@@ -19,13 +19,30 @@ Usage:
 
 import xml.etree.ElementTree as ET
 from xml.etree.ElementTree import Element, SubElement
+import asyncio
+import base64
+import functools
+import gzip
+import itertools
 import logging
+import re
+import ssl
+import threading
+import zlib
 
 import requests
+from requests.adapters import HTTPAdapter
 import urllib3
 
 from napalm.base.exceptions import ConnectionException
 
+# Hex codec lives in its own module; re-exported under the historic names
+from napalm_hios.hex_codec import (  # noqa: F401
+    decode_string as _decode_hex_string,
+    decode_mac as _decode_hex_mac,
+    encode_string,
+)
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
@@ -41,52 +58,34 @@ NSMAP = {
     "mops": NS_MOPS,
 }
 
+# Namespaced tags, precomputed so the parser compares instead of rewriting
+_TAG_MIB_DATA = "{%s}MIBData" % NS_MOPS
+_TAG_MIB = "{%s}MIB" % NS_MOPS
+_TAG_NODE = "{%s}Node" % NS_MOPS
+_TAG_ENTRY = "{%s}Entry" % NS_MOPS
+_TAG_ATTRIBUTE = "{%s}Attribute" % NS_MOPS
+_TAG_INDEX = "{%s}Index" % NS_MOPS
 
-def _decode_hex_string(value):
-    """Decode MOPS hex-encoded string to text. Returns original if not hex."""
-    if not value or not value.strip():
-        return ""
-    parts = value.strip().split()
-    if all(len(p) == 2 for p in parts):
-        try:
-            raw = bytes.fromhex(value.replace(" ", ""))
-            return raw.decode("utf-8", errors="replace")
-        except ValueError:
-            pass
-    return value
+# Bytes per read when streaming a get-config response into the parser
+_STREAM_CHUNK_SIZE = 16384
 
+# Request bodies below this size are never compressed — no WAN gain
+_COMPRESS_MIN_BYTES = 1024
 
-def _decode_hex_mac(value):
-    """Decode hex bytes to MAC address format.
+# (host, port) -> whether the switch accepted a gzip request body
+_gzip_support = {}
 
-    Handles two input forms:
-    1. Raw hex string from MOPS: "64 60 38 3f 4a a6" (before _decode_hex_string)
-    2. Already-decoded bytes: 6-char binary string (after _decode_hex_string mangled it)
-    """
-    if not value:
-        return ""
-    # Form 1: space-separated hex pairs (raw from MOPS, decode_strings=False)
-    parts = value.strip().split()
-    if len(parts) == 6 and all(len(p) == 2 for p in parts):
-        try:
-            # Validate they're actual hex
-            bytes.fromhex("".join(parts))
-            return ":".join(p.lower() for p in parts)
-        except ValueError:
-            pass
-    # Form 2: already decoded by _decode_hex_string into a 6-byte raw string
-    if len(value) == 6 and not value.isascii() or (len(value) == 6 and any(ord(c) > 127 or ord(c) < 32 for c in value)):
-        return ":".join(f"{ord(c):02x}" for c in value)
-    # Form 2b: 6-byte string that happens to be all printable (still binary MAC)
-    # Detect by checking if it does NOT look like text (no spaces, length exactly 6)
-    if len(value) == 6 and " " not in value and ":" not in value:
-        return ":".join(f"{ord(c):02x}" for c in value)
-    return value
+# Upload statuses/error texts meaning the handler could not read a gzipped
+# body — only these are worth resending uncompressed
+_UPLOAD_ENCODING_STATUS = (400, 415)
+_UPLOAD_ENCODING_ERROR = re.compile(
+    r"gzip|encod|decod|multipart|no file|nofile", re.IGNORECASE)
 
+# Set attributes per edit-config POST in set_chunked()
+_SET_CHUNK_SIZE = 64
 
-def encode_string(text):
-    """Encode a Python string to MOPS hex format (space-separated bytes)."""
-    return " ".join(f"{b:02x}" for b in text.encode("utf-8"))
+# Distinct get-config query sets kept pre-serialised (LRU)
+_GET_TEMPLATE_CACHE_SIZE = 256
 
 
 def encode_int(value):
@@ -99,71 +98,409 @@ class MOPSError(Exception):
     pass
 
 
-class MOPSClient:
-    """Client for MOPS (MIB Operations over HTTPS) on HiOS switches."""
+class _ResponseParser:
+    """Incremental parser for MOPS get-config responses.
 
-    def __init__(self, host, username="admin", password="private",
-                 port=443, timeout=10):
-        self.host = host
-        self.port = port
-        self.timeout = timeout
-        self.url = f"https://{host}:{port}/mops_data"
-        self.session = requests.Session()
-        self.session.auth = (username, password)
-        self.session.verify = False
-        self.session.headers.update({
-            "Content-Type": "application/xml",
-            "Accept-Encoding": "gzip",
-        })
-        self._message_id = 0
-        self._session_key = None
+    Built on XMLPullParser: feed() accepts chunks as they arrive from the
+    socket and each <Entry> is decoded as soon as its end tag is seen,
+    then detached from the tree. Peak memory is one entry plus the
+    result, instead of the full response text and a full ElementTree.
 
-    def __enter__(self):
-        return self
+    collect=True builds the same dict _parse_response() returns.
+    collect=False leaves entries in self.pending as (mib, node, entry)
+    tuples for the caller to drain (used by MOPSClient.iter_get()).
+    """
 
-    def __exit__(self, *args):
-        self.close()
+    def __init__(self, decode_strings=True, collect=True):
+        self.decode_strings = decode_strings
+        self.collect = collect
+        self.result = {"message_id": None, "mibs": {}, "errors": []}
+        self.pending = []
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._depth = 0
+        self._data_depth = None   # depth of <MIBData>, None when outside
+        self._data_elem = None
+        self._mib = None          # current MIB name (None = skipped)
+        self._mib_elem = None
+        self._node = None         # current Node name (None = skipped)
+        self._node_elem = None
+        self._entries = None
+
+    def feed(self, data):
+        """Feed a chunk of response bytes/text and decode completed entries."""
+        self._parser.feed(data)
+        self._process()
 
     def close(self):
-        self.session.close()
+        """Finish parsing. Raises ET.ParseError on truncated XML."""
+        self._parser.close()
+        self._process()
+        return self.result
+
+    def _process(self):
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._depth += 1
+                self._start(elem)
+            else:
+                self._end(elem)
+                self._depth -= 1
+
+    def _start(self, elem):
+        if self._depth == 1:
+            self.result["message_id"] = elem.get("message-id")
+            return
+        tag = elem.tag
+        if self._data_depth is None:
+            if tag == _TAG_MIB_DATA:
+                self._data_depth = self._depth
+                self._data_elem = elem
+            return
+        level = self._depth - self._data_depth
+        if level == 1 and tag == _TAG_MIB:
+            mib_name = elem.get("name")
+            if elem.get("error"):
+                # MIB-level error
+                self.result["errors"].append({
+                    "mib": mib_name,
+                    "node": None,
+                    "error": elem.get("error"),
+                })
+                self._mib = None
+                return
+            self._mib = mib_name
+            self._mib_elem = elem
+            if self.collect and mib_name not in self.result["mibs"]:
+                self.result["mibs"][mib_name] = {}
+        elif level == 2 and tag == _TAG_NODE and self._mib is not None:
+            node_name = elem.get("name")
+            if elem.get("error"):
+                # Node-level error
+                self.result["errors"].append({
+                    "mib": self._mib,
+                    "node": node_name,
+                    "error": elem.get("error"),
+                })
+                self._node = None
+                return
+            self._node = node_name
+            self._node_elem = elem
+            if self.collect:
+                self._entries = []
+                self.result["mibs"][self._mib][node_name] = self._entries
+
+    def _end(self, elem):
+        if self._data_depth is None:
+            return
+        level = self._depth - self._data_depth
+        tag = elem.tag
+        if level == 3:
+            if tag == _TAG_ENTRY and self._node is not None:
+                entry = self._decode_entry(elem)
+                if self.collect:
+                    self._entries.append(entry)
+                else:
+                    self.pending.append((self._mib, self._node, entry))
+                self._node_elem.remove(elem)
+        elif level == 2:
+            if tag == _TAG_NODE and self._mib is not None:
+                self._mib_elem.remove(elem)
+                self._node = None
+                self._node_elem = None
+                self._entries = None
+        elif level == 1:
+            self._data_elem.remove(elem)
+            self._mib = None
+            self._mib_elem = None
+        elif level == 0:
+            self._data_depth = None
+            self._data_elem = None
+
+    def _decode_entry(self, entry_elem):
+        entry = {}
+        for child in entry_elem:
+            child_tag = child.tag
+            if child_tag == _TAG_ATTRIBUTE:
+                name = child.get("name")
+                if child.get("error"):
+                    self.result["errors"].append({
+                        "mib": self._mib,
+                        "node": self._node,
+                        "attribute": name,
+                        "error": child.get("error"),
+                    })
+                    continue
+                value = child.text or ""
+                if self.decode_strings:
+                    value = _decode_hex_string(value)
+                entry[name] = value
+            elif child_tag == _TAG_INDEX:
+                # Table row index — contains Attribute children
+                # with index column values (e.g. VLAN ID, row key).
+                # Index values are typically integers, don't hex-decode them
+                for idx_attr in child:
+                    if idx_attr.tag == _TAG_ATTRIBUTE:
+                        entry["_idx_" + idx_attr.get("name")] = (
+                            idx_attr.text or "")
+        return entry
+
+
+class _ResumableSocket(ssl.SSLSocket):
+    """SSLSocket that hands its TLS session back to the context on close.
+
+    TLS 1.3 tickets arrive after the handshake, with the first response,
+    so the session worth resuming is only known once the socket was used.
+    Only the public close() and session are used.
+    """
 
-    def _get_session_key(self):
-        """Get MOPS session key via /mops_login.
+    def close(self):
+        try:
+            session = self.session
+        except (OSError, ValueError):
+            session = None
+        remember = getattr(self.context, "remember", None)
+        if remember is not None:
+            remember(session)
+        super().close()
+
+
+class _ResumingContext(ssl.SSLContext):
+    """Client TLS context that offers the last session back on reconnect.
+
+    urllib3's default context sets OP_NO_TICKET and never passes a session
+    to wrap_socket, so every new socket pays a full handshake. This one
+    keeps tickets on and resumes the most recent session to the host.
+    Certificates are not verified (HiOS ships self-signed).
+    """
 
-        Required for download/upload on HiOS 10.x (uses Authorization: Mops).
-        Falls back silently if login endpoint is unavailable (HiOS 9.x uses Basic).
+    sslsocket_class = _ResumableSocket
+
+    def __new__(cls):
+        return super().__new__(cls, ssl.PROTOCOL_TLS_CLIENT)
+
+    def __init__(self):
+        super().__init__()
+        self.check_hostname = False
+        self.verify_mode = ssl.CERT_NONE
+        self.minimum_version = ssl.TLSVersion.TLSv1_2
+        self._lock = threading.Lock()
+        self._session = None
+        self.handshakes = 0
+        self.resumed = 0
+
+    def remember(self, session):
+        """Offer session on the next wrap_socket() (None is ignored)."""
+        if session is not None:
+            with self._lock:
+                self._session = session
+
+    def wrap_socket(self, sock, *args, session=None, **kwargs):
+        with self._lock:
+            session = session or self._session
+        sslsock = super().wrap_socket(sock, *args, session=session, **kwargs)
+        with self._lock:
+            self.handshakes += 1
+            if sslsock.session_reused:
+                self.resumed += 1
+            self._session = sslsock.session or self._session
+        return sslsock
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter shared by the open MOPSClients talking to one host:port.
+
+    Sessions mount it per client (each keeps its own auth and headers).
+    A session closing must not tear down a pool other clients still use,
+    so close() is a no-op here; MOPSClient.close() drops its reference
+    and the last one releases the sockets (see _release_adapter).
+    """
 
-        Uses a separate session without HTTP Basic auth — the /mops_login
-        endpoint rejects Basic and expects credentials in the XML body.
-        """
-        if self._session_key:
-            return self._session_key
-        user, pwd = self.session.auth
-        payload = (
-            "<mops-auth><login>"
-            "<app-name>webif</app-name>"
-            "<credentials>"
-            f"<user>{user}</user>"
-            f"<password>{pwd}</password>"
-            "</credentials>"
-            "</login></mops-auth>"
-        )
-        try:
-            login_session = requests.Session()
-            login_session.verify = False
-            login_session.headers.update({"Content-Type": "application/xml"})
-            r = login_session.post(
-                f"https://{self.host}:{self.port}/mops_login",
-                data=payload, timeout=self.timeout)
-            login_session.close()
-            if r.status_code == 200 and "<session-key>" in r.text:
-                import re
-                m = re.search(r'<session-key>([^<]+)</session-key>', r.text)
-                if m:
-                    self._session_key = m.group(1)
-        except requests.exceptions.RequestException:
-            pass
-        return self._session_key
+    def __init__(self, ssl_context):
+        self.ssl_context = ssl_context
+        super().__init__(pool_connections=1, pool_maxsize=4)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def close(self):
+        pass
+
+    def _release(self):
+        super().close()
+
+
+# (host, port) -> [adapter, open clients]; TLS contexts (and the session
+# they resume) outlive the pool, so a reopened client skips the handshake
+_pools = {}
+_tls_contexts = {}
+_pools_lock = threading.Lock()
+
+
+def _tls_context(host, port):
+    """Return the resuming TLS context for host:port, creating it once."""
+    with _pools_lock:
+        return _tls_contexts.setdefault((host, port), _ResumingContext())
+
+
+def _acquire_adapter(host, port):
+    """Return the shared adapter for host:port and count one more user."""
+    ctx = _tls_context(host, port)
+    with _pools_lock:
+        pool = _pools.get((host, port))
+        if pool is None:
+            pool = _pools[(host, port)] = [_PooledAdapter(ctx), 0]
+        pool[1] += 1
+        return pool[0]
+
+
+def _release_adapter(host, port, adapter):
+    """Drop one user of adapter; the last one closes its sockets."""
+    with _pools_lock:
+        pool = _pools.get((host, port))
+        if pool is None or pool[0] is not adapter:
+            return
+        pool[1] -= 1
+        if pool[1] > 0:
+            return
+        del _pools[(host, port)]
+    adapter._release()
+
+
+def close_pools():
+    """Close every pooled MOPS connection and forget cached TLS sessions."""
+    with _pools_lock:
+        adapters = [pool[0] for pool in _pools.values()]
+        _pools.clear()
+        _tls_contexts.clear()
+    for adapter in adapters:
+        adapter._release()
+
+
+def _rpc_root(message_id):
+    """Create the common RPC envelope."""
+    rpc = Element("rpc")
+    rpc.set("xmlns", NS_NETCONF)
+    rpc.set("xmlns:xsi", NS_XSI)
+    rpc.set("xsi:schemaLocation", "urn:x-mops:1.0 ../mops.xsd")
+    rpc.set("message-id", str(message_id))
+    mib_op = SubElement(rpc, "mibOperation")
+    mib_op.set("xmlns", NS_MOPS)
+    return rpc, mib_op
+
+
+@functools.lru_cache(maxsize=_GET_TEMPLATE_CACHE_SIZE)
+def _get_request_template(queries, source):
+    """Serialise a get-config request once, split around the message-id.
+
+    queries: tuple of (mib_name, node_name, (attr_names,)) — hashable.
+    Returns (head, tail); head + str(message_id) + tail is the request.
+    """
+    rpc, mib_op = _rpc_root(0)
+
+    get_config = SubElement(mib_op, "get-config")
+    src = SubElement(get_config, "source")
+    SubElement(src, source)
+
+    mib_data = SubElement(get_config, "MIBData")
+
+    # Group queries by MIB name
+    mib_nodes = {}
+    for mib_name, node_name, attrs in queries:
+        if mib_name not in mib_nodes:
+            mib_nodes[mib_name] = []
+        mib_nodes[mib_name].append((node_name, attrs))
+
+    for mib_name, nodes in mib_nodes.items():
+        mib_elem = SubElement(mib_data, "MIB")
+        mib_elem.set("name", mib_name)
+        for node_name, attrs in nodes:
+            node_elem = SubElement(mib_elem, "Node")
+            node_elem.set("name", node_name)
+            for attr in attrs:
+                get_elem = SubElement(node_elem, "Get")
+                get_elem.set("name", attr)
+
+    xml = ET.tostring(rpc, encoding="unicode", xml_declaration=True)
+    # The rpc start tag precedes any caller-supplied name
+    head, tail = xml.split('message-id="0"', 1)
+    return head + 'message-id="', '"' + tail
+
+
+def _format_error(error):
+    """Render a response error dict as 'MIB/Node[idx=val]/attr: message'."""
+    parts = [error[k] for k in ("mib", "node") if error.get(k)]
+    if error.get("index") and parts:
+        parts[-1] += "[" + ",".join(
+            f"{k}={v}" for k, v in error["index"].items()) + "]"
+    if error.get("attribute"):
+        parts.append(error["attribute"])
+    return f"{'/'.join(parts)}: {error['error']}"
+
+
+def _error_matches(error, mutation):
+    """True if a response error (MIB, Node or attribute level) hits mutation.
+
+    An error naming a table row (index) only hits the mutation on that row.
+    """
+    mib_name, node_name, values = mutation[0], mutation[1], mutation[2]
+    if error["mib"] != mib_name:
+        return False
+    if error["node"] is not None and error["node"] != node_name:
+        return False
+    if error.get("index"):
+        index = mutation[3] if len(mutation) > 3 else None
+        if not index or {k: str(v) for k, v in index.items()} != error["index"]:
+            return False
+    return "attribute" not in error or error["attribute"] in values
+
+
+def _set_result(mutation, status, errors):
+    return {"mutation": mutation, "status": status, "errors": errors}
+
+
+def _chunk_mutations(mutations, chunk_size):
+    """Split mutations into POST-sized chunks, keeping their order.
+
+    Consecutive mutations on the same MIB/node form a group, and a chunk
+    only starts a group it can hold whole; a group larger than chunk_size
+    is split over chunks of its own. A chunk holds at most chunk_size Set
+    attributes; a single mutation is never split, so one with more
+    attributes gets a chunk of its own.
+    """
+    chunk, size = [], 0
+    for _key, group in itertools.groupby(mutations, key=lambda m: m[:2]):
+        group = list(group)
+        counts = [max(len(mutation[2]), 1) for mutation in group]
+        if chunk and size + sum(counts) > chunk_size:
+            yield chunk
+            chunk, size = [], 0
+        for mutation, count in zip(group, counts):
+            if chunk and size + count > chunk_size:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(mutation)
+            size += count
+    if chunk:
+        yield chunk
+
+
+def _row_index(elem):
+    """Index attributes of a response Node/Entry as {name: value}, or None."""
+    idx_elem = elem.find("{%s}Index" % NS_MOPS)
+    if idx_elem is None:
+        return None
+    return {attr.get("name"): (attr.text or "").strip() for attr in idx_elem
+            if attr.tag == "{%s}Attribute" % NS_MOPS}
+
+
+class _MOPSMessages:
+    """MOPS XML request building and response parsing.
+
+    Transport-independent half of the protocol, shared by MOPSClient
+    (requests) and AsyncMOPSClient (asyncio). Subclasses provide
+    self._message_id.
+    """
 
     def _next_id(self):
         self._message_id += 1
@@ -171,46 +508,20 @@ class MOPSClient:
 
     def _rpc_envelope(self):
         """Create the common RPC envelope."""
-        rpc = Element("rpc")
-        rpc.set("xmlns", NS_NETCONF)
-        rpc.set("xmlns:xsi", NS_XSI)
-        rpc.set("xsi:schemaLocation", "urn:x-mops:1.0 ../mops.xsd")
-        rpc.set("message-id", str(self._next_id()))
-        mib_op = SubElement(rpc, "mibOperation")
-        mib_op.set("xmlns", NS_MOPS)
-        return rpc, mib_op
+        return _rpc_root(self._next_id())
 
     def _build_get_request(self, queries, source="running-config"):
         """Build MOPS get-config XML request.
 
         queries: list of (mib_name, node_name, [attr_names])
-        """
-        rpc, mib_op = self._rpc_envelope()
-
-        get_config = SubElement(mib_op, "get-config")
-        src = SubElement(get_config, "source")
-        SubElement(src, source)
-
-        mib_data = SubElement(get_config, "MIBData")
-
-        # Group queries by MIB name
-        mib_nodes = {}
-        for mib_name, node_name, attrs in queries:
-            if mib_name not in mib_nodes:
-                mib_nodes[mib_name] = []
-            mib_nodes[mib_name].append((node_name, attrs))
-
-        for mib_name, nodes in mib_nodes.items():
-            mib_elem = SubElement(mib_data, "MIB")
-            mib_elem.set("name", mib_name)
-            for node_name, attrs in nodes:
-                node_elem = SubElement(mib_elem, "Node")
-                node_elem.set("name", node_name)
-                for attr in attrs:
-                    get_elem = SubElement(node_elem, "Get")
-                    get_elem.set("name", attr)
 
-        return ET.tostring(rpc, encoding="unicode", xml_declaration=True)
+        Polling loops send the same queries every cycle, so the serialised
+        body is cached per query set and only the message-id is spliced in.
+        """
+        key = tuple((mib_name, node_name, tuple(attrs))
+                    for mib_name, node_name, attrs in queries)
+        head, tail = _get_request_template(key, source)
+        return f"{head}{self._next_id()}{tail}"
 
     def _build_set_request(self, mutations):
         """Build MOPS edit-config XML request.
@@ -260,23 +571,6 @@ class MOPSClient:
 
         return ET.tostring(rpc, encoding="unicode", xml_declaration=True)
 
-    def _send(self, xml_body):
-        """Send XML request and return parsed response."""
-        try:
-            r = self.session.post(self.url, data=xml_body, timeout=self.timeout)
-        except requests.exceptions.ConnectionError as e:
-            raise ConnectionException(f"MOPS connection failed to {self.host}: {e}")
-        except requests.exceptions.Timeout as e:
-            raise ConnectionException(f"MOPS timeout connecting to {self.host}: {e}")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionException(f"MOPS request failed to {self.host}: {e}")
-        if r.status_code == 401:
-            raise ConnectionException(
-                f"MOPS authentication failed on {self.host} (HTTP 401)")
-        if r.status_code != 200:
-            raise MOPSError(f"HTTP {r.status_code}: {r.text[:200]}")
-        return r.text
-
     def _is_ok_response(self, xml_text):
         """Check if response indicates SET success.
 
@@ -286,11 +580,27 @@ class MOPSClient:
         Returns True if mibResponse contains no errors (echo-back success).
         Returns False if response contains neither <ok/> nor mibResponse.
         """
+        errors = self._set_errors(xml_text)
+        if errors is None:
+            return False
+        if errors:
+            raise MOPSError(
+                f"SET failed: {'; '.join(_format_error(e) for e in errors)}")
+        return True
+
+    def _set_errors(self, xml_text):
+        """Collect errors from an edit-config response.
+
+        Returns [] for <ok/> or a clean mibResponse, a list of error dicts
+        ({mib, node[, attribute], error} as in get-config responses, plus
+        index {name: value} when the error names a table row) when the
+        switch rejected something, None for an unrecognised response.
+        """
         root = ET.fromstring(xml_text)
         for elem in root:
             tag = elem.tag.replace("{%s}" % NS_NETCONF, "")
             if tag == "ok":
-                return True
+                return []
             tag_mops = elem.tag.replace("{%s}" % NS_MOPS, "")
             if tag_mops == "mibResponse":
                 # Parse mibResponse for errors at any level
@@ -302,31 +612,59 @@ class MOPSClient:
                             continue
                         mib_name = mib_elem.get("name", "?")
                         if mib_elem.get("error"):
-                            errors.append(f"{mib_name}: {mib_elem.get('error')}")
+                            errors.append({"mib": mib_name, "node": None,
+                                           "error": mib_elem.get("error")})
                             continue
                         for node_elem in mib_elem:
                             node_tag = node_elem.tag.replace("{%s}" % NS_MOPS, "")
                             if node_tag != "Node":
                                 continue
                             node_name = node_elem.get("name", "?")
+                            node_index = _row_index(node_elem)
                             if node_elem.get("error"):
-                                errors.append(
-                                    f"{mib_name}/{node_name}: "
-                                    f"{node_elem.get('error')}")
+                                error = {"mib": mib_name, "node": node_name,
+                                         "error": node_elem.get("error")}
+                                if node_index:
+                                    error["index"] = node_index
+                                errors.append(error)
                                 continue
                             for entry_elem in node_elem:
+                                index = _row_index(entry_elem) or node_index
                                 for attr_elem in entry_elem:
                                     if attr_elem.get("error"):
-                                        attr_name = attr_elem.get("name", "?")
-                                        errors.append(
-                                            f"{mib_name}/{node_name}/"
-                                            f"{attr_name}: "
-                                            f"{attr_elem.get('error')}")
-                if errors:
-                    raise MOPSError(
-                        f"SET failed: {'; '.join(errors)}")
-                return True
-        return False
+                                        error = {
+                                            "mib": mib_name,
+                                            "node": node_name,
+                                            "attribute": attr_elem.get("name", "?"),
+                                            "error": attr_elem.get("error"),
+                                        }
+                                        if index:
+                                            error["index"] = index
+                                        errors.append(error)
+                return errors
+        return None
+
+    def _chunk_results(self, chunk, xml_text):
+        """Attribute an edit-config response to the mutations that caused it.
+
+        chunk: list of mutation tuples sent in one POST.
+        Returns one result dict per mutation (see MOPSClient.set_chunked).
+        """
+        errors = self._set_errors(xml_text)
+        if errors is None:
+            return [_set_result(m, "error", [f"SET failed: {xml_text[:300]}"])
+                    for m in chunk]
+        results = []
+        for mutation in chunk:
+            mine = [_format_error(e) for e in errors
+                    if _error_matches(e, mutation)]
+            if mine:
+                results.append(_set_result(mutation, "error", mine))
+            elif errors:
+                results.append(_set_result(mutation, "unconfirmed", []))
+            else:
+                results.append(_set_result(mutation, "ok", []))
+        return results
 
     def _parse_response(self, xml_text, decode_strings=True):
         """Parse MOPS response into structured dict.
@@ -343,93 +681,214 @@ class MOPSClient:
             "errors": [{"mib": "...", "node": "...", "error": "noSuchName"}, ...]
         }
         """
-        root = ET.fromstring(xml_text)
+        parser = _ResponseParser(decode_strings=decode_strings)
+        # Feed in slices so pending parser events stay bounded
+        for pos in range(0, len(xml_text), _STREAM_CHUNK_SIZE):
+            parser.feed(xml_text[pos:pos + _STREAM_CHUNK_SIZE])
+        return parser.close()
 
-        result = {
-            "message_id": root.get("message-id"),
-            "mibs": {},
-            "errors": [],
+
+class MOPSClient(_MOPSMessages):
+    """Client for MOPS (MIB Operations over HTTPS) on HiOS switches."""
+
+    def __init__(self, host, username="admin", password="private",
+                 port=443, timeout=10, compress=False):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.compress = compress
+        self.url = f"https://{host}:{port}/mops_data"
+        self.session = requests.Session()
+        self._adapter = _acquire_adapter(host, port)
+        self.session.mount(f"https://{host}:{port}/", self._adapter)
+        self.session.auth = (username, password)
+        self.session.verify = False
+        self.session.headers.update({
+            "Content-Type": "application/xml",
+            "Accept-Encoding": "gzip",
+        })
+        self._message_id = 0
+        self._session_key = None
+        # Payload bytes (headers excluded): on the wire vs uncompressed
+        self.transfer_stats = {
+            "requests": 0,
+            "bytes_sent": 0, "bytes_sent_raw": 0,
+            "bytes_received": 0, "bytes_received_raw": 0,
         }
+        self.last_transfer = None
 
-        # Find MIBData in response
-        for mib_data in root.iter("{%s}MIBData" % NS_MOPS):
-            for mib_elem in mib_data:
-                mib_name = mib_elem.get("name")
-                tag = mib_elem.tag.replace("{%s}" % NS_MOPS, "")
+    def __enter__(self):
+        return self
 
-                if tag != "MIB":
-                    continue
+    def __exit__(self, *args):
+        self.close()
 
-                # Check for MIB-level error
-                if mib_elem.get("error"):
-                    result["errors"].append({
-                        "mib": mib_name,
-                        "node": None,
-                        "error": mib_elem.get("error"),
-                    })
-                    continue
+    def close(self):
+        """Close the session and release this client's share of the pool.
 
-                if mib_name not in result["mibs"]:
-                    result["mibs"][mib_name] = {}
-
-                for node_elem in mib_elem:
-                    node_tag = node_elem.tag.replace("{%s}" % NS_MOPS, "")
-                    if node_tag != "Node":
-                        continue
-
-                    node_name = node_elem.get("name")
-
-                    # Check for node-level error
-                    if node_elem.get("error"):
-                        result["errors"].append({
-                            "mib": mib_name,
-                            "node": node_name,
-                            "error": node_elem.get("error"),
-                        })
-                        continue
-
-                    entries = []
-                    for entry_elem in node_elem:
-                        entry_tag = entry_elem.tag.replace("{%s}" % NS_MOPS, "")
-                        if entry_tag != "Entry":
-                            continue
+        Sockets stay open while other clients to the same host:port are
+        open; the TLS session is kept for resumption either way.
+        """
+        self.session.close()
+        adapter, self._adapter = self._adapter, None
+        if adapter is not None:
+            _release_adapter(self.host, self.port, adapter)
 
-                        entry = {}
-                        for child_elem in entry_elem:
-                            child_tag = child_elem.tag.replace("{%s}" % NS_MOPS, "")
-
-                            if child_tag == "Attribute":
-                                name = child_elem.get("name")
-                                if child_elem.get("error"):
-                                    result["errors"].append({
-                                        "mib": mib_name,
-                                        "node": node_name,
-                                        "attribute": name,
-                                        "error": child_elem.get("error"),
-                                    })
-                                    continue
-                                value = child_elem.text or ""
-                                if decode_strings:
-                                    value = _decode_hex_string(value)
-                                entry[name] = value
-
-                            elif child_tag == "Index":
-                                # Table row index — contains Attribute children
-                                # with index column values (e.g. VLAN ID, row key)
-                                for idx_attr in child_elem:
-                                    idx_tag = idx_attr.tag.replace("{%s}" % NS_MOPS, "")
-                                    if idx_tag == "Attribute":
-                                        name = idx_attr.get("name")
-                                        value = idx_attr.text or ""
-                                        # Index values are typically integers,
-                                        # don't hex-decode them
-                                        entry["_idx_" + name] = value
-
-                        entries.append(entry)
-
-                    result["mibs"][mib_name][node_name] = entries
-
-        return result
+    def connection_stats(self):
+        """TLS handshakes made to this host:port by the shared pool.
+
+        Returns: dict with 'handshakes' (total) and 'resumed' (abbreviated
+        handshakes that reused a cached TLS session).
+        """
+        ctx = _tls_context(self.host, self.port)
+        return {"handshakes": ctx.handshakes, "resumed": ctx.resumed}
+
+    def _get_session_key(self):
+        """Get MOPS session key via /mops_login.
+
+        Required for download/upload on HiOS 10.x (uses Authorization: Mops).
+        Falls back silently if login endpoint is unavailable (HiOS 9.x uses Basic).
+
+        Goes over the pooled data connection with auth=() — the /mops_login
+        endpoint rejects Basic and expects credentials in the XML body.
+        """
+        if self._session_key:
+            return self._session_key
+        user, pwd = self.session.auth
+        payload = (
+            "<mops-auth><login>"
+            "<app-name>webif</app-name>"
+            "<credentials>"
+            f"<user>{user}</user>"
+            f"<password>{pwd}</password>"
+            "</credentials>"
+            "</login></mops-auth>"
+        )
+        try:
+            r = self.session.post(
+                f"https://{self.host}:{self.port}/mops_login",
+                data=payload, timeout=self.timeout, auth=())
+            if r.status_code == 200 and "<session-key>" in r.text:
+                import re
+                m = re.search(r'<session-key>([^<]+)</session-key>', r.text)
+                if m:
+                    self._session_key = m.group(1)
+        except requests.exceptions.RequestException:
+            pass
+        return self._session_key
+
+    def _record_transfer(self, sent, sent_raw, r, received_raw=None):
+        """Count one request/response in transfer_stats and last_transfer.
+
+        r.raw.tell() is what urllib3 pulled off the socket, before gzip
+        decoding; received_raw is the decoded body length (default: from
+        the already-read r.content).
+        """
+        if received_raw is None:
+            content = r.content
+            received_raw = len(content) if isinstance(content, bytes) else 0
+        try:
+            received = int(r.raw.tell())
+        except (AttributeError, TypeError, ValueError):
+            received = received_raw
+        self.last_transfer = {
+            "bytes_sent": sent, "bytes_sent_raw": sent_raw,
+            "bytes_received": received, "bytes_received_raw": received_raw,
+        }
+        self.transfer_stats["requests"] += 1
+        for key, value in self.last_transfer.items():
+            self.transfer_stats[key] += value
+
+    def _gzip_accepted(self):
+        """Probe once per switch whether /mops_data takes a gzip body.
+
+        Not all firmware decodes Content-Encoding on requests, and one that
+        does not may still answer 200 with an error, so the probe checks
+        that a gzipped sysDescr GET really returns sysDescr.
+        """
+        key = (self.host, self.port)
+        if key not in _gzip_support:
+            xml = self._build_get_request(
+                [("SNMPv2-MIB", "system", ["sysDescr"])])
+            try:
+                r = self.session.post(
+                    self.url, data=gzip.compress(xml.encode("utf-8")),
+                    headers={"Content-Encoding": "gzip"},
+                    timeout=self.timeout)
+                entries = (self._parse_response(r.text)["mibs"]
+                           .get("SNMPv2-MIB", {}).get("system", []))
+                supported = (r.status_code == 200 and bool(entries)
+                             and "sysDescr" in entries[0])
+            except (requests.exceptions.RequestException, ET.ParseError):
+                supported = False
+            logger.debug("MOPS gzip request bodies on %s: %s",
+                         self.host, "accepted" if supported else "refused")
+            _gzip_support[key] = supported
+        return _gzip_support[key]
+
+    def _encode_body(self, body):
+        """Return (data, extra_headers), gzipped if enabled and worthwhile."""
+        raw = body.encode("utf-8") if isinstance(body, str) else body
+        if (self.compress and len(raw) >= _COMPRESS_MIN_BYTES
+                and self._gzip_accepted()):
+            return raw, gzip.compress(raw), {"Content-Encoding": "gzip"}
+        return raw, raw, {}
+
+    def _post(self, xml_body, stream=False):
+        """POST XML to /mops_data and return the checked HTTP response.
+
+        Non-streamed responses are counted in transfer_stats here; stream
+        readers call _record_transfer() once the body is consumed.
+        """
+        raw, data, headers = self._encode_body(xml_body)
+        try:
+            r = self.session.post(self.url, data=data, headers=headers,
+                                  timeout=self.timeout, stream=stream)
+        except requests.exceptions.ConnectionError as e:
+            raise ConnectionException(f"MOPS connection failed to {self.host}: {e}")
+        except requests.exceptions.Timeout as e:
+            raise ConnectionException(f"MOPS timeout connecting to {self.host}: {e}")
+        except requests.exceptions.RequestException as e:
+            raise ConnectionException(f"MOPS request failed to {self.host}: {e}")
+        r._mops_sent = (len(data), len(raw))
+        if not stream:
+            self._record_transfer(len(data), len(raw), r)
+        if r.status_code == 401:
+            raise ConnectionException(
+                f"MOPS authentication failed on {self.host} (HTTP 401)")
+        if r.status_code != 200:
+            raise MOPSError(f"HTTP {r.status_code}: {r.text[:200]}")
+        return r
+
+    def _iter_counted(self, r):
+        """iter_content() that records the transfer once fully read."""
+        received_raw = 0
+        for chunk in r.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+            received_raw += len(chunk)
+            yield chunk
+        self._record_transfer(*r._mops_sent, r, received_raw)
+
+    def _send(self, xml_body):
+        """Send XML request and return the response text."""
+        return self._post(xml_body).text
+
+    def _send_parsed(self, xml_body, decode_strings=True):
+        """Send a get-config request and parse the reply as it streams in.
+
+        Same result as _parse_response(_send(xml_body)), without holding
+        the response text or a full ElementTree in memory.
+        """
+        r = self._post(xml_body, stream=True)
+        parser = _ResponseParser(decode_strings=decode_strings)
+        try:
+            for chunk in self._iter_counted(r):
+                parser.feed(chunk)
+        except requests.exceptions.RequestException as e:
+            raise ConnectionException(
+                f"MOPS response from {self.host} interrupted: {e}")
+        finally:
+            r.close()
+        return parser.close()
 
     def get(self, mib_name, node_name, attributes, decode_strings=True):
         """Query a single MIB node.
@@ -442,8 +901,7 @@ class MOPSClient:
         MIB-level and node-level errors still raise MOPSError.
         """
         xml = self._build_get_request([(mib_name, node_name, attributes)])
-        response = self._send(xml)
-        parsed = self._parse_response(response, decode_strings=decode_strings)
+        parsed = self._send_parsed(xml, decode_strings=decode_strings)
 
         for err in parsed["errors"]:
             if "attribute" not in err:
@@ -452,6 +910,46 @@ class MOPSClient:
 
         return parsed["mibs"].get(mib_name, {}).get(node_name, [])
 
+    def iter_get(self, mib_name, node_name, attributes, decode_strings=True):
+        """Query a single MIB node, yielding entry dicts as they arrive.
+
+        Same entries and error handling as get(), but the response is
+        streamed and parsed incrementally — constant memory regardless of
+        table size (FDB, LLDP, ARP on large switches).
+
+        MIB-level and node-level errors raise MOPSError. They precede the
+        node's entries in the response, so nothing has been yielded yet.
+        """
+        xml = self._build_get_request([(mib_name, node_name, attributes)])
+        r = self._post(xml, stream=True)
+        parser = _ResponseParser(decode_strings=decode_strings, collect=False)
+        errors = parser.result["errors"]
+        try:
+            chunks = self._iter_counted(r)
+            while True:
+                try:
+                    chunk = next(chunks, None)
+                except requests.exceptions.RequestException as e:
+                    raise ConnectionException(
+                        f"MOPS response from {self.host} interrupted: {e}")
+                if chunk is None:
+                    parser.close()
+                else:
+                    parser.feed(chunk)
+                for err in errors:
+                    if "attribute" not in err:
+                        raise MOPSError(
+                            f"{err['mib']}/{err.get('node', '?')}: "
+                            f"{err['error']}")
+                del errors[:]
+                pending, parser.pending = parser.pending, []
+                for _mib, _node, entry in pending:
+                    yield entry
+                if chunk is None:
+                    return
+        finally:
+            r.close()
+
     def get_multi(self, queries, decode_strings=True):
         """Query multiple MIB nodes in one request.
 
@@ -459,8 +957,7 @@ class MOPSClient:
         Returns: full parsed response dict
         """
         xml = self._build_get_request(queries)
-        response = self._send(xml)
-        return self._parse_response(response, decode_strings=decode_strings)
+        return self._send_parsed(xml, decode_strings=decode_strings)
 
     def set(self, mib_name, node_name, values):
         """Set attributes on a single MIB node.
@@ -487,6 +984,34 @@ class MOPSClient:
             return True
         raise MOPSError(f"SET failed: {response[:300]}")
 
+    def set_chunked(self, mutations, chunk_size=_SET_CHUNK_SIZE):
+        """Send mutations as several size-bounded edit-config POSTs.
+
+        For batches too large for one atomic set_multi (hundreds of
+        per-port rows). Chunks keep the mutation order and go back-to-back
+        over the kept-alive connection; a rejected chunk does not stop
+        the rest. Not atomic — earlier chunks stay applied.
+
+        mutations: list of (mib_name, node_name, {attr: value}[, index])
+        chunk_size: max Set attributes per POST
+        Returns: list of dicts in mutation order:
+            {'mutation': tuple, 'status': 'ok'|'error'|'unconfirmed',
+             'errors': ['MIB/Node/attr: message', ...]}
+            'unconfirmed' marks mutations in a chunk the switch reported
+            errors for, without naming them.
+        Raises ConnectionException if the switch becomes unreachable.
+        """
+        results = []
+        for chunk in _chunk_mutations(mutations, chunk_size):
+            try:
+                response = self._send(self._build_set_request(chunk))
+            except MOPSError as e:
+                results.extend(_set_result(m, "error", [str(e)])
+                               for m in chunk)
+                continue
+            results.extend(self._chunk_results(chunk, response))
+        return results
+
     def set_indexed(self, mib_name, node_name, index, values):
         """Set attributes on a specific table row.
 
@@ -910,21 +1435,36 @@ class MOPSClient:
 
         return info
 
-    def probe(self):
+    def probe(self, with_serial=False):
         """Probe the device for MOPS availability.
 
         Checks both unauthenticated deviceInfo.xml and authenticated sysDescr GET.
         Returns the sysDescr string on success.
         Raises ConnectionException on failure.
+
+        with_serial: also read hm2DevMgmtSerialNumber in the same POST and
+        return (sysDescr, serial) — serial is '' if the MIB is missing.
         """
         # Step 1: Check device is reachable via deviceInfo.xml (no auth)
         self.device_info()
 
         # Step 2: Authenticated MOPS GET — verifies credentials
-        entries = self.get("SNMPv2-MIB", "system", ["sysDescr"])
+        if with_serial:
+            mibs = self.get_multi([
+                ("SNMPv2-MIB", "system", ["sysDescr"]),
+                ("HM2-DEVMGMT-MIB", "hm2DeviceMgmtGroup",
+                 ["hm2DevMgmtSerialNumber"]),
+            ])["mibs"]
+            entries = mibs.get("SNMPv2-MIB", {}).get("system", [])
+            dev = mibs.get("HM2-DEVMGMT-MIB", {}).get("hm2DeviceMgmtGroup", [{}])
+        else:
+            entries = self.get("SNMPv2-MIB", "system", ["sysDescr"])
         if not entries or "sysDescr" not in entries[0]:
             raise ConnectionException(
                 f"MOPS probe on {self.host}: sysDescr not returned")
+        if with_serial:
+            return (entries[0]["sysDescr"],
+                    (dev or [{}])[0].get("hm2DevMgmtSerialNumber", ""))
         return entries[0]["sysDescr"]
 
     def _config_auth_headers(self):
@@ -959,11 +1499,28 @@ class MOPSClient:
         except requests.exceptions.RequestException as e:
             raise ConnectionException(
                 f"Config download failed on {self.host}: {e}")
+        self._record_transfer(0, 0, r)
         if r.status_code != 200:
             raise ConnectionException(
                 f"Config download HTTP {r.status_code} from {self.host}")
         return r.text
 
+    def _upload(self, url, body, headers, compress):
+        """POST a prepared multipart upload body, optionally gzipped."""
+        data = body
+        if compress:
+            data = gzip.compress(body)
+            headers = dict(headers, **{'Content-Encoding': 'gzip'})
+        try:
+            auth = () if 'Authorization' in headers else None
+            r = self.session.post(url, data=data, headers=headers,
+                                  auth=auth, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            raise ConnectionException(
+                f"Config upload failed on {self.host}: {e}")
+        self._record_transfer(len(data), len(body), r)
+        return r
+
     def upload_config(self, xml_data, profile, destination='nvm'):
         """Upload config XML to the device.
 
@@ -981,35 +1538,359 @@ class MOPSClient:
         url = (f"https://{self.host}:{self.port}/upload.html"
                f"?filetype=config&destination={destination}&profile={profile}")
         headers = self._config_auth_headers()
-        # The session has Content-Type: application/xml for MOPS XML-RPC.
-        # Multipart file uploads need requests to auto-generate the
-        # multipart/form-data Content-Type with boundary.  Temporarily
-        # remove the session default so it doesn't override.
-        saved_ct = self.session.headers.pop('Content-Type', None)
-        try:
-            auth = () if 'Authorization' in headers else None
-            r = self.session.post(
-                url,
-                files={'file': ('config.xml', xml_data, 'text/xml')},
-                headers=headers,
-                auth=auth,
-                timeout=self.timeout,
-            )
-        except requests.exceptions.RequestException as e:
-            raise ConnectionException(
-                f"Config upload failed on {self.host}: {e}")
-        finally:
-            if saved_ct is not None:
-                self.session.headers['Content-Type'] = saved_ct
+        # Multipart body built here (not files=) so it can be gzipped; the
+        # explicit Content-Type with boundary overrides the session's
+        # application/xml default.
+        body, content_type = urllib3.encode_multipart_formdata(
+            {'file': ('config.xml', xml_data, 'text/xml')})
+        headers['Content-Type'] = content_type
+        upload_key = (self.host, self.port, "upload")
+        compress = (self.compress and len(body) >= _COMPRESS_MIN_BYTES
+                    and _gzip_support.get(upload_key, True))
+        r = self._upload(url, body, headers, compress)
+        if compress:
+            if r.status_code == 200 and 'config.OK' in r.text:
+                _gzip_support[upload_key] = True
+            elif self._upload_undecodable(r):
+                # The upload handler couldn't read the gzipped body — resend
+                # plain. A config-level rejection is final and never resent.
+                r = self._upload(url, body, headers, False)
+                if r.status_code == 200 and 'config.OK' in r.text:
+                    _gzip_support[upload_key] = False
         if r.status_code != 200:
             raise ConnectionException(
                 f"Config upload HTTP {r.status_code} from {self.host}")
         # The switch returns HTTP 200 for both success and application-level
         # errors.  Parse the response body to detect failures.
         if 'config.OK' not in r.text:
-            import re
-            m = re.search(r"<errortext value='([^']+)'", r.text)
-            msg = m.group(1) if m else r.text.strip()
+            msg = self._upload_error(r)
             raise ConnectionException(
                 f"Config upload rejected on {self.host}: {msg}")
         return True
+
+    @staticmethod
+    def _upload_error(r):
+        """Device error text from an upload response, else the raw body."""
+        m = re.search(r"<errortext value='([^']+)'", r.text)
+        return m.group(1) if m else r.text.strip()
+
+    @classmethod
+    def _upload_undecodable(cls, r):
+        """True when a gzipped upload failed on transport or encoding.
+
+        HTTP 400/415, or an HTTP 200 error naming the body encoding (or no
+        file at all). Any other rejection is about the config itself.
+        """
+        if r.status_code in _UPLOAD_ENCODING_STATUS:
+            return True
+        if r.status_code != 200:
+            return False
+        m = re.search(r"<errortoken value='([^']+)'", r.text)
+        detail = (m.group(1) + ' ' if m else '') + cls._upload_error(r)
+        return bool(_UPLOAD_ENCODING_ERROR.search(detail))
+
+
+class AsyncMOPSClient(_MOPSMessages):
+    """asyncio client for MOPS — same get/get_multi/set_multi/save_config
+    surface as MOPSClient, as coroutines.
+
+    Speaks HTTP/1.1 directly over asyncio streams (no extra dependency)
+    and keeps one TLS connection per device alive between requests, so a
+    single event loop can drive hundreds of switches without a thread
+    each. Requests on one client are serialised — HiOS handles one MOPS
+    request at a time per session anyway. Bound fleet-wide concurrency
+    with an asyncio.Semaphore in the caller.
+
+    Usage:
+        async with AsyncMOPSClient("192.168.1.4", "admin", "private") as m:
+            entries = await m.get("SNMPv2-MIB", "system", ["sysName"])
+    """
+
+    def __init__(self, host, username="admin", password="private",
+                 port=443, timeout=10):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.username = username
+        self.password = password
+        self._message_id = 0
+        self._reader = None
+        self._writer = None
+        self._lock = None   # created on first use, inside the running loop
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+    async def _connect(self):
+        """Open the TLS connection (certificate not verified, as MOPSClient)."""
+        ctx = ssl.create_default_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, ssl=ctx)
+
+    def _request_head(self, body):
+        credentials = f"{self.username}:{self.password}".encode("utf-8")
+        return (
+            "POST /mops_data HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Authorization: Basic {base64.b64encode(credentials).decode()}\r\n"
+            "Content-Type: application/xml\r\n"
+            "Accept-Encoding: gzip\r\n"
+            "Connection: keep-alive\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode("ascii")
+
+    async def _read_response(self, status_line, feed):
+        """Read the rest of one HTTP response, passing decoded body chunks
+        to feed().
+
+        Non-200 bodies are not fed; their first bytes are returned as
+        error text instead. Returns (status_code, keep_alive, error_text).
+        """
+        reader = self._reader
+        status = int(status_line.split()[1])
+        error_body = []
+        if status != 200:
+            def feed(data):
+                if sum(len(d) for d in error_body) < 200:
+                    error_body.append(data)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        gunzip = None
+        if headers.get("content-encoding", "").lower() == "gzip":
+            gunzip = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        def emit(data):
+            if gunzip is not None:
+                data = gunzip.decompress(data)
+            if data:
+                feed(data)
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    # Trailers end with an empty line
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                emit(await reader.readexactly(size))
+                await reader.readexactly(2)
+        elif "content-length" in headers:
+            remaining = int(headers["content-length"])
+            while remaining:
+                data = await reader.read(min(remaining, _STREAM_CHUNK_SIZE))
+                if not data:
+                    raise asyncio.IncompleteReadError(b"", remaining)
+                remaining -= len(data)
+                emit(data)
+        else:
+            # No framing — body runs to EOF
+            keep_alive = False
+            while True:
+                data = await reader.read(_STREAM_CHUNK_SIZE)
+                if not data:
+                    break
+                emit(data)
+        if gunzip is not None:
+            tail = gunzip.flush()
+            if tail:
+                feed(tail)
+        error_text = b"".join(error_body).decode("utf-8", errors="replace")
+        return status, keep_alive, error_text
+
+    async def _exchange(self, body, feed, idempotent):
+        """Send one request on the kept-alive connection.
+
+        If the device dropped an idle connection before answering, an
+        idempotent request (get) is sent once more on a new connection.
+        Sets are never resent, and nothing is resent once response bytes
+        have reached feed().
+        """
+        for attempt in (1, 2):
+            reused = self._writer is not None
+            if not reused:
+                await self._connect()
+            answered = False
+            try:
+                self._writer.write(self._request_head(body) + body)
+                await self._writer.drain()
+                status_line = await self._reader.readline()
+                if not status_line:
+                    raise ConnectionResetError("connection closed by device")
+                answered = True
+                status, keep_alive, error_text = await self._read_response(
+                    status_line, feed)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if reused and attempt == 1 and idempotent and not answered:
+                    continue
+                raise
+            except BaseException:
+                # Cancelled or failed mid-response — stream position unknown
+                await self.close()
+                raise
+            if not keep_alive:
+                await self.close()
+            return status, error_text
+
+    async def _post(self, xml_body, feed, idempotent=False):
+        """POST XML to /mops_data; body chunks go to feed(). Checks status.
+
+        idempotent: the request may be resent after a dropped idle
+        connection (see _exchange).
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        body = xml_body.encode("utf-8")
+        async with self._lock:
+            try:
+                status, error_text = await asyncio.wait_for(
+                    self._exchange(body, feed, idempotent), self.timeout)
+            except asyncio.TimeoutError as e:
+                raise ConnectionException(
+                    f"MOPS timeout connecting to {self.host}: {e}")
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                raise ConnectionException(
+                    f"MOPS request failed to {self.host}: {e}")
+        if status == 401:
+            raise ConnectionException(
+                f"MOPS authentication failed on {self.host} (HTTP 401)")
+        if status != 200:
+            raise MOPSError(f"HTTP {status}: {error_text[:200]}")
+
+    async def _send(self, xml_body):
+        """Send XML request and return the response text."""
+        chunks = []
+        await self._post(xml_body, chunks.append)
+        return b"".join(chunks).decode("utf-8", errors="replace")
+
+    async def _send_parsed(self, xml_body, decode_strings=True):
+        """Send a get-config request, parsing the reply as it streams in."""
+        parser = _ResponseParser(decode_strings=decode_strings)
+        await self._post(xml_body, parser.feed, idempotent=True)
+        return parser.close()
+
+    async def get(self, mib_name, node_name, attributes, decode_strings=True):
+        """Query a single MIB node. See MOPSClient.get()."""
+        xml = self._build_get_request([(mib_name, node_name, attributes)])
+        parsed = await self._send_parsed(xml, decode_strings=decode_strings)
+
+        for err in parsed["errors"]:
+            if "attribute" not in err:
+                raise MOPSError(
+                    f"{err['mib']}/{err.get('node', '?')}: {err['error']}")
+
+        return parsed["mibs"].get(mib_name, {}).get(node_name, [])
+
+    async def get_multi(self, queries, decode_strings=True):
+        """Query multiple MIB nodes in one request. See MOPSClient.get_multi()."""
+        xml = self._build_get_request(queries)
+        return await self._send_parsed(xml, decode_strings=decode_strings)
+
+    async def set(self, mib_name, node_name, values):
+        """Set attributes on a single MIB node. See MOPSClient.set()."""
+        return await self.set_multi([(mib_name, node_name, values)])
+
+    async def set_multi(self, mutations):
+        """Set attributes on multiple MIB nodes in one request.
+
+        mutations: list of (mib_name, node_name, {attr: encoded_value}[, index])
+        Returns: True on success, raises MOPSError on failure.
+        """
+        xml = self._build_set_request(mutations)
+        response = await self._send(xml)
+        if self._is_ok_response(response):
+            return True
+        raise MOPSError(f"SET failed: {response[:300]}")
+
+    async def set_chunked(self, mutations, chunk_size=_SET_CHUNK_SIZE):
+        """Send mutations as size-bounded POSTs. See MOPSClient.set_chunked()."""
+        results = []
+        for chunk in _chunk_mutations(mutations, chunk_size):
+            try:
+                response = await self._send(self._build_set_request(chunk))
+            except MOPSError as e:
+                results.extend(_set_result(m, "error", [str(e)])
+                               for m in chunk)
+                continue
+            results.extend(self._chunk_results(chunk, response))
+        return results
+
+    async def set_indexed(self, mib_name, node_name, index, values):
+        """Set attributes on a specific table row. See MOPSClient.set_indexed()."""
+        return await self.set_multi([(mib_name, node_name, values, index)])
+
+    async def save_config(self, dest="nvm"):
+        """Save running config to NVM (or ENVM). See MOPSClient.save_config()."""
+        dst_code = "2" if dest == "nvm" else "3"
+
+        # Step 1: Read the activation key (raw — it's an integer, not a string)
+        entries = await self.get(
+            "HM2-FILEMGMT-MIB", "hm2FileMgmtActionGroup",
+            ["hm2FMActionActivateKey", "hm2FMActionStatus"],
+            decode_strings=False)
+        key = entries[0]["hm2FMActionActivateKey"]
+
+        # Step 2: Clear source/dest data
+        await self.set("HM2-FILEMGMT-MIB", "hm2FileMgmtActionGroup", {
+            "hm2FMActionSourceData": "",
+            "hm2FMActionDestinationData": "",
+        })
+
+        # Step 3: Trigger the save — SET on indexed table row
+        await self.set_indexed("HM2-FILEMGMT-MIB", "hm2FMActionEntry",
+            index={
+                "hm2FMActionType": "2",           # copy
+                "hm2FMActionItemType": "10",       # config
+                "hm2FMActionSourceType": "10",     # runningConfig
+                "hm2FMActionDestinationType": dst_code,  # nvm(2) or envm(3)
+            },
+            values={"hm2FMActionActivate": key})
+
+        # Step 4: Read result
+        entries = await self.get(
+            "HM2-FILEMGMT-MIB", "hm2FileMgmtActionGroup",
+            ["hm2FMActionActivateResult", "hm2FMActionStatus",
+             "hm2FMActionResult", "hm2FMActionResultText"])
+        return entries[0] if entries else {}
+
+    async def nvm_state(self):
+        """Check if running config is saved. See MOPSClient.nvm_state()."""
+        entries = await self.get(
+            "HM2-FILEMGMT-MIB", "hm2FileMgmtStatusGroup",
+            ["hm2FMNvmState", "hm2FMEnvmState", "hm2FMBootParamState"])
+        if entries:
+            STATE_NAMES = {"1": "ok", "2": "out of sync", "3": "absent"}
+            return {k: {"value": v, "label": STATE_NAMES.get(v, v)}
+                    for k, v in entries[0].items()}
+        return {}
+
+    async def probe(self):
+        """Authenticated sysDescr GET. Returns sysDescr, raises on failure."""
+        entries = await self.get("SNMPv2-MIB", "system", ["sysDescr"])
+        if not entries or "sysDescr" not in entries[0]:
+            raise ConnectionException(
+                f"MOPS probe on {self.host}: sysDescr not returned")
+        return entries[0]["sysDescr"]
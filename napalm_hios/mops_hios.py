@@ -13,14 +13,18 @@ Confirmed working MIBs/Nodes:
   IEEE8021-Q-BRIDGE-MIB/ieee8021QBridgeVlanStaticEntry
 """
 
+import copy
+import dis
 import logging
+from contextlib import contextmanager
 
 from napalm.base.exceptions import ConnectionException
 
 from napalm_hios.mops_client import (
-    MOPSClient, MOPSError,
+    MOPSClient, AsyncMOPSClient, MOPSError,
     _decode_hex_string, _decode_hex_mac, encode_string, encode_int,
 )
+from napalm_hios import hex_codec
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +100,27 @@ _MAU_TYPES = {
 }
 
 
+# FDB sources, in order of preference — Q-BRIDGE-MIB is the fallback
+# when the IEEE 802.1Q table is not served.
+_FDB_QUERIES = (
+    ("IEEE8021-Q-BRIDGE-MIB", "ieee8021QBridgeTpFdbEntry",
+     ["ieee8021QBridgeTpFdbAddress",
+      "ieee8021QBridgeTpFdbPort",
+      "ieee8021QBridgeTpFdbStatus",
+      "ieee8021QBridgeFdbId"]),
+    ("Q-BRIDGE-MIB", "dot1qTpFdbEntry",
+     ["dot1qTpFdbAddress",
+      "dot1qTpFdbPort",
+      "dot1qTpFdbStatus",
+      "dot1qFdbId"]),
+)
+
+_ARP_QUERY = (
+    "IP-MIB", "ipNetToMediaEntry",
+    ["ipNetToMediaIfIndex", "ipNetToMediaPhysAddress",
+     "ipNetToMediaNetAddress", "ipNetToMediaType"])
+
+
 def _try_mac(value):
     """If value looks like a MAC (6 raw bytes or hex string), format as xx:xx:xx:xx:xx:xx.
 
@@ -206,26 +231,7 @@ def _parse_sysDescr(text):
     return 'Unknown', 'Unknown'
 
 
-def _decode_hex_ip(hex_str):
-    """Decode hex-encoded IP address from MOPS.
-
-    IPv4: "c0 a8 03 01" (4 bytes) → "192.168.3.1"
-    IPv6: 16 bytes → compressed IPv6 notation
-    Returns empty string if not a valid IP.
-    """
-    if not hex_str or not hex_str.strip():
-        return ""
-    parts = hex_str.strip().split()
-    try:
-        octets = [int(p, 16) for p in parts]
-    except ValueError:
-        return hex_str
-    if len(octets) == 4:
-        return ".".join(str(o) for o in octets)
-    if len(octets) == 16:
-        import ipaddress
-        return str(ipaddress.IPv6Address(bytes(octets)))
-    return hex_str
+_decode_hex_ip = hex_codec.decode_ip
 
 
 def _encode_hex_ip(ip_str):
@@ -267,13 +273,10 @@ def _decode_bits_hex(hex_str, bit_map):
     except ValueError:
         return []
     enabled = []
-    for byte_idx, byte_val in enumerate(octets):
-        for bit_idx in range(8):
-            if byte_val & (0x80 >> bit_idx):
-                bit_num = byte_idx * 8 + bit_idx
-                name = bit_map.get(bit_num)
-                if name:
-                    enabled.append(name)
+    for pos in hex_codec.portlist_ports(octets):
+        name = bit_map.get(pos - 1)
+        if name:
+            enabled.append(name)
     return enabled
 
 
@@ -361,26 +364,7 @@ _SSH_HOST_KEY = {
 }
 
 
-def _decode_portlist_hex(hex_str, ifindex_map):
-    """Decode PortList hex string to interface names.
-
-    MOPS returns PortList as space-separated hex bytes (e.g. "c0 00 00 00").
-    Each bit = a bridge port number (1-based, MSB first).
-    """
-    interfaces = []
-    if not hex_str or not hex_str.strip():
-        return interfaces
-    try:
-        octets = bytes.fromhex(hex_str.replace(" ", ""))
-    except ValueError:
-        return interfaces
-    for byte_idx, byte_val in enumerate(octets):
-        for bit_idx in range(8):
-            if byte_val & (0x80 >> bit_idx):
-                port_num = byte_idx * 8 + bit_idx + 1
-                name = ifindex_map.get(str(port_num), f'port{port_num}')
-                interfaces.append(name)
-    return interfaces
+_decode_portlist_hex = hex_codec.decode_portlist
 
 
 def _encode_portlist_hex(interfaces, ifindex_map):
@@ -397,14 +381,7 @@ def _encode_portlist_hex(interfaces, ifindex_map):
         if bp is None:
             raise ValueError(f"Unknown interface '{iface}'")
         bp_nums.append(bp)
-    max_port = max(bp_nums) if bp_nums else 0
-    num_bytes = (max_port + 7) // 8 if max_port else 0
-    bitmap = bytearray(num_bytes)
-    for bp in bp_nums:
-        byte_idx = (bp - 1) // 8
-        bit_idx = (bp - 1) % 8
-        bitmap[byte_idx] |= (0x80 >> bit_idx)
-    return " ".join(f"{b:02x}" for b in bitmap)
+    return hex_codec.encode_hex(hex_codec.encode_portlist(bp_nums))
 
 
 def _decode_lldp_capabilities(hex_str):
@@ -425,6 +402,119 @@ def _decode_lldp_capabilities(hex_str):
     return caps
 
 
+class _StopRecording(BaseException):
+    """Raised by _QueryRecorder when a getter needs more than get/get_multi.
+
+    A BaseException, so a getter's own `except Exception` cannot swallow it
+    and carry on with empty data.
+    """
+    pass
+
+
+class _QueryRecorder:
+    """Stand-in MOPSClient that records queries instead of sending them.
+
+    Used by MOPSHIOS.get_many() to learn which (mib, node, attrs) each
+    getter asks for. Every query answers with an empty result, so getters
+    run to completion on empty data (or bail out — either is fine, the
+    queries issued before that point are what we want).
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def get(self, mib_name, node_name, attributes, decode_strings=True):
+        self.queries.append((mib_name, node_name, list(attributes)))
+        return []
+
+    def get_multi(self, queries, decode_strings=True):
+        for mib_name, node_name, attrs in queries:
+            self.queries.append((mib_name, node_name, list(attrs)))
+        return {"message_id": None, "mibs": {}, "errors": []}
+
+    def __getattr__(self, name):
+        raise _StopRecording(name)
+
+
+class _PrefetchedClient:
+    """MOPSClient proxy that answers get/get_multi from one merged response.
+
+    parsed is a raw (decode_strings=False) _parse_response() result and
+    fetched maps (mib, node) -> set of attributes it contains. Queries that
+    are fully covered are answered locally, with the same attribute
+    filtering and hex decoding the real client would have applied.
+    Anything else (uncovered queries, setters, save) goes to the real client.
+    """
+
+    def __init__(self, client, parsed, fetched):
+        self._client = client
+        self._parsed = parsed
+        self._fetched = fetched
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def _covers(self, mib_name, node_name, attributes):
+        have = self._fetched.get((mib_name, node_name))
+        return have is not None and set(attributes) <= have
+
+    def _entries(self, mib_name, node_name, attributes, decode_strings):
+        wanted = set(attributes)
+        entries = []
+        rows = self._parsed["mibs"].get(mib_name, {}).get(node_name)
+        if rows is None:
+            return None
+        for row in rows:
+            entry = {}
+            for key, value in row.items():
+                if key.startswith("_idx_"):
+                    entry[key] = value
+                elif key in wanted:
+                    entry[key] = (_decode_hex_string(value)
+                                  if decode_strings else value)
+            entries.append(entry)
+        return entries
+
+    def _errors(self, mib_name, node_name, attributes):
+        errors = []
+        for err in self._parsed["errors"]:
+            if err["mib"] != mib_name or err["node"] not in (None, node_name):
+                continue
+            if "attribute" in err and err["attribute"] not in attributes:
+                continue
+            errors.append(err)
+        return errors
+
+    def get(self, mib_name, node_name, attributes, decode_strings=True):
+        if not self._covers(mib_name, node_name, attributes):
+            return self._client.get(mib_name, node_name, attributes,
+                                    decode_strings=decode_strings)
+        for err in self._errors(mib_name, node_name, attributes):
+            if "attribute" not in err:
+                raise MOPSError(
+                    f"{err['mib']}/{err.get('node', '?')}: {err['error']}")
+        return self._entries(mib_name, node_name, attributes,
+                             decode_strings) or []
+
+    def get_multi(self, queries, decode_strings=True):
+        if not all(self._covers(m, n, a) for m, n, a in queries):
+            return self._client.get_multi(queries,
+                                          decode_strings=decode_strings)
+        result = {
+            "message_id": self._parsed["message_id"],
+            "mibs": {},
+            "errors": [],
+        }
+        for mib_name, node_name, attrs in queries:
+            entries = self._entries(mib_name, node_name, attrs, decode_strings)
+            if entries is not None:
+                result["mibs"].setdefault(mib_name, {})[node_name] = entries
+            for err in self._errors(mib_name, node_name, attrs):
+                if err not in result["errors"]:
+                    result["errors"].append(err)
+        return result
+
+
 class MOPSHIOS:
     """MOPS protocol handler for HiOS devices.
 
@@ -432,15 +522,20 @@ class MOPSHIOS:
     MOPS (HTTPS/XML) as the transport instead of SSH CLI or SNMP walks.
     """
 
-    def __init__(self, hostname, username, password, timeout, port=443):
+    def __init__(self, hostname, username, password, timeout, port=443,
+                 compress=False, port_map_cache=None):
         self.hostname = hostname
         self.username = username
         self.password = password
         self.timeout = timeout
         self.port = port
+        self.compress = compress  # gzip request bodies (probed per switch)
+        self.port_map_cache = port_map_cache  # see port_map_cache.PortMapCache
         self.client = None
         self._connected = False
         self._ifindex_map = None  # cached ifIndex -> name
+        self._device_key = None   # (serial, firmware) for port_map_cache
+        self._saved_ifindex = None
 
         # Staging support for atomic commits
         self._staging = False
@@ -454,15 +549,20 @@ class MOPSHIOS:
         """Connect via MOPS and verify with sysDescr probe."""
         self.client = MOPSClient(
             self.hostname, self.username, self.password,
-            port=self.port, timeout=self.timeout,
+            port=self.port, timeout=self.timeout, compress=self.compress,
         )
         try:
-            self.client.probe()
+            if self.port_map_cache is not None:
+                sys_descr, serial = self.client.probe(with_serial=True)
+            else:
+                self.client.probe()
             self._connected = True
         except (ConnectionException, MOPSError) as e:
             self.client.close()
             self.client = None
             raise ConnectionException(f"MOPS probe failed on {self.hostname}: {e}")
+        if self.port_map_cache is not None and serial:
+            self._load_port_maps(serial, _parse_sysDescr(sys_descr)[1])
 
     def is_factory_default(self):
         """Check if device is in factory-default password state."""
@@ -505,6 +605,8 @@ class MOPSHIOS:
             self.client = None
         self._connected = False
         self._ifindex_map = None
+        self._device_key = None
+        self._saved_ifindex = None
         self._staging = False
         self._mutations = []
 
@@ -526,14 +628,42 @@ class MOPSHIOS:
             return self._ifindex_map
         entries = self.client.get("IF-MIB", "ifXEntry", ["ifIndex", "ifName"],
                                   decode_strings=False)
+        return self._set_ifindex_map(entries)
+
+    def _set_ifindex_map(self, entries):
+        """Cache ifIndex -> name from raw ifXEntry rows (ifName still hex)."""
         self._ifindex_map = {}
         for entry in entries:
             idx = entry.get("ifIndex", "")
             name = _decode_hex_string(entry.get("ifName", ""))
             if idx and name:
                 self._ifindex_map[idx] = name
+        self._save_port_maps()
         return self._ifindex_map
 
+    def _load_port_maps(self, serial, firmware):
+        """Warm the ifIndex map from port_map_cache for this serial+firmware."""
+        self._device_key = (serial, firmware)
+        cached = self.port_map_cache.get(serial, firmware, "ifindex")
+        if cached:
+            self._ifindex_map = dict(cached)
+            self._saved_ifindex = dict(cached)
+
+    def _save_port_maps(self):
+        """Persist a freshly fetched ifIndex map if it differs from the cache.
+
+        A different map means the module layout changed, so every map
+        cached for the device is dropped before storing the new one.
+        """
+        if (self._device_key is None or not self._ifindex_map
+                or self._ifindex_map == self._saved_ifindex):
+            return
+        serial, firmware = self._device_key
+        if self._saved_ifindex is not None:
+            self.port_map_cache.invalidate(serial, firmware)
+        self.port_map_cache.set(serial, firmware, "ifindex", self._ifindex_map)
+        self._saved_ifindex = dict(self._ifindex_map)
+
     def _get_bridge_port_map(self):
         """Map bridge port numbers to interface names.
 
@@ -542,13 +672,16 @@ class MOPSHIOS:
         """
         return self._build_ifindex_map()
 
-    def _get_with_ifindex(self, *tables, decode_strings=False):
+    def _get_with_ifindex(self, *tables, decode_strings=False, strict=False):
         """Fetch tables via get_multi, bundling IF-MIB/ifXEntry when cache is cold.
 
         On cold cache: adds ifXEntry to the request so ifindex map is built
         from the same HTTP POST as the getter's own data (1 POST instead of 2).
         On warm cache: fetches only the requested tables (ifindex from cache).
 
+        strict: raise MOPSError on a MIB- or node-level error for one of
+        the tables, as MOPSClient.get() and iter_get() do.
+
         Returns (mibs_dict, ifindex_map) where mibs_dict is
         result["mibs"] from get_multi.
         """
@@ -561,13 +694,16 @@ class MOPSHIOS:
         mibs = result["mibs"]
 
         if need_cache:
-            if_entries = mibs.get("IF-MIB", {}).get("ifXEntry", [])
-            self._ifindex_map = {}
-            for entry in if_entries:
-                idx = entry.get("ifIndex", "")
-                name = _decode_hex_string(entry.get("ifName", ""))
-                if idx and name:
-                    self._ifindex_map[idx] = name
+            self._set_ifindex_map(mibs.get("IF-MIB", {}).get("ifXEntry", []))
+
+        if strict:
+            for err in result["errors"]:
+                if "attribute" in err:
+                    continue
+                if any(err["mib"] == mib and err.get("node") in (None, node)
+                       for mib, node, _attrs in tables):
+                    raise MOPSError(
+                        f"{err['mib']}/{err.get('node', '?')}: {err['error']}")
 
         return mibs, self._ifindex_map
 
@@ -590,18 +726,30 @@ class MOPSHIOS:
         self._staging = True
         self._mutations = []
 
-    def commit_staging(self):
+    def commit_staging(self, chunk_size=None):
         """Fire all queued mutations in one atomic POST.
 
         Applies staged mutations to running config via set_multi().
         Does NOT save to NVM — call save_config() separately when ready.
+
+        Args:
+            chunk_size: for batches too large for one POST (hundreds of
+                per-port rows) — send as several POSTs of at most this many
+                Set attributes via MOPSClient.set_chunked(). Not atomic;
+                returns the per-mutation result list so partial failures
+                can be re-staged on their own.
         """
         if not self._mutations:
             self._staging = False
-            return
-        self.client.set_multi(self._mutations)
+            return [] if chunk_size else None
+        results = None
+        if chunk_size:
+            results = self.client.set_chunked(self._mutations, chunk_size)
+        else:
+            self.client.set_multi(self._mutations)
         self._staging = False
         self._mutations = []
+        return results
 
     def discard_staging(self):
         """Clear queued mutations without sending."""
@@ -646,6 +794,89 @@ class MOPSHIOS:
         else:
             self.client.set(mib, node, values)
 
+    # ------------------------------------------------------------------
+    # Batched getters
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _prefetch(self, getters):
+        """Serve the named getters' MOPS queries from one merged POST.
+
+        Each getter is dry-run against a _QueryRecorder to collect the
+        (mib, node, attrs) it asks for. Queries are merged per node into
+        one get_multi (raw, decode_strings=False), and for the duration of
+        the block self.client answers covered queries from that response.
+        Queries a getter only issues after seeing real data are still sent
+        individually, so results match calling each getter on its own.
+        The dry runs use a throwaway copy (see _dry_run_copy), so nothing
+        they cache from the recorder's empty data reaches this instance.
+        """
+        client = self.client
+        recorder = _QueryRecorder()
+        for name in getters:
+            getter = getattr(self._dry_run_copy(recorder), name, None)
+            if getter is None:
+                continue
+            try:
+                getter()
+            except (Exception, _StopRecording):
+                # Empty data or a non-query client call — the queries
+                # recorded up to this point are all we need.
+                pass
+
+        merged = {}
+        for mib_name, node_name, attrs in recorder.queries:
+            have = merged.setdefault((mib_name, node_name), [])
+            have.extend(a for a in attrs if a not in have)
+        if not merged:
+            yield
+            return
+
+        parsed = client.get_multi(
+            [(mib_name, node_name, attrs)
+             for (mib_name, node_name), attrs in merged.items()],
+            decode_strings=False)
+        fetched = {key: set(attrs) for key, attrs in merged.items()}
+        self.client = _PrefetchedClient(client, parsed, fetched)
+        try:
+            yield
+        finally:
+            self.client = client
+
+    def _dry_run_copy(self, client):
+        """Copy of this backend on `client` whose state can be thrown away.
+
+        Mutable caches are copied and the port_map_cache is detached, so a
+        recording pass leaves this instance and the persistent cache as
+        they were.
+        """
+        dry = copy.copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, (dict, list, set)):
+                setattr(dry, name, copy.deepcopy(value))
+        dry.client = client
+        dry.port_map_cache = None
+        dry._device_key = None
+        return dry
+
+    def get_many(self, getters):
+        """Run several getters off a single merged get-config POST.
+
+        Args:
+            getters: list of getter names, e.g. ['get_facts', 'get_mrp',
+                'get_rstp_port'].
+
+        Returns: dict of {getter_name: getter_result}.
+        Raises: ValueError on a name that is not a getter of this backend.
+        """
+        getters = list(getters)
+        for name in getters:
+            if not name.startswith('get_') or not callable(
+                    getattr(self, name, None)):
+                raise ValueError(f"Unknown getter '{name}'")
+        with self._prefetch(getters):
+            return {name: getattr(self, name)() for name in getters}
+
     # ------------------------------------------------------------------
     # Standard NAPALM getters
     # ------------------------------------------------------------------
@@ -680,13 +911,9 @@ class MOPSHIOS:
                            int(x.split('/')[1]) if '/' in x and x.split('/')[1].isdigit() else 0)
         )
 
-        # Cache the ifindex map from this query (raw ifIndex, decoded ifName)
-        self._ifindex_map = {}
-        for entry in if_entries:
-            idx = entry.get("ifIndex", "")
-            name = _decode_hex_string(entry.get("ifName", ""))
-            if idx and name:
-                self._ifindex_map[idx] = name
+        # Cache the ifindex map from this query (raw ifIndex, decoded ifName);
+        # a changed module layout refreshes port_map_cache
+        self._set_ifindex_map(if_entries)
 
         sys_descr = _decode_hex_string(sys_data.get("sysDescr", ""))
         model, os_version = _parse_sysDescr(sys_descr)
@@ -1190,101 +1417,119 @@ class MOPSHIOS:
 
         return neighbors
 
+    @staticmethod
+    def _mac_table_entry(entry, ifindex_map):
+        """Convert one FDB row (either MIB naming convention) to NAPALM format."""
+        # Get MAC address — try both MIB naming conventions
+        mac_raw = (entry.get("ieee8021QBridgeTpFdbAddress", "") or
+                   entry.get("dot1qTpFdbAddress", ""))
+        port = (entry.get("ieee8021QBridgeTpFdbPort", "") or
+                entry.get("dot1qTpFdbPort", ""))
+        status = (entry.get("ieee8021QBridgeTpFdbStatus", "") or
+                  entry.get("dot1qTpFdbStatus", ""))
+        # FDB ID = VLAN ID on HiOS (matches SNMP OID index suffix)
+        fdb_id = (entry.get("ieee8021QBridgeFdbId", "") or
+                  entry.get("dot1qFdbId", ""))
+
+        mac = _decode_hex_mac(mac_raw) if mac_raw else ""
+        iface = ifindex_map.get(port, f"port{port}") if port else ""
+
+        # Status: 3=learned, 5=static (match SNMP: anything not learned = static)
+        static = _safe_int(status) != 3
+
+        return {
+            'mac': mac,
+            'interface': iface,
+            'vlan': _safe_int(fdb_id, 0),
+            'static': static,
+            'active': True,
+            'moves': 0,
+            'last_move': 0.0,
+        }
+
+    @staticmethod
+    def _arp_table_entry(entry, ifindex_map):
+        """Convert one ipNetToMediaEntry row to NAPALM format (None if no IP)."""
+        ifidx = entry.get("ipNetToMediaIfIndex", "")
+        mac_raw = entry.get("ipNetToMediaPhysAddress", "")
+        ip = entry.get("ipNetToMediaNetAddress", "")
+
+        if not ip:
+            return None
+
+        iface = ifindex_map.get(ifidx, f"if{ifidx}")
+        mac = _decode_hex_mac(mac_raw) if mac_raw else ""
+
+        return {
+            'interface': iface,
+            'mac': mac,
+            'ip': ip,
+            'age': 0.0,
+        }
+
     def get_mac_address_table(self):
         """Return MAC address table from IEEE8021-Q-BRIDGE-MIB FDB.
 
         Request ieee8021QBridgeFdbId (or dot1qFdbId) explicitly — on HiOS
         this equals the VLAN ID directly, matching the SNMP OID index suffix.
+        A MIB- or node-level error falls back to Q-BRIDGE-MIB, as in
+        iter_mac_address_table().
         """
         # decode_strings=False: FDB address is binary MAC
-        try:
-            mibs, ifindex_map = self._get_with_ifindex(
-                ("IEEE8021-Q-BRIDGE-MIB", "ieee8021QBridgeTpFdbEntry",
-                 ["ieee8021QBridgeTpFdbAddress",
-                  "ieee8021QBridgeTpFdbPort",
-                  "ieee8021QBridgeTpFdbStatus",
-                  "ieee8021QBridgeFdbId"]),
-                decode_strings=False,
-            )
-            entries = mibs.get("IEEE8021-Q-BRIDGE-MIB", {}).get(
-                "ieee8021QBridgeTpFdbEntry", [])
-        except MOPSError:
+        for mib, node, attrs in _FDB_QUERIES:
             try:
                 mibs, ifindex_map = self._get_with_ifindex(
-                    ("Q-BRIDGE-MIB", "dot1qTpFdbEntry",
-                     ["dot1qTpFdbAddress",
-                      "dot1qTpFdbPort",
-                      "dot1qTpFdbStatus",
-                      "dot1qFdbId"]),
-                    decode_strings=False,
-                )
-                entries = mibs.get("Q-BRIDGE-MIB", {}).get(
-                    "dot1qTpFdbEntry", [])
+                    (mib, node, attrs), decode_strings=False, strict=True)
             except MOPSError:
-                return []
+                continue
+            entries = mibs.get(mib, {}).get(node, [])
+            return [self._mac_table_entry(entry, ifindex_map)
+                    for entry in entries]
+        return []
 
-        mac_table = []
-        for entry in entries:
-            # Get MAC address — try both MIB naming conventions
-            mac_raw = (entry.get("ieee8021QBridgeTpFdbAddress", "") or
-                       entry.get("dot1qTpFdbAddress", ""))
-            port = (entry.get("ieee8021QBridgeTpFdbPort", "") or
-                    entry.get("dot1qTpFdbPort", ""))
-            status = (entry.get("ieee8021QBridgeTpFdbStatus", "") or
-                      entry.get("dot1qTpFdbStatus", ""))
-            # FDB ID = VLAN ID on HiOS (matches SNMP OID index suffix)
-            fdb_id = (entry.get("ieee8021QBridgeFdbId", "") or
-                      entry.get("dot1qFdbId", ""))
-
-            mac = _decode_hex_mac(mac_raw) if mac_raw else ""
-            iface = ifindex_map.get(port, f"port{port}") if port else ""
-
-            # Status: 3=learned, 5=static (match SNMP: anything not learned = static)
-            static = _safe_int(status) != 3
-
-            mac_table.append({
-                'mac': mac,
-                'interface': iface,
-                'vlan': _safe_int(fdb_id, 0),
-                'static': static,
-                'active': True,
-                'moves': 0,
-                'last_move': 0.0,
-            })
+    def iter_mac_address_table(self):
+        """Yield MAC address table entries as they stream in.
 
-        return mac_table
+        Same entries as get_mac_address_table(), decoded one row at a time
+        from the streamed response — constant memory on large FDBs.
+        """
+        ifindex_map = self._build_ifindex_map()
+        for mib, node, attrs in _FDB_QUERIES:
+            started = False
+            try:
+                for entry in self.client.iter_get(mib, node, attrs,
+                                                  decode_strings=False):
+                    started = True
+                    yield self._mac_table_entry(entry, ifindex_map)
+            except MOPSError:
+                if started:
+                    raise
+                continue
+            return
 
     def get_arp_table(self, vrf=""):
         """Return ARP table from IP-MIB/ipNetToMediaEntry."""
         # decode_strings=False: MAC address is binary
         mibs, ifindex_map = self._get_with_ifindex(
-            ("IP-MIB", "ipNetToMediaEntry",
-             ["ipNetToMediaIfIndex", "ipNetToMediaPhysAddress",
-              "ipNetToMediaNetAddress", "ipNetToMediaType"]),
-            decode_strings=False,
-        )
+            _ARP_QUERY, decode_strings=False)
         entries = mibs.get("IP-MIB", {}).get("ipNetToMediaEntry", [])
         arp_table = []
         for entry in entries:
-            ifidx = entry.get("ipNetToMediaIfIndex", "")
-            mac_raw = entry.get("ipNetToMediaPhysAddress", "")
-            ip = entry.get("ipNetToMediaNetAddress", "")
-
-            if not ip:
-                continue
-
-            iface = ifindex_map.get(ifidx, f"if{ifidx}")
-            mac = _decode_hex_mac(mac_raw) if mac_raw else ""
-
-            arp_table.append({
-                'interface': iface,
-                'mac': mac,
-                'ip': ip,
-                'age': 0.0,
-            })
-
+            arp_entry = self._arp_table_entry(entry, ifindex_map)
+            if arp_entry is not None:
+                arp_table.append(arp_entry)
         return arp_table
 
+    def iter_arp_table(self, vrf=""):
+        """Yield ARP table entries as they stream in (see get_arp_table)."""
+        ifindex_map = self._build_ifindex_map()
+        mib, node, attrs = _ARP_QUERY
+        for entry in self.client.iter_get(mib, node, attrs,
+                                          decode_strings=False):
+            arp_entry = self._arp_table_entry(entry, ifindex_map)
+            if arp_entry is not None:
+                yield arp_entry
+
     def get_vlans(self):
         """Return VLAN table from IEEE8021-Q-BRIDGE-MIB or Q-BRIDGE-MIB.
 
@@ -1398,8 +1643,16 @@ class MOPSHIOS:
                 return {}
 
         port_set = set(ports) if ports else None
+        # PortLists repeat across VLANs — decode each column in one batch
+        egress_col, untagged_col, forbidden_col = (
+            hex_codec.decode_portlists(
+                [entry.get("ieee8021QBridgeVlanStatic" + col, "") or
+                 entry.get("dot1qVlanStatic" + col, "") for entry in entries],
+                bridge_map)
+            for col in ("EgressPorts", "UntaggedPorts", "ForbiddenEgressPorts"))
         vlans = {}
-        for entry in entries:
+        for entry, egress, untagged, forbidden in zip(
+                entries, egress_col, untagged_col, forbidden_col):
             vlan_id_raw = (entry.get("ieee8021QBridgeVlanStaticVlanIndex", "") or
                            entry.get("dot1qVlanIndex", ""))
             vlan_id = _safe_int(vlan_id_raw, 0)
@@ -1410,16 +1663,9 @@ class MOPSHIOS:
                 entry.get("ieee8021QBridgeVlanStaticName", "") or
                 entry.get("dot1qVlanStaticName", ""))
 
-            egress_raw = (entry.get("ieee8021QBridgeVlanStaticEgressPorts", "") or
-                          entry.get("dot1qVlanStaticEgressPorts", ""))
-            untagged_raw = (entry.get("ieee8021QBridgeVlanStaticUntaggedPorts", "") or
-                            entry.get("dot1qVlanStaticUntaggedPorts", ""))
-            forbidden_raw = (entry.get("ieee8021QBridgeVlanStaticForbiddenEgressPorts", "") or
-                             entry.get("dot1qVlanStaticForbiddenEgressPorts", ""))
-
-            egress_ifaces = set(_decode_portlist_hex(egress_raw, bridge_map))
-            untagged_ifaces = set(_decode_portlist_hex(untagged_raw, bridge_map))
-            forbidden_ifaces = set(_decode_portlist_hex(forbidden_raw, bridge_map))
+            egress_ifaces = set(egress)
+            untagged_ifaces = set(untagged)
+            forbidden_ifaces = set(forbidden)
 
             port_modes = {}
             for iface in egress_ifaces:
@@ -2138,7 +2384,11 @@ class MOPSHIOS:
 
     def get_config_status(self):
         """Check if running config is saved to NVM."""
-        state = self.client.nvm_state()
+        return self._config_status(self.client.nvm_state())
+
+    @staticmethod
+    def _config_status(state):
+        """Format a client.nvm_state() dict as get_config_status()."""
         nvm = state.get("hm2FMNvmState", {}).get("label", "unknown")
         envm = state.get("hm2FMEnvmState", {}).get("label", "absent")
         boot = state.get("hm2FMBootParamState", {}).get("label", "ok")
@@ -8325,3 +8575,299 @@ class MOPSHIOS:
                     "hm2AgentIpsgIfConfigEntry",
                     index={"ifIndex": ifidx},
                     values=vals)
+
+
+def _unrecordable(cls):
+    """Names of cls methods the AsyncMOPSHIOS replay cannot record.
+
+    Read from the bytecode: a method is unrecordable if it calls a client
+    method other than get/get_multi (self.client.<name>) or another
+    unrecordable method (self.<name>). The _apply_* helpers only reach the
+    client when not staging, and the replay always stages setters.
+    """
+    methods = {}
+    for name, attr in vars(cls).items():
+        func = getattr(attr, '__func__', attr)
+        if callable(func) and hasattr(func, '__code__'):
+            methods[name] = func.__code__
+
+    def scan(code, client_calls, self_calls):
+        prev = None
+        for ins in dis.get_instructions(code):
+            if ins.opname in ('LOAD_ATTR', 'LOAD_METHOD') and prev is not None:
+                if prev.argval == 'client' and prev.opname in (
+                        'LOAD_ATTR', 'LOAD_METHOD'):
+                    client_calls.add(ins.argval)
+                elif prev.argval == 'self' and ins.argval in methods:
+                    self_calls.add(ins.argval)
+            prev = ins
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):
+                scan(const, client_calls, self_calls)
+
+    calls = {}
+    unrecordable = set()
+    for name, code in methods.items():
+        client_calls, self_calls = set(), set()
+        scan(code, client_calls, self_calls)
+        calls[name] = self_calls
+        if (client_calls - {'get', 'get_multi'}
+                and not name.startswith('_apply_')):
+            unrecordable.add(name)
+    changed = True
+    while changed:
+        changed = False
+        for name, self_calls in calls.items():
+            if name not in unrecordable and self_calls & unrecordable:
+                unrecordable.add(name)
+                changed = True
+    return unrecordable
+
+
+class AsyncMOPSHIOS:
+    """asyncio adapter exposing the MOPSHIOS getters/setters as coroutines.
+
+    Runs on AsyncMOPSClient, so one event loop can poll a whole fleet
+    without a thread per switch. Getter logic is not duplicated: each
+    call replays the synchronous MOPSHIOS method against data fetched
+    asynchronously. A round records the queries the method makes, sends
+    all of them in one get_multi, and replays; most getters finish in
+    one round, data-dependent follow-up queries add one round each.
+
+    Setters run the same way in MOPSHIOS staging mode and their queued
+    mutations are sent with one set_multi (or held until commit_staging()
+    if staging). Methods the replay cannot record because they need other
+    client calls (VLAN CRUD, MRP, profiles, config transfer, ...) and have
+    no coroutine here are listed by _unsupported() and not offered at
+    all — use MOPSHIOS for those.
+
+    Usage:
+        sem = asyncio.Semaphore(50)
+
+        async def poll(host):
+            async with sem:
+                dev = AsyncMOPSHIOS(host, "admin", "private", timeout=10)
+                await dev.open()
+                try:
+                    return await dev.get_many(['get_facts', 'get_mrp'])
+                finally:
+                    await dev.close()
+    """
+
+    _SETTER_PREFIXES = ('set_', 'add_', 'delete_', 'reset_', 'create_',
+                        'update_', 'clear_')
+    _UNSUPPORTED = None     # derived on first use, see _unsupported()
+
+    def __init__(self, hostname, username, password, timeout, port=443):
+        self.hostname = hostname
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.port = port
+        self.client = None
+        self._connected = False
+        self._backend = MOPSHIOS(hostname, username, password, timeout,
+                                 port=port)
+
+        # Staging support for atomic commits
+        self._staging = False
+        self._mutations = []
+
+    async def open(self):
+        """Connect via MOPS and verify with sysDescr probe."""
+        self.client = AsyncMOPSClient(
+            self.hostname, self.username, self.password,
+            port=self.port, timeout=self.timeout,
+        )
+        try:
+            await self.client.probe()
+            self._connected = True
+        except (ConnectionException, MOPSError) as e:
+            await self.client.close()
+            self.client = None
+            raise ConnectionException(f"MOPS probe failed on {self.hostname}: {e}")
+
+    async def close(self):
+        """Close the MOPS session."""
+        if self.client:
+            await self.client.close()
+            self.client = None
+        self._connected = False
+        self._backend._ifindex_map = None
+        self._staging = False
+        self._mutations = []
+
+    def is_alive(self):
+        return self._connected
+
+    async def _replay(self, calls, stage=False):
+        """Run backend methods until all their queries are answered.
+
+        calls: list of (method_name, args, kwargs).
+        Returns (results, mutations) from the final, fully-served round.
+        """
+        backend = self._backend
+        parsed = {"message_id": None, "mibs": {}, "errors": []}
+        fetched = {}
+        while True:
+            recorder = _QueryRecorder()
+            saved_map = backend._ifindex_map
+            backend.client = _PrefetchedClient(recorder, parsed, fetched)
+            results = []
+            error = None
+            try:
+                for name, args, kwargs in calls:
+                    if stage:
+                        backend.start_staging()
+                    try:
+                        results.append(getattr(backend, name)(*args, **kwargs))
+                    except _StopRecording as e:
+                        raise NotImplementedError(
+                            f"{name} needs MOPSClient.{e}() — not available "
+                            f"via AsyncMOPSHIOS, use MOPSHIOS")
+                    except Exception as e:
+                        if error is None:
+                            error = e
+                        results.append(None)
+                mutations = backend.get_staged_mutations()
+            finally:
+                backend.client = None
+                backend.discard_staging()
+
+            if not recorder.queries:
+                if error is not None:
+                    raise error
+                return results, mutations
+
+            # Incomplete data this round — undo cache side effects, fetch, retry
+            backend._ifindex_map = saved_map
+            merged = {}
+            for mib_name, node_name, attrs in recorder.queries:
+                key = (mib_name, node_name)
+                have = merged.setdefault(key, sorted(fetched.get(key, ())))
+                have.extend(a for a in attrs if a not in have)
+            response = await self.client.get_multi(
+                [(mib_name, node_name, attrs)
+                 for (mib_name, node_name), attrs in merged.items()],
+                decode_strings=False)
+            parsed["message_id"] = response["message_id"]
+            parsed["errors"] = [
+                err for err in parsed["errors"]
+                if (err["mib"], err["node"]) not in merged]
+            for err in response["errors"]:
+                if err not in parsed["errors"]:
+                    parsed["errors"].append(err)
+            for (mib_name, node_name), attrs in merged.items():
+                rows = response["mibs"].get(mib_name, {}).get(node_name)
+                if rows is not None:
+                    parsed["mibs"].setdefault(mib_name, {})[node_name] = rows
+                fetched[(mib_name, node_name)] = set(attrs)
+
+    async def _call(self, name, *args, **kwargs):
+        if name.startswith(self._SETTER_PREFIXES):
+            results, mutations = await self._replay([(name, args, kwargs)],
+                                                    stage=True)
+            if self._staging:
+                self._mutations.extend(mutations)
+            elif mutations:
+                await self.client.set_multi(mutations)
+            return results[0]
+        results, _ = await self._replay([(name, args, kwargs)])
+        return results[0]
+
+    @classmethod
+    def _unsupported(cls):
+        """MOPSHIOS methods neither replayable nor overridden here."""
+        if cls._UNSUPPORTED is None:
+            cls._UNSUPPORTED = frozenset(
+                name for name in _unrecordable(MOPSHIOS)
+                if not callable(getattr(cls, name, None)))
+        return cls._UNSUPPORTED
+
+    @classmethod
+    def _supports(cls, name, prefixes):
+        return (name.startswith(prefixes) and name not in cls._unsupported()
+                and callable(getattr(MOPSHIOS, name, None)))
+
+    def _own(self, name):
+        """True if name is a getter coroutine of this class, not replayed."""
+        return name != 'get_many' and callable(getattr(type(self), name, None))
+
+    def __getattr__(self, name):
+        if self._supports(name, ('get_',) + self._SETTER_PREFIXES):
+            async def method(*args, **kwargs):
+                return await self._call(name, *args, **kwargs)
+            method.__name__ = name
+            method.__doc__ = getattr(MOPSHIOS, name).__doc__
+            return method
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __dir__(self):
+        prefixes = ('get_',) + self._SETTER_PREFIXES
+        return sorted(set(super().__dir__()) | {
+            name for name in dir(MOPSHIOS) if self._supports(name, prefixes)})
+
+    async def get_many(self, getters):
+        """Run several getters off merged get-config POSTs.
+
+        All replayed getters share each round, so this costs as many
+        round-trips as the slowest getter alone (usually one). Getters with
+        their own coroutine here (get_config_status) are awaited as when
+        called directly.
+
+        Returns: dict of {getter_name: getter_result}.
+        """
+        getters = list(getters)
+        for name in getters:
+            if not (name.startswith('get_') and self._own(name)
+                    or self._supports(name, 'get_')):
+                raise ValueError(f"Unknown getter '{name}'")
+        replayed = [name for name in getters if not self._own(name)]
+        results, _ = await self._replay([(name, (), {}) for name in replayed])
+        results = dict(zip(replayed, results))
+        for name in getters:
+            if self._own(name):
+                results[name] = await getattr(self, name)()
+        return {name: results[name] for name in getters}
+
+    async def get_config_status(self):
+        """Check if running config is saved to NVM."""
+        return MOPSHIOS._config_status(await self.client.nvm_state())
+
+    async def save_config(self):
+        """Save running config to NVM via MOPS."""
+        await self.client.save_config()
+        return await self.get_config_status()
+
+    def start_staging(self):
+        """Enter staging mode — setter mutations are queued, not sent."""
+        self._staging = True
+        self._mutations = []
+
+    async def commit_staging(self, chunk_size=None):
+        """Fire all queued mutations in one atomic POST (no NVM save).
+
+        chunk_size: send in size-bounded POSTs instead and return the
+        per-mutation results — see MOPSHIOS.commit_staging().
+        """
+        results = [] if chunk_size else None
+        if self._mutations:
+            if chunk_size:
+                results = await self.client.set_chunked(self._mutations,
+                                                        chunk_size)
+            else:
+                await self.client.set_multi(self._mutations)
+        self._staging = False
+        self._mutations = []
+        return results
+
+    def discard_staging(self):
+        """Clear queued mutations without sending."""
+        self._staging = False
+        self._mutations = []
+
+    def get_staged_mutations(self):
+        """Return list of staged mutation tuples."""
+        return list(self._mutations)
+
@@ -23,7 +23,10 @@ import logging
 import os
 import xml.etree.ElementTree as ET
 
-from napalm_hios.mops_client import encode_string, _decode_hex_string, MOPSError
+from napalm_hios.mops_client import (
+    encode_string, _decode_hex_string, _set_result, MOPSError,
+)
+from napalm_hios import hex_codec
 
 logger = logging.getLogger(__name__)
 
@@ -55,32 +58,12 @@ def _encode_portlist_hex(port_names, name_to_idx):
             bp_nums.append(int(bp))
     if not bp_nums:
         return ""
-    max_port = max(bp_nums)
-    num_bytes = (max_port + 7) // 8
-    bitmap = bytearray(num_bytes)
-    for bp in bp_nums:
-        byte_idx = (bp - 1) // 8
-        bit_idx = (bp - 1) % 8
-        bitmap[byte_idx] |= (0x80 >> bit_idx)
-    return " ".join(f"{b:02x}" for b in bitmap)
+    return hex_codec.encode_hex(hex_codec.encode_portlist(bp_nums))
 
 
 def _decode_portlist_to_names(hex_str, ifindex_map):
     """Decode MOPS hex bitmap back to comma-separated port names."""
-    if not hex_str or not hex_str.strip():
-        return ""
-    try:
-        octets = bytes.fromhex(hex_str.replace(" ", ""))
-    except ValueError:
-        return ""
-    names = []
-    for byte_idx, byte_val in enumerate(octets):
-        for bit_idx in range(8):
-            if byte_val & (0x80 >> bit_idx):
-                port_num = byte_idx * 8 + bit_idx + 1
-                name = ifindex_map.get(str(port_num), f'port{port_num}')
-                names.append(name)
-    return ",".join(names)
+    return ",".join(hex_codec.decode_portlist(hex_str, ifindex_map))
 
 
 class OfflineClient:
@@ -390,6 +373,14 @@ class OfflineClient:
                 self.set(mib_name, node_name, attrs)
         return True
 
+    def set_chunked(self, mutations, chunk_size=None):
+        """Set attributes on multiple nodes — no POST size to bound offline.
+
+        Returns the MOPSClient.set_chunked() result list, all 'ok'.
+        """
+        self.set_multi(mutations)
+        return [_set_result(m, "ok", []) for m in mutations]
+
     def set_indexed(self, mib_name, node_name, index, values):
         """Set attributes on a specific table row identified by index.
 
@@ -80,10 +80,18 @@ class OfflineHIOS(MOPSHIOS):
         """MAC table is runtime state — not in config XML."""
         return []
 
+    def iter_mac_address_table(self):
+        """MAC table is runtime state — not in config XML."""
+        return iter(())
+
     def get_arp_table(self, vrf=""):
         """ARP table is runtime state — not in config XML."""
         return []
 
+    def iter_arp_table(self, vrf=""):
+        """ARP table is runtime state — not in config XML."""
+        return iter(())
+
     def get_optics(self):
         """Optics are runtime state — not in config XML."""
         return {}
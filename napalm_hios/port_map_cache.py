@@ -0,0 +1,104 @@
+"""
+Port map cache — keep ifIndex/bridge-port maps between driver sessions.
+
+Every getter that reports per-port data needs the ifIndex -> name map
+(IF-MIB/ifXEntry), and the SNMP backend also walks dot1dBasePortIfIndex
+for VLAN PortLists. Both are rebuilt on each open(), so short tool runs
+pay for an extra fetch or walk every time. The maps only change with the
+hardware (modules) or firmware, so they are cached per serial number +
+firmware version, with a TTL as a backstop.
+
+Any object with the same get/set/invalidate methods can stand in for
+PortMapCache (e.g. a shared Redis-backed store for a fleet poller).
+
+Usage:
+    driver = get_network_driver('hios')
+    device = driver(host, user, pw,
+                    optional_args={'port_map_cache': True})      # default dir
+                    # or {'port_map_cache': '/var/cache/hios-ports'}
+                    # or {'port_map_cache': PortMapCache(ttl=3600)}
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "napalm-hios", "port-maps")
+
+DEFAULT_TTL = 24 * 3600
+
+
+class PortMapCache:
+    """On-disk port map cache, one JSON file per serial + firmware.
+
+    Maps are stored by name ('ifindex', 'bridge_ports') with their own
+    timestamp, so backends that know only some of them can share a file.
+    Unreadable or expired entries are treated as missing.
+    """
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL):
+        self.path = path or DEFAULT_CACHE_DIR
+        self.ttl = ttl
+
+    def _file(self, serial, firmware):
+        name = re.sub(r'[^A-Za-z0-9._-]', '_', f"{serial}_{firmware}")
+        return os.path.join(self.path, f"{name}.json")
+
+    def _load(self, serial, firmware):
+        try:
+            with open(self._file(serial, firmware)) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, serial, firmware, name):
+        """Return the cached map, or None if missing or older than ttl."""
+        entry = self._load(serial, firmware).get(name)
+        if not isinstance(entry, dict):
+            return None
+        if time.time() - entry.get("created", 0) > self.ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, serial, firmware, name, data):
+        """Store a map; write errors are logged, never raised."""
+        maps = self._load(serial, firmware)
+        maps[name] = {"created": time.time(), "data": data}
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(maps, f)
+            os.replace(tmp, self._file(serial, firmware))
+        except OSError as e:
+            logger.debug("Port map cache write failed: %s", e)
+
+    def invalidate(self, serial, firmware):
+        """Drop every map cached for this device."""
+        try:
+            os.remove(self._file(serial, firmware))
+        except OSError:
+            pass
+
+
+def resolve_port_map_cache(value):
+    """Turn the 'port_map_cache' optional arg into a cache object.
+
+    None/False → no cache, True → PortMapCache() in DEFAULT_CACHE_DIR,
+    str → PortMapCache(path), anything else is used as-is.
+    """
+    if value is None or value is False:
+        return None
+    if value is True:
+        return PortMapCache()
+    if isinstance(value, str):
+        return PortMapCache(value)
+    return value
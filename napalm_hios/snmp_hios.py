@@ -11,22 +11,35 @@ HM2-DIAGNOSTIC-MIB. Uses raw OID strings — no MIB files needed.
 """
 
 import asyncio
+import collections
+import hashlib
+import hmac
 import ipaddress
+import os
 import re
 import logging
+import threading
+import time
 
 from pysnmp.hlapi.v3arch.asyncio import (
     SnmpEngine, CommunityData, UsmUserData, UdpTransportTarget, ContextData,
-    ObjectType, ObjectIdentity, get_cmd, set_cmd, bulk_walk_cmd,
-    usmHMACMD5AuthProtocol, usmDESPrivProtocol,
+    ObjectType, ObjectIdentity, get_cmd, set_cmd, bulk_cmd,
+    usmHMACMD5AuthProtocol, usmHMACSHAAuthProtocol,
+    usmDESPrivProtocol, usmAesCfb128Protocol, usmAesCfb256Protocol,
 )
 from pysnmp.proto.rfc1902 import (
     Integer32, Unsigned32, OctetString, ObjectIdentifier,
 )
-from pysnmp.proto.secmod.rfc3414.localkey import hash_passphrase_md5
+from pysnmp.proto import errind
+from pysnmp.proto.rfc1905 import EndOfMibView
+from pysnmp.proto.secmod.rfc3414.localkey import (
+    hash_passphrase_md5, hash_passphrase_sha,
+)
 from pysnmp.entity.config import USM_KEY_TYPE_MASTER
 from napalm.base.exceptions import ConnectionException
 
+from napalm_hios import hex_codec
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -980,13 +993,8 @@ def _decode_portlist(octets, bridge_port_to_name):
             except (UnicodeDecodeError, AttributeError):
                 return interfaces
 
-    for byte_idx, byte_val in enumerate(octets):
-        for bit_idx in range(8):
-            if byte_val & (0x80 >> bit_idx):
-                port_num = byte_idx * 8 + bit_idx + 1
-                name = bridge_port_to_name.get(str(port_num), f'port{port_num}')
-                interfaces.append(name)
-    return interfaces
+    return [bridge_port_to_name.get(str(p), f'port{p}')
+            for p in hex_codec.portlist_ports(octets)]
 
 
 def _encode_portlist(interfaces, name_to_bp, total_ports=None):
@@ -995,21 +1003,13 @@ def _encode_portlist(interfaces, name_to_bp, total_ports=None):
     Reverse of _decode_portlist(). Each bit = bridge port number (1-based,
     MSB of first octet = port 1).
     """
-    # Determine bitmap size
     bp_nums = []
     for iface in interfaces:
         bp = name_to_bp.get(iface)
         if bp is None:
             raise ValueError(f"Unknown interface '{iface}'")
         bp_nums.append(int(bp))
-    max_port = total_ports or (max(bp_nums) if bp_nums else 0)
-    num_bytes = (max_port + 7) // 8 if max_port else 0
-    bitmap = bytearray(num_bytes)
-    for bp in bp_nums:
-        byte_idx = (bp - 1) // 8
-        bit_idx = (bp - 1) % 8
-        bitmap[byte_idx] |= (0x80 >> bit_idx)
-    return bytes(bitmap)
+    return hex_codec.encode_portlist(bp_nums, total_ports)
 
 
 # MRP enum mappings
@@ -1267,6 +1267,174 @@ def _decode_implied_string(suffix_str):
         return suffix_str
 
 
+# ---------------------------------------------------------------------------
+# SNMPv3 USM keys
+# ---------------------------------------------------------------------------
+
+# auth name -> (pysnmp protocol, RFC 3414 password-to-key function)
+_AUTH_PROTOCOLS = {
+    'md5': (usmHMACMD5AuthProtocol, hash_passphrase_md5),
+    'sha': (usmHMACSHAAuthProtocol, hash_passphrase_sha),
+}
+
+_PRIV_PROTOCOLS = {
+    'des': usmDESPrivProtocol,
+    'aes128': usmAesCfb128Protocol,
+    'aes256': usmAesCfb256Protocol,
+}
+
+# Distinct (password, auth) master keys kept per process (LRU)
+_MASTER_KEY_CACHE_SIZE = 64
+
+# GETBULK sizing: starting repetitions per request, and the starting cap
+# on varbinds per response for lock-step table walks (columns x reps)
+_BULK_MAX_REPETITIONS = 25
+_BULK_MAX_VARBINDS = 50
+
+# Adaptive walks stay within these repetitions
+_BULK_MIN_REPETITIONS = 2
+_BULK_REPETITIONS_LIMIT = 200
+
+# (host, port, table OID) -> last max-repetitions that worked
+_bulk_repetitions = {}
+
+# Scalar GETs started within this many seconds of each other on the
+# session loop share one GET PDU
+_GET_COALESCE_WINDOW = 0.002
+
+# Per-session request budget: requests on the wire at once, and
+# requests per second (None = unlimited). HiOS agents answer one PDU
+# at a time, so a deeper queue on the switch only adds retransmits.
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_MAX_PPS = 100
+
+# (host, port) -> varbinds per GET that fit the agent's message size,
+# learnt from tooBig responses (unset = no limit seen yet)
+_get_max_varbinds = {}
+
+# (host, port) -> varbinds per SET that fit, for commit_staging()
+_set_max_varbinds = {}
+
+# Walk cache lifetime in seconds per column/table OID prefix (longest
+# prefix wins). Port identity barely changes; interface status and
+# counters are shared only between back-to-back getters. Anything not
+# listed (FDB, ARP, LLDP neighbours, ...) is always walked live.
+DEFAULT_WALK_CACHE_TTLS = {
+    OID_ifName: 300,
+    OID_ifDescr: 300,
+    OID_dot1dBasePortIfIndex: 300,
+    OID_lldpLocPortId: 300,
+    '1.3.6.1.2.1.2.2.1': 2,       # ifTable
+    '1.3.6.1.2.1.31.1.1.1': 2,    # ifXTable
+}
+
+
+class _SNMPStatusError(ConnectionException):
+    """The agent answered a request with a non-zero error-status."""
+
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.status = status
+
+
+class _RequestBudget:
+    """Paces the SNMP requests of one session towards its agent.
+
+    Requests queue in FIFO order for one of max_in_flight slots, so a
+    long walk (one request per response) takes turns with the other
+    getters instead of starving them, and are spaced to max_pps with a
+    burst of max_in_flight. A timeout halves the slots (down to one);
+    every answered request gives one back, up to max_in_flight.
+
+    Lives on one event loop; not thread-safe.
+    """
+
+    def __init__(self, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                 max_pps=DEFAULT_MAX_PPS):
+        self.max_in_flight = max_in_flight
+        self.max_pps = max_pps
+        self.limit = max_in_flight or 0  # current slots; 0 = unlimited
+        self.in_flight = 0
+        self._waiters = collections.deque()
+        self._next_send = 0.0   # theoretical time of the next request
+
+    async def acquire(self):
+        """Wait for a slot and the rate limit; release() must follow."""
+        if not self.limit or (self.in_flight < self.limit and not self._waiters):
+            self.in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if not waiter.cancelled():
+                    self._free()    # slot was handed over as we got cancelled
+                raise
+        if self.max_pps:
+            try:
+                await self._pace()
+            except asyncio.CancelledError:
+                self._free()
+                raise
+
+    async def _pace(self):
+        now = time.monotonic()
+        interval = 1 / self.max_pps
+        self._next_send = max(self._next_send, now) + interval
+        delay = self._next_send - now - (self.max_in_flight or 1) * interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def release(self, timed_out=False):
+        """Return a slot; timed_out backs off, an answer ramps back up."""
+        if self.max_in_flight:
+            if timed_out:
+                self.limit = max(1, self.limit // 2)
+            elif self.limit < self.max_in_flight:
+                self.limit += 1
+        self._free()
+
+    def _free(self):
+        self.in_flight -= 1
+        # Hand free slots straight to the oldest waiters
+        while self._waiters and (not self.limit or self.in_flight < self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+# Master key cache, keyed on a salted digest so no cleartext password is
+# held beyond the session that owns it. Salt is random per process.
+_master_key_salt = os.urandom(16)
+_master_keys = collections.OrderedDict()
+_master_keys_lock = threading.Lock()
+
+
+def _master_key(password, auth='md5'):
+    """RFC 3414 master key for a password (1 MB hash expansion).
+
+    Cached process-wide: the expansion costs ~10 ms and would otherwise
+    run for every GET and every walked column. The privacy master key
+    uses the auth hash too (RFC 3826), so one key serves both. pysnmp
+    localizes it with the agent's engine ID once per SnmpEngine.
+    """
+    digest = hmac.new(_master_key_salt, password.encode(),
+                      hashlib.sha256).digest()
+    with _master_keys_lock:
+        key = _master_keys.get((digest, auth))
+        if key is not None:
+            _master_keys.move_to_end((digest, auth))
+            return key
+    key = _AUTH_PROTOCOLS[auth][1](password.encode())
+    with _master_keys_lock:
+        _master_keys[(digest, auth)] = key
+        while len(_master_keys) > _MASTER_KEY_CACHE_SIZE:
+            _master_keys.popitem(last=False)
+    return key
+
+
 # ---------------------------------------------------------------------------
 # SNMP HiOS class
 # ---------------------------------------------------------------------------
@@ -1281,38 +1449,87 @@ class SNMPHIOS:
     Falls back to SNMPv2c when password is empty (community-only mode).
 
     Short passwords (< 8 chars, e.g. HiOS default "private") are handled
-    by pre-computing the MD5 master key, bypassing pysnmp's RFC 3414
-    minimum length enforcement.
-
-    Each public getter runs in its own asyncio.run() with a fresh
-    SnmpEngine, because pysnmp engines are bound to the event loop
-    that created them and cannot be reused across asyncio.run() calls.
+    by pre-computing the master key, bypassing pysnmp's RFC 3414
+    minimum length enforcement. auth_protocol ('md5'/'sha') and
+    priv_protocol ('des'/'aes128'/'aes256') match the HiOS user's
+    SNMP auth/encryption settings (default MD5/DES).
+
+    pysnmp engines are bound to the event loop that runs them, so open()
+    starts a background event loop thread owned by this instance. One
+    SnmpEngine and transport target live on it until close(), and the
+    sync getters hand their coroutines to it via _run(). Engine boot,
+    socket setup and USM discovery are paid once per session instead of
+    once per getter. Without open() (or after close()) each call falls
+    back to asyncio.run() with a fresh engine.
+
+    Every get_* has an awaitable aget_* twin for asyncio callers. From
+    another loop it is handed to the session loop; aopen() instead binds
+    the session to the caller's running loop, with no thread at all.
+
+    However many getters run at once, at most max_in_flight requests
+    are outstanding and at most max_pps sent per second (see
+    _RequestBudget); None lifts either limit.
     """
 
-    def __init__(self, hostname, username, password, timeout, port=161):
+    # Session event loop state, set by open() and cleared by close()
+    _loop = None
+    _loop_thread = None
+    _engine = None       # SnmpEngine living on _loop
+    _transport = None
+    _owns_loop = True   # False once aopen() adopts the caller's loop
+    _budget = None      # (loop, _RequestBudget) for the last loop used
+
+    def __init__(self, hostname, username, password, timeout, port=161,
+                 port_map_cache=None, auth_protocol='md5', priv_protocol='des',
+                 max_repetitions=None, walk_cache_ttls=None,
+                 max_in_flight=DEFAULT_MAX_IN_FLIGHT, max_pps=DEFAULT_MAX_PPS):
+        if auth_protocol not in _AUTH_PROTOCOLS:
+            raise ValueError(f"Invalid auth_protocol '{auth_protocol}': "
+                             f"use {', '.join(_AUTH_PROTOCOLS)}")
+        if priv_protocol not in _PRIV_PROTOCOLS:
+            raise ValueError(f"Invalid priv_protocol '{priv_protocol}': "
+                             f"use {', '.join(_PRIV_PROTOCOLS)}")
         self.hostname = hostname
         self.username = username
         self.password = password
         self.timeout = timeout
         self.port = port
+        self.auth_protocol = auth_protocol
+        self.priv_protocol = priv_protocol
+        self.max_repetitions = max_repetitions  # GETBULK; None = adaptive
+        self.max_in_flight = max_in_flight
+        self.max_pps = max_pps
+        self.port_map_cache = port_map_cache  # see port_map_cache.PortMapCache
+        # {OID prefix: seconds}; {} disables the walk cache
+        self.walk_cache_ttls = (DEFAULT_WALK_CACHE_TTLS if walk_cache_ttls is None
+                                else dict(walk_cache_ttls))
+        self._walk_cache = {}     # base OID -> (expires, {suffix: value})
+        self._pending_gets = []   # [(oids, future)] awaiting _flush_gets()
+        self._get_tasks = set()   # in-flight coalesced GETs
+        self._staging = False
+        self._staged_sets = {}    # OID -> value queued by _apply_sets()
         self._connected = False
+        self._responded = False   # agent has answered at least one request
         self._ifindex_map = None  # cached ifIndex -> name mapping
+        self._bp_map = None       # bridge port -> ifIndex, from port_map_cache
+        self._device_key = None   # (serial, firmware) for port_map_cache
+        self._saved_ifindex = None
 
     def _build_auth(self):
         """Build pysnmp auth object (SNMPv3 or SNMPv2c).
 
-        SNMPv3 authPriv when password is set (uses MD5/DES, pre-computed
-        master key to handle passwords shorter than 8 chars).
+        SNMPv3 authPriv when password is set (auth_protocol/priv_protocol,
+        cached master key — also handles passwords shorter than 8 chars).
         SNMPv2c when password is empty (community = username).
         """
         if self.password:
-            # SNMPv3 authPriv — pre-compute master key to bypass 8-char limit
-            master_key = hash_passphrase_md5(self.password.encode())
+            # SNMPv3 authPriv — pre-computed master key bypasses 8-char limit
+            master_key = _master_key(self.password, self.auth_protocol)
             return UsmUserData(
                 self.username,
                 authKey=master_key, privKey=master_key,
-                authProtocol=usmHMACMD5AuthProtocol,
-                privProtocol=usmDESPrivProtocol,
+                authProtocol=_AUTH_PROTOCOLS[self.auth_protocol][0],
+                privProtocol=_PRIV_PROTOCOLS[self.priv_protocol],
                 authKeyType=USM_KEY_TYPE_MASTER,
                 privKeyType=USM_KEY_TYPE_MASTER,
             )
@@ -1325,64 +1542,316 @@ class SNMPHIOS:
     # ------------------------------------------------------------------
 
     def open(self):
-        """Validate SNMP connectivity with a sysDescr GET."""
+        """Validate SNMP connectivity with a sysDescr GET.
+
+        With a port_map_cache the serial number rides along in the same
+        GET, and cached port maps for this serial+firmware are loaded.
+        """
+        self._start_loop()
         try:
-            result = asyncio.run(self._get_scalar(OID_sysDescr))
-            if OID_sysDescr not in result:
-                raise ConnectionException(f"No sysDescr response from {self.hostname}")
-            self._connected = True
-        except ConnectionException:
-            raise
+            result = self._run(self._get_scalar(*self._open_oids()))
+        except Exception as e:
+            self._open_failed(e)
+        self._opened(result)
+
+    async def aopen(self):
+        """open() on the running event loop, without a session thread.
+
+        The session engine and transport live on the caller's loop, so
+        aget_* run inline and many switches can share one loop. Sync
+        methods must then be called from another thread.
+        """
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._loop_thread = threading.current_thread()
+            self._owns_loop = False
+        try:
+            result = await self._arun(self._get_scalar(*self._open_oids()))
         except Exception as e:
-            raise ConnectionException(f"Cannot set up SNMP for {self.hostname}: {e}")
+            self._open_failed(e)
+        self._opened(result)
+
+    def _open_oids(self):
+        oids = [OID_sysDescr]
+        if self.port_map_cache is not None:
+            oids.append(OID_hm2SerialNumber)
+        return oids
+
+    def _open_failed(self, e):
+        self._stop_loop()
+        if isinstance(e, ConnectionException):
+            raise e
+        raise ConnectionException(f"Cannot set up SNMP for {self.hostname}: {e}")
+
+    def _opened(self, result):
+        """Finish open()/aopen() from the sysDescr probe result."""
+        if OID_sysDescr not in result:
+            self._open_failed(ConnectionException(
+                f"No sysDescr response from {self.hostname}"))
+        self._connected = True
+        serial = str(result.get(OID_hm2SerialNumber, '')).strip()
+        if self.port_map_cache is not None and serial:
+            _, firmware = _parse_sysDescr(str(result[OID_sysDescr]))
+            self._load_port_maps(serial, firmware)
 
     def close(self):
         """Close SNMP session."""
+        self._stop_loop()
         self._connected = False
         self._ifindex_map = None
+        self._bp_map = None
+        self._device_key = None
+        self._saved_ifindex = None
+        self._walk_cache.clear()
+        self._staging = False
+        self._staged_sets = {}
+
+    async def aclose(self):
+        """close() from a coroutine; safe on the loop aopen() adopted."""
+        self.close()
+
+    def _load_port_maps(self, serial, firmware):
+        """Warm ifIndex and bridge-port maps from port_map_cache."""
+        self._device_key = (serial, firmware)
+        cached = self.port_map_cache.get(serial, firmware, "ifindex")
+        if cached:
+            self._ifindex_map = dict(cached)
+            self._saved_ifindex = dict(cached)
+            self._bp_map = self.port_map_cache.get(
+                serial, firmware, "bridge_ports")
+
+    def _save_port_maps(self):
+        """Persist a freshly walked ifIndex map if it differs from the cache.
+
+        A different map means the module layout changed, so every map
+        cached for the device (bridge ports too) is dropped first.
+        """
+        if (self._device_key is None or not self._ifindex_map
+                or self._ifindex_map == self._saved_ifindex):
+            return
+        serial, firmware = self._device_key
+        if self._saved_ifindex is not None:
+            self.port_map_cache.invalidate(serial, firmware)
+            self._bp_map = None
+        self.port_map_cache.set(serial, firmware, "ifindex", self._ifindex_map)
+        self._saved_ifindex = dict(self._ifindex_map)
+
+    # ------------------------------------------------------------------
+    # Session event loop
+    # ------------------------------------------------------------------
+
+    def _start_loop(self):
+        """Start the session event loop thread (no-op if running)."""
+        if self._loop is not None:
+            return
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True,
+                                  name=f"snmp-{self.hostname}")
+        thread.start()
+        self._loop, self._loop_thread = loop, thread
+
+    def _stop_loop(self):
+        """Close the session engine and stop the event loop thread.
+
+        A loop adopted by aopen() belongs to the caller and keeps running.
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        if self._engine is not None:
+            try:
+                if self._on_session_loop():
+                    self._engine.close_dispatcher()
+                elif loop.is_running():
+                    self._run(self._close_engine())
+            except Exception as e:
+                logger.debug("SNMP engine close failed: %s", e)
+        if self._owns_loop:
+            loop.call_soon_threadsafe(loop.stop)
+            self._loop_thread.join(timeout=5)
+            if not self._loop_thread.is_alive():
+                loop.close()
+        self._loop = self._loop_thread = None
+        self._owns_loop = True
+        self._engine = self._transport = self._budget = None
+
+    async def _close_engine(self):
+        self._engine.close_dispatcher()
+
+    def _run(self, coro):
+        """Run a coroutine from sync code and return its result.
+
+        Dispatched to the session loop while open, else asyncio.run().
+        """
+        loop = self._loop
+        if loop is None:
+            return asyncio.run(coro)
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError(
+                "SNMPHIOS sync method called from its own event loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _arun(self, coro):
+        """Await a coroutine from any event loop (the aget_* API).
+
+        Runs inline on the session loop, or when no session is open;
+        from any other loop it is handed to the session loop and awaited
+        without blocking the caller.
+        """
+        loop = self._loop
+        if loop is None or self._on_session_loop():
+            return await coro
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def _on_session_loop(self):
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _get_engine(self):
+        """SnmpEngine for the running loop — the session engine when on it."""
+        if self._loop is None or not self._on_session_loop():
+            return SnmpEngine()
+        if self._engine is None:
+            self._engine = SnmpEngine()
+        return self._engine
+
+    async def _get_transport(self):
+        """UDP transport target — resolved once per session when on its loop."""
+        if self._loop is None or not self._on_session_loop():
+            return await UdpTransportTarget.create(
+                (self.hostname, self.port), timeout=self.timeout, retries=1,
+            )
+        if self._transport is None:
+            self._transport = await UdpTransportTarget.create(
+                (self.hostname, self.port), timeout=self.timeout, retries=1,
+            )
+        return self._transport
+
+    def _get_budget(self):
+        """Request budget shared by everything on the running loop."""
+        loop = asyncio.get_running_loop()
+        current = self._budget
+        if current is None or current[0] is not loop:
+            current = self._budget = (
+                loop, _RequestBudget(self.max_in_flight, self.max_pps))
+        return current[1]
 
     # ------------------------------------------------------------------
     # Core SNMP plumbing (async)
     # ------------------------------------------------------------------
 
+    async def _send(self, command, *args, **kwargs):
+        """Send one request (get_cmd, bulk_cmd, set_cmd) within the budget.
+
+        Returns the command's (errorIndication, errorStatus, errorIndex,
+        varBinds); a timeout makes the budget back off.
+        """
+        budget = self._get_budget()
+        await budget.acquire()
+        timed_out = False
+        try:
+            result = await command(*args, **kwargs)
+            timed_out = isinstance(result[0], errind.RequestTimedOut)
+            if not result[0]:
+                self._responded = True
+            return result
+        finally:
+            budget.release(timed_out)
+
     async def _get_scalar(self, *oids):
         """GET scalar values. Appends .0 to each OID unless it already
-        contains a table index (detected by having 12+ dot-separated parts).
+        contains a table index (detected by having 14+ dot-separated parts).
+
+        On the session loop, calls started within _GET_COALESCE_WINDOW of
+        each other are answered by one GET PDU (see _flush_gets()), so
+        getters gathered together cost a single round-trip.
 
         Returns {base_oid: value, ...}.
         """
-        engine = SnmpEngine()
-        transport = await UdpTransportTarget.create(
-            (self.hostname, self.port), timeout=self.timeout, retries=1,
-        )
-        auth = self._build_auth()
-        object_types = []
-        for oid in oids:
-            # Table row OIDs (like fw version 1.1.1 index) are already fully qualified
-            if len(oid.split('.')) >= 14:
-                object_types.append(ObjectType(ObjectIdentity(oid)))
+        # Table row OIDs (like fw version 1.1.1 index) are already fully qualified
+        requested = [oid if len(oid.split('.')) >= 14 else oid + '.0'
+                     for oid in oids]
+        if self._loop is None or not self._on_session_loop():
+            values = await self._get_oids(requested)
+        else:
+            future = self._loop.create_future()
+            if not self._pending_gets:
+                self._loop.call_later(_GET_COALESCE_WINDOW, self._flush_gets)
+            self._pending_gets.append((requested, future))
+            values = await future
+        return {oid: values[full] for oid, full in zip(oids, requested)
+                if full in values}
+
+    def _flush_gets(self):
+        """Send the GETs queued by _get_scalar() as one request."""
+        batch, self._pending_gets = self._pending_gets, []
+        task = asyncio.ensure_future(self._send_gets(batch))
+        self._get_tasks.add(task)
+        task.add_done_callback(self._get_tasks.discard)
+
+    async def _send_gets(self, batch):
+        """Answer a batch of queued _get_scalar() calls.
+
+        All OIDs go out together. If the agent rejects the merged request
+        (noSuchName, genErr, ...) each caller is retried on its own, so one
+        getter's bad OID fails only that getter.
+        """
+        oids = list(dict.fromkeys(oid for requested, _ in batch
+                                  for oid in requested))
+        values = error = None
+        try:
+            values = await self._get_oids(oids)
+        except _SNMPStatusError as e:
+            if len(batch) > 1:
+                await asyncio.gather(*(self._send_gets([item]) for item in batch))
+                return
+            error = e
+        except Exception as e:
+            error = e
+        for _, future in batch:
+            if future.done():
+                continue    # caller was cancelled
+            if error is not None:
+                future.set_exception(error)
             else:
-                object_types.append(ObjectType(ObjectIdentity(oid + '.0')))
-        errorIndication, errorStatus, errorIndex, varBinds = await get_cmd(
-            engine, auth, transport, ContextData(), *object_types,
-        )
-        if errorIndication:
-            raise ConnectionException(f"SNMP error: {errorIndication}")
-        if errorStatus:
-            raise ConnectionException(
-                f"SNMP error: {errorStatus.prettyPrint()} at "
-                f"{varBinds[int(errorIndex) - 1][0] if errorIndex else '?'}"
-            )
+                future.set_result(values)
+
+    async def _get_oids(self, oids):
+        """GET fully qualified OIDs in as few PDUs as the agent accepts.
+
+        Requests are only split once the agent has answered tooBig; the
+        size that fits is kept per device in _get_max_varbinds.
+
+        Returns {oid: value, ...}.
+        """
+        engine = self._get_engine()
+        transport = await self._get_transport()
+        auth = self._build_auth()
+        key = (self.hostname, self.port)
         result = {}
-        for oid_obj, val in varBinds:
-            oid_str = str(oid_obj)
-            # Strip trailing .0 to get base OID for scalar OIDs
-            if oid_str.endswith('.0'):
-                base = oid_str[:-2]
-                # Only strip .0 if the base matches one of the requested OIDs
-                if base in oids:
-                    oid_str = base
-            result[oid_str] = val
+        while oids:
+            chunk = oids[:_get_max_varbinds.get(key, len(oids))]
+            errorIndication, errorStatus, errorIndex, varBinds = await self._send(
+                get_cmd, engine, auth, transport, ContextData(),
+                *(ObjectType(ObjectIdentity(oid)) for oid in chunk),
+            )
+            if errorIndication:
+                raise ConnectionException(f"SNMP error: {errorIndication}")
+            if errorStatus:
+                if int(errorStatus) == 1 and len(chunk) > 1:   # tooBig
+                    _get_max_varbinds[key] = (len(chunk) + 1) // 2
+                    continue
+                raise _SNMPStatusError(
+                    f"SNMP error: {errorStatus.prettyPrint()} at "
+                    f"{varBinds[int(errorIndex) - 1][0] if errorIndex else '?'}",
+                    int(errorStatus))
+            for oid_obj, val in varBinds:
+                result[str(oid_obj)] = val
+            oids = oids[len(chunk):]
         return result
 
     async def _walk(self, base_oid, engine=None):
@@ -1392,43 +1861,16 @@ class SNMPHIOS:
         after base_oid (e.g. '.1' for ifIndex row 1).
 
         Accepts an optional engine to share across parallel walks
-        within the same asyncio.run() call.
+        (defaults to the session engine, see _get_engine()).
         """
-        if engine is None:
-            engine = SnmpEngine()
-        transport = await UdpTransportTarget.create(
-            (self.hostname, self.port), timeout=self.timeout, retries=1,
-        )
-        auth = self._build_auth()
-        result = {}
-        base_prefix = base_oid + '.'
-        async for errorIndication, errorStatus, errorIndex, varBinds in bulk_walk_cmd(
-            engine, auth, transport, ContextData(),
-            0, 25,  # nonRepeaters=0, maxRepetitions=25
-            ObjectType(ObjectIdentity(base_oid)),
-            lookupMib=False,
-        ):
-            if errorIndication:
-                logger.warning("SNMP walk error for %s: %s", base_oid, errorIndication)
-                break
-            if errorStatus:
-                logger.warning("SNMP walk status error for %s: %s", base_oid, errorStatus)
-                break
-            for oid_obj, val in varBinds:
-                oid_str = str(oid_obj)
-                if not oid_str.startswith(base_prefix):
-                    break
-                suffix = oid_str[len(base_prefix):]
-                result[suffix] = val
-            else:
-                # Inner for completed without break — all OIDs still in tree
-                continue
-            # Inner for hit break (out-of-tree OID) — stop outer loop too
-            break
-        return result
+        return (await self._bulk_walk([base_oid], engine))[0]
 
     async def _walk_columns(self, oid_map, engine=None):
-        """Walk multiple columns in parallel, merge by row index.
+        """Walk table columns in lock-step, merging rows by index.
+
+        All columns ride in one GETBULK varbind list (see _bulk_walk()),
+        so a 12-column table is one request stream instead of twelve
+        parallel walks.
 
         Args:
             oid_map: {'col_name': oid_string, ...}
@@ -1437,18 +1879,153 @@ class SNMPHIOS:
         Returns:
             {row_idx: {'col_name': value, ...}, ...}
         """
-        if engine is None:
-            engine = SnmpEngine()
-        names = list(oid_map.keys())
-        oids = [oid_map[n] for n in names]
-        results = await asyncio.gather(*(self._walk(oid, engine) for oid in oids))
-
+        if len(oid_map) == 1:
+            (name, oid), = oid_map.items()
+            data = await self._walk(oid, engine)
+            return {suffix: {name: val} for suffix, val in data.items()}
+        names = list(oid_map)
+        results = await self._bulk_walk([oid_map[n] for n in names], engine)
         merged = {}
         for col_name, col_data in zip(names, results):
             for suffix, val in col_data.items():
                 merged.setdefault(suffix, {})[col_name] = val
         return merged
 
+    async def _bulk_walk(self, base_oids, engine=None):
+        """Walk columns, serving those with a walk_cache_ttls entry from cache.
+
+        Cached columns are fresh copies; only the rest go on the wire.
+        Returns [{suffix: value, ...}, ...] in base_oids order.
+        """
+        now = time.monotonic()
+        cached = {}
+        for oid in base_oids:
+            entry = self._walk_cache.get(oid)
+            if entry is not None and entry[0] > now:
+                cached[oid] = entry[1]
+        missing = [oid for oid in base_oids if oid not in cached]
+        if missing:
+            walked, complete = await self._bulk_walk_live(missing, engine)
+            for oid, data in zip(missing, walked):
+                cached[oid] = data
+                ttl = self._walk_ttl(oid)
+                if complete and ttl > 0:
+                    self._walk_cache[oid] = (time.monotonic() + ttl, data)
+        return [dict(cached[oid]) for oid in base_oids]
+
+    def _walk_ttl(self, oid):
+        """Cache lifetime for a column: longest matching walk_cache_ttls prefix."""
+        best, ttl = -1, 0
+        for prefix, seconds in self.walk_cache_ttls.items():
+            if (oid == prefix or oid.startswith(prefix + '.')) and len(prefix) > best:
+                best, ttl = len(prefix), seconds
+        return ttl
+
+    def _invalidate_walks(self, *oids):
+        """Drop cached walks overlapping any of oids (all when none given)."""
+        if not oids:
+            self._walk_cache.clear()
+            return
+        for key in list(self._walk_cache):
+            if any(key == o or key.startswith(o + '.') or o.startswith(key + '.')
+                   for o in oids):
+                del self._walk_cache[key]
+
+    async def _bulk_walk_live(self, base_oids, engine=None):
+        """Walk one or more columns with GETBULK, advancing them in lock-step.
+
+        Each column advances from its own last OID and drops out when it
+        leaves its subtree, hits endOfMibView or stops increasing; a
+        truncated response (partial last row) just continues from there.
+
+        max-repetitions adapts unless self.max_repetitions is set: it
+        doubles while full responses come back, drops to the rows that
+        fit when the agent truncates, halves on tooBig and quarters on
+        a timeout (once per walk, and only after the agent has answered —
+        an unreachable agent fails on its first timeout). The last working value is kept per
+        device and table in _bulk_repetitions, so LAN and VPN targets
+        each settle on their own size.
+
+        Returns ([{suffix: value, ...}, ...] in base_oids order, complete),
+        where complete is False if an error cut the walk short.
+        """
+        if engine is None:
+            engine = self._get_engine()
+        transport = await self._get_transport()
+        auth = self._build_auth()
+        results = [{} for _ in base_oids]
+        prefixes = [oid + '.' for oid in base_oids]
+        cursors = list(base_oids)   # last OID seen per column
+        active = list(range(len(base_oids)))
+        key = (self.hostname, self.port, base_oids[0].rsplit('.', 1)[0])
+        adaptive = self.max_repetitions is None
+        if adaptive:
+            reps = _bulk_repetitions.get(key) or max(1, min(
+                _BULK_MAX_REPETITIONS, _BULK_MAX_VARBINDS // len(active)))
+        else:
+            reps = self.max_repetitions
+        good = None                 # last reps that got a clean response
+        timeout_retry = True
+        complete = True
+        while active:
+            width = len(active)
+            errorIndication, errorStatus, errorIndex, varBinds = await self._send(
+                bulk_cmd, engine, auth, transport, ContextData(), 0, reps,
+                *(ObjectType(ObjectIdentity(cursors[c])) for c in active),
+                lookupMib=False,
+            )
+            if errorIndication:
+                if (adaptive and timeout_retry and reps > _BULK_MIN_REPETITIONS
+                        and (good is not None or self._responded)
+                        and isinstance(errorIndication, errind.RequestTimedOut)):
+                    # Large responses lost on the path (fragments dropped)
+                    timeout_retry = False
+                    reps = max(_BULK_MIN_REPETITIONS, reps // 4)
+                    continue
+                logger.warning("SNMP walk error for %s: %s",
+                               base_oids[0], errorIndication)
+                complete = False
+                break
+            if errorStatus:
+                if adaptive and int(errorStatus) == 1 and reps > 1:   # tooBig
+                    reps = max(1, reps // 2)
+                    continue
+                logger.warning("SNMP walk status error for %s: %s",
+                               base_oids[0], errorStatus)
+                complete = False
+                break
+            # varBinds are row-major, width per repetition
+            finished = set()
+            progressed = False
+            for pos, (oid_obj, val) in enumerate(varBinds):
+                col = active[pos % width]
+                if col in finished:
+                    continue
+                oid_str = str(oid_obj)
+                prefix = prefixes[col]
+                if (isinstance(val, EndOfMibView)
+                        or not oid_str.startswith(prefix)
+                        or oid_str == cursors[col]):
+                    finished.add(col)
+                    continue
+                results[col][oid_str[len(prefix):]] = val
+                cursors[col] = oid_str
+                progressed = True
+            if not progressed:
+                break
+            active = [c for c in active if c not in finished]
+            good = reps
+            if adaptive and active:
+                rows = len(varBinds) // width
+                if rows < reps:
+                    # Agent truncated to its message size — ask for what fits
+                    reps = max(1, rows)
+                else:
+                    reps = min(_BULK_REPETITIONS_LIMIT, reps * 2)
+        if adaptive and good is not None:
+            _bulk_repetitions[key] = good
+        return results, complete
+
     async def _build_ifindex_map(self, engine=None):
         """Build and cache ifIndex -> interface name mapping.
 
@@ -1459,17 +2036,32 @@ class SNMPHIOS:
             return self._ifindex_map
         data = await self._walk(OID_ifName, engine)
         self._ifindex_map = {idx: str(val) for idx, val in data.items()}
+        self._save_port_maps()
         return self._ifindex_map
 
+    async def _walk_bridge_ports(self, engine):
+        """bridge port -> ifIndex (dot1dBasePortIfIndex).
+
+        Served from port_map_cache when warm; walked (and stored) otherwise.
+        """
+        if self._bp_map is not None:
+            return self._bp_map
+        bp_data = await self._walk(OID_dot1dBasePortIfIndex, engine)
+        if self._device_key is not None and bp_data:
+            self._bp_map = {bp: str(ifidx) for bp, ifidx in bp_data.items()}
+            self.port_map_cache.set(*self._device_key, "bridge_ports",
+                                    self._bp_map)
+        return bp_data
+
     async def _build_bp_to_name(self, ifmap, engine):
         """Build bridge-port number -> interface name mapping."""
-        bp_data = await self._walk(OID_dot1dBasePortIfIndex, engine)
+        bp_data = await self._walk_bridge_ports(engine)
         return {bp: ifmap.get(str(ifidx), f'if{ifidx}')
                 for bp, ifidx in bp_data.items()}
 
     async def _build_name_to_bp(self, ifmap, engine):
         """Build interface name -> bridge-port number mapping."""
-        bp_data = await self._walk(OID_dot1dBasePortIfIndex, engine)
+        bp_data = await self._walk_bridge_ports(engine)
         return {ifmap.get(str(ifidx), f'if{ifidx}'): bp
                 for bp, ifidx in bp_data.items()}
 
@@ -1479,10 +2071,17 @@ class SNMPHIOS:
 
     def get_facts(self):
         """Return device facts from standard + Hirschmann private MIBs."""
-        return asyncio.run(self._get_facts_async())
+        return self._run(self._get_facts_async())
+
+    async def aget_facts(self):
+        """Awaitable get_facts()."""
+        return await self._arun(self._get_facts_async())
 
     async def _get_facts_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
+        if self._device_key is not None:
+            # Re-walk so a changed module layout refreshes port_map_cache
+            self._ifindex_map = None
         scalars, ifmap = await asyncio.gather(
             self._get_scalar(
                 OID_sysName, OID_sysUpTime, OID_sysDescr,
@@ -1527,10 +2126,14 @@ class SNMPHIOS:
 
     def get_interfaces(self):
         """Return interface details from IF-MIB ifTable + ifXTable."""
-        return asyncio.run(self._get_interfaces_async())
+        return self._run(self._get_interfaces_async())
+
+    async def aget_interfaces(self):
+        """Awaitable get_interfaces()."""
+        return await self._arun(self._get_interfaces_async())
 
     async def _get_interfaces_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         rows = await self._walk_columns({
             'name': OID_ifName,
             'oper': OID_ifOperStatus,
@@ -1569,10 +2172,14 @@ class SNMPHIOS:
 
     def get_interfaces_ip(self):
         """Return interface IP addresses from IP-MIB ipAddrTable."""
-        return asyncio.run(self._get_interfaces_ip_async())
+        return self._run(self._get_interfaces_ip_async())
+
+    async def aget_interfaces_ip(self):
+        """Awaitable get_interfaces_ip()."""
+        return await self._arun(self._get_interfaces_ip_async())
 
     async def _get_interfaces_ip_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         rows = await self._walk_columns({
             'ifindex': OID_ipAdEntIfIndex,
@@ -1593,10 +2200,14 @@ class SNMPHIOS:
 
     def get_interfaces_counters(self):
         """Return interface counters from IF-MIB HC counters."""
-        return asyncio.run(self._get_interfaces_counters_async())
+        return self._run(self._get_interfaces_counters_async())
+
+    async def aget_interfaces_counters(self):
+        """Awaitable get_interfaces_counters()."""
+        return await self._arun(self._get_interfaces_counters_async())
 
     async def _get_interfaces_counters_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         rows = await self._walk_columns({
             'rx_octets': OID_ifHCInOctets,
@@ -1633,10 +2244,14 @@ class SNMPHIOS:
 
     def get_arp_table(self, vrf=''):
         """Return ARP table from IP-MIB ipNetToMediaTable."""
-        return asyncio.run(self._get_arp_table_async())
+        return self._run(self._get_arp_table_async())
+
+    async def aget_arp_table(self, vrf=''):
+        """Awaitable get_arp_table()."""
+        return await self._arun(self._get_arp_table_async())
 
     async def _get_arp_table_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         rows = await self._walk_columns({
             'mac': OID_ipNetToMediaPhysAddress,
@@ -1661,10 +2276,14 @@ class SNMPHIOS:
 
     def get_mac_address_table(self):
         """Return MAC address table from Q-BRIDGE-MIB + BRIDGE-MIB."""
-        return asyncio.run(self._get_mac_address_table_async())
+        return self._run(self._get_mac_address_table_async())
+
+    async def aget_mac_address_table(self):
+        """Awaitable get_mac_address_table()."""
+        return await self._arun(self._get_mac_address_table_async())
 
     async def _get_mac_address_table_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
 
         bp_to_name = await self._build_bp_to_name(ifmap, engine)
@@ -1705,10 +2324,14 @@ class SNMPHIOS:
 
     def get_lldp_neighbors(self):
         """Return LLDP neighbors from LLDP-MIB."""
-        return asyncio.run(self._get_lldp_neighbors_async())
+        return self._run(self._get_lldp_neighbors_async())
+
+    async def aget_lldp_neighbors(self):
+        """Awaitable get_lldp_neighbors()."""
+        return await self._arun(self._get_lldp_neighbors_async())
 
     async def _get_lldp_neighbors_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
 
         # Get local port number -> ifIndex mapping
@@ -1758,10 +2381,14 @@ class SNMPHIOS:
 
     def get_lldp_neighbors_detail(self, interface=''):
         """Return detailed LLDP neighbor info from LLDP-MIB."""
-        return asyncio.run(self._get_lldp_neighbors_detail_async(interface))
+        return self._run(self._get_lldp_neighbors_detail_async(interface))
+
+    async def aget_lldp_neighbors_detail(self, interface=''):
+        """Awaitable get_lldp_neighbors_detail()."""
+        return await self._arun(self._get_lldp_neighbors_detail_async(interface))
 
     async def _get_lldp_neighbors_detail_async(self, interface=''):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         loc_ports = await self._walk(OID_lldpLocPortId, engine)
 
@@ -1843,10 +2470,14 @@ class SNMPHIOS:
 
     def get_vlans(self):
         """Return VLAN info from Q-BRIDGE-MIB + BRIDGE-MIB."""
-        return asyncio.run(self._get_vlans_async())
+        return self._run(self._get_vlans_async())
+
+    async def aget_vlans(self):
+        """Awaitable get_vlans()."""
+        return await self._arun(self._get_vlans_async())
 
     async def _get_vlans_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
 
         bp_to_name = await self._build_bp_to_name(ifmap, engine)
@@ -1873,10 +2504,14 @@ class SNMPHIOS:
 
     def get_vlan_ingress(self, *ports):
         """Return per-port ingress settings from Q-BRIDGE-MIB."""
-        return asyncio.run(self._get_vlan_ingress_async(*ports))
+        return self._run(self._get_vlan_ingress_async(*ports))
+
+    async def aget_vlan_ingress(self, *ports):
+        """Awaitable get_vlan_ingress()."""
+        return await self._arun(self._get_vlan_ingress_async(*ports))
 
     async def _get_vlan_ingress_async(self, *ports):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         bp_to_name = await self._build_bp_to_name(ifmap, engine)
 
@@ -1903,10 +2538,14 @@ class SNMPHIOS:
 
     def get_vlan_egress(self, *ports):
         """Return per-VLAN-per-port membership (T/U/F) from Q-BRIDGE-MIB."""
-        return asyncio.run(self._get_vlan_egress_async(*ports))
+        return self._run(self._get_vlan_egress_async(*ports))
+
+    async def aget_vlan_egress(self, *ports):
+        """Awaitable get_vlan_egress()."""
+        return await self._arun(self._get_vlan_egress_async(*ports))
 
     async def _get_vlan_egress_async(self, *ports):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         bp_to_name = await self._build_bp_to_name(ifmap, engine)
 
@@ -1954,13 +2593,13 @@ class SNMPHIOS:
         Args:
             port: port name (str) or list of port names
         """
-        return asyncio.run(self._set_vlan_ingress_async(
+        return self._run(self._set_vlan_ingress_async(
             port, pvid, frame_types, ingress_filtering))
 
     async def _set_vlan_ingress_async(self, port, pvid, frame_types,
                                        ingress_filtering):
         ports = [port] if isinstance(port, str) else list(port)
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         name_to_bp = await self._build_name_to_bp(ifmap, engine)
 
@@ -1991,7 +2630,7 @@ class SNMPHIOS:
                 sets.append((f"{OID_dot1qPortIngressFiltering}.{bp}",
                              Integer32(1 if ingress_filtering else 2)))
         if sets:
-            await self._set_oids(*sets)
+            await self._apply_sets(*sets)
 
     def set_vlan_egress(self, vlan_id, port, mode):
         """Set port(s) VLAN membership via SNMP.
@@ -1999,7 +2638,7 @@ class SNMPHIOS:
         Args:
             port: port name (str) or list of port names
         """
-        return asyncio.run(self._set_vlan_egress_async(vlan_id, port, mode))
+        return self._run(self._set_vlan_egress_async(vlan_id, port, mode))
 
     async def _set_vlan_egress_async(self, vlan_id, port, mode):
         if mode not in ('tagged', 'untagged', 'forbidden', 'none'):
@@ -2008,7 +2647,7 @@ class SNMPHIOS:
                 f"'forbidden', or 'none'")
 
         ports = [port] if isinstance(port, str) else list(port)
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         name_to_bp = await self._build_name_to_bp(ifmap, engine)
 
@@ -2020,13 +2659,15 @@ class SNMPHIOS:
                 raise ValueError(f"Unknown interface '{p}'")
             bp_ints.append(int(bp))
 
-        # Read current bitmaps for this VLAN
+        # Read current bitmaps for this VLAN (including staged edits)
         vid = str(vlan_id)
-        rows = await self._walk_columns({
+        columns = {
             'egress': OID_dot1qVlanStaticEgressPorts,
             'untagged': OID_dot1qVlanStaticUntaggedPorts,
             'forbidden': OID_dot1qVlanStaticForbiddenEgressPorts,
-        }, engine)
+        }
+        rows = self._overlay_staged(
+            await self._walk_columns(columns, engine), columns)
 
         if vid not in rows:
             raise ValueError(f"VLAN {vlan_id} does not exist")
@@ -2072,7 +2713,7 @@ class SNMPHIOS:
                 untagged[byte_idx] &= ~bit_mask
                 forbidden[byte_idx] &= ~bit_mask
 
-        await self._set_oids(
+        await self._apply_sets(
             (f"{OID_dot1qVlanStaticEgressPorts}.{vid}",
              OctetString(bytes(egress))),
             (f"{OID_dot1qVlanStaticUntaggedPorts}.{vid}",
@@ -2091,11 +2732,11 @@ class SNMPHIOS:
             port: port name (str) or list of port names
             vlan_id: target VLAN ID (must already exist)
         """
-        return asyncio.run(self._set_access_port_async(port, vlan_id))
+        return self._run(self._set_access_port_async(port, vlan_id))
 
     async def _set_access_port_async(self, port, vlan_id):
         ports = [port] if isinstance(port, str) else list(port)
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         name_to_bp = await self._build_name_to_bp(ifmap, engine)
 
@@ -2106,11 +2747,13 @@ class SNMPHIOS:
                 raise ValueError(f"Unknown interface '{p}'")
             bp_ints.append(int(bp))
 
-        # Read all VLAN bitmaps
-        rows = await self._walk_columns({
+        # Read all VLAN bitmaps (including staged edits)
+        columns = {
             'egress': OID_dot1qVlanStaticEgressPorts,
             'untagged': OID_dot1qVlanStaticUntaggedPorts,
-        }, engine)
+        }
+        rows = self._overlay_staged(
+            await self._walk_columns(columns, engine), columns)
 
         vid = str(vlan_id)
         if vid not in rows:
@@ -2165,11 +2808,11 @@ class SNMPHIOS:
                          Unsigned32(int(vlan_id))))
 
         if sets:
-            await self._set_oids(*sets)
+            await self._apply_sets(*sets)
 
     def create_vlan(self, vlan_id, name=''):
         """Create a VLAN in the VLAN database via SNMP."""
-        return asyncio.run(self._create_vlan_async(vlan_id, name))
+        return self._run(self._create_vlan_async(vlan_id, name))
 
     async def _create_vlan_async(self, vlan_id, name):
         sets = [(f"{OID_dot1qVlanStaticRowStatus}.{vlan_id}",
@@ -2181,14 +2824,14 @@ class SNMPHIOS:
 
     def update_vlan(self, vlan_id, name):
         """Rename an existing VLAN via SNMP."""
-        return asyncio.run(self._set_oids(
+        return self._run(self._set_oids(
             (f"{OID_dot1qVlanStaticName}.{vlan_id}",
              OctetString(name)),
         ))
 
     def delete_vlan(self, vlan_id):
         """Delete a VLAN from the VLAN database via SNMP."""
-        return asyncio.run(self._set_oids(
+        return self._run(self._set_oids(
             (f"{OID_dot1qVlanStaticRowStatus}.{vlan_id}",
              Integer32(6)),  # destroy
         ))
@@ -2199,7 +2842,11 @@ class SNMPHIOS:
         Note: SNMP community strings cannot be queried via SNMP for
         security reasons, so community dict is always empty.
         """
-        return asyncio.run(self._get_snmp_information_async())
+        return self._run(self._get_snmp_information_async())
+
+    async def aget_snmp_information(self):
+        """Awaitable get_snmp_information()."""
+        return await self._arun(self._get_snmp_information_async())
 
     async def _get_snmp_information_async(self):
         scalars = await self._get_scalar(OID_sysName, OID_sysContact, OID_sysLocation)
@@ -2227,7 +2874,7 @@ class SNMPHIOS:
             sets.append((f"{OID_sysLocation}.0", OctetString(location)))
         if not sets:
             return None
-        asyncio.run(self._set_oids(*sets))
+        self._run(self._set_oids(*sets))
         return self.get_snmp_information()
 
     # ------------------------------------------------------------------
@@ -2247,10 +2894,14 @@ class SNMPHIOS:
             'memory': {'available_ram': 253076, 'used_ram': 128424},
         }
         """
-        return asyncio.run(self._get_environment_async())
+        return self._run(self._get_environment_async())
+
+    async def aget_environment(self):
+        """Awaitable get_environment()."""
+        return await self._arun(self._get_environment_async())
 
     async def _get_environment_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         # Fetch scalars and walks in parallel
         scalars_task = self._get_scalar(
@@ -2376,10 +3027,14 @@ class SNMPHIOS:
 
     def get_optics(self):
         """Return SFP optical power from HM2-DEVMGMT-MIB hm2SfpDiagTable."""
-        return asyncio.run(self._get_optics_async())
+        return self._run(self._get_optics_async())
+
+    async def aget_optics(self):
+        """Awaitable get_optics()."""
+        return await self._arun(self._get_optics_async())
 
     async def _get_optics_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         rows = await self._walk_columns({
             'tx_power': OID_hm2SfpDiagTxPower,
@@ -2419,10 +3074,10 @@ class SNMPHIOS:
 
     def get_users(self):
         """Return user accounts from HM2-USERMGMT-MIB hm2UserConfigTable."""
-        return asyncio.run(self._get_users_async())
+        return self._run(self._get_users_async())
 
     async def _get_users_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         rows = await self._walk_columns({
             'role': OID_hm2UserAccessRole,
             'status': OID_hm2UserStatus,
@@ -2448,10 +3103,14 @@ class SNMPHIOS:
 
     def get_ntp_servers(self):
         """Return NTP server list from HM2-TIMESYNC-MIB."""
-        return asyncio.run(self._get_ntp_servers_async())
+        return self._run(self._get_ntp_servers_async())
+
+    async def aget_ntp_servers(self):
+        """Awaitable get_ntp_servers()."""
+        return await self._arun(self._get_ntp_servers_async())
 
     async def _get_ntp_servers_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         addrs = await self._walk(OID_hm2SntpServerAddr, engine)
         result = {}
         for suffix, val in addrs.items():
@@ -2462,10 +3121,14 @@ class SNMPHIOS:
 
     def get_ntp_stats(self):
         """Return NTP statistics from HM2-TIMESYNC-MIB."""
-        return asyncio.run(self._get_ntp_stats_async())
+        return self._run(self._get_ntp_stats_async())
+
+    async def aget_ntp_stats(self):
+        """Awaitable get_ntp_stats()."""
+        return await self._arun(self._get_ntp_stats_async())
 
     async def _get_ntp_stats_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         scalars_task = self._get_scalar(
             OID_hm2SntpRequestInterval, OID_hm2SntpClientStatus,
         )
@@ -2510,10 +3173,14 @@ class SNMPHIOS:
 
     def get_mrp(self):
         """Return MRP ring redundancy config from HM2-L2REDUNDANCY-MIB."""
-        return asyncio.run(self._get_mrp_async())
+        return self._run(self._get_mrp_async())
+
+    async def aget_mrp(self):
+        """Awaitable get_mrp()."""
+        return await self._arun(self._get_mrp_async())
 
     async def _get_mrp_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
 
         rows = await self._walk_columns({
@@ -2617,7 +3284,11 @@ class SNMPHIOS:
 
     def get_hidiscovery(self):
         """Return HiDiscovery config from HM2-NETCONFIG-MIB."""
-        return asyncio.run(self._get_hidiscovery_async())
+        return self._run(self._get_hidiscovery_async())
+
+    async def aget_hidiscovery(self):
+        """Awaitable get_hidiscovery()."""
+        return await self._arun(self._get_hidiscovery_async())
 
     async def _get_hidiscovery_async(self):
         try:
@@ -2681,7 +3352,11 @@ class SNMPHIOS:
                 'boot': 'ok',             # 'ok' | 'out of sync'
             }
         """
-        return asyncio.run(self._get_config_status_async())
+        return self._run(self._get_config_status_async())
+
+    async def aget_config_status(self):
+        """Awaitable get_config_status()."""
+        return await self._arun(self._get_config_status_async())
 
     async def _get_config_status_async(self):
         scalars = await self._get_scalar(
@@ -2710,7 +3385,7 @@ class SNMPHIOS:
         Polls NVM state until no longer busy (up to 10s).
         Returns the post-save config status.
         """
-        return asyncio.run(self._save_config_async())
+        return self._run(self._save_config_async())
 
     async def _save_config_async(self):
         # 1. GET the advisory lock key
@@ -2731,7 +3406,11 @@ class SNMPHIOS:
 
     def get_config_remote(self):
         """Return remote config backup settings via SNMP."""
-        return asyncio.run(self._get_config_remote_async())
+        return self._run(self._get_config_remote_async())
+
+    async def aget_config_remote(self):
+        """Awaitable get_config_remote()."""
+        return await self._arun(self._get_config_remote_async())
 
     async def _get_config_remote_async(self):
         scalars = await self._get_scalar(
@@ -2759,7 +3438,7 @@ class SNMPHIOS:
                           auto_backup_username=None, auto_backup_password=None,
                           username=None, password=None):
         """Configure remote config transfer and/or auto-backup via SNMP."""
-        return asyncio.run(self._set_config_remote_async(
+        return self._run(self._set_config_remote_async(
             action=action, server=server, profile=profile,
             source=source, destination=destination,
             auto_backup=auto_backup, auto_backup_url=auto_backup_url,
@@ -2867,7 +3546,7 @@ class SNMPHIOS:
         Args:
             keep_ip: If True, preserve management IP address.
         """
-        return asyncio.run(self._clear_config_async(keep_ip))
+        return self._run(self._clear_config_async(keep_ip))
 
     async def _clear_config_async(self, keep_ip=False):
         scalars = await self._get_scalar(OID_hm2FMActionActivateKey)
@@ -2890,7 +3569,7 @@ class SNMPHIOS:
             erase_all: If True, also regenerate factory.cfg from firmware.
                 Use when factory defaults file may be corrupted.
         """
-        return asyncio.run(self._clear_factory_async(erase_all))
+        return self._run(self._clear_factory_async(erase_all))
 
     async def _clear_factory_async(self, erase_all=False):
         scalars = await self._get_scalar(OID_hm2FMActionActivateKey)
@@ -2927,19 +3606,18 @@ class SNMPHIOS:
 
         Appends .0 unless the OID is already fully qualified (>=14 parts).
         """
-        engine = SnmpEngine()
-        transport = await UdpTransportTarget.create(
-            (self.hostname, self.port), timeout=self.timeout, retries=1,
-        )
+        engine = self._get_engine()
+        transport = await self._get_transport()
         auth = self._build_auth()
         if len(oid.split('.')) >= 14:
             oid_obj = ObjectIdentity(oid)
         else:
             oid_obj = ObjectIdentity(oid + '.0')
-        errorIndication, errorStatus, errorIndex, varBinds = await set_cmd(
-            engine, auth, transport, ContextData(),
+        errorIndication, errorStatus, errorIndex, varBinds = await self._send(
+            set_cmd, engine, auth, transport, ContextData(),
             ObjectType(oid_obj, value),
         )
+        self._invalidate_walks()
         if errorIndication:
             raise ConnectionException(f"SNMP SET error: {errorIndication}")
         if errorStatus:
@@ -2953,25 +3631,163 @@ class SNMPHIOS:
 
         Each argument is a (oid_string, value) tuple.  OIDs are used
         as-is (no .0 appended) — caller must supply fully qualified OIDs.
+
+        Cached walks are dropped whatever the outcome: one SET can change
+        other tables too (e.g. a VLAN's static egress and current egress).
         """
-        engine = SnmpEngine()
-        transport = await UdpTransportTarget.create(
-            (self.hostname, self.port), timeout=self.timeout, retries=1,
-        )
+        engine = self._get_engine()
+        transport = await self._get_transport()
         auth = self._build_auth()
         object_types = [
             ObjectType(ObjectIdentity(oid), val) for oid, val in oid_value_pairs
         ]
-        errorIndication, errorStatus, errorIndex, varBinds = await set_cmd(
-            engine, auth, transport, ContextData(), *object_types,
+        errorIndication, errorStatus, errorIndex, varBinds = await self._send(
+            set_cmd, engine, auth, transport, ContextData(), *object_types,
         )
+        self._invalidate_walks()
         if errorIndication:
             raise ConnectionException(f"SNMP SET error: {errorIndication}")
         if errorStatus:
-            raise ConnectionException(
+            raise _SNMPStatusError(
                 f"SNMP SET error: {errorStatus.prettyPrint()} at "
-                f"{varBinds[int(errorIndex) - 1][0] if errorIndex else '?'}"
-            )
+                f"{varBinds[int(errorIndex) - 1][0] if errorIndex else '?'}",
+                int(errorStatus))
+
+    # ------------------------------------------------------------------
+    # Staging (batched SETs)
+    # ------------------------------------------------------------------
+
+    def start_staging(self):
+        """Enter staging mode — setter varbinds are queued, not sent.
+
+        Covers set_interface, set_vlan_ingress, set_vlan_egress and
+        set_access_port. PortList edits merge per VLAN row: a staged call
+        builds on the bitmaps queued by earlier ones, not the device's.
+        All other setters (VLAN CRUD, MRP, ...) fire immediately, so
+        create a VLAN before staging its members.
+        """
+        self._staging = True
+        self._staged_sets = {}
+
+    def commit_staging(self, chunk_size=None):
+        """Send all queued varbinds as one SET PDU (atomic on HiOS).
+
+        Never split silently: if the agent answers tooBig nothing was
+        applied, and ConnectionException names a chunk_size to commit
+        with instead. Does NOT save to NVM — call save_config() separately
+        when ready.
+
+        If the SET fails the queue is kept (still staging), so it can be
+        inspected with get_staged_mutations() and committed again.
+
+        Args:
+            chunk_size: send the queue as several SETs of at most this many
+                varbinds, smaller still if the agent answers tooBig. Not
+                atomic; a rejected SET does not stop the rest. Returns a
+                per-mutation result list of {'mutation': (oid, value),
+                'status': 'ok'|'error', 'errors': [...]} dicts, like
+                MOPSHIOS.commit_staging(chunk_size=...).
+        """
+        pairs = list(self._staged_sets.items())
+        results = None
+        if chunk_size:
+            results = self._run(self._commit_chunks(pairs, chunk_size))
+        elif pairs:
+            self._run(self._commit_atomic(pairs))
+        self._staging = False
+        self._staged_sets = {}
+        return results
+
+    async def _commit_atomic(self, pairs):
+        """Send pairs as one SET PDU; tooBig raises rather than splitting."""
+        try:
+            await self._set_oids(*pairs)
+        except _SNMPStatusError as e:
+            if e.status != 1 or len(pairs) < 2:
+                raise
+            fits = _set_max_varbinds.get((self.hostname, self.port))
+            hint = min(fits, len(pairs) - 1) if fits else (len(pairs) + 1) // 2
+            raise ConnectionException(
+                f"Staged commit of {len(pairs)} varbinds is too big for one "
+                f"SET PDU on {self.hostname}; nothing was applied. Commit "
+                f"with commit_staging(chunk_size={hint}) to send it in "
+                f"non-atomic chunks") from e
+
+    async def _commit_chunks(self, pairs, chunk_size):
+        """Send pairs as SETs of at most chunk_size varbinds; per-pair results."""
+        results = []
+        for i in range(0, len(pairs), chunk_size):
+            chunk = pairs[i:i + chunk_size]
+            sent = []
+            try:
+                await self._set_oids_chunked(chunk, chunk_size, sent=sent)
+            except _SNMPStatusError as e:
+                results.extend({'mutation': pair, 'status': 'ok', 'errors': []}
+                               for pair in sent)
+                results.extend({'mutation': pair, 'status': 'error',
+                                'errors': [str(e)]}
+                               for pair in chunk[len(sent):])
+                continue
+            results.extend({'mutation': pair, 'status': 'ok', 'errors': []}
+                           for pair in chunk)
+        return results
+
+    def discard_staging(self):
+        """Clear queued varbinds without sending."""
+        self._staging = False
+        self._staged_sets = {}
+
+    def get_staged_mutations(self):
+        """Return the queued (oid, value) pairs in send order."""
+        return list(self._staged_sets.items())
+
+    async def _apply_sets(self, *oid_value_pairs):
+        """_set_oids() that respects staging mode.
+
+        When staging, the pairs are queued; a repeated OID keeps only its
+        latest value, moved to the end of the queue. Otherwise they are
+        sent at once, split only if the agent answers tooBig.
+        """
+        if not self._staging:
+            await self._set_oids_chunked(list(oid_value_pairs))
+            return
+        for oid, val in oid_value_pairs:
+            self._staged_sets.pop(oid, None)
+            self._staged_sets[oid] = val
+
+    def _overlay_staged(self, rows, oid_map):
+        """Replace walked values with ones queued for the same OIDs."""
+        if not self._staged_sets:
+            return rows
+        for index, cols in rows.items():
+            for name, oid in oid_map.items():
+                staged = self._staged_sets.get(f"{oid}.{index}")
+                if staged is not None:
+                    cols[name] = staged
+        return rows
+
+    async def _set_oids_chunked(self, pairs, chunk_size=None, sent=None):
+        """Send pairs in as few SET PDUs as the agent allows.
+
+        Halves the PDU on tooBig and remembers the size that fits. Pairs
+        whose PDU was accepted are appended to `sent`, if given.
+        """
+        key = (self.hostname, self.port)
+        while pairs:
+            size = _set_max_varbinds.get(key, len(pairs))
+            if chunk_size:
+                size = min(size, chunk_size)
+            chunk = pairs[:size]
+            try:
+                await self._set_oids(*chunk)
+            except _SNMPStatusError as e:
+                if e.status == 1 and len(chunk) > 1:   # tooBig
+                    _set_max_varbinds[key] = (len(chunk) + 1) // 2
+                    continue
+                raise
+            if sent is not None:
+                sent.extend(chunk)
+            pairs = pairs[len(chunk):]
 
     # ------------------------------------------------------------------
     # Write operations — vendor-specific (MRP, HiDiscovery)
@@ -2987,7 +3803,7 @@ class SNMPHIOS:
         """
         interfaces = ([interface] if isinstance(interface, str)
                       else list(interface))
-        ifindex_map = asyncio.run(self._build_ifindex_map())
+        ifindex_map = self._run(self._build_ifindex_map())
         name_to_idx = {name: idx for idx, name in ifindex_map.items()}
 
         sets = []
@@ -3002,7 +3818,7 @@ class SNMPHIOS:
                 sets.append((f"{OID_ifAlias}.{ifidx}",
                              OctetString(description)))
         if sets:
-            asyncio.run(self._set_oids(*sets))
+            self._run(self._apply_sets(*sets))
 
     def set_hidiscovery(self, status, blinking=None):
         """Set HiDiscovery operating mode via SNMP.
@@ -3015,7 +3831,7 @@ class SNMPHIOS:
         status = status.lower().strip()
         if status not in ('on', 'off', 'ro'):
             raise ValueError(f"Invalid status '{status}': use 'on', 'off', or 'ro'")
-        return asyncio.run(self._set_hidiscovery_async(status, blinking))
+        return self._run(self._set_hidiscovery_async(status, blinking))
 
     async def _set_hidiscovery_async(self, status, blinking=None):
         if status == 'off':
@@ -3054,14 +3870,14 @@ class SNMPHIOS:
             raise ValueError(f"operation must be 'enable' or 'disable', got '{operation}'")
         if mode not in ('manager', 'client'):
             raise ValueError(f"mode must be 'manager' or 'client', got '{mode}'")
-        return asyncio.run(self._set_mrp_async(
+        return self._run(self._set_mrp_async(
             operation, mode, port_primary, port_secondary, vlan,
             recovery_delay, advanced_mode,
         ))
 
     async def _set_mrp_async(self, operation, mode, port_primary, port_secondary,
                              vlan, recovery_delay, advanced_mode):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         sfx = MRP_DEFAULT_DOMAIN_SUFFIX
 
         # Build reverse ifName → ifIndex map for port resolution
@@ -3148,7 +3964,7 @@ class SNMPHIOS:
 
         Returns the post-deletion MRP state (should show configured=False).
         """
-        return asyncio.run(self._delete_mrp_async())
+        return self._run(self._delete_mrp_async())
 
     async def _delete_mrp_async(self):
         sfx = MRP_DEFAULT_DOMAIN_SUFFIX
@@ -3169,10 +3985,14 @@ class SNMPHIOS:
 
     def get_mrp_sub_ring(self):
         """Return MRP sub-ring (SRM) configuration and operating state."""
-        return asyncio.run(self._get_mrp_sub_ring_async())
+        return self._run(self._get_mrp_sub_ring_async())
+
+    async def aget_mrp_sub_ring(self):
+        """Awaitable get_mrp_sub_ring()."""
+        return await self._arun(self._get_mrp_sub_ring_async())
 
     async def _get_mrp_sub_ring_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         # Global scalars
         enabled = False
@@ -3281,11 +4101,11 @@ class SNMPHIOS:
         """
         if mode not in _SRM_ADMIN_STATE_REV:
             raise ValueError(f"mode must be one of {list(_SRM_ADMIN_STATE_REV)}, got '{mode}'")
-        return asyncio.run(self._set_mrp_sub_ring_async(
+        return self._run(self._set_mrp_sub_ring_async(
             ring_id, enabled, mode, port, vlan, name))
 
     async def _set_mrp_sub_ring_async(self, ring_id, enabled, mode, port, vlan, name):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         # Global enable/disable
         if enabled is not None:
@@ -3367,7 +4187,7 @@ class SNMPHIOS:
         Args:
             ring_id: int — specific instance to delete (None = disable globally)
         """
-        return asyncio.run(self._delete_mrp_sub_ring_async(ring_id))
+        return self._run(self._delete_mrp_sub_ring_async(ring_id))
 
     async def _delete_mrp_sub_ring_async(self, ring_id):
         if ring_id is None:
@@ -3397,10 +4217,14 @@ class SNMPHIOS:
 
     def get_lldp_neighbors_detail_extended(self, interface=''):
         """Return extended LLDP detail with 802.1/802.3 extension data."""
-        return asyncio.run(self._get_lldp_neighbors_detail_extended_async(interface))
+        return self._run(self._get_lldp_neighbors_detail_extended_async(interface))
+
+    async def aget_lldp_neighbors_detail_extended(self, interface=''):
+        """Awaitable get_lldp_neighbors_detail_extended()."""
+        return await self._arun(self._get_lldp_neighbors_detail_extended_async(interface))
 
     async def _get_lldp_neighbors_detail_extended_async(self, interface=''):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         loc_ports = await self._walk(OID_lldpLocPortId, engine)
 
@@ -3633,7 +4457,14 @@ class SNMPHIOS:
         storage_int = self._STORAGE_TYPE.get(storage)
         if storage_int is None:
             raise ValueError(f"Invalid storage '{storage}': use 'nvm' or 'envm'")
-        return asyncio.run(self._get_profiles_async(storage_int))
+        return self._run(self._get_profiles_async(storage_int))
+
+    async def aget_profiles(self, storage='nvm'):
+        """Awaitable get_profiles()."""
+        storage_int = self._STORAGE_TYPE.get(storage)
+        if storage_int is None:
+            raise ValueError(f"Invalid storage '{storage}': use 'nvm' or 'envm'")
+        return await self._arun(self._get_profiles_async(storage_int))
 
     async def _get_profiles_async(self, storage_filter):
         from datetime import datetime, timezone
@@ -3709,6 +4540,17 @@ class SNMPHIOS:
                 }
         return {'fingerprint': '', 'verified': False}
 
+    async def aget_config_fingerprint(self):
+        """Awaitable get_config_fingerprint()."""
+        profiles = await self.aget_profiles('nvm')
+        for p in profiles:
+            if p['active']:
+                return {
+                    'fingerprint': p['fingerprint'],
+                    'verified': p['fingerprint_verified'],
+                }
+        return {'fingerprint': '', 'verified': False}
+
     def activate_profile(self, storage='nvm', index=1):
         """Activate a config profile. Note: causes a warm restart.
 
@@ -3721,7 +4563,7 @@ class SNMPHIOS:
         storage_int = self._STORAGE_TYPE.get(storage)
         if storage_int is None:
             raise ValueError(f"Invalid storage '{storage}': use 'nvm' or 'envm'")
-        return asyncio.run(self._activate_profile_async(storage_int, index))
+        return self._run(self._activate_profile_async(storage_int, index))
 
     async def _activate_profile_async(self, storage_int, index):
         oid = f'{OID_hm2FMProfileActive}.{storage_int}.{index}'
@@ -3745,7 +4587,7 @@ class SNMPHIOS:
         for p in profiles:
             if p['index'] == index and p['active']:
                 raise ValueError(f"Cannot delete active profile {index}")
-        return asyncio.run(self._delete_profile_async(storage_int, index))
+        return self._run(self._delete_profile_async(storage_int, index))
 
     async def _delete_profile_async(self, storage_int, index):
         oid = f'{OID_hm2FMProfileAction}.{storage_int}.{index}'
@@ -3767,7 +4609,7 @@ class SNMPHIOS:
         """
         if not (30 <= seconds <= 600):
             raise ValueError(f"Watchdog interval must be 30-600, got {seconds}")
-        return asyncio.run(self._start_watchdog_async(seconds))
+        return self._run(self._start_watchdog_async(seconds))
 
     async def _start_watchdog_async(self, seconds):
         await self._set_scalar(OID_hm2ConfigWatchdogTimeInterval, Integer32(seconds))
@@ -3775,7 +4617,7 @@ class SNMPHIOS:
 
     def stop_watchdog(self):
         """Stop (disable) the config watchdog timer."""
-        return asyncio.run(self._stop_watchdog_async())
+        return self._run(self._stop_watchdog_async())
 
     async def _stop_watchdog_async(self):
         await self._set_scalar(OID_hm2ConfigWatchdogAdminStatus, Integer32(2))  # disable
@@ -3792,7 +4634,11 @@ class SNMPHIOS:
                 'remaining': 45,
             }
         """
-        return asyncio.run(self._get_watchdog_status_async())
+        return self._run(self._get_watchdog_status_async())
+
+    async def aget_watchdog_status(self):
+        """Awaitable get_watchdog_status()."""
+        return await self._arun(self._get_watchdog_status_async())
 
     async def _get_watchdog_status_async(self):
         scalars = await self._get_scalar(
@@ -3814,7 +4660,11 @@ class SNMPHIOS:
 
     def get_login_policy(self):
         """Read password and login lockout policy."""
-        return asyncio.run(self._get_login_policy_async())
+        return self._run(self._get_login_policy_async())
+
+    async def aget_login_policy(self):
+        """Awaitable get_login_policy()."""
+        return await self._arun(self._get_login_policy_async())
 
     async def _get_login_policy_async(self):
         scalars = await self._get_scalar(
@@ -3848,7 +4698,7 @@ class SNMPHIOS:
                          min_uppercase=None, min_lowercase=None,
                          min_numeric=None, min_special=None):
         """Set password and login lockout policy."""
-        return asyncio.run(self._set_login_policy_async(
+        return self._run(self._set_login_policy_async(
             min_password_length, max_login_attempts, lockout_duration,
             min_uppercase, min_lowercase, min_numeric, min_special))
 
@@ -3893,10 +4743,14 @@ class SNMPHIOS:
 
     def get_syslog(self):
         """Read syslog configuration."""
-        return asyncio.run(self._get_syslog_async())
+        return self._run(self._get_syslog_async())
+
+    async def aget_syslog(self):
+        """Awaitable get_syslog()."""
+        return await self._arun(self._get_syslog_async())
 
     async def _get_syslog_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         scalars_task = self._get_scalar(OID_hm2LogSyslogAdminStatus)
         rows_task = self._walk_columns({
             'ip': OID_hm2LogSyslogServerIPAddr,
@@ -3927,7 +4781,7 @@ class SNMPHIOS:
 
     def set_syslog(self, enabled=None, servers=None):
         """Set syslog configuration."""
-        return asyncio.run(self._set_syslog_async(enabled, servers))
+        return self._run(self._set_syslog_async(enabled, servers))
 
     async def _set_syslog_async(self, enabled, servers):
         sets = []
@@ -3943,10 +4797,14 @@ class SNMPHIOS:
 
     def get_ntp(self):
         """Read SNTP client configuration."""
-        return asyncio.run(self._get_ntp_async())
+        return self._run(self._get_ntp_async())
+
+    async def aget_ntp(self):
+        """Awaitable get_ntp()."""
+        return await self._arun(self._get_ntp_async())
 
     async def _get_ntp_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         scalars = await self._get_scalar(
             OID_hm2SntpClientAdminState,
             OID_hm2SntpRequestInterval,
@@ -3987,7 +4845,7 @@ class SNMPHIOS:
 
     def set_ntp(self, client_enabled=None, server_enabled=None):
         """Set SNTP client enable/disable."""
-        return asyncio.run(self._set_ntp_async(
+        return self._run(self._set_ntp_async(
             client_enabled, server_enabled))
 
     async def _set_ntp_async(self, client_enabled, server_enabled):
@@ -4007,7 +4865,11 @@ class SNMPHIOS:
 
     def get_services(self, *fields):
         """Read service enable/disable state."""
-        return asyncio.run(self._get_services_async(fields))
+        return self._run(self._get_services_async(fields))
+
+    async def aget_services(self, *fields):
+        """Awaitable get_services()."""
+        return await self._arun(self._get_services_async(fields))
 
     async def _get_services_async(self, fields=()):
         # All scalars in one GET — maximum efficiency
@@ -4154,7 +5016,7 @@ class SNMPHIOS:
                      ssh_hmac=None, ssh_kex=None,
                      ssh_encryption=None, ssh_host_key=None):
         """Set service enable/disable state."""
-        return asyncio.run(self._set_services_async(
+        return self._run(self._set_services_async(
             http, https, ssh, telnet, snmp_v1, snmp_v2, snmp_v3,
             iec61850, profinet, ethernet_ip, opcua, modbus,
             unsigned_sw, aca_auto_update, aca_config_write,
@@ -4259,7 +5121,11 @@ class SNMPHIOS:
 
     def get_snmp_config(self):
         """Read SNMP config: versions, port, trap service, v3 users, trap dests."""
-        return asyncio.run(self._get_snmp_config_async())
+        return self._run(self._get_snmp_config_async())
+
+    async def aget_snmp_config(self):
+        """Awaitable get_snmp_config()."""
+        return await self._arun(self._get_snmp_config_async())
 
     async def _get_snmp_config_async(self):
         scalars = await self._get_scalar(
@@ -4271,7 +5137,7 @@ class SNMPHIOS:
         )
 
         # v3 user auth/enc
-        engine = SnmpEngine()
+        engine = self._get_engine()
         user_rows = await self._walk_columns({
             'auth': OID_hm2UserSnmpAuthType,
             'enc': OID_hm2UserSnmpEncType,
@@ -4316,7 +5182,7 @@ class SNMPHIOS:
     async def _get_trap_dests_async(self, engine=None):
         """Walk SNMP-TARGET-MIB for trap destinations."""
         if engine is None:
-            engine = SnmpEngine()
+            engine = self._get_engine()
 
         addr_rows = await self._walk_columns({
             'taddr': OID_snmpTargetAddrTAddress,
@@ -4381,7 +5247,7 @@ class SNMPHIOS:
     def set_snmp_config(self, v1=None, v2=None, v3=None,
                         trap_service=None):
         """Set SNMP version enable/disable and trap service."""
-        return asyncio.run(self._set_snmp_config_async(
+        return self._run(self._set_snmp_config_async(
             v1, v2, v3, trap_service))
 
     async def _set_snmp_config_async(self, v1, v2, v3,
@@ -4409,7 +5275,7 @@ class SNMPHIOS:
                            security_model='v3', security_name='admin',
                            security_level='authpriv'):
         """Add an SNMP trap destination via SNMP."""
-        asyncio.run(self._add_snmp_trap_dest_async(
+        self._run(self._add_snmp_trap_dest_async(
             name, address, port, security_model,
             security_name, security_level))
 
@@ -4471,7 +5337,7 @@ class SNMPHIOS:
 
     def delete_snmp_trap_dest(self, name):
         """Delete an SNMP trap destination via SNMP."""
-        asyncio.run(self._delete_snmp_trap_dest_async(name))
+        self._run(self._delete_snmp_trap_dest_async(name))
 
     async def _delete_snmp_trap_dest_async(self, name):
         suffix = self._encode_implied_string(name)
@@ -4489,10 +5355,14 @@ class SNMPHIOS:
 
     def get_auto_disable(self):
         """Return auto-disable state: per-port table + per-reason table."""
-        return asyncio.run(self._get_auto_disable_async())
+        return self._run(self._get_auto_disable_async())
+
+    async def aget_auto_disable(self):
+        """Awaitable get_auto_disable()."""
+        return await self._arun(self._get_auto_disable_async())
 
     async def _get_auto_disable_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
 
         intf_rows = await self._walk_columns({
@@ -4547,12 +5417,12 @@ class SNMPHIOS:
         Args:
             interface: port name (str) or list of port names
         """
-        return asyncio.run(self._set_auto_disable_async(interface, timer))
+        return self._run(self._set_auto_disable_async(interface, timer))
 
     async def _set_auto_disable_async(self, interface, timer):
         interfaces = ([interface] if isinstance(interface, str)
                       else list(interface))
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         name_to_idx = {name: idx for idx, name in ifmap.items()}
 
@@ -4572,12 +5442,12 @@ class SNMPHIOS:
         Args:
             interface: port name (str) or list of port names
         """
-        return asyncio.run(self._reset_auto_disable_async(interface))
+        return self._run(self._reset_auto_disable_async(interface))
 
     async def _reset_auto_disable_async(self, interface):
         interfaces = ([interface] if isinstance(interface, str)
                       else list(interface))
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         name_to_idx = {name: idx for idx, name in ifmap.items()}
 
@@ -4593,7 +5463,7 @@ class SNMPHIOS:
 
     def set_auto_disable_reason(self, reason, enabled=True):
         """Enable or disable auto-disable recovery for a specific reason type."""
-        return asyncio.run(self._set_auto_disable_reason_async(reason, enabled))
+        return self._run(self._set_auto_disable_reason_async(reason, enabled))
 
     async def _set_auto_disable_reason_async(self, reason, enabled):
         reason_idx = _AUTO_DISABLE_REASONS_REV.get(reason)
@@ -4612,10 +5482,14 @@ class SNMPHIOS:
 
     def get_loop_protection(self):
         """Return loop protection configuration and state."""
-        return asyncio.run(self._get_loop_protection_async())
+        return self._run(self._get_loop_protection_async())
+
+    async def aget_loop_protection(self):
+        """Awaitable get_loop_protection()."""
+        return await self._arun(self._get_loop_protection_async())
 
     async def _get_loop_protection_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
 
         scalars = await self._get_scalar(
@@ -4682,7 +5556,7 @@ class SNMPHIOS:
         Args:
             interface: port name (str), list of port names, or None for global
         """
-        return asyncio.run(self._set_loop_protection_async(
+        return self._run(self._set_loop_protection_async(
             interface, enabled, mode, action, vlan_id,
             transmit_interval, receive_threshold,
         ))
@@ -4693,7 +5567,7 @@ class SNMPHIOS:
         if interface is not None:
             interfaces = ([interface] if isinstance(interface, str)
                           else list(interface))
-            engine = SnmpEngine()
+            engine = self._get_engine()
             ifmap = await self._build_ifindex_map(engine)
             name_to_idx = {name: idx for idx, name in ifmap.items()}
 
@@ -4755,10 +5629,14 @@ class SNMPHIOS:
 
     def get_storm_control(self):
         """Return per-port storm control configuration."""
-        return asyncio.run(self._get_storm_control_async())
+        return self._run(self._get_storm_control_async())
+
+    async def aget_storm_control(self):
+        """Awaitable get_storm_control()."""
+        return await self._arun(self._get_storm_control_async())
 
     async def _get_storm_control_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
 
         scalars = await self._get_scalar(OID_hm2StormBucketType)
@@ -4807,7 +5685,7 @@ class SNMPHIOS:
                           multicast_enabled=None, multicast_threshold=None,
                           unicast_enabled=None, unicast_threshold=None):
         """Set per-port storm control configuration."""
-        return asyncio.run(self._set_storm_control_async(
+        return self._run(self._set_storm_control_async(
             interface, unit, broadcast_enabled, broadcast_threshold,
             multicast_enabled, multicast_threshold,
             unicast_enabled, unicast_threshold,
@@ -4819,7 +5697,7 @@ class SNMPHIOS:
                                         unicast_enabled, unicast_threshold):
         interfaces = ([interface] if isinstance(interface, str)
                       else list(interface))
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         name_to_idx = {name: idx for idx, name in ifmap.items()}
 
@@ -4900,10 +5778,14 @@ class SNMPHIOS:
 
     def get_sflow(self):
         """Return sFlow agent info and receiver table."""
-        return asyncio.run(self._get_sflow_async())
+        return self._run(self._get_sflow_async())
+
+    async def aget_sflow(self):
+        """Awaitable get_sflow()."""
+        return await self._arun(self._get_sflow_async())
 
     async def _get_sflow_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         scalars = await self._get_scalar(
             OID_sFlowVersion, OID_sFlowAgentAddress)
@@ -4947,7 +5829,7 @@ class SNMPHIOS:
     def set_sflow(self, receiver, address=None, port=None, owner=None,
                   timeout=None, max_datagram_size=None):
         """Configure an sFlow receiver."""
-        return asyncio.run(self._set_sflow_async(
+        return self._run(self._set_sflow_async(
             receiver, address, port, owner, timeout, max_datagram_size))
 
     async def _set_sflow_async(self, receiver, address, port, owner,
@@ -4993,10 +5875,14 @@ class SNMPHIOS:
 
     def get_sflow_port(self, interfaces=None, type=None):
         """Return sFlow sampler and poller config per port."""
-        return asyncio.run(self._get_sflow_port_async(interfaces, type))
+        return self._run(self._get_sflow_port_async(interfaces, type))
+
+    async def aget_sflow_port(self, interfaces=None, type=None):
+        """Awaitable get_sflow_port()."""
+        return await self._arun(self._get_sflow_port_async(interfaces, type))
 
     async def _get_sflow_port_async(self, interfaces, type_filter):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         iface_set = set(interfaces) if interfaces else None
 
@@ -5053,7 +5939,7 @@ class SNMPHIOS:
     def set_sflow_port(self, interfaces, receiver, sample_rate=None,
                        interval=None, max_header_size=None):
         """Configure sFlow sampling/polling on ports."""
-        return asyncio.run(self._set_sflow_port_async(
+        return self._run(self._set_sflow_port_async(
             interfaces, receiver, sample_rate, interval,
             max_header_size))
 
@@ -5066,7 +5952,7 @@ class SNMPHIOS:
 
         interfaces = ([interfaces] if isinstance(interfaces, str)
                       else list(interfaces))
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         name_to_idx = {name: idx for idx, name in ifmap.items()}
 
@@ -5125,10 +6011,14 @@ class SNMPHIOS:
 
     def get_qos(self):
         """Return per-port QoS trust mode and queue scheduling."""
-        return asyncio.run(self._get_qos_async())
+        return self._run(self._get_qos_async())
+
+    async def aget_qos(self):
+        """Awaitable get_qos()."""
+        return await self._arun(self._get_qos_async())
 
     async def _get_qos_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
 
         scalars = await self._get_scalar(OID_hm2CosQueueNumQueuesPerPort)
@@ -5150,7 +6040,7 @@ class SNMPHIOS:
         }, engine)
 
         # Default priority (IEEE8021-BRIDGE-MIB, suffix = componentId.bridgePort)
-        bp_data = await self._walk(OID_dot1dBasePortIfIndex, engine)
+        bp_data = await self._walk_bridge_ports(engine)
         priority_data = await self._walk(
             OID_ieee8021BridgePortDefaultUserPriority, engine)
         priority_by_idx = {}
@@ -5205,7 +6095,7 @@ class SNMPHIOS:
                 queue=None, scheduler=None, min_bw=None, max_bw=None,
                 default_priority=None):
         """Set per-port QoS trust mode, shaping rate, or queue scheduling."""
-        return asyncio.run(self._set_qos_async(
+        return self._run(self._set_qos_async(
             interface, trust_mode, shaping_rate,
             queue, scheduler, min_bw, max_bw,
             default_priority,
@@ -5216,7 +6106,7 @@ class SNMPHIOS:
                               default_priority=None):
         interfaces = ([interface] if isinstance(interface, str)
                       else list(interface))
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         name_to_idx = {name: idx for idx, name in ifmap.items()}
 
@@ -5244,7 +6134,7 @@ class SNMPHIOS:
         # Build ifIndex→bridgePort reverse map for default_priority
         idx_to_bp = {}
         if default_priority is not None:
-            bp_data = await self._walk(OID_dot1dBasePortIfIndex, engine)
+            bp_data = await self._walk_bridge_ports(engine)
             idx_to_bp = {str(ifidx_val): bp_num
                          for bp_num, ifidx_val in bp_data.items()}
 
@@ -5287,10 +6177,14 @@ class SNMPHIOS:
 
     def get_qos_mapping(self):
         """Return global dot1p and DSCP to traffic class mapping tables."""
-        return asyncio.run(self._get_qos_mapping_async())
+        return self._run(self._get_qos_mapping_async())
+
+    async def aget_qos_mapping(self):
+        """Awaitable get_qos_mapping()."""
+        return await self._arun(self._get_qos_mapping_async())
 
     async def _get_qos_mapping_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         dot1p_rows = await self._walk_columns({
             'tc': OID_hm2TrafficClass,
@@ -5314,7 +6208,7 @@ class SNMPHIOS:
 
     def set_qos_mapping(self, dot1p=None, dscp=None):
         """Set global dot1p and/or DSCP to traffic class mappings."""
-        return asyncio.run(self._set_qos_mapping_async(dot1p, dscp))
+        return self._run(self._set_qos_mapping_async(dot1p, dscp))
 
     async def _set_qos_mapping_async(self, dot1p, dscp):
         sets = []
@@ -5336,7 +6230,11 @@ class SNMPHIOS:
 
     def get_management_priority(self):
         """Return management frame priority settings."""
-        return asyncio.run(self._get_management_priority_async())
+        return self._run(self._get_management_priority_async())
+
+    async def aget_management_priority(self):
+        """Awaitable get_management_priority()."""
+        return await self._arun(self._get_management_priority_async())
 
     async def _get_management_priority_async(self):
         scalars = await self._get_scalar(
@@ -5350,7 +6248,7 @@ class SNMPHIOS:
 
     def set_management_priority(self, dot1p=None, ip_dscp=None):
         """Set management frame priority."""
-        return asyncio.run(self._set_management_priority_async(
+        return self._run(self._set_management_priority_async(
             dot1p, ip_dscp))
 
     async def _set_management_priority_async(self, dot1p, ip_dscp):
@@ -5368,7 +6266,11 @@ class SNMPHIOS:
 
     def get_management(self):
         """Return management network configuration via SNMP."""
-        return asyncio.run(self._get_management_async())
+        return self._run(self._get_management_async())
+
+    async def aget_management(self):
+        """Awaitable get_management()."""
+        return await self._arun(self._get_management_async())
 
     async def _get_management_async(self):
         _PROTOCOL_MAP = {1: 'local', 2: 'bootp', 3: 'dhcp'}
@@ -5422,7 +6324,7 @@ class SNMPHIOS:
                 raise ValueError(
                     f"VLAN {vlan_id} does not exist on device — "
                     f"create it first to avoid management lockout")
-        return asyncio.run(self._set_management_async(
+        return self._run(self._set_management_async(
             protocol, vlan_id, ip_address, netmask, gateway,
             mgmt_port, dhcp_option_66_67, ipv6_enabled))
 
@@ -5496,7 +6398,11 @@ class SNMPHIOS:
 
     def get_rstp(self):
         """Return global STP/RSTP configuration and state."""
-        return asyncio.run(self._get_rstp_async())
+        return self._run(self._get_rstp_async())
+
+    async def aget_rstp(self):
+        """Awaitable get_rstp()."""
+        return await self._arun(self._get_rstp_async())
 
     async def _get_rstp_async(self):
         # Global scalars — batch into one _get_scalar call
@@ -5571,10 +6477,14 @@ class SNMPHIOS:
 
     def get_rstp_port(self, interface=None):
         """Return per-port STP/RSTP state."""
-        return asyncio.run(self._get_rstp_port_async(interface))
+        return self._run(self._get_rstp_port_async(interface))
+
+    async def aget_rstp_port(self, interface=None):
+        """Awaitable get_rstp_port()."""
+        return await self._arun(self._get_rstp_port_async(interface))
 
     async def _get_rstp_port_async(self, interface):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
 
         # Walk STP port table + CST port table
@@ -5640,7 +6550,7 @@ class SNMPHIOS:
                  hello_time=None, max_age=None, forward_delay=None,
                  hold_count=None, bpdu_guard=None, bpdu_filter=None):
         """Set global STP/RSTP configuration."""
-        return asyncio.run(self._set_rstp_async(
+        return self._run(self._set_rstp_async(
             enabled, mode, priority, hello_time, max_age,
             forward_delay, hold_count, bpdu_guard, bpdu_filter))
 
@@ -5693,7 +6603,7 @@ class SNMPHIOS:
         Args:
             interface: port name (str) or list of port names
         """
-        return asyncio.run(self._set_rstp_port_async(
+        return self._run(self._set_rstp_port_async(
             interface, enabled, edge_port, auto_edge, path_cost, priority,
             root_guard, loop_guard, tcn_guard, bpdu_filter, bpdu_flood))
 
@@ -5703,7 +6613,7 @@ class SNMPHIOS:
                                     bpdu_filter, bpdu_flood):
         interfaces = ([interface] if isinstance(interface, str)
                       else list(interface))
-        engine = SnmpEngine()
+        engine = self._get_engine()
         ifmap = await self._build_ifindex_map(engine)
         name_to_idx = {name: idx for idx, name in ifmap.items()}
 
@@ -5808,10 +6718,14 @@ class SNMPHIOS:
             return str(epoch_seconds)
 
     def get_signal_contact(self):
-        return asyncio.run(self._get_signal_contact_async())
+        return self._run(self._get_signal_contact_async())
+
+    async def aget_signal_contact(self):
+        """Awaitable get_signal_contact()."""
+        return await self._arun(self._get_signal_contact_async())
 
     async def _get_signal_contact_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         common_task = self._walk_columns({
             'trap_en': OID_hm2SigConTrapEnable,
             'trap_cause': OID_hm2SigConTrapCause,
@@ -5904,7 +6818,7 @@ class SNMPHIOS:
                            manual_state=None, trap_enabled=None,
                            monitoring=None, power_supply=None,
                            link_alarm=None):
-        return asyncio.run(self._set_signal_contact_async(
+        return self._run(self._set_signal_contact_async(
             contact_id, mode, manual_state, trap_enabled,
             monitoring, power_supply, link_alarm))
 
@@ -5941,7 +6855,7 @@ class SNMPHIOS:
                     f"{OID_hm2SigConSensePSState}.{cid}.{psid}",
                     Integer32(1 if enabled else 2)))
         if link_alarm:
-            engine = SnmpEngine()
+            engine = self._get_engine()
             ifmap = await self._build_ifindex_map(engine)
             name_to_idx = {v: int(k) for k, v in ifmap.items()}
             for port, enabled in link_alarm.items():
@@ -5959,10 +6873,14 @@ class SNMPHIOS:
     # ------------------------------------------------------------------
 
     def get_device_monitor(self):
-        return asyncio.run(self._get_device_monitor_async())
+        return self._run(self._get_device_monitor_async())
+
+    async def aget_device_monitor(self):
+        """Awaitable get_device_monitor()."""
+        return await self._arun(self._get_device_monitor_async())
 
     async def _get_device_monitor_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         # Walk the common table (indexed by hm2DevMonID, always 1)
         common_task = self._walk_columns({
             'trap_en': OID_hm2DevMonTrapEnable,
@@ -6041,7 +6959,7 @@ class SNMPHIOS:
 
     def set_device_monitor(self, trap_enabled=None, monitoring=None,
                            power_supply=None, link_alarm=None):
-        return asyncio.run(self._set_device_monitor_async(
+        return self._run(self._set_device_monitor_async(
             trap_enabled, monitoring, power_supply, link_alarm))
 
     async def _set_device_monitor_async(self, trap_enabled, monitoring,
@@ -6064,7 +6982,7 @@ class SNMPHIOS:
                     f"{OID_hm2DevMonSensePSState}.1.{psid}",
                     Integer32(1 if enabled else 2)))
         if link_alarm:
-            engine = SnmpEngine()
+            engine = self._get_engine()
             ifmap = await self._build_ifindex_map(engine)
             name_to_idx = {v: int(k) for k, v in ifmap.items()}
             for port, enabled in link_alarm.items():
@@ -6082,10 +7000,14 @@ class SNMPHIOS:
     # ------------------------------------------------------------------
 
     def get_devsec_status(self):
-        return asyncio.run(self._get_devsec_status_async())
+        return self._run(self._get_devsec_status_async())
+
+    async def aget_devsec_status(self):
+        """Awaitable get_devsec_status()."""
+        return await self._arun(self._get_devsec_status_async())
 
     async def _get_devsec_status_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         # Walk the scalar config group (suffix .0 for each scalar)
         config_task = self._walk_columns({
             'trap_en': OID_hm2DevSecTrapEnable,
@@ -6154,7 +7076,7 @@ class SNMPHIOS:
 
     def set_devsec_status(self, trap_enabled=None, monitoring=None,
                           no_link=None):
-        return asyncio.run(self._set_devsec_status_async(
+        return self._run(self._set_devsec_status_async(
             trap_enabled, monitoring, no_link))
 
     async def _set_devsec_status_async(self, trap_enabled, monitoring,
@@ -6172,7 +7094,7 @@ class SNMPHIOS:
                 sets.append((f"{oid}.0",
                              Integer32(1 if enabled else 2)))
         if no_link:
-            engine = SnmpEngine()
+            engine = self._get_engine()
             ifmap = await self._build_ifindex_map(engine)
             name_to_idx = {v: int(k) for k, v in ifmap.items()}
             for port, enabled in no_link.items():
@@ -6190,7 +7112,11 @@ class SNMPHIOS:
     # ------------------------------------------------------------------
 
     def get_banner(self):
-        return asyncio.run(self._get_banner_async())
+        return self._run(self._get_banner_async())
+
+    async def aget_banner(self):
+        """Awaitable get_banner()."""
+        return await self._arun(self._get_banner_async())
 
     async def _get_banner_async(self):
         scalars = await self._get_scalar(
@@ -6217,7 +7143,7 @@ class SNMPHIOS:
 
     def set_banner(self, pre_login_enabled=None, pre_login_text=None,
                    cli_login_enabled=None, cli_login_text=None):
-        return asyncio.run(self._set_banner_async(
+        return self._run(self._set_banner_async(
             pre_login_enabled, pre_login_text,
             cli_login_enabled, cli_login_text))
 
@@ -6244,7 +7170,11 @@ class SNMPHIOS:
     # ------------------------------------------------------------------
 
     def get_session_config(self):
-        return asyncio.run(self._get_session_config_async())
+        return self._run(self._get_session_config_async())
+
+    async def aget_session_config(self):
+        """Awaitable get_session_config()."""
+        return await self._arun(self._get_session_config_async())
 
     async def _get_session_config_async(self):
         scalars = await self._get_scalar(
@@ -6334,7 +7264,7 @@ class SNMPHIOS:
                            netconf_timeout=None,
                            netconf_max_sessions=None,
                            serial_enabled=None, envm_enabled=None):
-        return asyncio.run(self._set_session_config_async(
+        return self._run(self._set_session_config_async(
             ssh_timeout, ssh_max_sessions,
             ssh_outbound_timeout, ssh_outbound_max_sessions,
             telnet_timeout, telnet_max_sessions,
@@ -6396,13 +7326,17 @@ class SNMPHIOS:
     # ------------------------------------------------------------------
 
     def get_ip_restrict(self):
-        return asyncio.run(self._get_ip_restrict_async())
+        return self._run(self._get_ip_restrict_async())
+
+    async def aget_ip_restrict(self):
+        """Awaitable get_ip_restrict()."""
+        return await self._arun(self._get_ip_restrict_async())
 
     async def _get_ip_restrict_async(self):
         scalars = await self._get_scalar(
             OID_hm2RmaOperation, OID_hm2RmaLoggingGlobal)
 
-        engine = SnmpEngine()
+        engine = self._get_engine()
         rows = await self._walk_columns({
             'row_status': OID_hm2RmaRowStatus,
             'ip_type': OID_hm2RmaIpAddrType,
@@ -6472,7 +7406,7 @@ class SNMPHIOS:
         }
 
     def set_ip_restrict(self, enabled=None, logging=None):
-        return asyncio.run(self._set_ip_restrict_async(
+        return self._run(self._set_ip_restrict_async(
             enabled, logging))
 
     async def _set_ip_restrict_async(self, enabled, logging):
@@ -6494,7 +7428,7 @@ class SNMPHIOS:
                              profinet=True,
                              interface='',
                              per_rule_logging=False):
-        return asyncio.run(self._add_ip_restrict_rule_async(
+        return self._run(self._add_ip_restrict_rule_async(
             index, ip, prefix_length,
             http, https, snmp, telnet, ssh, iec61850,
             modbus, ethernet_ip, profinet,
@@ -6539,7 +7473,7 @@ class SNMPHIOS:
         await self._set_oids(*sets)
 
     def delete_ip_restrict_rule(self, index):
-        return asyncio.run(self._set_oids(
+        return self._run(self._set_oids(
             (f"{OID_hm2RmaRowStatus}.{index}",
              Integer32(6)),  # destroy
         ))
@@ -6552,10 +7486,14 @@ class SNMPHIOS:
     _DNS_CONFIG_SOURCE_REV = {v: k for k, v in _DNS_CONFIG_SOURCE.items()}
 
     def get_dns(self):
-        return asyncio.run(self._get_dns_async())
+        return self._run(self._get_dns_async())
+
+    async def aget_dns(self):
+        """Awaitable get_dns()."""
+        return await self._arun(self._get_dns_async())
 
     async def _get_dns_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         # Scalars
         scalars = await self._get_scalar(
@@ -6643,13 +7581,13 @@ class SNMPHIOS:
             sets.append((OID_hm2DnsClientCacheAdminState + '.0',
                          Integer32(1 if cache_enabled else 2)))
         if sets:
-            asyncio.run(self._set_oids(*sets))
+            self._run(self._set_oids(*sets))
 
     def add_dns_server(self, address):
-        return asyncio.run(self._add_dns_server_async(address))
+        return self._run(self._add_dns_server_async(address))
 
     async def _add_dns_server_async(self, address):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         # Find used indices
         cfg_rows = await self._walk_columns({
             'row_status': OID_hm2DnsClientServerRowStatus,
@@ -6677,10 +7615,10 @@ class SNMPHIOS:
         )
 
     def delete_dns_server(self, address):
-        return asyncio.run(self._delete_dns_server_async(address))
+        return self._run(self._delete_dns_server_async(address))
 
     async def _delete_dns_server_async(self, address):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         cfg_rows = await self._walk_columns({
             'addr': OID_hm2DnsClientServerAddress,
             'row_status': OID_hm2DnsClientServerRowStatus,
@@ -6719,10 +7657,14 @@ class SNMPHIOS:
     _POE_SOURCE = {0: 'internal', 1: 'external'}
 
     def get_poe(self):
-        return asyncio.run(self._get_poe_async())
+        return self._run(self._get_poe_async())
+
+    async def aget_poe(self):
+        """Awaitable get_poe()."""
+        return await self._arun(self._get_poe_async())
 
     async def _get_poe_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         # Scalars
         scalars = await self._get_scalar(
@@ -6819,7 +7761,7 @@ class SNMPHIOS:
         if interface is not None:
             interfaces = ([interface] if isinstance(interface, str)
                           else list(interface))
-            ifmap = asyncio.run(self._build_ifindex_map(SnmpEngine()))
+            ifmap = self._run(self._build_ifindex_map())
             name_to_idx = {n: idx for idx, n in ifmap.items()}
 
             for iface in interfaces:
@@ -6857,7 +7799,7 @@ class SNMPHIOS:
                              Integer32(1 if enabled else 2)))
 
         if sets:
-            asyncio.run(self._set_oids(*sets))
+            self._run(self._set_oids(*sets))
 
     # ------------------------------------------------------------------
     # SNMP Config Extensions
@@ -6873,7 +7815,11 @@ class SNMPHIOS:
     # ------------------------------------------------------------------
 
     def get_remote_auth(self):
-        return asyncio.run(self._get_remote_auth_async())
+        return self._run(self._get_remote_auth_async())
+
+    async def aget_remote_auth(self):
+        """Awaitable get_remote_auth()."""
+        return await self._arun(self._get_remote_auth_async())
 
     async def _get_remote_auth_async(self):
         # LDAP global admin state (scalar)
@@ -6940,10 +7886,14 @@ class SNMPHIOS:
         return '.' + '.'.join(str(ord(c)) for c in name)
 
     def get_users(self):
-        return asyncio.run(self._get_users_async())
+        return self._run(self._get_users_async())
+
+    async def aget_users(self):
+        """Awaitable get_users()."""
+        return await self._arun(self._get_users_async())
 
     async def _get_users_async(self):
-        engine = SnmpEngine()
+        engine = self._get_engine()
         rows = await self._walk_columns({
             'role': OID_hm2UserAccessRole,
             'locked': OID_hm2UserLockoutStatus,
@@ -6977,7 +7927,7 @@ class SNMPHIOS:
                  snmp_auth_type=None, snmp_enc_type=None,
                  snmp_auth_password=None, snmp_enc_password=None,
                  policy_check=None, locked=None):
-        asyncio.run(self._set_user_async(
+        self._run(self._set_user_async(
             name, password=password, role=role,
             snmp_auth_type=snmp_auth_type, snmp_enc_type=snmp_enc_type,
             snmp_auth_password=snmp_auth_password,
@@ -6992,7 +7942,7 @@ class SNMPHIOS:
         suffix = self._encode_implied_string(name)
 
         # Check if user exists
-        engine = SnmpEngine()
+        engine = self._get_engine()
         existing = await self._walk_columns({
             'row_status': OID_hm2UserStatus,
         }, engine=engine)
@@ -7067,7 +8017,7 @@ class SNMPHIOS:
             await self._set_oids(*attr_sets)
 
     def delete_user(self, name):
-        asyncio.run(self._delete_user_async(name))
+        self._run(self._delete_user_async(name))
 
     async def _delete_user_async(self, name):
         suffix = self._encode_implied_string(name)
@@ -7112,10 +8062,14 @@ class SNMPHIOS:
         return result
 
     def get_port_security(self, interface=None):
-        return asyncio.run(self._get_port_security_async(interface))
+        return self._run(self._get_port_security_async(interface))
+
+    async def aget_port_security(self, interface=None):
+        """Awaitable get_port_security()."""
+        return await self._arun(self._get_port_security_async(interface))
 
     async def _get_port_security_async(self, interface=None):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         # Scalars — global config
         scalars = await self._get_scalar(
@@ -7194,7 +8148,7 @@ class SNMPHIOS:
         if interface is not None:
             interfaces = ([interface] if isinstance(interface, str)
                           else list(interface))
-            ifmap = asyncio.run(self._build_ifindex_map(SnmpEngine()))
+            ifmap = self._run(self._build_ifindex_map())
             name_to_idx = {n: idx for idx, n in ifmap.items()}
 
             for iface in interfaces:
@@ -7245,7 +8199,7 @@ class SNMPHIOS:
                     Integer32(val)))
 
         if sets:
-            asyncio.run(self._set_oids(*sets))
+            self._run(self._set_oids(*sets))
 
     def add_port_security(self, interface, vlan=None, mac=None, ip=None,
                           entries=None):
@@ -7257,7 +8211,7 @@ class SNMPHIOS:
             else:
                 raise ValueError("Provide mac=, ip=, or entries=")
 
-        ifmap = asyncio.run(self._build_ifindex_map(SnmpEngine()))
+        ifmap = self._run(self._build_ifindex_map())
         name_to_idx = {n: idx for idx, n in ifmap.items()}
         ifidx = name_to_idx.get(interface)
         if ifidx is None:
@@ -7266,11 +8220,11 @@ class SNMPHIOS:
         for entry in entries:
             v = entry.get('vlan', vlan)
             if 'mac' in entry:
-                asyncio.run(self._set_oids((
+                self._run(self._set_oids((
                     f"{OID_hm2AgentPortSecurityMACAddressAdd}.{ifidx}",
                     OctetString(f"{v} {entry['mac']}".encode()))))
             elif 'ip' in entry:
-                asyncio.run(self._set_oids((
+                self._run(self._set_oids((
                     f"{OID_hm2AgentPortSecurityIPAddressAdd}.{ifidx}",
                     OctetString(f"{v} {entry['ip']}".encode()))))
 
@@ -7284,7 +8238,7 @@ class SNMPHIOS:
             else:
                 raise ValueError("Provide mac=, ip=, or entries=")
 
-        ifmap = asyncio.run(self._build_ifindex_map(SnmpEngine()))
+        ifmap = self._run(self._build_ifindex_map())
         name_to_idx = {n: idx for idx, n in ifmap.items()}
         ifidx = name_to_idx.get(interface)
         if ifidx is None:
@@ -7293,11 +8247,11 @@ class SNMPHIOS:
         for entry in entries:
             v = entry.get('vlan', vlan)
             if 'mac' in entry:
-                asyncio.run(self._set_oids((
+                self._run(self._set_oids((
                     f"{OID_hm2AgentPortSecurityMACAddressRemove}.{ifidx}",
                     OctetString(f"{v} {entry['mac']}".encode()))))
             elif 'ip' in entry:
-                asyncio.run(self._set_oids((
+                self._run(self._set_oids((
                     f"{OID_hm2AgentPortSecurityIPAddressRemove}.{ifidx}",
                     OctetString(f"{v} {entry['ip']}".encode()))))
 
@@ -7306,10 +8260,14 @@ class SNMPHIOS:
     # ------------------------------------------------------------------
 
     def get_dhcp_snooping(self, interface=None):
-        return asyncio.run(self._get_dhcp_snooping_async(interface))
+        return self._run(self._get_dhcp_snooping_async(interface))
+
+    async def aget_dhcp_snooping(self, interface=None):
+        """Awaitable get_dhcp_snooping()."""
+        return await self._arun(self._get_dhcp_snooping_async(interface))
 
     async def _get_dhcp_snooping_async(self, interface=None):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         # Scalars — global config
         scalars = await self._get_scalar(
@@ -7405,7 +8363,7 @@ class SNMPHIOS:
         if interface is not None:
             interfaces = ([interface] if isinstance(interface, str)
                           else list(interface))
-            ifmap = asyncio.run(self._build_ifindex_map(SnmpEngine()))
+            ifmap = self._run(self._build_ifindex_map())
             name_to_idx = {n: idx for idx, n in ifmap.items()}
 
             for iface in interfaces:
@@ -7434,17 +8392,21 @@ class SNMPHIOS:
                         Integer32(1 if auto_disable else 2)))
 
         if sets:
-            asyncio.run(self._set_oids(*sets))
+            self._run(self._set_oids(*sets))
 
     # ------------------------------------------------------------------
     # ARP Inspection (DAI)
     # ------------------------------------------------------------------
 
     def get_arp_inspection(self, interface=None):
-        return asyncio.run(self._get_arp_inspection_async(interface))
+        return self._run(self._get_arp_inspection_async(interface))
+
+    async def aget_arp_inspection(self, interface=None):
+        """Awaitable get_arp_inspection()."""
+        return await self._arun(self._get_arp_inspection_async(interface))
 
     async def _get_arp_inspection_async(self, interface=None):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         # Scalars — global validation flags
         scalars = await self._get_scalar(
@@ -7569,7 +8531,7 @@ class SNMPHIOS:
         if interface is not None:
             interfaces = ([interface] if isinstance(interface, str)
                           else list(interface))
-            ifmap = asyncio.run(self._build_ifindex_map(SnmpEngine()))
+            ifmap = self._run(self._build_ifindex_map())
             name_to_idx = {n: idx for idx, n in ifmap.items()}
 
             for iface in interfaces:
@@ -7594,17 +8556,21 @@ class SNMPHIOS:
                         Integer32(1 if auto_disable else 2)))
 
         if sets:
-            asyncio.run(self._set_oids(*sets))
+            self._run(self._set_oids(*sets))
 
     # -------------------------------------------------------------------
     # IP Source Guard
     # -------------------------------------------------------------------
 
     def get_ip_source_guard(self, interface=None):
-        return asyncio.run(self._get_ip_source_guard_async(interface))
+        return self._run(self._get_ip_source_guard_async(interface))
+
+    async def aget_ip_source_guard(self, interface=None):
+        """Awaitable get_ip_source_guard()."""
+        return await self._arun(self._get_ip_source_guard_async(interface))
 
     async def _get_ip_source_guard_async(self, interface=None):
-        engine = SnmpEngine()
+        engine = self._get_engine()
 
         # Per-port table walk
         port_rows = await self._walk_columns({
@@ -7703,7 +8669,7 @@ class SNMPHIOS:
         sets = []
         interfaces = ([interface] if isinstance(interface, str)
                       else list(interface))
-        ifmap = asyncio.run(self._build_ifindex_map(SnmpEngine()))
+        ifmap = self._run(self._build_ifindex_map())
         name_to_idx = {n: idx for idx, n in ifmap.items()}
 
         for iface in interfaces:
@@ -7720,4 +8686,4 @@ class SNMPHIOS:
                     Integer32(1 if port_security else 2)))
 
         if sets:
-            asyncio.run(self._set_oids(*sets))
+            self._run(self._set_oids(*sets))
@@ -1,11 +1,20 @@
 from netmiko import ConnectHandler
 from napalm.base.exceptions import ConnectionException
-from napalm_hios.utils import log_error, parse_dot_keys, parse_table, parse_multiline_table
+from napalm_hios.utils import (
+    log_error, parse_dot_keys, parse_table, parse_multiline_table,
+    TableSpec, BLANK_LINE, SECTION_END,
+)
 from typing import List, Dict, Any
 
+import codecs
 import logging
+import os
+import queue
 import re
+import secrets
+import select
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +27,45 @@ def _safe_int(val, default=0):
         return default
 
 
+# Channel patterns, matched as soon as the bytes arrive (see _read_until)
+_CLI_PROMPT = re.compile(r'[>#]\s*$')
+_CONFIRM_PROMPT = re.compile(r'\([Yy]/[Nn]\)')
+_XML_START = re.compile(r'(?=<\?xml)')
+_XML_END = re.compile(r'(?<=</Config>)')
+_LINE_END = re.compile(r'\n')
+_GATE_OR_PROMPT = re.compile(r'Enter new password|[>#]\s*$')
+_CONFIRM_OR_PROMPT = re.compile(r'Confirm|[>#]\s*$')
+
+# Seconds to wait for a prompt, a full XML profile, and the password
+# gate banner after login
+_PROMPT_TIMEOUT = 10
+_XML_TIMEOUT = 25
+_GATE_TIMEOUT = 1
+
+# Tail of the previous read re-scanned with each new chunk, so a
+# pattern split across reads still matches
+_MATCH_OVERLAP = 64
+
+# Commands written per channel round-trip by cli_batch().  Bounded so the
+# typed-ahead lines fit the device's CLI input buffer.
+_BATCH_SIZE = 25
+_UNANSWERED = 'Error: confirmation prompt not answered'
+
+# Terminal size requested for extra shell channels (netmiko's defaults)
+_CHANNEL_TERM_WIDTH = 511
+_CHANNEL_TERM_HEIGHT = 1000
+
+# Precompiled CLI tables (see utils.TableSpec)
+_MAC_TABLE = TableSpec(
+    r'^[ \t]*(\d+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+\S+[ \t]+(\S+)')
+_EVENTS_TABLE = TableSpec(
+    r'^[ \t]*(\d{4}-\d{2}-\d{2}[ \t]+\d{2}:\d{2}:\d{2})[ \t]+(\S+)[ \t]*(.*)',
+    header=r'Time stamp\s+Event', until=BLANK_LINE)
+_LAST_NUMBER = re.compile(r'(\d+)\D*$')
+
+# _extract_table_rows() specs, keyed by header pattern
+_SECTION_TABLES = {}
+
 # Auto-disable reason → category mapping (CLI doesn't show category)
 _AD_REASON_CATEGORY = {
     'link-flap': 'port-monitor', 'crc-error': 'port-monitor',
@@ -112,17 +160,49 @@ _DEVSEC_SENSE_CLI_CMD = {
     'dev_mode_enabled': 'support-mode-enabled',
 }
 
+class _ShellChannel:
+    """Netmiko-like wrapper for an extra shell channel on the SSH transport.
+
+    Provides the subset of the netmiko connection SSHHIOS uses.
+    send_command() goes through the owning worker's cli_batch(), so the
+    channel is read with the same sentinel splitting.
+    """
+
+    def __init__(self, channel, run_batch):
+        self.remote_conn = channel
+        self._run_batch = run_batch
+        self._decoder = codecs.getincrementaldecoder('utf-8')('replace')
+
+    def read_channel(self):
+        data = b''
+        while self.remote_conn.recv_ready():
+            data += self.remote_conn.recv(65535)
+        return self._decoder.decode(data)
+
+    def write_channel(self, data):
+        self.remote_conn.sendall(data.encode())
+
+    def send_command(self, command, **kwargs):
+        return self._run_batch([command])[0]
+
+    def disconnect(self):
+        self.remote_conn.close()
+
+
 class SSHHIOS:
-    def __init__(self, hostname, username, password, timeout, port=22):
+    def __init__(self, hostname, username, password, timeout, port=22,
+                 channels=1):
         self.hostname = hostname
         self.username = username
         self.password = password
         self.timeout = timeout
         self.port = port
+        self.channels = channels          # Shell channels for run_parallel()
         self.connection = None
         self.pagination_disabled = False  # Track the pagination state
         self._in_config_mode = False      # Track global config mode
         self._factory_default = False     # True if password gate detected on open
+        self._workers = None              # Extra channel workers, opened lazily
 
     def open(self):
         try:
@@ -135,8 +215,7 @@ class SSHHIOS:
                 port=self.port
             )
             # Check for factory-default password gate
-            time.sleep(1)
-            output = self.connection.read_channel()
+            output, _ = self._read_until(_GATE_OR_PROMPT, _GATE_TIMEOUT)
             if 'Enter new password' in output:
                 self._factory_default = True
                 logger.info("Factory-default password gate detected on %s", self.hostname)
@@ -158,6 +237,12 @@ class SSHHIOS:
                     )
             except Exception:
                 pass  # best-effort check — don't block close
+            for worker in self._workers or ():
+                try:
+                    worker.connection.disconnect()
+                except Exception:
+                    pass
+            self._workers = None
             self.connection.disconnect()
             self._in_config_mode = False
 
@@ -171,7 +256,7 @@ class SSHHIOS:
             commands = [commands]
 
         output_dict = {}
-        
+
         for command in commands:
             try:
                 output = self.connection.send_command(
@@ -187,6 +272,179 @@ class SSHHIOS:
 
         return output_dict
 
+    def _cli(self, commands):
+        """Getter reads: cli_batch() outputs keyed by command, like cli().
+
+        For internal show-command lists only — cli() stays one command per
+        round-trip so callers get netmiko's per-command prompt handling.
+        """
+        return dict(zip(commands, self.cli_batch(commands)))
+
+    def cli_batch(self, commands, chunk_size=_BATCH_SIZE):
+        """Execute commands in as few channel round-trips as possible.
+
+        Each chunk of commands goes out in one channel write, with a '!'
+        comment line after every command as a sentinel.  The combined
+        output is read once and split on the echoed sentinels.
+
+        Returns the outputs as a list in command order, so repeated
+        commands (e.g. 'exit') keep their own output.  If a chunk cannot
+        be read back, it and everything after it get 'Error: ...' like
+        cli(), and nothing further is sent.  A command that asks a (Y/N)
+        question gets its sentinel as the answer, which declines it; its
+        output becomes 'Error: confirmation prompt not answered: ...' and
+        the following chunks are not sent (commands already typed ahead
+        in the same chunk still run).
+        """
+        if not self.connection:
+            raise ConnectionException("SSH connection is not open")
+
+        commands = list(commands)
+        outputs = []
+        for i in range(0, len(commands), chunk_size):
+            chunk = commands[i:i + chunk_size]
+            try:
+                outputs += self._run_batch(chunk)
+            except Exception as e:
+                logger.error(f"Failed to execute command batch: {e}")
+                outputs += [f"Error: {str(e)}"] * (len(commands) - i)
+                break
+            if any(o.startswith(_UNANSWERED) for o in outputs[i:]):
+                logger.error("Command batch stopped at a confirmation prompt")
+                outputs += ["Error: not sent, batch stopped at a confirmation "
+                            "prompt"] * (len(commands) - len(outputs))
+                break
+        return outputs
+
+    def _run_batch(self, commands):
+        """Write commands plus sentinels in one go and split the output."""
+        token = f'!napalm-hios-{secrets.token_hex(4)}'
+        sentinels = [f'{token}/{n}/' for n in range(len(commands))]
+
+        self.connection.read_channel()   # drop anything stale
+        self.connection.write_channel(''.join(
+            f'{command}\n{sentinel}\n'
+            for command, sentinel in zip(commands, sentinels)))
+
+        output, match = self._read_until(
+            re.compile(re.escape(sentinels[-1])),
+            _PROMPT_TIMEOUT * len(commands))
+        if match is None:
+            raise ConnectionException("Timed out waiting for batch output")
+        if not _CLI_PROMPT.search(output, match.end()):
+            rest, _ = self._read_until(_CLI_PROMPT, _PROMPT_TIMEOUT)
+            output += rest
+
+        text = output.replace('\r\n', '\n').replace('\r', '')
+        results = []
+        pos = 0
+        for command, sentinel in zip(commands, sentinels):
+            end = text.find(sentinel, pos)
+            if end < 0:
+                results.append("Error: output lost in batch")
+                continue
+            segment = self._batch_segment(text[pos:end], command)
+            if _CONFIRM_PROMPT.search(segment):
+                prompt = segment.splitlines()[-1].strip()
+                segment = f"{_UNANSWERED}: {prompt}"
+            results.append(segment)
+            newline = text.find('\n', end)
+            pos = len(text) if newline < 0 else newline + 1
+        return results
+
+    @staticmethod
+    def _batch_segment(segment, command):
+        """Strip the command echo and trailing prompt from one batch segment."""
+        lines = segment.split('\n')
+        for i, line in enumerate(lines):
+            if line.rstrip().endswith(command):
+                lines = lines[i + 1:]
+                break
+        if lines and _CLI_PROMPT.search(lines[-1]):
+            lines = lines[:-1]
+        return '\n'.join(lines).strip()
+
+    # ------------------------------------------------------------------
+    # Multiplexed channels
+    # ------------------------------------------------------------------
+
+    def run_parallel(self, calls):
+        """Run independent read-only calls concurrently over SSH channels.
+
+        Each call is a callable taking an SSHHIOS and is run with either
+        this session or a worker bound to an extra shell channel on the
+        same authenticated transport, so there is no new key exchange or
+        login. Up to `channels` calls run at once. The extra channels open
+        on first use, within the free SSH sessions that
+        get_session_config() reports. Calls must not enter config mode.
+
+        Returns the results in call order; the first exception is raised.
+        """
+        calls = list(calls)
+        workers = [self] + self._open_workers()
+        if len(workers) == 1 or len(calls) < 2:
+            return [call(self) for call in calls]
+
+        free = queue.SimpleQueue()
+        for worker in workers:
+            free.put(worker)
+
+        def run(call):
+            worker = free.get()
+            try:
+                return call(worker)
+            finally:
+                free.put(worker)
+
+        with ThreadPoolExecutor(max_workers=len(workers)) as pool:
+            return list(pool.map(run, calls))
+
+    def _open_workers(self):
+        """Open the extra shell channels once; returns the live workers."""
+        if self._workers is not None:
+            return self._workers
+        self._workers = []
+        wanted = self.channels - 1
+        if wanted < 1 or not self.connection:
+            return self._workers
+        try:
+            ssh = self.get_session_config()['ssh']
+            if ssh['max_sessions']:
+                wanted = min(wanted, ssh['max_sessions'] - ssh['active_sessions'])
+        except Exception as e:
+            logger.warning(f"Could not read SSH session limit: {e}")
+        for _ in range(wanted):
+            try:
+                self._workers.append(self._open_channel())
+            except Exception as e:
+                logger.warning(f"Failed to open extra SSH channel: {e}")
+                break
+        return self._workers
+
+    def _open_channel(self):
+        """Open a shell channel on the existing transport and wrap it.
+
+        The worker is a new SSHHIOS with its own state; only the SSH
+        transport is shared with this session.
+        """
+        transport = self.connection.remote_conn.get_transport()
+        channel = transport.open_session(timeout=self.timeout)
+        try:
+            channel.get_pty(width=_CHANNEL_TERM_WIDTH, height=_CHANNEL_TERM_HEIGHT)
+            channel.invoke_shell()
+            worker = type(self)(self.hostname, self.username, self.password,
+                                self.timeout, port=self.port)
+            worker.connection = _ShellChannel(channel, worker.cli_batch)
+            worker._workers = []
+            _, match = worker._read_until(_CLI_PROMPT, _PROMPT_TIMEOUT)
+            if match is None:
+                raise ConnectionException("No CLI prompt on extra SSH channel")
+            worker.disable_pagination()
+        except Exception:
+            channel.close()
+            raise
+        return worker
+
     def get_interfaces(self):
         """Get interface details from the device."""
         port_output = self.cli('show port')['show port']
@@ -226,7 +484,7 @@ class SSHHIOS:
             if len(fields) < 6:
                 continue
             name = fields[0]
-            if '/' not in name or re.match(r'^-+$', name):
+            if '/' not in name:
                 continue
             if name.startswith('Interface'):
                 continue
@@ -295,8 +553,8 @@ class SSHHIOS:
         }
 
         try:
-            output = self.cli('show system info')['show system info']
-            data = parse_dot_keys(output)
+            results = self._cli(['show system info', 'show port'])
+            data = parse_dot_keys(results['show system info'])
 
             facts['model'] = data.get('Device hardware description', '')
             facts['serial_number'] = data.get('Serial number', '')
@@ -310,8 +568,7 @@ class SSHHIOS:
                 facts['uptime'] = self._parse_uptime(data['System uptime'])
 
             # Get interface list
-            interfaces_output = self.cli('show port')['show port']
-            facts['interface_list'] = self._parse_interface_list(interfaces_output)
+            facts['interface_list'] = self._parse_interface_list(results['show port'])
 
         except Exception as e:
             log_error(logger, f"Error retrieving system facts via SSH: {str(e)}")
@@ -363,10 +620,16 @@ class SSHHIOS:
             'memory': {}
         }
 
-        fan_status_output = self.cli('show fan')['show fan']
-        temperature_output = self.cli('show system temperature limits')['show system temperature limits']
-        system_info_output = self.cli('show system info')['show system info']
-        resources_output = self.cli('show system resources')['show system resources']
+        results = self._cli([
+            'show fan',
+            'show system temperature limits',
+            'show system info',
+            'show system resources',
+        ])
+        fan_status_output = results['show fan']
+        temperature_output = results['show system temperature limits']
+        system_info_output = results['show system info']
+        resources_output = results['show system resources']
 
         # Parse fan status — not all devices have fans (e.g. GRS1042)
         if 'Error' not in fan_status_output and 'Invalid' not in fan_status_output:
@@ -578,6 +841,48 @@ class SSHHIOS:
             except Exception as e:
                 logger.warning(f"Failed to disable pagination: {str(e)}")
 
+    def _wait_readable(self, timeout):
+        """Block until the SSH channel has data or timeout passes.
+
+        Returns False on timeout. A channel that cannot be select()ed
+        falls back to a short sleep.
+        """
+        try:
+            readable, _, _ = select.select(
+                [self.connection.remote_conn], [], [], timeout)
+        except (AttributeError, TypeError, ValueError, OSError):
+            time.sleep(min(timeout, 0.05))
+            return True
+        return bool(readable)
+
+    def _read_until(self, pattern, timeout, idle=None):
+        """Read the channel until the compiled pattern matches.
+
+        Waits on socket readability instead of sleeping, and checks each
+        chunk as it arrives (only the new text plus _MATCH_OVERLAP, so a
+        long transfer is scanned once). With idle, also stops once no
+        data has arrived for that many seconds.
+
+        Returns (output, match); match is None if the read timed out.
+        """
+        output = ''
+        scanned = 0
+        deadline = time.monotonic() + timeout
+        while True:
+            data = self.connection.read_channel()
+            if data:
+                output += data
+                match = pattern.search(output, max(0, scanned - _MATCH_OVERLAP))
+                if match:
+                    return output, match
+                scanned = len(output)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return output, None
+            wait = remaining if idle is None else min(remaining, idle)
+            if not self._wait_readable(wait) and idle is not None:
+                return output, None
+
     def _get_active_profile_index(self):
         """Helper method to find the active profile index."""
         try:
@@ -603,76 +908,130 @@ class SSHHIOS:
             log_error(logger, f"Error getting active profile index: {str(e)}")
             raise
 
-    def _get_xml_config(self, profile_index):
-        """Helper method to retrieve XML configuration for a specific profile."""
+    def _stream_channel(self, start, end, sink, timeout, overlap=_MATCH_OVERLAP):
+        """Pass the channel data between two patterns to sink, chunk by chunk.
+
+        Data before the first `start` match is dropped; data up to the
+        `end` match is handed to sink() as it arrives, with carriage
+        returns removed.  Only the current chunk plus `overlap` characters
+        (at least the longest possible match) are held, so a terminator
+        split across reads is still found and memory stays constant.
+        Raises ConnectionException if no data arrives for `timeout`
+        seconds before `end` is seen.
+
+        Returns whatever was read after the `end` match (often the prompt
+        that followed it in the same chunk).
+        """
+        pending = ''
+        started = False
+        deadline = time.monotonic() + timeout
+        while True:
+            data = self.connection.read_channel()
+            if data:
+                deadline = time.monotonic() + timeout
+                pending += data
+                if not started:
+                    m = start.search(pending)
+                    if m is None:
+                        pending = pending[-overlap:]
+                    else:
+                        started = True
+                        pending = pending[m.end():]
+                if started:
+                    m = end.search(pending)
+                    if m is not None:
+                        sink(pending[:m.start()].replace('\r', ''))
+                        return pending[m.end():]
+                    keep = len(pending) - overlap
+                    if keep > 0:
+                        sink(pending[:keep].replace('\r', ''))
+                        pending = pending[keep:]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ConnectionException(
+                    "Timed out waiting for the end of the configuration")
+            self._wait_readable(remaining)
+
+    def _current_prompt(self):
+        """Return the CLI prompt as the device prints it right now."""
+        self.connection.read_channel()   # drop anything stale
+        self.connection.write_channel('\n')
+        output, match = self._read_until(_CLI_PROMPT, _PROMPT_TIMEOUT)
+        if match is None:
+            raise ConnectionException("No CLI prompt")
+        return output.rstrip().rsplit('\n', 1)[-1].strip()
+
+    def _get_xml_config(self, profile_index, sink=None):
+        """Helper method to retrieve XML configuration for a specific profile.
+
+        With sink, each chunk of XML is passed to it as it arrives and
+        nothing is returned; otherwise the XML is returned as a string.
+        """
         if not self.connection:
             raise ConnectionException("SSH connection is not open")
-            
+
+        chunks = []
         try:
             # First command to initiate XML retrieval
             cmd = f'show config profiles nvm {profile_index}'
             self.connection.write_channel(cmd + '\n')
-            time.sleep(0.5)
-            
-            # Wait for the Y/N prompt
-            output = ""
-            max_attempts = 20
-            for _ in range(max_attempts):
-                new_data = self.connection.read_channel()
-                output += new_data
-                if '(Y/N) ?' in output:
-                    break
-                time.sleep(0.5)
-            
-            if '(Y/N) ?' not in output:
+            _, match = self._read_until(_CONFIRM_PROMPT, _PROMPT_TIMEOUT)
+            if match is None:
                 raise Exception("Did not receive expected Y/N prompt")
-                
-            # Send 'y' and collect XML
+
+            # Send 'y' and stream XML from <?xml up to </Config>
             self.connection.write_channel('y\n')
-            time.sleep(0.5)
-            
-            xml_output = ""
-            xml_started = False
-            max_attempts = 50  # Adjust based on typical response time
-            
-            for _ in range(max_attempts):
-                new_data = self.connection.read_channel()
-                
-                if not xml_started and '<?xml' in new_data:
-                    xml_started = True
-                    xml_output = new_data[new_data.find('<?xml'):]
-                elif xml_started:
-                    xml_output += new_data
-                
-                # Check if we've reached the end of XML
-                if xml_started and '</Config>' in new_data:
-                    # Only keep up to </Config>
-                    xml_output = xml_output[:xml_output.find('</Config>') + 9]
-                    break
-                    
-                time.sleep(0.5)
-            
-            if not xml_started or '</Config>' not in xml_output:
-                raise Exception("Failed to retrieve complete XML configuration")
-            
-            return xml_output.strip()
-            
+            rest = self._stream_channel(_XML_START, _XML_END,
+                                        sink or chunks.append, _XML_TIMEOUT)
+            # The prompt usually arrives with </Config>; only wait if it didn't
+            if not _CLI_PROMPT.search(rest):
+                self._read_until(_CLI_PROMPT, _PROMPT_TIMEOUT)
+
         except Exception as e:
             log_error(logger, f"Error retrieving XML configuration: {str(e)}")
             raise
 
-    def get_config(self, retrieve: str = 'all', full: bool = False, sanitized: bool = True, format: str = 'text'):
+        if sink is None:
+            return ''.join(chunks).strip()
+
+    def _stream_running_config(self, command, sink):
+        """Stream 'show running-config script' output to sink."""
+        prompt = self._current_prompt()
+        self.connection.write_channel(command + '\n')
+        # Output starts after the echoed command line and ends at the prompt
+        self._stream_channel(
+            _LINE_END, re.compile(r'\r?\n' + re.escape(prompt)), sink,
+            _XML_TIMEOUT, overlap=max(_MATCH_OVERLAP, len(prompt) + 2))
+
+    def get_config(self, retrieve: str = 'all', full: bool = False, sanitized: bool = True,
+                   format: str = 'text', stream_to=None):
+        """Retrieve the running config as CLI script ('text') or XML ('xml').
+
+        stream_to: a file path or a callable.  The config is then written
+        to the file, or passed to the callable (e.g. the feed() of an
+        xml.etree.ElementTree.XMLPullParser), chunk by chunk as it
+        arrives from the channel, and 'running' in the result stays ''.
+        Errors are raised rather than logged, and a partly written file
+        is removed.
+        """
         config_dict = {
             'running': '',
             'startup': '',
             'candidate': ''
         }
 
+        if stream_to is not None:
+            self._stream_config(full, format, stream_to)
+            return config_dict
+
         try:
             if format == 'text':
                 command = 'show running-config script all' if full else 'show running-config script'
                 output = self.cli(command)
                 config_dict['running'] = output[command].strip()
+            elif format == 'xml':
+                config_dict['running'] = self._get_xml_config(
+                    self._get_active_profile_index())
             else:
                 # Handle other formats if needed
                 log_error(logger, f"Unsupported config format: {format}")
@@ -681,6 +1040,34 @@ class SSHHIOS:
 
         return config_dict
 
+    def _stream_config(self, full, format, stream_to):
+        """get_config(stream_to=...): write the config to a file or callable."""
+        if not self.connection:
+            raise ConnectionException("SSH connection is not open")
+        if format not in ('text', 'xml'):
+            raise ValueError(f"Unsupported config format: {format}")
+
+        def run(sink):
+            if format == 'xml':
+                self._get_xml_config(self._get_active_profile_index(), sink)
+            else:
+                self._stream_running_config(
+                    'show running-config script all' if full
+                    else 'show running-config script', sink)
+
+        if callable(stream_to):
+            run(stream_to)
+            return
+        try:
+            with open(stream_to, 'w') as f:
+                run(f.write)
+        except BaseException:
+            try:
+                os.remove(stream_to)
+            except OSError:
+                pass
+            raise
+
     def get_config_status(self):
         """Check if running config is saved to NVM.
 
@@ -720,12 +1107,16 @@ class SSHHIOS:
         finally:
             self._disable()
 
-        # NVM write is async — poll until settled (not "busy")
-        for _ in range(10):
+        # NVM write is async — poll until settled (not "busy"), starting
+        # fast since small configs are written in well under a second
+        delay = 0.1
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
             status = self.get_config_status()
             if status['nvm'] != 'busy':
                 return status
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 2, 1)
 
         return self.get_config_status()
 
@@ -1102,23 +1493,15 @@ class SSHHIOS:
             1     16:5f:8d:ba:75:cc  3/3        23       learned
         """
         output = self.cli('show mac-addr-table')['show mac-addr-table']
-        mac_address_table = []
-
-        for fields in parse_table(output, min_fields=5):
-            try:
-                mac_address_table.append({
-                    'mac': fields[1],
-                    'interface': fields[2],
-                    'vlan': int(fields[0]),
-                    'static': fields[4].lower() != 'learned',
-                    'active': True,
-                    'moves': 0,
-                    'last_move': 0.0
-                })
-            except (ValueError, IndexError):
-                continue
-
-        return mac_address_table
+        return [{
+            'mac': mac,
+            'interface': interface,
+            'vlan': int(vlan),
+            'static': status.lower() != 'learned',
+            'active': True,
+            'moves': 0,
+            'last_move': 0.0
+        } for vlan, mac, interface, status in _MAC_TABLE.rows(output)]
     
 
     def _parse_ntp_server_info(self, server_output, status_output):
@@ -1954,27 +2337,12 @@ class SSHHIOS:
         Returns the output after confirmation.
         """
         self.connection.write_channel(cmd + '\n')
-        time.sleep(0.5)
-
-        output = ""
-        for _ in range(20):
-            output += self.connection.read_channel()
-            if '(Y/N)' in output or '(y/n)' in output:
-                break
-            time.sleep(0.5)
-
+        output, _ = self._read_until(_CONFIRM_PROMPT, _PROMPT_TIMEOUT)
         self.connection.write_channel('y\n')
-        time.sleep(0.5)
 
-        # Read remaining output
-        for _ in range(10):
-            new_data = self.connection.read_channel()
-            output += new_data
-            if not new_data:
-                break
-            time.sleep(0.3)
-
-        return output
+        # Read what follows until the prompt returns or the device goes quiet
+        rest, _ = self._read_until(_CLI_PROMPT, _PROMPT_TIMEOUT, idle=0.5)
+        return output + rest
 
     def clear_config(self, keep_ip=False):
         """Clear running config (back to default) via SSH.
@@ -2037,14 +2405,12 @@ class SSHHIOS:
                 "called on factory-fresh devices")
         # Send password to 'Enter new password:' prompt
         self.connection.write_channel(new_password + '\n')
-        time.sleep(1)
         # Send password to 'Confirm new password:' prompt
-        output = self.connection.read_channel()
-        if 'Confirm' in output:
+        _, match = self._read_until(_CONFIRM_OR_PROMPT, _PROMPT_TIMEOUT)
+        if match is not None and match.group() == 'Confirm':
             self.connection.write_channel(new_password + '\n')
-            time.sleep(2)
-        # Read remaining output — should get normal CLI prompt
-        output = self.connection.read_channel()
+            # Read remaining output — should get normal CLI prompt
+            self._read_until(_CLI_PROMPT, _PROMPT_TIMEOUT)
         self._factory_default = False
         # Now set up pagination
         self.disable_pagination()
@@ -3637,7 +4003,7 @@ class SSHHIOS:
         if _all or 'devsec_monitors' in fields:
             cmds.append('show security-status monitor')
 
-        results = self.cli(cmds) if cmds else {}
+        results = self._cli(cmds) if cmds else {}
 
         if _all or any(f in fields for f in
                        ('http', 'https', 'ssh', 'telnet', 'snmp')):
@@ -4170,66 +4536,28 @@ class SSHHIOS:
     def _extract_table_rows(text, header_pattern):
         """Extract data rows from a CLI table identified by header
         line pattern.  Returns list of whitespace-split field lists."""
-        rows = []
-        lines = text.splitlines()
-        header_found = False
-        sep_found = False
-        for line in lines:
-            stripped = line.strip()
-            if not header_found:
-                if re.search(header_pattern, stripped):
-                    header_found = True
-                continue
-            if not sep_found:
-                if (re.match(r'^[-\s]+$', stripped)
-                        and '---' in stripped):
-                    sep_found = True
-                continue
-            if not stripped:
-                break
-            if (stripped.endswith(':')
-                    and '....' not in stripped
-                    and len(stripped) < 50):
-                break
-            fields = stripped.split()
-            if fields:
-                rows.append(fields)
-        return rows
+        spec = _SECTION_TABLES.get(header_pattern)
+        if spec is None:
+            spec = _SECTION_TABLES[header_pattern] = TableSpec(
+                r'^[ \t]*(\S.*)', header=header_pattern, until=SECTION_END)
+        return [row.split() for row, in spec.rows(text)]
 
     @staticmethod
     def _parse_events_section(text):
         """Parse events table (Time stamp / Event / Info) from CLI."""
         events = []
-        in_events = False
-        past_sep = False
-        for line in text.splitlines():
-            stripped = line.strip()
-            if not in_events:
-                if re.search(r'Time stamp\s+Event', stripped):
-                    in_events = True
-                continue
-            if not past_sep:
-                if (re.match(r'^[-\s]+$', stripped)
-                        and '---' in stripped):
-                    past_sep = True
-                continue
-            if not stripped:
-                break
-            m = re.match(
-                r'\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'
-                r'\s+(\S+)\s*(.*)', line)
-            if m:
-                info_text = m.group(3).strip()
-                info_num = 0
-                if info_text and info_text != '-':
-                    nums = re.findall(r'\d+', info_text)
-                    if nums:
-                        info_num = int(nums[-1])
-                events.append({
-                    'cause': m.group(2),
-                    'info': info_num,
-                    'timestamp': m.group(1).strip(),
-                })
+        for timestamp, cause, info_text in _EVENTS_TABLE.rows(text):
+            info_text = info_text.strip()
+            info_num = 0
+            if info_text and info_text != '-':
+                m = _LAST_NUMBER.search(info_text)
+                if m:
+                    info_num = int(m.group(1))
+            events.append({
+                'cause': cause,
+                'info': info_num,
+                'timestamp': timestamp,
+            })
         return events
 
     def get_signal_contact(self):
@@ -4902,7 +5230,7 @@ class SSHHIOS:
 
     def get_dns(self):
         """Read DNS client configuration via CLI."""
-        results = self.cli([
+        results = self._cli([
             'show dns client info',
             'show dns client servers',
             'show dns client servers extern',
@@ -5092,7 +5420,7 @@ class SSHHIOS:
 
     def get_poe(self):
         """Read PoE configuration via CLI."""
-        results = self.cli([
+        results = self._cli([
             'show inlinepower global',
             'show inlinepower port',
             'show inlinepower slot',
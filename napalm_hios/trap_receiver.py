@@ -0,0 +1,359 @@
+"""
+SNMP trap/inform receiver — HiOS notifications as events.
+
+HiOS switches can send traps to any destination configured with
+add_snmp_trap_dest(). TrapReceiver listens for them on an asyncio UDP
+socket (SNMPv1/v2c communities and SNMPv3 USM users, traps and
+informs) and turns each notification into an event dict:
+
+    {'type': 'mrp', 'source': '192.168.1.4', 'trap_oid': '1.3.6...',
+     'uptime': 123456, 'varbinds': {oid: value, ...}, 'ring_state': 'open'}
+
+Types are classified by snmpTrapOID:
+
+    link_down / link_up   IF-MIB linkDown/linkUp (+ ifindex, interface,
+                          oper_status when the varbinds carry them)
+    restart               coldStart / warmStart
+    mrp                   HM2-L2REDUNDANCY-MIB (+ ring_state, redundancy)
+    config_change         HM2-FILEMGMT-MIB
+    trap                  anything else
+
+Devices registered with attach() have their caches invalidated for the
+tables an event touches, so the next getter reads live data: the SNMP
+walk cache, and on restart or config_change the ifIndex and bridge-port
+maps of the SNMP and MOPS sessions.
+wait_for() replaces sleep-and-poll loops, e.g. for ring verification:
+
+    async with TrapReceiver(port=1162) as traps:
+        traps.attach(device)
+        ...  # close the ring
+        event = await traps.wait_for('mrp', source=rm_ip, timeout=10,
+                                     predicate=lambda e: e.get('ring_state') == 'closed')
+
+SNMPv3 traps are authenticated against the sender's engine ID, so pass
+engine_id to add_v3_user(); informs use the receiver's own engine ID.
+"""
+
+import asyncio
+import logging
+import socket
+
+from pyasn1.type import univ
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config, engine
+from pysnmp.entity.rfc3413 import ntfrcv
+
+from napalm_hios.snmp_hios import (
+    _AUTH_PROTOCOLS, _PRIV_PROTOCOLS, _MRP_RING_OPER_STATE, _master_key,
+    OID_ifIndex, OID_ifOperStatus,
+    OID_hm2MrpRingOperState, OID_hm2MrpRedundancyOperState,
+)
+
+logger = logging.getLogger(__name__)
+
+OID_sysUpTime_0 = '1.3.6.1.2.1.1.3.0'
+OID_snmpTrapOID_0 = '1.3.6.1.6.3.1.1.4.1.0'
+
+# SNMPv2-MIB / IF-MIB generic notifications
+_GENERIC_TRAPS = {
+    '1.3.6.1.6.3.1.1.5.1': 'restart',      # coldStart
+    '1.3.6.1.6.3.1.1.5.2': 'restart',      # warmStart
+    '1.3.6.1.6.3.1.1.5.3': 'link_down',
+    '1.3.6.1.6.3.1.1.5.4': 'link_up',
+}
+
+# Hirschmann private MIB subtrees -> event type
+_HM2_TRAP_SUBTREES = {
+    '1.3.6.1.4.1.248.11.40': 'mrp',             # HM2-L2REDUNDANCY-MIB
+    '1.3.6.1.4.1.248.11.21': 'config_change',   # HM2-FILEMGMT-MIB
+}
+
+# Walk cache prefixes each event type invalidates (() = everything).
+# MRP tables are never walk-cached, so mrp events invalidate nothing.
+_INVALIDATES = {
+    'link_down': ('1.3.6.1.2.1.2.2.1', '1.3.6.1.2.1.31.1.1.1'),
+    'link_up': ('1.3.6.1.2.1.2.2.1', '1.3.6.1.2.1.31.1.1.1'),
+    'config_change': (),
+    'restart': (),
+}
+
+# Event types after which ifIndex/bridge-port maps may have changed
+_RESETS_PORT_MAPS = ('config_change', 'restart')
+
+_IF_OPER_STATUS = {1: 'up', 2: 'down', 3: 'testing', 5: 'dormant',
+                   6: 'notPresent', 7: 'lowerLayerDown'}
+
+
+def _value(val):
+    """pysnmp value -> int for numeric types, str otherwise."""
+    if isinstance(val, univ.Integer):
+        return int(val)
+    return val.prettyPrint()
+
+
+def _column(varbinds, column_oid):
+    """(row suffix, value) of the first varbind in a table column."""
+    prefix = column_oid + '.'
+    for oid, val in varbinds.items():
+        if oid.startswith(prefix):
+            return oid[len(prefix):], val
+    return None, None
+
+
+def decode_notification(source, varbinds):
+    """Build an event dict from a notification's varbinds.
+
+    Args:
+        source: sender IP address
+        varbinds: {oid_string: value} with pysnmp or plain values
+    """
+    varbinds = {oid: (_value(val) if hasattr(val, 'prettyPrint') else val)
+                for oid, val in varbinds.items()}
+    trap_oid = str(varbinds.pop(OID_snmpTrapOID_0, ''))
+    uptime = varbinds.pop(OID_sysUpTime_0, 0)
+    event_type = _GENERIC_TRAPS.get(trap_oid, 'trap')
+    if event_type == 'trap':
+        for subtree, name in _HM2_TRAP_SUBTREES.items():
+            if trap_oid.startswith(subtree + '.'):
+                event_type = name
+                break
+    event = {
+        'type': event_type,
+        'source': source,
+        'trap_oid': trap_oid,
+        'uptime': uptime,
+        'varbinds': varbinds,
+    }
+    if event_type in ('link_down', 'link_up'):
+        _, ifindex = _column(varbinds, OID_ifIndex)
+        row, oper = _column(varbinds, OID_ifOperStatus)
+        if ifindex is None:
+            ifindex = row   # ifOperStatus is indexed by ifIndex
+        if ifindex is not None:
+            event['ifindex'] = str(ifindex)
+        if oper is not None:
+            event['oper_status'] = _IF_OPER_STATUS.get(oper, 'unknown')
+    elif event_type == 'mrp':
+        _, ring_oper = _column(varbinds, OID_hm2MrpRingOperState)
+        if ring_oper is not None:
+            event['ring_state'] = _MRP_RING_OPER_STATE.get(ring_oper, 'undefined')
+        _, redundancy = _column(varbinds, OID_hm2MrpRedundancyOperState)
+        if redundancy is not None:
+            event['redundancy'] = redundancy == 1
+    return event
+
+
+class TrapReceiver:
+    """Asyncio SNMP notification receiver.
+
+    Args:
+        host: listen address (default all interfaces)
+        port: UDP port; 162 needs privileges, 0 picks a free port
+        communities: SNMPv1/v2c communities to accept
+    """
+
+    def __init__(self, host='0.0.0.0', port=162, communities=('public',)):
+        self.host = host
+        self.port = port
+        self.communities = tuple(communities)
+        self._users = []          # add_v3_user() kwargs, applied on start()
+        self._engine = None
+        self._transport = None
+        self._devices = {}        # source address -> backend or HIOSDriver
+        self._callbacks = []
+        self._waiters = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    # ------------------------------------------------------------------
+    # Setup
+    # ------------------------------------------------------------------
+
+    def add_v3_user(self, username, password, auth_protocol='md5',
+                    priv_protocol='des', engine_id=None):
+        """Accept SNMPv3 authPriv notifications from username.
+
+        engine_id (hex string or bytes) is the sending switch's
+        snmpEngineID, needed for traps; informs work without it.
+        """
+        if auth_protocol not in _AUTH_PROTOCOLS:
+            raise ValueError(f"Invalid auth_protocol '{auth_protocol}': "
+                             f"use {', '.join(_AUTH_PROTOCOLS)}")
+        if priv_protocol not in _PRIV_PROTOCOLS:
+            raise ValueError(f"Invalid priv_protocol '{priv_protocol}': "
+                             f"use {', '.join(_PRIV_PROTOCOLS)}")
+        if isinstance(engine_id, str):
+            engine_id = bytes.fromhex(engine_id.replace(':', '').replace(' ', ''))
+        master_key = _master_key(password, auth_protocol)
+        user = dict(
+            userName=username,
+            authProtocol=_AUTH_PROTOCOLS[auth_protocol][0], authKey=master_key,
+            privProtocol=_PRIV_PROTOCOLS[priv_protocol], privKey=master_key,
+            authKeyType=config.USM_KEY_TYPE_MASTER,
+            privKeyType=config.USM_KEY_TYPE_MASTER,
+        )
+        if engine_id is not None:
+            user['securityEngineId'] = univ.OctetString(engine_id)
+        self._users.append(user)
+        if self._engine is not None:
+            config.add_v3_user(self._engine, **user)
+
+    def attach(self, device, address=None):
+        """Invalidate device's caches on events from its address.
+
+        device is an SNMPHIOS, MOPSHIOS or HIOSDriver (its SNMP and MOPS
+        backends are looked up per event, so lazy or reopened sessions are
+        followed). address defaults to device.hostname resolved to an IP.
+        """
+        if address is None:
+            try:
+                address = socket.gethostbyname(device.hostname)
+            except OSError:
+                address = device.hostname
+        self._devices[address] = device
+
+    def detach(self, device):
+        for address, attached in list(self._devices.items()):
+            if attached is device:
+                del self._devices[address]
+
+    def subscribe(self, callback):
+        """Call callback(event) for every notification received."""
+        self._callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        self._callbacks.remove(callback)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """Bind the UDP socket on the running loop and start receiving."""
+        if self._engine is not None:
+            return
+        # Bind here so a busy port fails now, not inside pysnmp's endpoint task
+        sock = socket.socket(udp.UdpTransport.SOCK_FAMILY, socket.SOCK_DGRAM)
+        try:
+            sock.bind((self.host, self.port))
+        except OSError as e:
+            sock.close()
+            raise OSError(f"Cannot listen for traps on {self.host}:{self.port}: {e}")
+        sock.setblocking(False)
+        self.port = sock.getsockname()[1]
+        snmp_engine = engine.SnmpEngine()
+        transport = udp.UdpTransport().open_server_mode(sock=sock)
+        config.add_transport(snmp_engine, udp.DOMAIN_NAME, transport)
+        for i, community in enumerate(self.communities):
+            config.add_v1_system(snmp_engine, f'hios-trap-{i}', community)
+        for user in self._users:
+            config.add_v3_user(snmp_engine, **user)
+        ntfrcv.NotificationReceiver(snmp_engine, self._on_notification)
+        snmp_engine.transport_dispatcher.job_started(1)
+        self._engine, self._transport = snmp_engine, transport
+        logger.info("Listening for SNMP notifications on %s:%d", self.host, self.port)
+
+    async def stop(self):
+        if self._engine is None:
+            return
+        self._engine.transport_dispatcher.job_finished(1)
+        self._engine.close_dispatcher()
+        self._engine = self._transport = None
+        for waiter in self._waiters:
+            if not waiter[0].done():
+                waiter[0].cancel()
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    async def wait_for(self, type=None, source=None, predicate=None, timeout=None):
+        """Wait for the next matching event and return it.
+
+        Raises asyncio.TimeoutError if none arrives within timeout.
+        """
+        future = asyncio.get_running_loop().create_future()
+        waiter = (future, type, source, predicate)
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._waiters.remove(waiter)
+
+    def _on_notification(self, snmp_engine, state_reference, context_engine_id,
+                         context_name, varbinds, cb_ctx):
+        _, address = snmp_engine.message_dispatcher.get_transport_info(
+            state_reference)
+        event = decode_notification(
+            address[0], {str(oid): val for oid, val in varbinds})
+        self.dispatch(event)
+
+    def dispatch(self, event):
+        """Deliver an event: invalidate caches, then callbacks and waiters."""
+        for backend in self._backends(event['source']):
+            if ('ifindex' in event and 'interface' not in event
+                    and backend._ifindex_map):
+                event['interface'] = backend._ifindex_map.get(event['ifindex'], '')
+            self._invalidate(backend, event['type'])
+        for callback in list(self._callbacks):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning("Trap callback failed: %s", e)
+        for future, type_, source, predicate in list(self._waiters):
+            if future.done():
+                continue
+            if type_ is not None and event['type'] != type_:
+                continue
+            if source is not None and event['source'] != source:
+                continue
+            if predicate is not None and not predicate(event):
+                continue
+            future.set_result(event)
+
+    def _backends(self, address):
+        device = self._devices.get(address)
+        if device is None:
+            return []
+        if not (hasattr(device, 'snmp') or hasattr(device, 'mops')):
+            return [device]
+        # HIOSDriver keeps its sessions in .snmp and .mops; SSH and offline
+        # backends hold no caches
+        backends = [b for b in (getattr(device, 'snmp', None),
+                                getattr(device, 'mops', None)) if b is not None]
+        if not backends:
+            logger.debug("Trap from %s: %s has no SNMP or MOPS session, "
+                         "no caches to invalidate", address, device.hostname)
+        return backends
+
+    @staticmethod
+    def _invalidate(backend, event_type):
+        prefixes = _INVALIDATES.get(event_type)
+        reset_maps = event_type in _RESETS_PORT_MAPS
+        if prefixes is None and not reset_maps:
+            return
+
+        def invalidate():
+            if reset_maps:
+                # Rebuilt on next use; port_map_cache picks up any change
+                backend._ifindex_map = None
+                if hasattr(backend, '_bp_map'):
+                    backend._bp_map = None
+            if prefixes is not None and hasattr(backend, '_invalidate_walks'):
+                backend._invalidate_walks(*prefixes)
+
+        # SNMP caches belong to the session loop; hand over if needed
+        loop = getattr(backend, '_loop', None)
+        if loop is not None and not backend._on_session_loop():
+            try:
+                loop.call_soon_threadsafe(invalidate)
+                return
+            except RuntimeError:
+                pass  # loop closed
+        invalidate()
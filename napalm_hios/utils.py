@@ -32,6 +32,75 @@ def parse_dot_keys(text):
     return result
 
 
+# A separator line: only dashes and blanks, with at least one '---' run
+_SEPARATOR = re.compile(r'[-\s]*---[-\s]*')
+_SEPARATOR_LINE = re.compile(r'^[- \t]*---[- \t]*\r?$', re.M)
+
+# End of a header-scoped table: a blank line, or a short section title
+# ending in ':' that is not a dot-key line
+BLANK_LINE = r'^[ \t\r]*$'
+SECTION_END = BLANK_LINE + r'|^[ \t]*(?:(?!\.\.\.\.)[^\n]){0,48}:[ \t\r]*$'
+
+
+class TableSpec:
+    """
+    Declarative parser for one HiOS CLI table, compiled once at import.
+
+    The table body starts after the first dashed separator line (after
+    the first line matching `header`, if given) and runs to the end of
+    the text, or to the first line matching `until`. Rows are matched
+    with the compiled `row` pattern directly on the raw text, so there is
+    no splitlines()/strip()/split() per line; lines that don't match are
+    skipped. The row pattern's groups are the columns.
+
+    Args:
+        row: regex for one data row (MULTILINE; use [ \\t] not \\s
+            between fields so a match cannot run into the next line)
+        header: optional regex for the header line that scopes the table
+        until: optional regex for the line that ends the table
+    """
+
+    __slots__ = ('row', 'header', 'until')
+
+    def __init__(self, row, header=None, until=None):
+        self.row = re.compile(row, re.M)
+        self.header = re.compile(header, re.M) if header else None
+        self.until = re.compile(until, re.M) if until else None
+
+    def body(self, text):
+        """Return (start, end) offsets of the table body, or None."""
+        pos = 0
+        if self.header is not None:
+            m = self.header.search(text)
+            if m is None:
+                return None
+            pos = m.end()
+        m = _SEPARATOR_LINE.search(text, pos)
+        if m is None:
+            return None
+        start = m.end() + 1
+        end = len(text)
+        if self.until is not None:
+            m = self.until.search(text, start)
+            if m is not None:
+                end = m.start()
+        return start, end
+
+    def rows(self, text):
+        """Return the matched groups of each data row as a list of tuples.
+
+        The row pattern runs as one findall() over the body, so the
+        per-row work is only the caller's own conversion.
+        """
+        span = self.body(text)
+        if span is None:
+            return []
+        found = self.row.findall(text, *span)
+        if self.row.groups == 1:
+            return [(value,) for value in found]
+        return found
+
+
 def parse_table(text, min_fields=2):
     """
     Parse a HiOS fixed-width table with a dashed separator line.
@@ -47,22 +116,22 @@ def parse_table(text, min_fields=2):
     Returns:
         list of lists, one per data row
     """
-    rows = []
-    past_header = False
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        # Detect separator line
-        if re.match(r'^[-\s]+$', stripped) and '---' in stripped:
-            past_header = True
+    return list(iter_table(text, min_fields))
+
+
+def iter_table(text, min_fields=2):
+    """Generator form of parse_table(): yields one field list per row."""
+    m = _SEPARATOR_LINE.search(text)
+    if m is None:
+        return
+    separator = _SEPARATOR.fullmatch
+    for line in text[m.end() + 1:].splitlines():
+        fields = line.split()
+        if not fields or len(fields) < min_fields:
             continue
-        if not past_header:
+        if fields[0][0] == '-' and separator(line):
             continue
-        fields = stripped.split()
-        if len(fields) >= min_fields:
-            rows.append(fields)
-    return rows
+        yield fields
 
 
 def parse_multiline_table(text, lines_per_record, min_fields_first=2):
@@ -82,24 +151,25 @@ def parse_multiline_table(text, lines_per_record, min_fields_first=2):
         Secondary lines that don't have enough content are returned as
         empty lists.
     """
-    rows = parse_table(text, min_fields=1)
+    rows = iter_table(text, min_fields=1)
 
     records = []
-    i = 0
-    while i < len(rows):
-        first = rows[i]
+    pending = next(rows, None)
+    while pending is not None:
+        first, pending = pending, next(rows, None)
         # Check if this looks like the start of a record (has interface-like
         # first field with enough columns)
-        if len(first) >= min_fields_first and '/' in first[0]:
-            record = [first]
-            for j in range(1, lines_per_record):
-                if i + j < len(rows) and (not rows[i + j] or '/' not in rows[i + j][0]):
-                    record.append(rows[i + j])
-                else:
-                    record.append([])
-            records.append(tuple(record))
-            i += lines_per_record
-        else:
-            i += 1
+        if len(first) < min_fields_first or '/' not in first[0]:
+            continue
+        record = [first]
+        for _ in range(1, lines_per_record):
+            if pending is not None and '/' not in pending[0]:
+                record.append(pending)
+                pending = next(rows, None)
+            else:
+                record.append([])
+                if pending is not None:
+                    pending = next(rows, None)
+        records.append(tuple(record))
 
     return records
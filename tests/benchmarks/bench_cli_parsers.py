@@ -0,0 +1,228 @@
+"""Micro-benchmarks: precompiled CLI table parsers versus the line loops.
+
+Run from the repository root:
+    PYTHONPATH=. python tests/benchmarks/bench_cli_parsers.py [--rows N]
+
+The legacy_* functions are verbatim copies of the parsers TableSpec
+replaced (utils.parse_table, SSHHIOS.get_mac_address_table etc.).
+Tables are built from the captured fixtures in tests/fixtures, or, for
+show mac-addr-table and the events section, from the HiOS layout in the
+parser docstrings, grown to --rows rows. Every workload is first checked
+for identical output, then timed; figures are rows per second, plus the
+tracemalloc peak of one call.
+"""
+
+import argparse
+import os
+import random
+import re
+import timeit
+import tracemalloc
+
+from napalm_hios import utils
+from napalm_hios.ssh_hios import SSHHIOS
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "fixtures")
+
+
+# ---------------------------------------------------------------------------
+# Original parsers (baseline)
+# ---------------------------------------------------------------------------
+
+def legacy_parse_table(text, min_fields=2):
+    rows = []
+    past_header = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        # Detect separator line
+        if re.match(r'^[-\s]+$', stripped) and '---' in stripped:
+            past_header = True
+            continue
+        if not past_header:
+            continue
+        fields = stripped.split()
+        if len(fields) >= min_fields:
+            rows.append(fields)
+    return rows
+
+
+def legacy_parse_multiline_table(text, lines_per_record, min_fields_first=2):
+    rows = legacy_parse_table(text, min_fields=1)
+
+    records = []
+    i = 0
+    while i < len(rows):
+        first = rows[i]
+        if len(first) >= min_fields_first and '/' in first[0]:
+            record = [first]
+            for j in range(1, lines_per_record):
+                if i + j < len(rows) and (not rows[i + j] or '/' not in rows[i + j][0]):
+                    record.append(rows[i + j])
+                else:
+                    record.append([])
+            records.append(tuple(record))
+            i += lines_per_record
+        else:
+            i += 1
+
+    return records
+
+
+def legacy_mac_address_table(output):
+    mac_address_table = []
+
+    for fields in legacy_parse_table(output, min_fields=5):
+        try:
+            mac_address_table.append({
+                'mac': fields[1],
+                'interface': fields[2],
+                'vlan': int(fields[0]),
+                'static': fields[4].lower() != 'learned',
+                'active': True,
+                'moves': 0,
+                'last_move': 0.0
+            })
+        except (ValueError, IndexError):
+            continue
+
+    return mac_address_table
+
+
+def legacy_parse_events_section(text):
+    events = []
+    in_events = False
+    past_sep = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not in_events:
+            if re.search(r'Time stamp\s+Event', stripped):
+                in_events = True
+            continue
+        if not past_sep:
+            if (re.match(r'^[-\s]+$', stripped)
+                    and '---' in stripped):
+                past_sep = True
+            continue
+        if not stripped:
+            break
+        m = re.match(
+            r'\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'
+            r'\s+(\S+)\s*(.*)', line)
+        if m:
+            info_text = m.group(3).strip()
+            info_num = 0
+            if info_text and info_text != '-':
+                nums = re.findall(r'\d+', info_text)
+                if nums:
+                    info_num = int(nums[-1])
+            events.append({
+                'cause': m.group(2),
+                'info': info_num,
+                'timestamp': m.group(1).strip(),
+            })
+    return events
+
+
+# ---------------------------------------------------------------------------
+# Workloads
+# ---------------------------------------------------------------------------
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name)) as f:
+        return f.read()
+
+
+def _grow(text, rows, lines_per_row=1):
+    """Repeat the data rows of a captured table until it has `rows` rows."""
+    lines = text.splitlines()
+    sep = next(i for i, l in enumerate(lines) if '---' in l)
+    head, body = lines[:sep + 1], [l for l in lines[sep + 1:] if l.strip()]
+    reps = -(-rows * lines_per_row // len(body))
+    return '\r\n'.join(head + (body * reps)[:rows * lines_per_row]) + '\r\n'
+
+
+def _mac_table(rows, rng):
+    lines = ['VLAN  Mac Address        Interface  IfIndex  Status',
+             '----  -----------------  ---------  -------  ------------']
+    for _ in range(rows):
+        port = rng.randint(1, 48)
+        lines.append(f'{rng.randint(1, 4094):<4}  {rng.randbytes(6).hex(":")}  '
+                     f'1/{port:<7}  {port:<7}  '
+                     f'{rng.choice(("learned", "learned", "learned", "mgmt"))}')
+    return '\r\n'.join(lines) + '\r\n'
+
+
+def _events(rows, rng):
+    lines = ['Events', '', 'Time stamp           Event            Info',
+             '-------------------  ---------------  ----------']
+    for i in range(rows):
+        lines.append(f'2025-01-{1 + i % 28:02d} 12:{i % 60:02d}:{rng.randint(0, 59):02d}  '
+                     f'{rng.choice(("link-down", "temperature", "psu-fail"))}  '
+                     f'{rng.choice(("-", f"port 1/{i % 48}", "12 C"))}')
+    return '\r\n'.join(lines) + '\r\n\r\nOther section:\r\n'
+
+
+def _workloads(rows, rng):
+    mac = _mac_table(rows, rng)
+    arp = _grow(_fixture('show_ip_arp_table.txt'), rows)
+    port = _grow(_fixture('show_port.txt'), rows, 2)
+    counters = _grow(_fixture('show_interface_counters.txt'), rows, 3)
+    events = _events(rows, rng)
+    ssh = SSHHIOS.__new__(SSHHIOS)
+    ssh.cli = lambda cmd: {cmd: mac}
+    return [
+        ("mac_address_table", rows,
+         lambda: legacy_mac_address_table(mac),
+         ssh.get_mac_address_table),
+        ("parse_table mac", rows,
+         lambda: legacy_parse_table(mac, 5),
+         lambda: utils.parse_table(mac, 5)),
+        ("parse_table arp", rows,
+         lambda: legacy_parse_table(arp, 6),
+         lambda: utils.parse_table(arp, 6)),
+        ("multiline port", rows,
+         lambda: legacy_parse_multiline_table(port, 2),
+         lambda: utils.parse_multiline_table(port, 2)),
+        ("multiline counters", rows,
+         lambda: legacy_parse_multiline_table(counters, 3, 1),
+         lambda: utils.parse_multiline_table(counters, 3, 1)),
+        ("events section", rows,
+         lambda: legacy_parse_events_section(events),
+         lambda: SSHHIOS._parse_events_section(events)),
+    ]
+
+
+def _rate(fn, rows, repeat):
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    return rows / best
+
+
+def _peak(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    rng = random.Random(1)
+
+    print(f"{'workload':<20}{'legacy rows/s':>15}{'spec rows/s':>14}{'speedup':>9}"
+          f"{'legacy KiB':>12}{'spec KiB':>10}")
+    for name, rows, legacy, spec in _workloads(args.rows, rng):
+        assert legacy() == spec(), f"{name}: output differs from baseline"
+        old = _rate(legacy, rows, args.repeat)
+        new = _rate(spec, rows, args.repeat)
+        print(f"{name:<20}{old:>15,.0f}{new:>14,.0f}{new / old:>8.1f}x"
+              f"{_peak(legacy):>12,.0f}{_peak(spec):>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
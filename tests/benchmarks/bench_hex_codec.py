@@ -0,0 +1,149 @@
+"""Micro-benchmarks: hex_codec versus the original per-value helpers.
+
+Run from the repository root:
+    PYTHONPATH=. python tests/benchmarks/bench_hex_codec.py [--rows N]
+
+The legacy_* functions are verbatim copies of the helpers hex_codec
+replaced (mops_client._decode_hex_string etc.). Every workload is first
+checked for identical output, then timed; figures are rows per second.
+decode_portlist is per value, decode_portlists the memoised batch call.
+"""
+
+import argparse
+import ipaddress
+import random
+import timeit
+
+from napalm_hios import hex_codec
+
+
+# ---------------------------------------------------------------------------
+# Original helpers (baseline)
+# ---------------------------------------------------------------------------
+
+def legacy_decode_string(value):
+    if not value or not value.strip():
+        return ""
+    parts = value.strip().split()
+    if all(len(p) == 2 for p in parts):
+        try:
+            raw = bytes.fromhex(value.replace(" ", ""))
+            return raw.decode("utf-8", errors="replace")
+        except ValueError:
+            pass
+    return value
+
+
+def legacy_decode_mac(value):
+    if not value:
+        return ""
+    parts = value.strip().split()
+    if len(parts) == 6 and all(len(p) == 2 for p in parts):
+        try:
+            bytes.fromhex("".join(parts))
+            return ":".join(p.lower() for p in parts)
+        except ValueError:
+            pass
+    if len(value) == 6 and not value.isascii() or (len(value) == 6 and any(ord(c) > 127 or ord(c) < 32 for c in value)):
+        return ":".join(f"{ord(c):02x}" for c in value)
+    if len(value) == 6 and " " not in value and ":" not in value:
+        return ":".join(f"{ord(c):02x}" for c in value)
+    return value
+
+
+def legacy_decode_ip(hex_str):
+    if not hex_str or not hex_str.strip():
+        return ""
+    parts = hex_str.strip().split()
+    try:
+        octets = [int(p, 16) for p in parts]
+    except ValueError:
+        return hex_str
+    if len(octets) == 4:
+        return ".".join(str(o) for o in octets)
+    if len(octets) == 16:
+        return str(ipaddress.IPv6Address(bytes(octets)))
+    return hex_str
+
+
+def legacy_decode_portlist(hex_str, ifindex_map):
+    interfaces = []
+    if not hex_str or not hex_str.strip():
+        return interfaces
+    try:
+        octets = bytes.fromhex(hex_str.replace(" ", ""))
+    except ValueError:
+        return interfaces
+    for byte_idx, byte_val in enumerate(octets):
+        for bit_idx in range(8):
+            if byte_val & (0x80 >> bit_idx):
+                port_num = byte_idx * 8 + bit_idx + 1
+                name = ifindex_map.get(str(port_num), f'port{port_num}')
+                interfaces.append(name)
+    return interfaces
+
+
+def legacy_encode_string(text):
+    return " ".join(f"{b:02x}" for b in text.encode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Workloads — shapes seen on real switches
+# ---------------------------------------------------------------------------
+
+def _workloads(rows, rng):
+    macs = [rng.randbytes(6).hex(" ") for _ in range(rows)]
+    names = [f"port-{i}-uplink-to-cabinet-{i % 40}".encode().hex(" ")
+             for i in range(rows)]
+    ips = [rng.randbytes(4).hex(" ") for _ in range(rows)]
+    # 64-byte PortLists (512 bridge ports), mostly zero, few distinct masks
+    masks = [bytes([rng.choice((0, 0, 0, 0x80, 0xc0, 0xff)) for _ in range(4)])
+             + bytes(60) for _ in range(8)]
+    portlists = [rng.choice(masks).hex(" ") for _ in range(rows)]
+    ifmap = {str(i): f"{1 + (i - 1) // 8}/{1 + (i - 1) % 8}"
+             for i in range(1, 33)}
+    texts = [f"description {i}" for i in range(rows)]
+    return [
+        ("decode_string", names,
+         lambda: [legacy_decode_string(v) for v in names],
+         lambda: hex_codec.decode_strings(names)),
+        ("decode_mac", macs,
+         lambda: [legacy_decode_mac(v) for v in macs],
+         lambda: hex_codec.decode_macs(macs)),
+        ("decode_ip", ips,
+         lambda: [legacy_decode_ip(v) for v in ips],
+         lambda: hex_codec.decode_ips(ips)),
+        ("decode_portlist", portlists,
+         lambda: [legacy_decode_portlist(v, ifmap) for v in portlists],
+         lambda: [hex_codec.decode_portlist(v, ifmap) for v in portlists]),
+        ("decode_portlists", portlists,
+         lambda: [legacy_decode_portlist(v, ifmap) for v in portlists],
+         lambda: hex_codec.decode_portlists(portlists, ifmap)),
+        ("encode_string", texts,
+         lambda: [legacy_encode_string(v) for v in texts],
+         lambda: [hex_codec.encode_string(v) for v in texts]),
+    ]
+
+
+def _rate(fn, rows, repeat):
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    return rows / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    rng = random.Random(1)
+
+    print(f"{'workload':<18}{'legacy rows/s':>16}{'codec rows/s':>16}{'speedup':>10}")
+    for name, _, legacy, codec in _workloads(args.rows, rng):
+        assert legacy() == codec(), f"{name}: output differs from baseline"
+        old = _rate(legacy, args.rows, args.repeat)
+        new = _rate(codec, args.rows, args.repeat)
+        print(f"{name:<18}{old:>16,.0f}{new:>16,.0f}{new / old:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Unit tests for hex_codec — MOPS hex values and PortList bitmaps."""
+
+import unittest
+
+from napalm_hios import hex_codec
+
+
+class TestDecodeString(unittest.TestCase):
+
+    def test_canonical(self):
+        self.assertEqual(hex_codec.decode_string("48 69 4f 53"), "HiOS")
+        self.assertEqual(hex_codec.decode_string("48 69 4F 53"), "HiOS")
+        self.assertEqual(hex_codec.decode_string("41"), "A")
+
+    def test_irregular_spacing(self):
+        self.assertEqual(hex_codec.decode_string(" 48  69 "), "Hi")
+
+    def test_not_hex(self):
+        self.assertEqual(hex_codec.decode_string("BRS50"), "BRS50")
+        self.assertEqual(hex_codec.decode_string("4869"), "4869")
+        self.assertEqual(hex_codec.decode_string("zz yy"), "zz yy")
+        # integers that happen to be two hex digits are still decoded
+        self.assertEqual(hex_codec.decode_string("25"), "%")
+
+    def test_empty(self):
+        self.assertEqual(hex_codec.decode_string(""), "")
+        self.assertEqual(hex_codec.decode_string("   "), "")
+        self.assertEqual(hex_codec.decode_string(None), "")
+
+    def test_invalid_utf8_replaced(self):
+        self.assertEqual(hex_codec.decode_string("ff 41"), "�A")
+
+
+class TestDecodeMac(unittest.TestCase):
+
+    def test_canonical(self):
+        self.assertEqual(hex_codec.decode_mac("64 60 38 8A 42 D6"),
+                         "64:60:38:8a:42:d6")
+
+    def test_irregular_spacing(self):
+        self.assertEqual(hex_codec.decode_mac(" 64 60 38 8a 42  d6"),
+                         "64:60:38:8a:42:d6")
+
+    def test_binary_string(self):
+        self.assertEqual(hex_codec.decode_mac("d`8\x8aB\xd6"), "64:60:38:8a:42:d6")
+        self.assertEqual(hex_codec.decode_mac("ABCDEF"), "41:42:43:44:45:46")
+
+    def test_passthrough(self):
+        self.assertEqual(hex_codec.decode_mac("64 60 38"), "64 60 38")
+        self.assertEqual(hex_codec.decode_mac("64:60:38:8a:42:d6"),
+                         "64:60:38:8a:42:d6")
+        self.assertEqual(hex_codec.decode_mac(""), "")
+
+
+class TestDecodeIp(unittest.TestCase):
+
+    def test_ipv4(self):
+        self.assertEqual(hex_codec.decode_ip("c0 a8 03 01"), "192.168.3.1")
+        self.assertEqual(hex_codec.decode_ip("c0 a8 3 1"), "192.168.3.1")
+
+    def test_ipv6(self):
+        self.assertEqual(
+            hex_codec.decode_ip("fe 80 00 00 00 00 00 00 00 00 00 00 00 00 00 01"),
+            "fe80::1")
+
+    def test_other(self):
+        self.assertEqual(hex_codec.decode_ip("c0 a8"), "c0 a8")
+        self.assertEqual(hex_codec.decode_ip("xx"), "xx")
+        self.assertEqual(hex_codec.decode_ip(" "), "")
+
+
+class TestPortList(unittest.TestCase):
+
+    def test_portlist_ports(self):
+        self.assertEqual(hex_codec.portlist_ports(b"\xc0\x00\x01"), [1, 2, 24])
+        self.assertEqual(hex_codec.portlist_ports(b"\xff"), list(range(1, 9)))
+        self.assertEqual(hex_codec.portlist_ports(b""), [])
+
+    def test_decode_portlist(self):
+        ifmap = {"1": "1/1", "2": "1/2"}
+        self.assertEqual(hex_codec.decode_portlist("c0 80", ifmap),
+                         ["1/1", "1/2", "port9"])
+        self.assertEqual(hex_codec.decode_portlist("c 0", ifmap), ["1/1", "1/2"])
+        self.assertEqual(hex_codec.decode_portlist("zz", ifmap), [])
+        self.assertEqual(hex_codec.decode_portlist(None, ifmap), [])
+
+    def test_encode_portlist(self):
+        self.assertEqual(hex_codec.encode_portlist([1, 2, 9]), b"\xc0\x80")
+        self.assertEqual(hex_codec.encode_portlist(["24"]), b"\x00\x00\x01")
+        self.assertEqual(hex_codec.encode_portlist([1], total_ports=32),
+                         b"\x80\x00\x00\x00")
+        self.assertEqual(hex_codec.encode_portlist([]), b"")
+
+    def test_roundtrip(self):
+        ports = [1, 5, 8, 9, 17, 28]
+        self.assertEqual(
+            hex_codec.portlist_ports(hex_codec.encode_portlist(ports)), ports)
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_columns(self):
+        self.assertEqual(hex_codec.decode_strings(["48 69", "", "x"]),
+                         ["Hi", "", "x"])
+        self.assertEqual(hex_codec.decode_macs(["00 11 22 33 44 55", ""]),
+                         ["00:11:22:33:44:55", ""])
+        self.assertEqual(hex_codec.decode_ips(["0a 00 00 01"]), ["10.0.0.1"])
+
+    def test_decode_portlists_memoised(self):
+        ifmap = {"1": "1/1", "2": "1/2"}
+        out = hex_codec.decode_portlists(["c0", "c0", "", "40"], ifmap)
+        self.assertEqual(out, [["1/1", "1/2"], ["1/1", "1/2"], [], ["1/2"]])
+        out[0].append("x")
+        self.assertEqual(out[1], ["1/1", "1/2"])
+
+    def test_encode(self):
+        self.assertEqual(hex_codec.encode_string("Lab"), "4c 61 62")
+        self.assertEqual(hex_codec.encode_string(""), "")
+        self.assertEqual(hex_codec.encode_hex(b"\xc0\x00"), "c0 00")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
+import asyncio
+import threading
+import time
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from napalm_hios.hios import HIOSDriver
 from napalm.base.exceptions import (
     ConnectionException, CommandErrorException, MergeConfigException, CommitError
@@ -358,6 +361,17 @@ class TestHIOSDriver(unittest.TestCase):
             self.device.rollback()
         self.assertIn('activate_profile', str(ctx.exception))
 
+    def test_staging_dispatches_to_snmp(self):
+        self.device.active_protocol = 'snmp'
+        self.device.start_staging()
+        self.device.commit_staging()
+        self.mock_connection.start_staging.assert_called_once_with()
+        self.mock_connection.commit_staging.assert_called_once_with()
+
+    def test_staging_via_ssh_raises(self):
+        with self.assertRaises(NotImplementedError):
+            self.device.start_staging()
+
     def test_load_replace_candidate_raises(self):
         with self.assertRaises(NotImplementedError):
             self.device.load_replace_candidate(config='test')
@@ -373,7 +387,7 @@ class TestHIOSDriver(unittest.TestCase):
         self.mock_connection.get_config_status.return_value = {'saved': True, 'nvm': 'ok'}
         self.mock_connection._config_mode.return_value = None
         self.mock_connection._exit_config_mode.return_value = None
-        self.mock_connection.cli.return_value = {'cmd': ''}
+        self.mock_connection.cli_batch.return_value = ['', '']
         self.mock_connection.save_config.return_value = {'saved': True, 'nvm': 'ok'}
 
         self.device.commit_config()
@@ -384,6 +398,20 @@ class TestHIOSDriver(unittest.TestCase):
         self.mock_connection._config_mode.assert_called_once()
         self.mock_connection._exit_config_mode.assert_called_once()
         self.mock_connection.save_config.assert_called_once()
+        self.mock_connection.cli_batch.assert_called_once_with(
+            ['system location Test', 'no shutdown'])
+
+    def test_commit_config_command_error(self):
+        """Per-line errors from the batch are collected into CommitError."""
+        self.device.load_merge_candidate(config='system location Test\nbogus')
+        self.device.ssh = self.mock_connection
+        self.mock_connection.get_config_status.return_value = {'saved': True, 'nvm': 'ok'}
+        self.mock_connection.cli_batch.return_value = [
+            '', "Error: Invalid command 'bogus'"]
+        with self.assertRaises(CommitError) as ctx:
+            self.device.commit_config()
+        self.assertIn("bogus: Error: Invalid command", str(ctx.exception))
+        self.mock_connection.save_config.assert_not_called()
 
     def test_commit_config_unsaved_nvm_rejects(self):
         """Refuse to commit if NVM is out of sync (someone else's changes)."""
@@ -408,6 +436,117 @@ class TestHIOSDriver(unittest.TestCase):
         mock_snmp_cls.assert_called_once()
         self.assertEqual(device.active_protocol, 'snmp')
 
+    @patch('napalm_hios.hios.SNMPHIOS')
+    def test_port_map_cache_passed_to_backend(self, mock_snmp_cls):
+        """optional_args port_map_cache path becomes a PortMapCache."""
+        device = HIOSDriver('192.168.1.1', 'admin', 'private',
+                            optional_args={'protocol_preference': ['snmp'],
+                                           'port_map_cache': '/tmp/hios-ports'})
+        device.open()
+        cache = mock_snmp_cls.call_args.kwargs['port_map_cache']
+        self.assertEqual(cache.path, '/tmp/hios-ports')
+
+    @patch('napalm_hios.hios.SNMPHIOS')
+    def test_snmp_max_repetitions_passed_to_backend(self, mock_snmp_cls):
+        """snmp_max_repetitions pins GETBULK size; default leaves it adaptive."""
+        HIOSDriver('192.168.1.1', 'admin', 'private',
+                   optional_args={'protocol_preference': ['snmp']}).open()
+        self.assertIsNone(mock_snmp_cls.call_args.kwargs['max_repetitions'])
+        HIOSDriver('192.168.1.1', 'admin', 'private',
+                   optional_args={'protocol_preference': ['snmp'],
+                                  'snmp_max_repetitions': 10}).open()
+        self.assertEqual(mock_snmp_cls.call_args.kwargs['max_repetitions'], 10)
+
+    @patch('napalm_hios.hios.SNMPHIOS')
+    def test_snmp_request_budget_passed_to_backend(self, mock_snmp_cls):
+        HIOSDriver('192.168.1.1', 'admin', 'private',
+                   optional_args={'protocol_preference': ['snmp']}).open()
+        kwargs = mock_snmp_cls.call_args.kwargs
+        self.assertEqual((kwargs['max_in_flight'], kwargs['max_pps']), (4, 100))
+        HIOSDriver('192.168.1.1', 'admin', 'private',
+                   optional_args={'protocol_preference': ['snmp'],
+                                  'snmp_max_in_flight': 1, 'snmp_max_pps': None}).open()
+        kwargs = mock_snmp_cls.call_args.kwargs
+        self.assertEqual((kwargs['max_in_flight'], kwargs['max_pps']), (1, None))
+
+    # --- Async getters ---
+
+    def test_aget_snmp_awaits_backend_and_normalises(self):
+        """aget_* via SNMP awaits SNMPHIOS.aget_* and fills required keys."""
+        device = HIOSDriver('192.168.1.1', 'admin', 'private')
+        device.active_protocol = 'snmp'
+        device.snmp = Mock()
+        device.snmp.aget_facts = AsyncMock(return_value={'hostname': 'sw1'})
+        facts = asyncio.run(device.aget_facts())
+        device.snmp.aget_facts.assert_awaited_once_with()
+        device.snmp.get_facts.assert_not_called()
+        self.assertEqual(facts['hostname'], 'sw1')
+        self.assertEqual(facts['serial_number'], '')
+        self.assertIs(device._get_active_connection(), device.snmp)
+
+    def test_aget_forwards_arguments(self):
+        device = HIOSDriver('192.168.1.1', 'admin', 'private')
+        device.active_protocol = 'snmp'
+        device.snmp = Mock()
+        device.snmp.aget_vlan_egress = AsyncMock(return_value={1: {}})
+        result = asyncio.run(device.aget_vlan_egress('1/1', '1/2'))
+        device.snmp.aget_vlan_egress.assert_awaited_once_with('1/1', '1/2')
+        self.assertEqual(result, {1: {}})
+
+    def test_aget_blocking_protocol_uses_worker_thread(self):
+        """Non-SNMP backends run the sync getter off the event loop."""
+        device = HIOSDriver('192.168.1.1', 'admin', 'private')
+        device.active_protocol = 'mops'
+        device.mops = Mock()
+        threads = []
+
+        def get_vlans():
+            threads.append(threading.current_thread())
+            return {1: {'name': 'default'}}
+        device.mops.get_vlans.side_effect = get_vlans
+        vlans = asyncio.run(device.aget_vlans())
+        self.assertEqual(vlans, {1: {'name': 'default', 'interfaces': []}})
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_aget_blocking_getters_serialised(self):
+        """Concurrent aget_* on a blocking backend never share the session."""
+        device = HIOSDriver('192.168.1.1', 'admin', 'private')
+        device.active_protocol = 'mops'
+        device.mops = Mock()
+        active = []
+        overlaps = []
+
+        def getter(result):
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+            return result
+        device.mops.get_mrp.side_effect = lambda: getter({'configured': False})
+        device.mops.get_hidiscovery.side_effect = lambda: getter({'enabled': True})
+
+        async def both():
+            return await asyncio.gather(device.aget_mrp(), device.aget_hidiscovery())
+        mrp, hidiscovery = asyncio.run(both())
+        self.assertEqual(overlaps, [1, 1])
+        self.assertEqual(mrp['configured'], False)
+        self.assertEqual(hidiscovery['enabled'], True)
+        asyncio.run(device.aget_mrp())      # new loop, new lock
+
+    def test_aget_prefetch_is_per_task(self):
+        """Each SNMP aget_* task replays its own result, not a sibling's."""
+        device = HIOSDriver('192.168.1.1', 'admin', 'private')
+        device.active_protocol = 'snmp'
+        device.snmp = Mock()
+        device.snmp.aget_mrp = AsyncMock(return_value={'configured': False})
+
+        async def run():
+            task = asyncio.ensure_future(device.aget_mrp())
+            await asyncio.sleep(0)
+            self.assertIs(device._get_active_connection(), device.snmp)
+            return await task
+        self.assertEqual(asyncio.run(run())['configured'], False)
+
     # --- Lazy SSH ---
 
     def test_get_config_lazy_ssh(self):
@@ -423,6 +562,18 @@ class TestHIOSDriver(unittest.TestCase):
             config = self.device.get_config()
         self.assertIn('running', config)
 
+    def test_get_config_stream_to_uses_ssh(self):
+        """stream_to goes over SSH even when MOPS is the active protocol."""
+        self.device.active_protocol = 'mops'
+        self.device.mops = Mock()
+        self.mock_connection.get_config.return_value = {
+            'running': '', 'startup': '', 'candidate': ''}
+        sink = Mock()
+        self.device.get_config(format='xml', stream_to=sink)
+        self.mock_connection.get_config.assert_called_once_with(
+            'all', False, False, 'xml', stream_to=sink)
+        self.device.mops.get_config.assert_not_called()
+
     def test_cli_lazy_ssh(self):
         """cli should lazy-connect SSH when active protocol is SNMP."""
         self.device.active_protocol = 'snmp'
@@ -747,5 +898,75 @@ class TestHIOSDriver(unittest.TestCase):
                 enabled=True)
 
 
+    # --- get_many ---
+
+    def test_get_many_calls_each_getter(self):
+        """Non-MOPS protocols fall back to one call per getter."""
+        self.mock_connection.channels = 1
+        self.mock_connection.get_mrp.return_value = {'configured': False}
+        self.mock_connection.get_hidiscovery.return_value = {'enabled': True}
+        result = self.device.get_many(['get_mrp', 'get_hidiscovery'])
+        self.assertEqual(result, {'get_mrp': {'configured': False},
+                                  'get_hidiscovery': {'enabled': True}})
+
+    def test_get_many_mops_prefetch(self):
+        """MOPS wraps the driver getters in the backend prefetch context."""
+        self.device.active_protocol = 'mops'
+        self.device.mops = MagicMock()
+        self.mock_connection.get_mrp.return_value = {'configured': False}
+        result = self.device.get_many(['get_mrp'])
+        self.device.mops._prefetch.assert_called_once_with(['get_mrp'])
+        self.assertEqual(result, {'get_mrp': {'configured': False}})
+
+    def test_get_many_snmp_runs_getters_concurrently(self):
+        """Via SNMP the backend aget_* run together so their GETs coalesce."""
+        device = HIOSDriver('192.168.1.1', 'admin', 'private')
+        device.active_protocol = 'snmp'
+        device.snmp = Mock()
+        started = []
+
+        async def aget(name, result):
+            started.append(name)
+            await asyncio.sleep(0)
+            self.assertEqual(len(started), 2)   # both in flight
+            return result
+        device.snmp.aget_mrp = Mock(
+            side_effect=lambda: aget('mrp', {'configured': False}))
+        device.snmp.aget_hidiscovery = Mock(
+            side_effect=lambda: aget('hidiscovery', {'enabled': True}))
+        result = device.get_many(['get_mrp', 'get_hidiscovery'])
+        self.assertEqual(result, {'get_mrp': {'configured': False},
+                                  'get_hidiscovery': {'enabled': True}})
+        device.snmp.get_mrp.assert_not_called()
+        self.assertIs(device._get_active_connection(), device.snmp)
+
+    def test_get_many_ssh_channels_run_on_workers(self):
+        """Via SSH with ssh_channels > 1 each getter runs on a channel worker."""
+        device = HIOSDriver('192.168.1.1', 'admin', 'private')
+        device.active_protocol = 'ssh'
+        device.ssh = Mock(channels=3)
+        worker = Mock()
+        worker.get_mrp.return_value = {'configured': False}
+        worker.get_hidiscovery.return_value = {'enabled': True}
+        device.ssh.run_parallel.side_effect = lambda calls: [c(worker) for c in calls]
+        result = device.get_many(['get_mrp', 'get_hidiscovery'])
+        self.assertEqual(result, {'get_mrp': {'configured': False},
+                                  'get_hidiscovery': {'enabled': True}})
+        device.ssh.get_mrp.assert_not_called()
+        self.assertIsNot(device.ssh, worker)
+
+    @patch('napalm_hios.hios.SSHHIOS')
+    def test_ssh_channels_passed_to_backend(self, mock_ssh_cls):
+        device = HIOSDriver('192.168.1.1', 'admin', 'private',
+                            optional_args={'protocol_preference': ['ssh'],
+                                           'ssh_channels': 4})
+        device.open()
+        self.assertEqual(mock_ssh_cls.call_args.kwargs['channels'], 4)
+
+    def test_get_many_rejects_setters(self):
+        with self.assertRaises(ValueError):
+            self.device.get_many(['set_interface'])
+
+
 if __name__ == '__main__':
     unittest.main()
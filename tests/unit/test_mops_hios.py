@@ -1,10 +1,10 @@
 """Unit tests for MOPS backend — getters with mocked MOPSClient."""
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 
 from napalm_hios.mops_hios import (
-    MOPSHIOS, _safe_int, _parse_sysDescr, _mask_to_prefix,
+    MOPSHIOS, AsyncMOPSHIOS, _unrecordable, _safe_int, _parse_sysDescr, _mask_to_prefix,
     _decode_portlist_hex, _decode_lldp_capabilities, _encode_hex_ip,
     _decode_bits_hex, _encode_bits_hex,
     _TLS_VERSIONS, _TLS_CIPHER_SUITES, _SSH_HMAC, _SSH_KEX,
@@ -321,6 +321,24 @@ class TestMOPSHIOSGetters(unittest.TestCase):
         self.assertEqual(mac_table[1]["vlan"], 3)
         self.assertTrue(mac_table[1]["static"])
 
+    def test_get_mac_address_table_fallback(self):
+        """Same fallback as iter_mac_address_table on a node-level error."""
+        self.backend._ifindex_map = {"25": "cpu/1"}
+
+        def get_multi(queries, decode_strings=True):
+            mib, node, _attrs = queries[0]
+            if mib == "IEEE8021-Q-BRIDGE-MIB":
+                return {"mibs": {}, "errors": [
+                    {"mib": mib, "node": node, "error": "noSuchName"}]}
+            return {"mibs": {mib: {node: [
+                {"dot1qTpFdbAddress": "64 60 38 3f 4a a1",
+                 "dot1qTpFdbPort": "25", "dot1qTpFdbStatus": "5",
+                 "dot1qFdbId": "3"}]}}, "errors": []}
+        self.backend.client.get_multi.side_effect = get_multi
+        mac_table = self.backend.get_mac_address_table()
+        self.assertEqual(self.backend.client.get_multi.call_count, 2)
+        self.assertEqual(mac_table[0]["interface"], "cpu/1")
+
     # --- get_vlans ---
 
     def test_get_vlans(self):
@@ -374,6 +392,53 @@ class TestMOPSHIOSGetters(unittest.TestCase):
         self.assertEqual(arp[0]["mac"], "aa:bb:cc:dd:ee:ff")
         self.assertEqual(arp[0]["interface"], "cpu/1")
 
+    # --- streamed iter_* getters ---
+
+    def test_iter_mac_address_table(self):
+        self.backend._ifindex_map = {"7": "1/7"}
+        self.backend.client.iter_get.return_value = iter([
+            {"ieee8021QBridgeTpFdbAddress": "12 dd 6e 60 34 4b",
+             "ieee8021QBridgeTpFdbPort": "7",
+             "ieee8021QBridgeTpFdbStatus": "3",
+             "ieee8021QBridgeFdbId": "1"},
+        ])
+        rows = list(self.backend.iter_mac_address_table())
+        self.assertEqual(rows, [{
+            'mac': "12:dd:6e:60:34:4b", 'interface': "1/7", 'vlan': 1,
+            'static': False, 'active': True, 'moves': 0, 'last_move': 0.0,
+        }])
+        self.backend.client.get_multi.assert_not_called()
+
+    def test_iter_mac_address_table_fallback(self):
+        """IEEE table error before any row falls back to Q-BRIDGE-MIB."""
+        from napalm_hios.mops_client import MOPSError
+
+        def iter_get(mib, node, attrs, decode_strings=True):
+            if mib == "IEEE8021-Q-BRIDGE-MIB":
+                raise MOPSError("noSuchName")
+            yield {"dot1qTpFdbAddress": "64 60 38 3f 4a a1",
+                   "dot1qTpFdbPort": "25", "dot1qTpFdbStatus": "5",
+                   "dot1qFdbId": "3"}
+
+        self.backend._ifindex_map = {"25": "cpu/1"}
+        self.backend.client.iter_get.side_effect = iter_get
+        rows = list(self.backend.iter_mac_address_table())
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["interface"], "cpu/1")
+        self.assertTrue(rows[0]["static"])
+
+    def test_iter_arp_table(self):
+        self.backend._ifindex_map = {"100": "cpu/1"}
+        self.backend.client.iter_get.return_value = iter([
+            {"ipNetToMediaIfIndex": "100",
+             "ipNetToMediaPhysAddress": "aa bb cc dd ee ff",
+             "ipNetToMediaNetAddress": "192.168.1.1"},
+            {"ipNetToMediaIfIndex": "100"},
+        ])
+        rows = list(self.backend.iter_arp_table())
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["mac"], "aa:bb:cc:dd:ee:ff")
+
     # --- get_snmp_information ---
 
     def test_get_snmp_information(self):
@@ -586,6 +651,21 @@ class TestStaging(unittest.TestCase):
         self.assertFalse(self.backend._staging)
         self.assertEqual(self.backend._mutations, [])
 
+    def test_commit_staging_chunked(self):
+        """chunk_size routes through set_chunked and returns its results."""
+        self.backend.start_staging()
+        self.backend._mutations.extend([("X", "Y", {"Z": "1"}),
+                                        ("X", "Y", {"Z": "2"})])
+        results = [{"mutation": ("X", "Y", {"Z": "1"}), "status": "ok",
+                    "errors": []}]
+        self.backend.client.set_chunked.return_value = results
+        self.assertIs(self.backend.commit_staging(chunk_size=1), results)
+        self.backend.client.set_chunked.assert_called_once_with(
+            [("X", "Y", {"Z": "1"}), ("X", "Y", {"Z": "2"})], 1)
+        self.backend.client.set_multi.assert_not_called()
+        self.assertFalse(self.backend._staging)
+        self.assertEqual(self.backend._mutations, [])
+
     def test_commit_empty_staging(self):
         """Committing with no mutations should just clear staging."""
         self.backend.start_staging()
@@ -594,6 +674,242 @@ class TestStaging(unittest.TestCase):
         self.backend.client.set_multi.assert_not_called()
 
 
+class TestGetMany(unittest.TestCase):
+    """Test get_many — several getters served from one merged POST."""
+
+    RAW = {
+        "message_id": "1",
+        "mibs": {
+            "SNMPv2-MIB": {
+                "system": [{
+                    "sysDescr": "48 69 72 73 63 68 6d 61 6e 6e 20 42 52 53 35 30 "
+                                "20 48 69 4f 53 2d 32 41 2d 31 30 2e 33 2e 30 34",
+                    "sysName": "42 52 53 35 30",
+                    "sysUpTime": "1039868",
+                    "sysContact": "",
+                    "sysLocation": "4c 61 62",
+                }]
+            },
+            "IF-MIB": {
+                "ifXEntry": [
+                    {"ifIndex": "1", "ifName": "31 2f 31",
+                     "ifHighSpeed": "1000", "ifAlias": "75 70"},
+                    {"ifIndex": "10", "ifName": "31 2f 32",
+                     "ifHighSpeed": "0", "ifAlias": ""},
+                ],
+                "ifEntry": [
+                    {"ifIndex": "1", "ifDescr": "", "ifMtu": "1518",
+                     "ifSpeed": "1000000000", "ifPhysAddress": "64 60 38 3f 4a a6",
+                     "ifAdminStatus": "1", "ifOperStatus": "1"},
+                    {"ifIndex": "10", "ifDescr": "", "ifMtu": "1518",
+                     "ifSpeed": "0", "ifPhysAddress": "64 60 38 3f 4a a7",
+                     "ifAdminStatus": "1", "ifOperStatus": "2"},
+                ],
+            },
+        },
+        "errors": [],
+    }
+
+    def setUp(self):
+        self.backend = MOPSHIOS("198.51.100.1", "admin", "private", timeout=10)
+        self.backend.client = Mock()
+        self.backend.client.get_multi.return_value = self.RAW
+        self.backend._connected = True
+
+    def test_single_post_for_all_getters(self):
+        result = self.backend.get_many(['get_facts', 'get_interfaces'])
+        self.backend.client.get_multi.assert_called_once()
+        queries = self.backend.client.get_multi.call_args[0][0]
+        # ifXEntry is asked for by both getters — merged into one node query
+        ifx = [q for q in queries if q[:2] == ("IF-MIB", "ifXEntry")]
+        self.assertEqual(len(ifx), 1)
+        self.assertEqual(set(ifx[0][2]),
+                         {"ifIndex", "ifName", "ifHighSpeed", "ifAlias"})
+        self.assertEqual(result['get_facts']['hostname'], "BRS50")
+        self.assertEqual(result['get_facts']['interface_list'], ["1/1", "1/2"])
+        self.assertEqual(result['get_interfaces']['1/1']['description'], "up")
+        self.assertEqual(result['get_interfaces']['1/2']['mac_address'],
+                         "64:60:38:3f:4a:a7")
+
+    def test_matches_individual_getters(self):
+        batched = self.backend.get_many(['get_facts', 'get_interfaces'])
+        self.backend._ifindex_map = None
+        self.assertEqual(batched['get_facts'], self.backend.get_facts())
+        self.assertEqual(batched['get_interfaces'], self.backend.get_interfaces())
+
+    def test_client_restored(self):
+        client = self.backend.client
+        self.backend.get_many(['get_facts'])
+        self.assertIs(self.backend.client, client)
+
+    def test_uncovered_query_falls_through(self):
+        """Client calls other than get/get_multi go to the real client."""
+        self.backend.client.nvm_state.return_value = {}
+        self.backend.get_many(['get_facts', 'get_config_status'])
+        self.backend.client.nvm_state.assert_called_once()
+
+    def test_dry_run_leaves_state_untouched(self):
+        """The recording pass caches nothing from its empty data."""
+        self.backend._ifindex_map = {"1": "1/1"}
+        self.backend.port_map_cache = Mock()
+        self.backend._device_key = ("S1", "FW")
+        seen = []
+        real = MOPSHIOS._set_ifindex_map
+
+        def spy(backend, entries):
+            seen.append(backend)
+            return real(backend, entries)
+        with patch.object(MOPSHIOS, '_set_ifindex_map', spy):
+            with self.backend._prefetch(['get_facts']):
+                self.assertEqual(self.backend._ifindex_map, {"1": "1/1"})
+        self.assertIsNot(seen[0], self.backend)
+        self.backend.port_map_cache.set.assert_not_called()
+        self.backend.port_map_cache.invalidate.assert_not_called()
+
+    def test_broad_except_does_not_hide_stop(self):
+        """A getter catching Exception still stops at a non-query call."""
+        def get_guarded(backend):
+            backend.client.get("SNMPv2-MIB", "system", ["sysName"])
+            try:
+                backend.client.nvm_state()
+            except Exception:
+                return "swallowed"
+            return "real"
+        self.backend.client.nvm_state.return_value = {}
+        with patch.object(MOPSHIOS, 'get_guarded', get_guarded, create=True):
+            result = self.backend.get_many(['get_guarded'])
+        self.assertEqual(result, {'get_guarded': "real"})
+        queries = self.backend.client.get_multi.call_args[0][0]
+        self.assertEqual(queries, [("SNMPv2-MIB", "system", ["sysName"])])
+
+    def test_unknown_getter(self):
+        with self.assertRaises(ValueError):
+            self.backend.get_many(['set_interface'])
+        with self.assertRaises(ValueError):
+            self.backend.get_many(['get_nonexistent'])
+        self.backend.client.get_multi.assert_not_called()
+
+
+class TestAsyncMOPSHIOS(unittest.TestCase):
+    """Test AsyncMOPSHIOS — sync getters replayed over an async client."""
+
+    RAW = TestGetMany.RAW
+
+    def setUp(self):
+        import asyncio
+        self.run = asyncio.run
+        self.device = AsyncMOPSHIOS("198.51.100.1", "admin", "private",
+                                    timeout=10)
+        self.device.client = AsyncMock()
+        self.device.client.get_multi.side_effect = self._get_multi
+        self.device._connected = True
+
+    def _get_multi(self, queries, decode_strings=True):
+        """Answer only the requested nodes, like the switch does."""
+        mibs = {}
+        for mib, node, _attrs in queries:
+            rows = self.RAW["mibs"].get(mib, {}).get(node)
+            if rows is not None:
+                mibs.setdefault(mib, {})[node] = rows
+        return {"message_id": "1", "mibs": mibs, "errors": []}
+
+    def test_getter_one_round(self):
+        facts = self.run(self.device.get_facts())
+        self.device.client.get_multi.assert_awaited_once()
+        self.assertEqual(facts['hostname'], "BRS50")
+        self.assertEqual(facts['interface_list'], ["1/1", "1/2"])
+
+    def test_matches_sync_backend(self):
+        backend = MOPSHIOS("198.51.100.1", "admin", "private", timeout=10)
+        backend.client = Mock()
+        backend.client.get_multi.side_effect = self._get_multi
+        backend.client.get.side_effect = lambda mib, node, attrs, **kw: (
+            self.RAW["mibs"][mib][node])
+        backend._connected = True
+        self.assertEqual(self.run(self.device.get_interfaces()),
+                         backend.get_interfaces())
+
+    def test_get_many_merged(self):
+        result = self.run(self.device.get_many(['get_facts', 'get_interfaces']))
+        self.device.client.get_multi.assert_awaited_once()
+        self.assertEqual(result['get_interfaces']['1/1']['description'], "up")
+
+    def test_unknown_getter(self):
+        with self.assertRaises(ValueError):
+            self.run(self.device.get_many(['get_nonexistent']))
+        with self.assertRaises(AttributeError):
+            self.device.get_nonexistent
+
+    def test_setter_sends_set_multi(self):
+        self.run(self.device.set_interface("1/2", enabled=False))
+        self.device.client.set_multi.assert_awaited_once()
+        mutations = self.device.client.set_multi.call_args[0][0]
+        self.assertEqual(mutations[0][:2], ("IF-MIB", "ifEntry"))
+
+    def test_staging(self):
+        self.device.start_staging()
+        self.run(self.device.set_interface("1/2", enabled=False))
+        self.run(self.device.set_interface("1/1", description="x"))
+        self.device.client.set_multi.assert_not_awaited()
+        self.assertEqual(len(self.device.get_staged_mutations()), 2)
+        self.run(self.device.commit_staging())
+        self.device.client.set_multi.assert_awaited_once()
+        self.assertEqual(self.device.get_staged_mutations(), [])
+
+    def test_unsupported_methods_not_offered(self):
+        unsupported = AsyncMOPSHIOS._unsupported()
+        self.assertTrue({'create_vlan', 'set_mrp', 'get_config',
+                         'set_config_remote', 'delete_dns_server'}
+                        <= unsupported)
+        self.assertFalse({'get_facts', 'set_interface', 'set_hidiscovery',
+                          'get_config_status'} & unsupported)
+        for name in unsupported:
+            self.assertTrue(callable(getattr(MOPSHIOS, name)), name)
+            self.assertFalse(hasattr(self.device, name), name)
+            self.assertNotIn(name, dir(self.device))
+        self.assertIn('set_interface', dir(self.device))
+        with self.assertRaises(ValueError):
+            self.run(self.device.get_many(['get_config']))
+
+    def test_unrecordable_follows_calls(self):
+        class Backend:
+            def get_a(self):
+                return self.client.get("M", "n", ["x"])
+
+            def get_b(self):
+                return [self._helper() for _ in range(1)]
+
+            def _helper(self):
+                return self.client.download_config()
+
+            def set_c(self, value):
+                self._apply_set("M", "n", {"x": value})
+
+            def _apply_set(self, mib, node, values):
+                self.client.set(mib, node, values)
+        self.assertEqual(_unrecordable(Backend), {'get_b', '_helper'})
+
+    def test_get_many_uses_own_coroutines(self):
+        self.device.client.nvm_state.return_value = {
+            "hm2FMNvmState": {"value": "1", "label": "ok"}}
+        result = self.run(self.device.get_many(['get_facts',
+                                                'get_config_status']))
+        self.assertEqual(result['get_facts']['hostname'], "BRS50")
+        self.assertTrue(result['get_config_status']['saved'])
+        self.device.client.get_multi.assert_awaited_once()
+
+    def test_unsupported_client_call(self):
+        self.device._backend.set_hidiscovery = Mock(side_effect=(
+            lambda *a, **kw: self.device._backend.client.config_transfer()))
+        with self.assertRaises(NotImplementedError):
+            self.run(self.device.set_hidiscovery('on'))
+
+    def test_getter_error_propagates(self):
+        with self.assertRaises(ValueError):
+            self.run(self.device.set_interface("9/9", enabled=False))
+        self.device.client.set_multi.assert_not_awaited()
+
+
 class TestConnectionLifecycle(unittest.TestCase):
     """Test MOPS backend open/close."""
 
@@ -5875,5 +6191,61 @@ class TestMOPSIpSourceGuard(unittest.TestCase):
         self.backend._build_ifindex_map.assert_not_called()
 
 
+
+class TestPortMapCache(unittest.TestCase):
+    """Test port_map_cache warm-up and refresh on the MOPS backend."""
+
+    def setUp(self):
+        self.cache = MagicMock()
+        self.backend = MOPSHIOS("198.51.100.1", "admin", "private", timeout=10,
+                                port_map_cache=self.cache)
+
+    @patch('napalm_hios.mops_hios.MOPSClient')
+    def test_open_probes_serial_and_loads(self, mock_client_cls):
+        mock_client = mock_client_cls.return_value
+        mock_client.probe.return_value = (
+            "Hirschmann BRS50 HiOS-2A-10.3.04", "942135999")
+        self.cache.get.return_value = {"1": "1/1"}
+        self.backend.open()
+        mock_client.probe.assert_called_once_with(with_serial=True)
+        self.cache.get.assert_called_once_with(
+            "942135999", "HiOS-2A-10.3.04", "ifindex")
+        self.assertEqual(self.backend._ifindex_map, {"1": "1/1"})
+
+    def test_warm_map_skips_ifxentry(self):
+        self.backend._ifindex_map = {"1": "1/1"}
+        self.backend.client = Mock()
+        self.backend.client.get_multi.return_value = {"mibs": {}}
+        self.backend._get_with_ifindex(("IF-MIB", "ifEntry", ["ifIndex"]))
+        tables = self.backend.client.get_multi.call_args[0][0]
+        self.assertEqual(len(tables), 1)
+
+    def test_cold_fetch_stores_map(self):
+        self.backend._device_key = ("S1", "FW")
+        self.backend.client = Mock()
+        self.backend.client.get_multi.return_value = {"mibs": {"IF-MIB": {
+            "ifXEntry": [{"ifIndex": "1", "ifName": "31 2f 31"}]}}}
+        self.backend._get_with_ifindex(("IF-MIB", "ifEntry", ["ifIndex"]))
+        self.cache.set.assert_called_once_with("S1", "FW", "ifindex", {"1": "1/1"})
+        self.cache.invalidate.assert_not_called()
+
+    def test_changed_layout_invalidates(self):
+        self.backend._device_key = ("S1", "FW")
+        self.backend._saved_ifindex = {"1": "1/1"}
+        self.backend._set_ifindex_map([
+            {"ifIndex": "1", "ifName": "31 2f 31"},
+            {"ifIndex": "2", "ifName": "32 2f 31"},
+        ])
+        self.cache.invalidate.assert_called_once_with("S1", "FW")
+        self.cache.set.assert_called_once_with(
+            "S1", "FW", "ifindex", {"1": "1/1", "2": "2/1"})
+
+    def test_unchanged_layout_not_rewritten(self):
+        self.backend._device_key = ("S1", "FW")
+        self.backend._saved_ifindex = {"1": "1/1"}
+        self.backend._set_ifindex_map([{"ifIndex": "1", "ifName": "31 2f 31"}])
+        self.cache.set.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,9 +4,21 @@ These test the parsing logic directly without needing a live device.
 Fixtures were captured from a GRS1042 running HiOS-3A-09.4.04.
 """
 import os
+import re
+import select
+import socket
+import tempfile
+import threading
+import time
 import unittest
-from napalm_hios.ssh_hios import SSHHIOS
-from napalm_hios.utils import parse_dot_keys, parse_table, parse_multiline_table
+import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree.ElementTree import XMLPullParser
+from napalm.base.exceptions import ConnectionException
+from napalm_hios.ssh_hios import SSHHIOS, _CLI_PROMPT, _ShellChannel
+from napalm_hios.utils import (
+    parse_dot_keys, parse_table, parse_multiline_table, TableSpec, SECTION_END,
+)
 
 FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
 
@@ -54,6 +66,66 @@ class TestParseTable(unittest.TestCase):
         self.assertEqual(rows[0][1], '192.168.1.4')
 
 
+class TestTableSpec(unittest.TestCase):
+    """Test precompiled table specs and the getters built on them."""
+
+    MAC_TABLE = (
+        "VLAN  Mac Address        Interface  IfIndex  Status\r\n"
+        "----  -----------------  ---------  -------  ------------\r\n"
+        "1     16:5f:8d:ba:75:cc  3/3        23       learned\r\n"
+        "x     16:5f:8d:ba:75:cd  3/4        24       learned\r\n"
+        "10    64:60:38:8a:42:d6  cpu/1      1001     mgmt\r\n"
+        "20    64:60:38:8a:42:d7  1/1\r\n"
+    )
+
+    EVENTS = (
+        "Time stamp           Event         Info\n"
+        "-------------------  ------------  ----------\n"
+        "2025-03-01 10:15:02  link-failure  port 1/12\n"
+        "not an event line\n"
+        "2025-03-01 10:16:40  temperature   -\n"
+        "\n"
+        "2025-03-01 10:17:00  after-blank   1\n"
+    )
+
+    def test_rows_scoped_by_header_and_until(self):
+        spec = TableSpec(r'^[ \t]*(\S+)[ \t]+(\S+)',
+                         header=r'Intf\s+Status', until=SECTION_END)
+        text = ("Power Supply  Status\n-----  ----\n1  ok\n\n"
+                "Intf  Status\n----  ------\n1/1  up\n1/2  down\n"
+                "Modules:\n2/1  up\n")
+        self.assertEqual(spec.rows(text), [('1/1', 'up'), ('1/2', 'down')])
+        self.assertEqual(spec.rows('Intf  Status\n1/1  up\n'), [])
+        self.assertEqual(spec.rows('no table'), [])
+
+    def test_single_group_rows_are_tuples(self):
+        spec = TableSpec(r'^[ \t]*(\S.*)')
+        self.assertEqual(spec.rows('Name\n----\n a b\n'), [('a b',)])
+
+    def test_mac_address_table(self):
+        ssh = SSHHIOS.__new__(SSHHIOS)
+        ssh.cli = lambda cmd: {cmd: self.MAC_TABLE}
+        table = ssh.get_mac_address_table()
+        self.assertEqual([(e['vlan'], e['mac'], e['interface'], e['static'])
+                          for e in table],
+                         [(1, '16:5f:8d:ba:75:cc', '3/3', False),
+                          (10, '64:60:38:8a:42:d6', 'cpu/1', True)])
+
+    def test_events_section(self):
+        self.assertEqual(SSHHIOS._parse_events_section(self.EVENTS), [
+            {'cause': 'link-failure', 'info': 12,
+             'timestamp': '2025-03-01 10:15:02'},
+            {'cause': 'temperature', 'info': 0,
+             'timestamp': '2025-03-01 10:16:40'},
+        ])
+
+    def test_extract_table_rows_stops_at_section_title(self):
+        text = ("Intf  Status\n----  ------\n1/1   up\n"
+                "Port.....speed:\n1/2   down\nNext section:\n1/3  up\n")
+        self.assertEqual(SSHHIOS._extract_table_rows(text, r'Intf\s+Status'),
+                         [['1/1', 'up'], ['Port.....speed:'], ['1/2', 'down']])
+
+
 class TestInterfaceListParser(unittest.TestCase):
     """Test that _parse_interface_list correctly handles 2-line show port."""
 
@@ -307,18 +379,18 @@ class TestEnvironmentParser(unittest.TestCase):
         sysinfo = load_fixture('show_system_info.txt')
         resources = load_fixture('show_system_resources.txt')
 
-        def mock_cli(cmd):
-            if isinstance(cmd, list):
-                cmd = cmd[0]
+        def mock_cli(cmds):
+            if isinstance(cmds, str):
+                cmds = [cmds]
             mapping = {
                 'show fan': fan_out,
                 'show system temperature limits': temp_out,
                 'show system info': sysinfo,
                 'show system resources': resources,
             }
-            return {cmd: mapping.get(cmd, '')}
+            return {cmd: mapping.get(cmd, '') for cmd in cmds}
 
-        self.ssh.cli = mock_cli
+        self.ssh._cli = mock_cli
 
     def test_fanless_device(self):
         env = self.ssh.get_environment()
@@ -360,7 +432,7 @@ class TestFactsParser(unittest.TestCase):
         sysinfo = load_fixture('show_system_info.txt')
         port = load_fixture('show_port.txt')
         lookup = {'show system info': sysinfo, 'show port': port}
-        self.ssh.cli = lambda cmd: {cmd: lookup.get(cmd, '')}
+        self.ssh._cli = lambda cmds: {cmd: lookup.get(cmd, '') for cmd in cmds}
 
     def test_facts_fields(self):
         facts = self.ssh.get_facts()
@@ -1205,5 +1277,376 @@ class TestManagementSSH(unittest.TestCase):
             self.ssh.set_management(vlan_id=99)
 
 
+class _SocketChannel:
+    """Netmiko-like connection over one end of a socketpair (selectable)."""
+
+    def __init__(self, sock):
+        self.remote_conn = sock
+        sock.setblocking(False)
+
+    def read_channel(self):
+        try:
+            return self.remote_conn.recv(65536).decode()
+        except BlockingIOError:
+            return ''
+
+    def write_channel(self, data):
+        self.remote_conn.sendall(data.encode())
+
+
+class TestSSHChannelReader(unittest.TestCase):
+    """Test prompt/terminator matching on a readable channel."""
+
+    def setUp(self):
+        ours, self.device = socket.socketpair()
+        self.addCleanup(ours.close)
+        self.addCleanup(self.device.close)
+        self.ssh = SSHHIOS.__new__(SSHHIOS)
+        self.ssh.connection = _SocketChannel(ours)
+
+    def _send_later(self, *chunks, delay=0.02):
+        def run():
+            for chunk in chunks:
+                time.sleep(delay)
+                self.device.sendall(chunk.encode())
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def _answer(self, script, delay=0):
+        """Reply to each expected line from the host with a list of chunks."""
+        def run():
+            buf = b''
+            for expected, chunks in script:
+                while expected.encode() not in buf:
+                    buf += self.device.recv(4096)
+                buf = b''
+                for chunk in chunks:
+                    self.device.sendall(chunk.encode())
+                    time.sleep(delay)
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def test_match_split_across_chunks(self):
+        self._send_later('<?xml?><Config>...</Con', 'fig>\ntrailing')
+        start = time.monotonic()
+        output, match = self.ssh._read_until(re.compile('</Config>'), 5)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertIsNotNone(match)
+        self.assertEqual(output[match.start():match.end()], '</Config>')
+
+    def test_timeout_returns_none(self):
+        self._send_later('no prompt here')
+        output, match = self.ssh._read_until(_CLI_PROMPT, 0.2)
+        self.assertIsNone(match)
+        self.assertEqual(output, 'no prompt here')
+
+    def test_idle_gap_stops_read(self):
+        self._send_later('Saving...')
+        start = time.monotonic()
+        output, match = self.ssh._read_until(_CLI_PROMPT, 5, idle=0.1)
+        self.assertIsNone(match)
+        self.assertEqual(output, 'Saving...')
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_get_xml_config(self):
+        body = ''.join(f'<Entry id="{i}"/>' for i in range(2000))
+        xml = f'<?xml version="1.0"?><Config>{body}</Config>'
+        self._answer([
+            ('show config profiles nvm 1', ['Download profile? (Y/N) ?']),
+            ('y\n', ['y\r\n'] + [xml[i:i + 4096] for i in range(0, len(xml), 4096)]
+             + ['\r\n(GRS1042) #']),
+        ])
+        start = time.monotonic()
+        self.assertEqual(self.ssh._get_xml_config(1), xml)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_get_xml_config_prompt_with_terminator(self):
+        xml = '<?xml version="1.0"?><Config><Entry id="1"/></Config>'
+        self._answer([
+            ('show config profiles nvm 1', ['Download profile? (Y/N) ?']),
+            ('y\n', [f'y\r\n{xml}\r\n(GRS1042) #']),
+        ])
+        start = time.monotonic()
+        self.assertEqual(self.ssh._get_xml_config(1), xml)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_send_confirm(self):
+        self._answer([
+            ('clear config', ['Are you sure? (Y/N) ']),
+            ('y\n', ['y\r\nDone.\r\n', '(GRS1042) #']),
+        ])
+        output = self.ssh._send_confirm('clear config')
+        self.assertIn('(Y/N)', output)
+        self.assertTrue(output.endswith('(GRS1042) #'))
+
+    def _chunked(self, text, size=1000):
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    def test_stream_running_config_to_file(self):
+        body = ''.join(f'interface 1/{n}\r\n  name "uplink #{n}>"\r\nexit\r\n'
+                       for n in range(1, 2000))
+        config = f'!GRS1042 Configuration #\r\n{body}!\r\n'
+        self._answer([
+            ('\n', ['\r\n(GRS1042) #']),
+            ('show running-config script',
+             self._chunked(f'show running-config script\r\n{config}'
+                           f'\r\n(GRS1042) #', 997)),
+        ])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'backup.cli')
+            result = self.ssh.get_config(stream_to=path)
+            with open(path) as f:
+                self.assertEqual(f.read(), config.replace('\r', ''))
+        self.assertEqual(result['running'], '')
+
+    def test_stream_xml_to_parser(self):
+        body = ''.join(f'<Entry id="{i}"/>' for i in range(3000))
+        xml = f'<?xml version="1.0"?><Config>{body}</Config>'
+        tail = xml.rindex('</Config>') + 4   # split the terminator
+        self._answer([
+            ('show config profiles nvm 1', ['Download profile? (Y/N) ?']),
+            ('y\n', ['y\r\n'] + self._chunked(xml[:tail], 4096)
+             + [xml[tail:], '\r\n(GRS1042) #']),
+        ], delay=0.001)
+        self.ssh._get_active_profile_index = lambda: 1
+        parser = XMLPullParser(['end'])
+        fed = []
+        self.ssh.get_config(format='xml',
+                            stream_to=lambda c: (fed.append(c), parser.feed(c)))
+        parser.close()
+        ends = [elem.tag for _, elem in parser.read_events()]
+        self.assertEqual((ends.count('Entry'), ends[-1]), (3000, 'Config'))
+        self.assertGreater(len(fed), 1)
+        self.assertEqual(''.join(fed), xml)
+
+    def test_stream_timeout_removes_partial_file(self):
+        self._answer([
+            ('\n', ['\r\n(GRS1042) #']),
+            ('show running-config script',
+             ['show running-config script\r\n!partial\r\n']),
+        ])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'backup.cli')
+            with unittest.mock.patch('napalm_hios.ssh_hios._XML_TIMEOUT', 0.2):
+                with self.assertRaises(ConnectionException):
+                    self.ssh.get_config(stream_to=path)
+            self.assertFalse(os.path.exists(path))
+
+    def _cli_device(self, outputs, lines, confirm=()):
+        """Echo each line, print its output and the prompt, like the HiOS CLI.
+
+        Lines in `confirm` ask (Y/N) and take the next line as the answer.
+        """
+        def run():
+            buf = b''
+            asked = False
+            for _ in range(lines):
+                while b'\n' not in buf:
+                    buf += self.device.recv(4096)
+                line, buf = buf.split(b'\n', 1)
+                line = line.decode()
+                if asked:
+                    asked = False
+                    self.device.sendall(
+                        f'{line}\r\nAborted.\r\n(GRS1042) #'.encode())
+                    continue
+                if line in confirm:
+                    asked = True
+                    self.device.sendall(
+                        f'{line}\r\nAre you sure? (Y/N) '.encode())
+                    continue
+                out = outputs.get(line, '')
+                self.device.sendall(
+                    f'{line}\r\n{out}\r\n(GRS1042) #'.encode())
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def test_cli_batch_splits_output(self):
+        self._cli_device({'show fan': "Error: Invalid command 'fan'",
+                          'show port': 'Interface Name\r\n1/1       up',
+                          'exit': ''}, 6)
+        writes = []
+        write = self.ssh.connection.write_channel
+        self.ssh.connection.write_channel = lambda d: (writes.append(d), write(d))
+        self.assertEqual(
+            self.ssh.cli_batch(['show fan', 'show port', 'exit']),
+            ["Error: Invalid command 'fan'", 'Interface Name\n1/1       up', ''])
+        self.assertEqual(len(writes), 1)
+
+    def test_cli_batch_chunks(self):
+        commands = [f'vlan {n}' for n in range(12)]
+        self._cli_device({c: f'ok {c}' for c in commands}, 24)
+        writes = []
+        write = self.ssh.connection.write_channel
+        self.ssh.connection.write_channel = lambda d: (writes.append(d), write(d))
+        result = self.ssh.cli_batch(commands, chunk_size=5)
+        self.assertEqual(result, [f'ok {c}' for c in commands])
+        self.assertEqual(len(writes), 3)
+
+    def test_cli_sends_one_command_at_a_time(self):
+        self.ssh.connection = unittest.mock.Mock()
+        self.ssh.connection.send_command.side_effect = lambda c, **kw: f'ok {c}'
+        self.ssh.cli_batch = unittest.mock.Mock()
+        result = self.ssh.cli(['show port', 'show fan'])
+        self.assertEqual(result, {'show port': 'ok show port',
+                                  'show fan': 'ok show fan'})
+        self.assertEqual(self.ssh.connection.send_command.call_count, 2)
+        self.ssh.cli_batch.assert_not_called()
+
+    def test_cli_batch_stops_at_confirm_prompt(self):
+        self._cli_device({'vlan 5': 'ok vlan 5'}, 4,
+                         confirm={'clear mac-addr-table'})
+        result = self.ssh.cli_batch(
+            ['clear mac-addr-table', 'vlan 5', 'vlan 6', 'vlan 7'],
+            chunk_size=2)
+        self.assertEqual(result[0], 'Error: confirmation prompt not '
+                                    'answered: Are you sure? (Y/N)')
+        self.assertEqual(result[1], 'ok vlan 5')
+        self.assertTrue(result[2].startswith('Error: not sent'))
+        self.assertEqual(len(result), 4)
+        self.device.setblocking(False)
+        with self.assertRaises(BlockingIOError):
+            self.device.recv(4096)      # vlan 6 and vlan 7 never went out
+
+    def test_cli_batch_timeout_stops_sending(self):
+        with unittest.mock.patch('napalm_hios.ssh_hios._PROMPT_TIMEOUT', 0.1):
+            result = self.ssh.cli_batch(['show port', 'show fan'], chunk_size=1)
+        self.assertTrue(all(r.startswith('Error:') for r in result))
+        self.assertEqual(len(result), 2)
+        self.device.setblocking(False)
+        self.assertEqual(self.device.recv(4096).count(b'\n'), 2)
+
+
+
+class _FakeParamikoChannel:
+    """paramiko Channel stand-in on a socketpair, with a CLI thread behind it.
+
+    The device echoes each line and, for anything but a '!' comment,
+    answers '<line> ok' after `delay` seconds.
+    """
+
+    def __init__(self, delay):
+        self.sock, device = socket.socketpair()
+        self.sock.setblocking(False)
+        self.thread = threading.Thread(target=self._serve, args=(device, delay))
+        self.thread.start()
+
+    @staticmethod
+    def _serve(device, delay):
+        buf = b''
+        try:
+            device.sendall(b'\r\n(GRS1042) >')
+            while True:
+                while b'\n' not in buf:
+                    data = device.recv(4096)
+                    if not data:
+                        return
+                    buf += data
+                line, buf = buf.split(b'\n', 1)
+                line = line.decode()
+                out = ''
+                if not line.startswith('!'):
+                    time.sleep(delay)
+                    out = f'{line} ok\r\n'
+                device.sendall(f'{line}\r\n{out}(GRS1042) >'.encode())
+        except OSError:
+            pass
+        finally:
+            device.close()
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def recv_ready(self):
+        return bool(select.select([self.sock], [], [], 0)[0])
+
+    def recv(self, size):
+        return self.sock.recv(size)
+
+    def sendall(self, data):
+        self.sock.sendall(data)
+
+    def get_pty(self, **kwargs):
+        pass
+
+    def invoke_shell(self):
+        pass
+
+    def close(self):
+        self.sock.close()
+        self.thread.join()
+
+
+class TestSSHChannels(unittest.TestCase):
+    """Test run_parallel() over extra shell channels on one transport."""
+
+    def _ssh(self, channels, max_sessions=5, active_sessions=1, delay=0.1):
+        ssh = SSHHIOS('192.0.2.1', 'admin', 'test', 10, channels=channels)
+        opened = []
+
+        def open_session(timeout=None):
+            channel = _FakeParamikoChannel(delay)
+            opened.append(channel)
+            return channel
+        transport = unittest.mock.Mock(open_session=open_session)
+        main = _FakeParamikoChannel(delay)
+        main.get_transport = lambda: transport
+        ssh.connection = _ShellChannel(main, ssh.cli_batch)
+        ssh.get_session_config = lambda: {'ssh': {
+            'max_sessions': max_sessions, 'active_sessions': active_sessions}}
+        self.addCleanup(lambda: [c.close() for c in opened + [main]])
+        return ssh, opened
+
+    def test_calls_run_concurrently(self):
+        ssh, opened = self._ssh(channels=4)
+        calls = [lambda s, n=n: s.cli(f'show {n}')[f'show {n}'] for n in range(8)]
+        start = time.monotonic()
+        self.assertEqual(ssh.run_parallel(calls), [f'show {n} ok' for n in range(8)])
+        self.assertLess(time.monotonic() - start, 0.6)   # serial: 0.8 s
+        self.assertEqual(len(opened), 3)
+        # Pagination is disabled on each extra channel
+        self.assertTrue(all(w.pagination_disabled for w in ssh._workers))
+
+    def test_session_limit_caps_channels(self):
+        ssh, opened = self._ssh(channels=4, max_sessions=3, active_sessions=2,
+                                delay=0)
+        ssh.run_parallel([lambda s: s.cli('show a'), lambda s: s.cli('show b')])
+        self.assertEqual(len(opened), 1)
+
+    def test_workers_have_own_state(self):
+        ssh, opened = self._ssh(channels=3, delay=0)
+        ssh._in_config_mode = True
+        workers = ssh._open_workers()
+        self.assertEqual(len(workers), 2)
+        self.assertFalse(any(w._in_config_mode for w in workers))
+        barrier = threading.Barrier(2)
+
+        def touch(worker):
+            barrier.wait()          # both change their state at once
+            worker._in_config_mode = True
+            worker._workers.append(worker)
+            barrier.wait()
+            return worker._workers
+        with ThreadPoolExecutor(2) as pool:
+            seen = list(pool.map(touch, workers))
+        self.assertEqual(seen, [[workers[0]], [workers[1]]])
+        self.assertEqual(ssh._workers, workers)
+        scalars = (str, int, float, bool, type(None))
+        for worker in workers:
+            for name, value in vars(worker).items():
+                if not isinstance(value, scalars):
+                    self.assertIsNot(value, vars(ssh).get(name), name)
+            self.assertNotIn('get_session_config', vars(worker))
+
+    def test_single_channel_runs_in_turn(self):
+        ssh, opened = self._ssh(channels=1, delay=0)
+        result = ssh.run_parallel([lambda s: s is ssh] * 3)
+        self.assertEqual(result, [True] * 3)
+        self.assertEqual(opened, [])
+
+
 if __name__ == '__main__':
     unittest.main()
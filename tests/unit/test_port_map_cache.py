@@ -0,0 +1,82 @@
+"""Unit tests for PortMapCache — on-disk ifIndex/bridge-port maps."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from napalm_hios.port_map_cache import PortMapCache, resolve_port_map_cache
+
+
+class TestPortMapCache(unittest.TestCase):
+    """Test PortMapCache storage, TTL and invalidation."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = PortMapCache(self.tmp.name, ttl=60)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip(self):
+        self.cache.set("942135999", "HiOS-2A-10.3.04", "ifindex", {"1": "1/1"})
+        self.cache.set("942135999", "HiOS-2A-10.3.04", "bridge_ports", {"1": "1"})
+        self.assertEqual(
+            self.cache.get("942135999", "HiOS-2A-10.3.04", "ifindex"), {"1": "1/1"})
+        self.assertEqual(
+            self.cache.get("942135999", "HiOS-2A-10.3.04", "bridge_ports"),
+            {"1": "1"})
+
+    def test_keyed_by_serial_and_firmware(self):
+        self.cache.set("942135999", "HiOS-2A-10.3.04", "ifindex", {"1": "1/1"})
+        self.assertIsNone(self.cache.get("942135999", "HiOS-2A-10.3.01", "ifindex"))
+        self.assertIsNone(self.cache.get("942135000", "HiOS-2A-10.3.04", "ifindex"))
+
+    def test_ttl_expiry(self):
+        with patch("napalm_hios.port_map_cache.time.time", return_value=1000):
+            self.cache.set("S1", "FW", "ifindex", {"1": "1/1"})
+        with patch("napalm_hios.port_map_cache.time.time", return_value=1059):
+            self.assertEqual(self.cache.get("S1", "FW", "ifindex"), {"1": "1/1"})
+        with patch("napalm_hios.port_map_cache.time.time", return_value=1061):
+            self.assertIsNone(self.cache.get("S1", "FW", "ifindex"))
+
+    def test_invalidate(self):
+        self.cache.set("S1", "FW", "ifindex", {"1": "1/1"})
+        self.cache.invalidate("S1", "FW")
+        self.assertIsNone(self.cache.get("S1", "FW", "ifindex"))
+        self.cache.invalidate("S1", "FW")  # missing file is fine
+
+    def test_corrupt_file_is_a_miss(self):
+        self.cache.set("S1", "FW", "ifindex", {"1": "1/1"})
+        with open(self.cache._file("S1", "FW"), "w") as f:
+            f.write("{not json")
+        self.assertIsNone(self.cache.get("S1", "FW", "ifindex"))
+
+    def test_unsafe_key_characters(self):
+        self.cache.set("../S1", "HiOS 10/3", "ifindex", {"1": "1/1"})
+        self.assertEqual(os.listdir(self.tmp.name), [".._S1_HiOS_10_3.json"])
+
+    def test_write_failure_ignored(self):
+        blocker = os.path.join(self.tmp.name, "file")
+        with open(blocker, "w") as f:
+            json.dump({}, f)
+        cache = PortMapCache(os.path.join(blocker, "sub"))
+        cache.set("S1", "FW", "ifindex", {"1": "1/1"})
+        self.assertIsNone(cache.get("S1", "FW", "ifindex"))
+
+
+class TestResolvePortMapCache(unittest.TestCase):
+    """Test the 'port_map_cache' optional_args conversion."""
+
+    def test_values(self):
+        self.assertIsNone(resolve_port_map_cache(None))
+        self.assertIsNone(resolve_port_map_cache(False))
+        self.assertIsInstance(resolve_port_map_cache(True), PortMapCache)
+        self.assertEqual(resolve_port_map_cache("/tmp/x").path, "/tmp/x")
+        custom = object()
+        self.assertIs(resolve_port_map_cache(custom), custom)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@
 import unittest
 from unittest.mock import patch, AsyncMock, MagicMock
 import asyncio
+import threading
+import time
 
 from napalm_hios.snmp_hios import (
     SNMPHIOS, _format_mac, _mask_to_prefix, _parse_sysDescr,
@@ -15,7 +17,7 @@ from napalm_hios.snmp_hios import (
     OID_hm2FMActionActivateKey, OID_hm2FMActionActivate_save,
     OID_sysDescr, OID_sysName, OID_sysUpTime, OID_sysContact, OID_sysLocation,
     OID_ifDescr, OID_ifOperStatus, OID_ifAdminStatus, OID_ifHighSpeed,
-    OID_ifMtu, OID_ifPhysAddress, OID_ifAlias,
+    OID_ifMtu, OID_ifPhysAddress, OID_ifAlias, OID_ifName,
     OID_ipAdEntIfIndex, OID_ipAdEntNetMask,
     OID_ifHCInOctets, OID_ifHCOutOctets,
     OID_ifHCInUcastPkts, OID_ifHCOutUcastPkts,
@@ -190,6 +192,16 @@ from napalm_hios.snmp_hios import (
     OID_hm2AgentDaiIfAutoDisable,
 )
 from napalm.base.exceptions import ConnectionException
+from pysnmp.hlapi.v3arch.asyncio import (
+    usmHMACMD5AuthProtocol, usmHMACSHAAuthProtocol, usmAesCfb128Protocol,
+)
+from pysnmp.proto import errind
+from pysnmp.proto.rfc1902 import Integer32, OctetString
+from pysnmp.proto.rfc1905 import EndOfMibView
+from pysnmp.proto.secmod.rfc3414.localkey import hash_passphrase_sha
+
+from napalm_hios import snmp_hios
+from napalm_hios.snmp_hios import _master_key, _RequestBudget, _SNMPStatusError
 
 
 class TestHelpers(unittest.TestCase):
@@ -343,6 +355,39 @@ class TestSNMPHIOSAuth(unittest.TestCase):
         auth = snmp._build_auth()
         self.assertEqual(auth.security_level, 'authPriv')
 
+    def test_master_key_cached(self):
+        """Password-to-key expansion runs once per password and protocol."""
+        snmp_hios._master_keys.clear()
+        with patch.dict('napalm_hios.snmp_hios._AUTH_PROTOCOLS',
+                        {'md5': (usmHMACMD5AuthProtocol,
+                                 MagicMock(return_value=b'k' * 16))}):
+            snmp = SNMPHIOS('192.168.1.4', 'admin', 'private', 10)
+            for _ in range(5):
+                snmp._build_auth()
+            SNMPHIOS('192.168.1.5', 'admin', 'private', 10)._build_auth()
+            hasher = snmp_hios._AUTH_PROTOCOLS['md5'][1]
+            hasher.assert_called_once_with(b'private')
+            # Keyed on a salted digest, never on the cleartext password
+            self.assertNotIn(('private', 'md5'), snmp_hios._master_keys)
+            for digest, _ in snmp_hios._master_keys:
+                self.assertNotIn(b'private', digest)
+        snmp_hios._master_keys.clear()
+
+    def test_sha_aes(self):
+        snmp = SNMPHIOS('192.168.1.4', 'admin', 'private', 10,
+                        auth_protocol='sha', priv_protocol='aes128')
+        auth = snmp._build_auth()
+        self.assertEqual(auth.authentication_protocol, usmHMACSHAAuthProtocol)
+        self.assertEqual(auth.privacy_protocol, usmAesCfb128Protocol)
+        self.assertEqual(bytes(auth.authentication_key),
+                         bytes(hash_passphrase_sha(b'private')))
+
+    def test_invalid_protocol(self):
+        with self.assertRaises(ValueError):
+            SNMPHIOS('192.168.1.4', 'admin', 'private', 10, auth_protocol='sha256')
+        with self.assertRaises(ValueError):
+            SNMPHIOS('192.168.1.4', 'admin', 'private', 10, priv_protocol='3des')
+
 
 class TestSNMPHIOS(unittest.TestCase):
     """Test SNMPHIOS getter methods by mocking _get_scalar and _walk."""
@@ -2509,8 +2554,13 @@ class TestSNMPHIOS(unittest.TestCase):
         self.assertEqual(list(result['interfaces'].keys()), ['1/1'])
 
     def test_set_storm_control_bad_unit(self):
-        with self.assertRaises(ValueError):
-            self.snmp.set_storm_control('1/1', unit='bps')
+        async def mock_ifmap(engine=None):
+            self.snmp._ifindex_map = {'1': '1/1'}
+            return self.snmp._ifindex_map
+
+        with patch.object(self.snmp, '_build_ifindex_map', side_effect=mock_ifmap):
+            with self.assertRaises(ValueError):
+                self.snmp.set_storm_control('1/1', unit='bps')
 
     def test_set_storm_control_bad_port(self):
         async def mock_ifmap(engine=None):
@@ -2855,16 +2905,31 @@ class TestSNMPHIOS(unittest.TestCase):
         self.assertNotIn('cpu0', result['interfaces'])
 
     def test_set_qos_bad_trust_mode(self):
-        with self.assertRaises(ValueError):
-            self.snmp.set_qos('1/1', trust_mode='badval')
+        async def mock_ifmap(engine=None):
+            self.snmp._ifindex_map = {'1': '1/1'}
+            return self.snmp._ifindex_map
+
+        with patch.object(self.snmp, '_build_ifindex_map', side_effect=mock_ifmap):
+            with self.assertRaises(ValueError):
+                self.snmp.set_qos('1/1', trust_mode='badval')
 
     def test_set_qos_bad_scheduler(self):
-        with self.assertRaises(ValueError):
-            self.snmp.set_qos('1/1', scheduler='round-robin')
+        async def mock_ifmap(engine=None):
+            self.snmp._ifindex_map = {'1': '1/1'}
+            return self.snmp._ifindex_map
+
+        with patch.object(self.snmp, '_build_ifindex_map', side_effect=mock_ifmap):
+            with self.assertRaises(ValueError):
+                self.snmp.set_qos('1/1', scheduler='round-robin')
 
     def test_set_qos_queue_needed_no_index(self):
-        with self.assertRaises(ValueError):
-            self.snmp.set_qos('1/1', min_bw=50)
+        async def mock_ifmap(engine=None):
+            self.snmp._ifindex_map = {'1': '1/1'}
+            return self.snmp._ifindex_map
+
+        with patch.object(self.snmp, '_build_ifindex_map', side_effect=mock_ifmap):
+            with self.assertRaises(ValueError):
+                self.snmp.set_qos('1/1', min_bw=50)
 
     def test_set_qos_bad_port(self):
         async def mock_ifmap(engine=None):
@@ -3478,7 +3543,13 @@ class TestSNMPSnmpConfig(unittest.TestCase):
                 OID_hm2SnmpV3AdminStatus: 1,
                 OID_hm2SnmpPortNumber: 161,
             }
-        with patch.object(self.snmp, '_get_scalar', side_effect=mock_scalar):
+        async def mock_walk(columns, engine=None):
+            return {}
+        async def mock_ifmap(engine=None):
+            return {}
+        with patch.object(self.snmp, '_get_scalar', side_effect=mock_scalar), \
+             patch.object(self.snmp, '_walk_columns', side_effect=mock_walk), \
+             patch.object(self.snmp, '_build_ifindex_map', side_effect=mock_ifmap):
             result = self.snmp.get_snmp_config()
         self.assertFalse(result['versions']['v1'])
         self.assertTrue(result['versions']['v3'])
@@ -5388,5 +5459,793 @@ class TestSNMPIpSourceGuard(unittest.TestCase):
         self.snmp.set_ip_source_guard()
 
 
+
+class TestSNMPTableWalk(unittest.TestCase):
+    """Test the lock-step multi-column GETBULK walker."""
+
+    A = '1.3.6.1.2.1.31.1.1.1.1'    # ifName
+    B = '1.3.6.1.2.1.31.1.1.1.18'   # ifAlias
+
+    def setUp(self):
+        self.snmp = SNMPHIOS('192.168.1.254', 'public', '', 10,
+                             walk_cache_ttls={})
+        patcher = patch.object(self.snmp, '_get_transport',
+                               AsyncMock(return_value='target'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.dict(snmp_hios._bulk_repetitions, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _walk(self, responses, cols=None):
+        bulk = AsyncMock(side_effect=[
+            vbs if isinstance(vbs, tuple) else (None, 0, 0, vbs)
+            for vbs in responses])
+        # requested OIDs reach bulk_cmd as plain strings
+        with patch('napalm_hios.snmp_hios.bulk_cmd', bulk), \
+                patch('napalm_hios.snmp_hios.ObjectType', side_effect=str), \
+                patch('napalm_hios.snmp_hios.ObjectIdentity', side_effect=str):
+            result = asyncio.run(self.snmp._walk_columns(
+                cols or {'name': self.A, 'alias': self.B}, engine=MagicMock()))
+        return result, bulk
+
+    @staticmethod
+    def _requested(call):
+        return list(call.args[6:])
+
+    def test_lockstep_merge(self):
+        result, bulk = self._walk([
+            [(self.A + '.1', '1/1'), (self.B + '.1', 'uplink'),
+             (self.A + '.2', '1/2'), (self.B + '.2', '')],
+            [(self.A + '.3', '1/3'), ('1.3.6.1.2.1.31.1.1.1.19.1', 0)],
+            [('1.3.6.1.2.1.31.1.1.1.2.1', 0)],
+        ])
+        self.assertEqual(result, {
+            '1': {'name': '1/1', 'alias': 'uplink'},
+            '2': {'name': '1/2', 'alias': ''},
+            '3': {'name': '1/3'},
+        })
+        self.assertEqual(bulk.await_count, 3)
+        # one varbind list carries both columns, each from its own cursor
+        self.assertEqual(self._requested(bulk.await_args_list[0]), [self.A, self.B])
+        self.assertEqual(self._requested(bulk.await_args_list[1]),
+                         [self.A + '.2', self.B + '.2'])
+        # alias left its subtree — only the name column is still walked
+        self.assertEqual(self._requested(bulk.await_args_list[2]), [self.A + '.3'])
+
+    def test_repetitions_capped_by_width(self):
+        cols = {f'c{i}': f'1.3.6.1.4.1.248.{i}' for i in range(10)}
+        _, bulk = self._walk([[('1.3.6.1.9', EndOfMibView())] * 10], cols)
+        self.assertEqual(bulk.await_args.args[5], 5)   # 50 varbinds / 10 columns
+
+    def test_truncated_response(self):
+        result, bulk = self._walk([
+            [(self.A + '.1', '1/1'), (self.B + '.1', 'x'), (self.A + '.2', '1/2')],
+            [('1.3.6.1.9', EndOfMibView()), ('1.3.6.1.9', EndOfMibView())],
+        ])
+        self.assertEqual(result['2'], {'name': '1/2'})
+        self.assertEqual(self._requested(bulk.await_args_list[1]),
+                         [self.A + '.2', self.B + '.1'])
+
+    def test_error_returns_partial(self):
+        bulk = AsyncMock(side_effect=[
+            (None, 0, 0, [(self.A + '.1', '1/1'), (self.B + '.1', 'x')]),
+            ('requestTimedOut', 0, 0, []),
+        ])
+        with patch('napalm_hios.snmp_hios.bulk_cmd', bulk), \
+                self.assertLogs('napalm_hios.snmp_hios', level='WARNING'):
+            result = asyncio.run(self.snmp._walk_columns(
+                {'name': self.A, 'alias': self.B}, engine=MagicMock()))
+        self.assertEqual(result, {'1': {'name': '1/1', 'alias': 'x'}})
+
+    def test_non_increasing_oid_stops(self):
+        result, bulk = self._walk([
+            [(self.A + '.1', '1/1'), (self.B + '.1', 'x')],
+            [(self.A + '.1', '1/1'), (self.B + '.1', 'x')],
+        ])
+        self.assertEqual(bulk.await_count, 2)
+        self.assertEqual(len(result), 1)
+
+    def _rows(self, start, count):
+        return [vb for i in range(start, start + count)
+                for vb in ((f'{self.A}.{i}', 'n'), (f'{self.B}.{i}', 'a'))]
+
+    def test_repetitions_grow_while_full(self):
+        end = [('1.3.6.1.9', EndOfMibView())] * 2
+        result, bulk = self._walk([self._rows(1, 25), self._rows(26, 50), end])
+        self.assertEqual(len(result), 75)
+        self.assertEqual([c.args[5] for c in bulk.await_args_list], [25, 50, 100])
+        # the largest size that returned rows is kept for the next walk
+        key = ('192.168.1.254', 161, '1.3.6.1.2.1.31.1.1.1')
+        self.assertEqual(snmp_hios._bulk_repetitions[key], 50)
+        _, bulk = self._walk([end])
+        self.assertEqual(bulk.await_args.args[5], 50)
+
+    def test_repetitions_follow_truncation(self):
+        end = [('1.3.6.1.9', EndOfMibView())] * 2
+        _, bulk = self._walk([self._rows(1, 10), end])
+        self.assertEqual(bulk.await_args.args[5], 10)
+
+    def test_too_big_halves_and_retries(self):
+        result, bulk = self._walk([
+            (None, 1, 0, []),   # tooBig
+            [(self.A + '.1', '1/1'), (self.B + '.1', 'x'),
+             ('1.3.6.1.9', EndOfMibView()), ('1.3.6.1.9', EndOfMibView())],
+        ])
+        self.assertEqual([c.args[5] for c in bulk.await_args_list], [25, 12])
+        self.assertEqual(result, {'1': {'name': '1/1', 'alias': 'x'}})
+
+    def test_timeout_backs_off_once(self):
+        timeout = (errind.RequestTimedOut(), 0, 0, [])
+        self.snmp._responded = True
+        with self.assertLogs('napalm_hios.snmp_hios', level='WARNING'):
+            result, bulk = self._walk([timeout, timeout])
+        self.assertEqual([c.args[5] for c in bulk.await_args_list], [25, 6])
+        self.assertEqual(result, {})
+
+    def test_timeout_before_any_response_not_retried(self):
+        timeout = (errind.RequestTimedOut(), 0, 0, [])
+        with self.assertLogs('napalm_hios.snmp_hios', level='WARNING'):
+            result, bulk = self._walk([timeout, timeout])
+        self.assertEqual([c.args[5] for c in bulk.await_args_list], [25])
+        self.assertEqual(result, {})
+
+    def test_fixed_max_repetitions(self):
+        self.snmp.max_repetitions = 10
+        end = [('1.3.6.1.9', EndOfMibView())] * 2
+        _, bulk = self._walk([self._rows(1, 10), self._rows(11, 3), end])
+        self.assertEqual([c.args[5] for c in bulk.await_args_list], [10, 10, 10])
+        self.assertEqual(snmp_hios._bulk_repetitions, {})
+
+    def test_single_column_uses_walk(self):
+        async def mock_walk(oid, engine=None):
+            return {'1': '1/1'}
+        with patch.object(self.snmp, '_walk', side_effect=mock_walk):
+            result = asyncio.run(self.snmp._walk_columns({'name': self.A}))
+        self.assertEqual(result, {'1': {'name': '1/1'}})
+
+
+class TestSNMPWalkCache(unittest.TestCase):
+    """Test the per-session walk cache and its invalidation."""
+
+    def setUp(self):
+        self.snmp = SNMPHIOS('192.168.1.254', 'public', '', 10)
+        self.live = AsyncMock(side_effect=self._live)
+        patcher = patch.object(self.snmp, '_bulk_walk_live', self.live)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    async def _live(oids, engine=None):
+        return [{'.1': oid} for oid in oids], True
+
+    def _walk(self, *oids):
+        if len(oids) == 1:
+            return asyncio.run(self.snmp._walk(oids[0]))
+        return asyncio.run(self.snmp._walk_columns(
+            {str(i): oid for i, oid in enumerate(oids)}))
+
+    def _walked(self):
+        return [oid for call in self.live.await_args_list for oid in call.args[0]]
+
+    def test_port_identity_walked_once(self):
+        self._walk(OID_ifName)
+        self._walk(OID_ifName)
+        self._walk(OID_dot1dBasePortIfIndex)
+        self._walk(OID_dot1dBasePortIfIndex)
+        self.assertEqual(self._walked(), [OID_ifName, OID_dot1dBasePortIfIndex])
+
+    def test_uncached_tables_always_live(self):
+        self._walk(OID_dot1qTpFdbPort)
+        self._walk(OID_dot1qTpFdbPort)
+        self.assertEqual(self._walked(), [OID_dot1qTpFdbPort] * 2)
+
+    def test_columns_mix_cached_and_live(self):
+        self._walk(OID_ifName)
+        rows = self._walk(OID_ifName, OID_dot1qTpFdbPort)
+        self.assertEqual(rows, {'.1': {'0': OID_ifName, '1': OID_dot1qTpFdbPort}})
+        self.assertEqual(self._walked(), [OID_ifName, OID_dot1qTpFdbPort])
+
+    def test_ttl_expiry(self):
+        with patch('napalm_hios.snmp_hios.time.monotonic', return_value=1000.0):
+            self._walk(OID_ifHCInOctets)          # ifXTable: 2 s
+        with patch('napalm_hios.snmp_hios.time.monotonic', return_value=1001.0):
+            self._walk(OID_ifHCInOctets)
+        with patch('napalm_hios.snmp_hios.time.monotonic', return_value=1003.0):
+            self._walk(OID_ifHCInOctets)
+        self.assertEqual(self._walked(), [OID_ifHCInOctets] * 2)
+
+    def test_longest_prefix_wins(self):
+        self.assertEqual(self.snmp._walk_ttl(OID_ifName), 300)
+        self.assertEqual(self.snmp._walk_ttl(OID_ifAlias), 2)
+        self.assertEqual(self.snmp._walk_ttl(OID_dot1qTpFdbPort), 0)
+
+    def test_incomplete_walk_not_cached(self):
+        self.live.side_effect = None
+        self.live.return_value = ([{'.1': 'partial'}], False)
+        self._walk(OID_ifName)
+        self._walk(OID_ifName)
+        self.assertEqual(self.live.await_count, 2)
+
+    def test_results_are_copies(self):
+        self._walk(OID_ifName)['.2'] = 'mutated'
+        self.assertEqual(self._walk(OID_ifName), {'.1': OID_ifName})
+
+    @patch('napalm_hios.snmp_hios.set_cmd', new_callable=AsyncMock)
+    def test_set_invalidates(self, mock_set):
+        mock_set.return_value = (None, 0, 0, [])
+        self._walk(OID_ifName)
+        with patch.object(self.snmp, '_get_transport', AsyncMock()):
+            asyncio.run(self.snmp._set_oids((f'{OID_ifAlias}.1', OctetString('x'))))
+        self._walk(OID_ifName)
+        self.assertEqual(self._walked(), [OID_ifName] * 2)
+
+    def test_invalidate_overlapping(self):
+        self._walk(OID_ifName)
+        self._walk(OID_dot1dBasePortIfIndex)
+        self.snmp._invalidate_walks('1.3.6.1.2.1.31')
+        self.assertEqual(list(self.snmp._walk_cache), [OID_dot1dBasePortIfIndex])
+
+    def test_disabled(self):
+        self.snmp.walk_cache_ttls = {}
+        self._walk(OID_ifName)
+        self._walk(OID_ifName)
+        self.assertEqual(self.live.await_count, 2)
+
+    def test_close_clears(self):
+        self._walk(OID_ifName)
+        self.snmp.close()
+        self.assertEqual(self.snmp._walk_cache, {})
+
+
+class TestSNMPSessionLoop(unittest.TestCase):
+    """Test the per-session event loop thread, engine and transport."""
+
+    def setUp(self):
+        self.snmp = SNMPHIOS('192.168.1.254', 'admin', 'private', 10)
+
+    def _open(self):
+        async def mock_scalar(*oids):
+            return {OID_sysDescr: 'Hirschmann BRS50 HiOS-2A-10.3.04'}
+        with patch.object(self.snmp, '_get_scalar', side_effect=mock_scalar):
+            self.snmp.open()
+        self.addCleanup(self.snmp.close)
+
+    def test_getters_run_on_session_thread(self):
+        self._open()
+        threads = []
+
+        async def mock_scalar(*oids):
+            threads.append(threading.current_thread())
+            return {OID_sysDescr: 'x'}
+        with patch.object(self.snmp, '_get_scalar', side_effect=mock_scalar):
+            self.snmp._run(self.snmp._get_scalar(OID_sysDescr))
+            self.snmp._run(self.snmp._get_scalar(OID_sysDescr))
+        self.assertEqual(threads, [self.snmp._loop_thread] * 2)
+
+    @patch('napalm_hios.snmp_hios.UdpTransportTarget')
+    @patch('napalm_hios.snmp_hios.SnmpEngine')
+    def test_engine_and_transport_reused(self, mock_engine_cls, mock_target):
+        mock_target.create = AsyncMock(return_value='target')
+        self._open()
+
+        async def use():
+            return self.snmp._get_engine(), await self.snmp._get_transport()
+        first = self.snmp._run(use())
+        second = self.snmp._run(use())
+        self.assertEqual(first, second)
+        mock_engine_cls.assert_called_once()
+        mock_target.create.assert_awaited_once()
+
+    @patch('napalm_hios.snmp_hios.SnmpEngine')
+    def test_close_stops_loop(self, mock_engine_cls):
+        self._open()
+        thread = self.snmp._loop_thread
+
+        async def use():
+            return self.snmp._get_engine()
+        engine = self.snmp._run(use())
+        self.snmp.close()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+        engine.close_dispatcher.assert_called_once()
+        self.assertIsNone(self.snmp._loop)
+        self.assertIsNone(self.snmp._engine)
+
+    def test_open_failure_stops_loop(self):
+        async def mock_scalar(*oids):
+            raise ConnectionException("timeout")
+        with patch.object(self.snmp, '_get_scalar', side_effect=mock_scalar):
+            with self.assertRaises(ConnectionException):
+                self.snmp.open()
+        self.assertIsNone(self.snmp._loop)
+
+    @patch('napalm_hios.snmp_hios.SnmpEngine')
+    def test_without_open_uses_fresh_engine(self, mock_engine_cls):
+        async def use():
+            return self.snmp._get_engine()
+        self.snmp._run(use())
+        self.snmp._run(use())
+        self.assertEqual(mock_engine_cls.call_count, 2)
+        self.assertIsNone(self.snmp._engine)
+
+
+class TestSNMPAsyncAPI(unittest.TestCase):
+    """Test aget_* and aopen()/aclose() from a caller's event loop."""
+
+    def setUp(self):
+        self.snmp = SNMPHIOS('192.168.1.254', 'admin', 'private', 10)
+        self.addCleanup(self.snmp.close)
+
+    @staticmethod
+    async def _sys_descr(*oids):
+        return {OID_sysDescr: 'Hirschmann BRS50 HiOS-2A-10.3.04'}
+
+    def test_aget_without_session_runs_inline(self):
+        async def facts():
+            return {'hostname': 'sw1', 'thread': threading.current_thread()}
+        with patch.object(self.snmp, '_get_facts_async', side_effect=facts):
+            result = asyncio.run(self.snmp.aget_facts())
+        self.assertEqual(result['hostname'], 'sw1')
+        self.assertIs(result['thread'], threading.current_thread())
+
+    def test_aget_from_foreign_loop_uses_session_loop(self):
+        with patch.object(self.snmp, '_get_scalar', side_effect=self._sys_descr):
+            self.snmp.open()
+
+        async def vlans():
+            return threading.current_thread()
+        with patch.object(self.snmp, '_get_vlans_async', side_effect=vlans):
+            thread = asyncio.run(self.snmp.aget_vlans())
+        self.assertIs(thread, self.snmp._loop_thread)
+
+    def test_aopen_adopts_running_loop(self):
+        async def session():
+            with patch.object(self.snmp, '_get_scalar', side_effect=self._sys_descr):
+                await self.snmp.aopen()
+            loop = asyncio.get_running_loop()
+            adopted = self.snmp._loop is loop and self.snmp._on_session_loop()
+            with self.assertRaises(RuntimeError):
+                self.snmp.get_vlans()
+            await self.snmp.aclose()
+            return adopted, loop.is_running()
+        threads = threading.active_count()
+        self.assertEqual(asyncio.run(session()), (True, True))
+        self.assertEqual(threading.active_count(), threads)
+        self.assertIsNone(self.snmp._loop)
+        self.assertTrue(self.snmp._owns_loop)
+
+    def test_aopen_failure_raises_connection_exception(self):
+        async def timeout(*oids):
+            raise RuntimeError("no response")
+        with patch.object(self.snmp, '_get_scalar', side_effect=timeout):
+            with self.assertRaises(ConnectionException):
+                asyncio.run(self.snmp.aopen())
+        self.assertIsNone(self.snmp._loop)
+
+    def test_aget_profiles_validates_storage(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(self.snmp.aget_profiles('usb'))
+
+    def test_every_getter_has_async_twin(self):
+        # get_staged_mutations() inspects the local queue, not the device
+        getters = {n for n in dir(SNMPHIOS)
+                   if n.startswith('get_') and n != 'get_staged_mutations'}
+        self.assertEqual({n for n in dir(SNMPHIOS) if n.startswith('aget_')},
+                         {'a' + n for n in getters})
+
+
+class TestSNMPGetCoalescing(unittest.TestCase):
+    """Test that concurrent scalar GETs on the session share one PDU."""
+
+    def setUp(self):
+        self.snmp = SNMPHIOS('192.168.1.254', 'admin', 'private', 10)
+        for patcher in (
+            patch.object(self.snmp, '_get_transport',
+                         AsyncMock(return_value='target')),
+            patch('napalm_hios.snmp_hios.SnmpEngine'),
+            # requested OIDs reach get_cmd as plain strings
+            patch('napalm_hios.snmp_hios.ObjectType', side_effect=str),
+            patch('napalm_hios.snmp_hios.ObjectIdentity', side_effect=str),
+            patch.dict(snmp_hios._get_max_varbinds, clear=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.requests = []
+        self.too_big = None     # max varbinds the fake agent answers
+        self.bad_oid = None     # OID the fake agent rejects (noAccess)
+
+    async def _get_cmd(self, engine, auth, target, context, *oids):
+        self.requests.append(list(oids))
+        if self.too_big and len(oids) > self.too_big:
+            return None, Integer32(1), Integer32(0), []
+        if self.bad_oid in oids:
+            return (None, Integer32(6), Integer32(oids.index(self.bad_oid) + 1),
+                    [(oid, Integer32(0)) for oid in oids])
+        return None, Integer32(0), Integer32(0), [(oid, Integer32(1)) for oid in oids]
+
+    def _gather(self, *coros):
+        async def gather():
+            return await asyncio.gather(*coros, return_exceptions=True)
+        with patch.object(self.snmp, '_get_scalar',
+                          AsyncMock(return_value={OID_sysDescr: 'HiOS'})):
+            self.snmp.open()
+        self.addCleanup(self.snmp.close)
+        with patch('napalm_hios.snmp_hios.get_cmd', side_effect=self._get_cmd):
+            return self.snmp._run(gather())
+
+    def test_concurrent_calls_share_one_pdu(self):
+        first, second = self._gather(
+            self.snmp._get_scalar(OID_sysName, OID_sysContact),
+            self.snmp._get_scalar(OID_sysName, OID_sysLocation))
+        self.assertEqual(self.requests, [[OID_sysName + '.0', OID_sysContact + '.0',
+                                          OID_sysLocation + '.0']])
+        self.assertEqual(set(first), {OID_sysName, OID_sysContact})
+        self.assertEqual(set(second), {OID_sysName, OID_sysLocation})
+
+    def test_status_getters_cost_one_round_trip(self):
+        info, status, hidisc = self._gather(
+            self.snmp._get_snmp_information_async(),
+            self.snmp._get_config_status_async(),
+            self.snmp._get_hidiscovery_async())
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(len(self.requests[0]), 11)
+        self.assertEqual(info['chassis_id'], '1')
+        self.assertTrue(status['saved'])
+        self.assertTrue(hidisc['enabled'])
+
+    def test_too_big_splits_and_remembers(self):
+        self.too_big = 2
+        result, = self._gather(self.snmp._get_scalar(
+            OID_sysName, OID_sysContact, OID_sysLocation, OID_sysDescr))
+        self.assertEqual([len(r) for r in self.requests], [4, 2, 2])
+        self.assertEqual(len(result), 4)
+        self.assertEqual(snmp_hios._get_max_varbinds[('192.168.1.254', 161)], 2)
+
+    def test_rejected_batch_retried_per_caller(self):
+        self.bad_oid = OID_sysLocation + '.0'
+        good, bad = self._gather(
+            self.snmp._get_scalar(OID_sysName),
+            self.snmp._get_scalar(OID_sysLocation))
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(set(good), {OID_sysName})
+        self.assertIsInstance(bad, ConnectionException)
+        self.assertIn(OID_sysLocation, str(bad))
+
+    def test_without_session_each_call_sends(self):
+        with patch('napalm_hios.snmp_hios.get_cmd', side_effect=self._get_cmd):
+            asyncio.run(self.snmp._get_scalar(OID_sysName))
+            asyncio.run(self.snmp._get_scalar(OID_sysContact))
+        self.assertEqual(self.requests, [[OID_sysName + '.0'], [OID_sysContact + '.0']])
+
+
+class TestSNMPRequestBudget(unittest.TestCase):
+    """Test the per-session in-flight cap, pacing and timeout backoff."""
+
+    def _run_requests(self, budget, count, hold=0.01):
+        order, peak = [], [0]
+
+        async def request(n):
+            await budget.acquire()
+            order.append(n)
+            peak[0] = max(peak[0], budget.in_flight)
+            await asyncio.sleep(hold)
+            budget.release()
+
+        async def main():
+            await asyncio.gather(*(request(n) for n in range(count)))
+        asyncio.run(main())
+        return order, peak[0]
+
+    def test_in_flight_cap_and_fifo(self):
+        budget = _RequestBudget(max_in_flight=2, max_pps=None)
+        order, peak = self._run_requests(budget, 6)
+        self.assertEqual(peak, 2)
+        self.assertEqual(order, list(range(6)))
+        self.assertEqual(budget.in_flight, 0)
+
+    def test_unlimited(self):
+        budget = _RequestBudget(max_in_flight=None, max_pps=None)
+        _, peak = self._run_requests(budget, 6)
+        self.assertEqual(peak, 6)
+
+    def test_pacing(self):
+        budget = _RequestBudget(max_in_flight=1, max_pps=100)
+        start = time.monotonic()
+        self._run_requests(budget, 5, hold=0)
+        self.assertGreaterEqual(time.monotonic() - start, 0.035)
+
+    def test_timeout_backoff_and_recovery(self):
+        budget = _RequestBudget(max_in_flight=8, max_pps=None)
+        for expected in (4, 2, 1, 1):
+            budget.in_flight += 1
+            budget.release(timed_out=True)
+            self.assertEqual(budget.limit, expected)
+        budget.in_flight += 1
+        budget.release()
+        self.assertEqual(budget.limit, 2)
+
+    def test_cancelled_waiter_frees_its_place(self):
+        budget = _RequestBudget(max_in_flight=1, max_pps=None)
+
+        async def main():
+            await budget.acquire()
+            waiter = asyncio.ensure_future(budget.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0)
+            budget.release()
+            await asyncio.wait_for(budget.acquire(), 1)
+            budget.release()
+        asyncio.run(main())
+        self.assertEqual(budget.in_flight, 0)
+
+    def test_parallel_walks_stay_within_budget(self):
+        snmp = SNMPHIOS('192.168.1.254', 'public', '', 10, walk_cache_ttls={},
+                        max_in_flight=1, max_pps=None)
+        active, peak = [0], [0]
+
+        async def bulk_cmd(engine, auth, target, context, nonrep, reps, oid, **kw):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.001)
+            active[0] -= 1
+            if oid.endswith('.1'):
+                return errind.requestTimedOut, 0, 0, []
+            return None, 0, 0, [(oid + '.1', 1)]
+
+        async def main():
+            await asyncio.gather(*(snmp._walk(oid, MagicMock())
+                                   for oid in ('1.3.6.1.2.1.2.2.1.2', '1.3.6.1.2.1.2.2.1.3',
+                                               '1.3.6.1.2.1.2.2.1.5')))
+            return snmp._get_budget().limit
+        with patch.object(snmp, '_get_transport', AsyncMock(return_value='t')), \
+                patch('napalm_hios.snmp_hios.bulk_cmd', side_effect=bulk_cmd), \
+                patch('napalm_hios.snmp_hios.ObjectType', side_effect=str), \
+                patch('napalm_hios.snmp_hios.ObjectIdentity', side_effect=str), \
+                patch.dict(snmp_hios._bulk_repetitions, clear=True), \
+                self.assertLogs('napalm_hios.snmp_hios', level='WARNING'):
+            limit = asyncio.run(main())
+        self.assertEqual(peak[0], 1)
+        self.assertEqual(limit, 1)
+
+
+class TestSNMPStaging(unittest.TestCase):
+    """Test queued SETs, merged PortList edits and chunked commit."""
+
+    EGRESS = '1.3.6.1.2.1.17.7.1.4.3.1.2'
+    UNTAGGED = '1.3.6.1.2.1.17.7.1.4.3.1.4'
+    PVID = '1.3.6.1.2.1.17.7.1.4.5.1.1'
+
+    def setUp(self):
+        self.snmp = SNMPHIOS('192.168.1.254', 'admin', 'private', 10)
+        self.pdus = []
+        self.too_big = None     # max varbinds the fake agent accepts
+        self.rows = {
+            '1': {'egress': b'\xff' * 6, 'untagged': b'\xff' * 6,
+                  'forbidden': b'\x00' * 6},
+            '10': {'egress': b'\x00' * 6, 'untagged': b'\x00' * 6,
+                   'forbidden': b'\x00' * 6},
+            '20': {'egress': b'\x00' * 6, 'untagged': b'\x00' * 6,
+                   'forbidden': b'\x00' * 6},
+        }
+
+        async def set_oids(*pairs):
+            if self.too_big and len(pairs) > self.too_big:
+                raise _SNMPStatusError('SNMP SET error: tooBig', 1)
+            self.pdus.append(dict(pairs))
+
+        async def ifmap(engine=None):
+            return {str(i): f'1/{i}' for i in range(1, 49)}
+
+        async def bridge_ports(engine=None):
+            return {str(i): str(i) for i in range(1, 49)}
+
+        async def walk_columns(oid_map, engine=None):
+            return {vid: {name: cols[name] for name in oid_map}
+                    for vid, cols in self.rows.items()}
+
+        for patcher in (
+            patch.object(self.snmp, '_set_oids', side_effect=set_oids),
+            patch.object(self.snmp, '_build_ifindex_map', side_effect=ifmap),
+            patch.object(self.snmp, '_walk_bridge_ports', side_effect=bridge_ports),
+            patch.object(self.snmp, '_walk_columns', side_effect=walk_columns),
+            patch('napalm_hios.snmp_hios.SnmpEngine'),
+            patch.dict(snmp_hios._set_max_varbinds, clear=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_access_change_for_48_ports_is_one_pdu(self):
+        ports = [f'1/{i}' for i in range(1, 49)]
+        self.snmp.start_staging()
+        for port in ports:      # one call per port, as a tool would
+            self.snmp.set_access_port(port, 10)
+        self.snmp.set_interface(ports[:2], description='uplink')
+        self.assertEqual(self.pdus, [])
+        self.assertEqual(len(self.snmp.get_staged_mutations()), 2 + 2 + 48 + 2)
+        self.snmp.commit_staging()
+
+        self.assertEqual(len(self.pdus), 1)
+        pdu = self.pdus[0]
+        self.assertEqual(bytes(pdu[f'{self.EGRESS}.1']), b'\x00' * 6)
+        self.assertEqual(bytes(pdu[f'{self.UNTAGGED}.10']), b'\xff' * 6)
+        self.assertEqual(int(pdu[f'{self.PVID}.48']), 10)
+        self.assertFalse(self.snmp._staging)
+        self.assertEqual(self.snmp.get_staged_mutations(), [])
+
+    def test_egress_edits_merge_per_vlan_row(self):
+        self.snmp.start_staging()
+        self.snmp.set_vlan_egress(20, '1/1', 'tagged')
+        self.snmp.set_vlan_egress(20, ['1/2', '1/9'], 'untagged')
+        self.snmp.set_vlan_egress(20, '1/2', 'forbidden')
+        self.snmp.commit_staging()
+        pdu, = self.pdus
+        self.assertEqual(len(pdu), 3)
+        self.assertEqual(bytes(pdu[f'{self.EGRESS}.20'])[:2], b'\x80\x80')
+        self.assertEqual(bytes(pdu[f'{self.UNTAGGED}.20'])[:2], b'\x00\x80')
+
+    def test_staged_values_queue_in_last_write_order(self):
+        self.snmp.start_staging()
+        self.snmp.set_vlan_ingress('1/1', pvid=5)
+        self.snmp.set_interface('1/1', enabled=False)
+        self.snmp.set_vlan_ingress('1/1', pvid=7)
+        staged = self.snmp.get_staged_mutations()
+        self.assertEqual([oid for oid, _ in staged],
+                         [f'{OID_ifAdminStatus}.1', f'{self.PVID}.1'])
+        self.assertEqual(int(staged[1][1]), 7)
+
+    def test_commit_too_big_raises_and_keeps_queue(self):
+        self.too_big = 20
+        self.snmp.start_staging()
+        self.snmp.set_access_port([f'1/{i}' for i in range(1, 49)], 10)
+        with self.assertRaises(ConnectionException) as ctx:
+            self.snmp.commit_staging()
+        self.assertIn('commit_staging(chunk_size=26)', str(ctx.exception))
+        self.assertEqual(self.pdus, [])
+        self.assertTrue(self.snmp._staging)
+        self.assertEqual(len(self.snmp.get_staged_mutations()), 52)
+
+    def test_commit_chunks_split_on_too_big_and_remember(self):
+        self.too_big = 20
+        self.snmp.start_staging()
+        self.snmp.set_access_port([f'1/{i}' for i in range(1, 49)], 10)
+        results = self.snmp.commit_staging(chunk_size=26)
+        self.assertEqual([len(pdu) for pdu in self.pdus], [13, 13, 13, 13])
+        self.assertEqual(snmp_hios._set_max_varbinds[('192.168.1.254', 161)], 13)
+        self.assertEqual({r['status'] for r in results}, {'ok'})
+
+    def test_commit_chunk_size(self):
+        self.snmp.start_staging()
+        self.snmp.set_interface([f'1/{i}' for i in range(1, 6)], enabled=True)
+        self.snmp.commit_staging(chunk_size=2)
+        self.assertEqual([len(pdu) for pdu in self.pdus], [2, 2, 1])
+
+    def test_discard_and_immediate_without_staging(self):
+        self.snmp.start_staging()
+        self.snmp.set_interface('1/1', enabled=True)
+        self.snmp.discard_staging()
+        self.snmp.commit_staging()
+        self.assertEqual(self.pdus, [])
+        self.snmp.set_interface('1/1', enabled=True)
+        self.assertEqual(len(self.pdus), 1)
+
+    def test_other_errors_not_split(self):
+        async def rejected(*pairs):
+            raise _SNMPStatusError('SNMP SET error: wrongValue', 10)
+        self.snmp.start_staging()
+        self.snmp.set_interface(['1/1', '1/2'], enabled=True)
+        with patch.object(self.snmp, '_set_oids', side_effect=rejected):
+            with self.assertRaises(ConnectionException):
+                self.snmp.commit_staging()
+        self.assertEqual(snmp_hios._set_max_varbinds, {})
+
+    def test_failed_commit_keeps_queue(self):
+        async def unreachable(*pairs):
+            raise ConnectionException('SNMP SET error: timeout')
+        self.snmp.start_staging()
+        self.snmp.set_interface(['1/1', '1/2'], enabled=True)
+        staged = self.snmp.get_staged_mutations()
+        with patch.object(self.snmp, '_set_oids', side_effect=unreachable):
+            with self.assertRaises(ConnectionException):
+                self.snmp.commit_staging()
+        self.assertTrue(self.snmp._staging)
+        self.assertEqual(self.snmp.get_staged_mutations(), staged)
+        self.snmp.commit_staging()
+        self.assertEqual(len(self.pdus), 1)
+        self.assertEqual(self.snmp.get_staged_mutations(), [])
+
+    def test_commit_chunk_size_results(self):
+        async def set_oids(*pairs):
+            if f'{OID_ifAdminStatus}.3' in dict(pairs):
+                raise _SNMPStatusError('SNMP SET error: wrongValue', 10)
+            self.pdus.append(dict(pairs))
+        self.snmp.start_staging()
+        self.snmp.set_interface([f'1/{i}' for i in range(1, 6)], enabled=True)
+        staged = self.snmp.get_staged_mutations()
+        with patch.object(self.snmp, '_set_oids', side_effect=set_oids):
+            results = self.snmp.commit_staging(chunk_size=2)
+        self.assertEqual([r['mutation'] for r in results], staged)
+        self.assertEqual([r['status'] for r in results],
+                         ['ok', 'ok', 'error', 'error', 'ok'])
+        self.assertIn('wrongValue', results[2]['errors'][0])
+        self.assertFalse(self.snmp._staging)
+        self.assertEqual(self.snmp.commit_staging(chunk_size=2), [])
+
+
+class TestSNMPPortMapCache(unittest.TestCase):
+    """Test port_map_cache warm-up and refresh on the SNMP backend."""
+
+    def setUp(self):
+        self.cache = MagicMock()
+        self.snmp = SNMPHIOS('192.168.1.254', 'admin', 'private', 10,
+                             port_map_cache=self.cache)
+
+    def _open(self, serial='942135999'):
+        async def mock_scalar(*oids):
+            self.assertIn(OID_hm2SerialNumber, oids)
+            return {OID_sysDescr: 'Hirschmann BRS50 HiOS-2A-10.3.04',
+                    OID_hm2SerialNumber: serial}
+        with patch.object(self.snmp, '_get_scalar', side_effect=mock_scalar):
+            self.snmp.open()
+        self.addCleanup(self.snmp.close)
+
+    def test_open_loads_maps(self):
+        self.cache.get.side_effect = lambda s, fw, name: {
+            'ifindex': {'1': '1/1'}, 'bridge_ports': {'1': '1'}}[name]
+        self._open()
+        self.assertEqual(self.snmp._device_key, ('942135999', 'HiOS-2A-10.3.04'))
+        self.assertEqual(self.snmp._ifindex_map, {'1': '1/1'})
+        self.assertEqual(self.snmp._bp_map, {'1': '1'})
+
+    def test_open_without_serial_skips_cache(self):
+        self._open(serial='')
+        self.assertIsNone(self.snmp._device_key)
+        self.cache.get.assert_not_called()
+
+    def test_bridge_ports_served_from_cache(self):
+        self.snmp._bp_map = {'1': '1', '2': '2'}
+        walk = AsyncMock()
+        with patch.object(self.snmp, '_walk', walk):
+            bp = asyncio.run(self.snmp._build_bp_to_name({'1': '1/1', '2': '1/2'}, None))
+        self.assertEqual(bp, {'1': '1/1', '2': '1/2'})
+        walk.assert_not_awaited()
+
+    def test_bridge_ports_walked_and_stored(self):
+        self.snmp._device_key = ('S1', 'FW')
+        walk = AsyncMock(return_value={'1': 1, '2': 2})
+        with patch.object(self.snmp, '_walk', walk):
+            asyncio.run(self.snmp._walk_bridge_ports(None))
+        self.cache.set.assert_called_once_with(
+            'S1', 'FW', 'bridge_ports', {'1': '1', '2': '2'})
+
+    def test_changed_layout_invalidates(self):
+        self.snmp._device_key = ('S1', 'FW')
+        self.snmp._ifindex_map = {'1': '1/1'}
+        self.snmp._saved_ifindex = {'1': '1/1'}
+        self.snmp._bp_map = {'1': '1'}
+        self.snmp._ifindex_map = {'1': '1/1', '2': '2/1'}
+        self.snmp._save_port_maps()
+        self.cache.invalidate.assert_called_once_with('S1', 'FW')
+        self.cache.set.assert_called_once_with(
+            'S1', 'FW', 'ifindex', {'1': '1/1', '2': '2/1'})
+        self.assertIsNone(self.snmp._bp_map)
+
+    def test_unchanged_layout_not_rewritten(self):
+        self.snmp._device_key = ('S1', 'FW')
+        self.snmp._ifindex_map = {'1': '1/1'}
+        self.snmp._saved_ifindex = {'1': '1/1'}
+        self.snmp._save_port_maps()
+        self.cache.set.assert_not_called()
+        self.cache.invalidate.assert_not_called()
+
+    def test_close_resets(self):
+        self.snmp._device_key = ('S1', 'FW')
+        self.snmp._bp_map = {'1': '1'}
+        self.snmp.close()
+        self.assertIsNone(self.snmp._device_key)
+        self.assertIsNone(self.snmp._bp_map)
+
+
 if __name__ == '__main__':
     unittest.main()
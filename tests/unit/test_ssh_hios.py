@@ -127,6 +127,8 @@ class TestSSHDns(unittest.TestCase):
         self.ssh = SSHHIOS('198.51.100.1', 'admin', 'private', 10)
         self.ssh._connected = True
         self.ssh.connection = Mock()
+        # Getters batch through _cli(); serve them from the cli mock
+        self.ssh._cli = lambda cmds: self.ssh.cli(cmds)
 
     def _mock_cli(self, responses):
         """Helper: set up cli mock that returns dict keyed by command."""
@@ -391,6 +393,8 @@ class TestSSHPoe(unittest.TestCase):
         self.ssh = SSHHIOS('198.51.100.1', 'admin', 'private', 10)
         self.ssh._connected = True
         self.ssh.connection = Mock()
+        # Getters batch through _cli(); serve them from the cli mock
+        self.ssh._cli = lambda cmds: self.ssh.cli(cmds)
 
     def _mock_cli(self, responses):
         """Helper: set up cli mock that returns dict keyed by command."""
@@ -0,0 +1,234 @@
+"""Unit tests for TrapReceiver — notification decoding and cache invalidation."""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import Mock
+
+from pysnmp.hlapi.v3arch.asyncio import (
+    SnmpEngine, CommunityData, UsmUserData, UdpTransportTarget, ContextData,
+    NotificationType, ObjectIdentity, send_notification,
+)
+from pysnmp.entity import config
+from pysnmp.proto.rfc1902 import Integer32, ObjectIdentifier, TimeTicks
+
+from napalm_hios.mops_hios import MOPSHIOS
+from napalm_hios.snmp_hios import (
+    SNMPHIOS, _master_key, OID_ifName, OID_ifOperStatus,
+    OID_dot1dBasePortIfIndex,
+)
+from napalm_hios.trap_receiver import (
+    TrapReceiver, decode_notification, OID_snmpTrapOID_0, OID_sysUpTime_0,
+)
+
+LINK_DOWN = '1.3.6.1.6.3.1.1.5.3'
+COLD_START = '1.3.6.1.6.3.1.1.5.1'
+MRP_TRAP = '1.3.6.1.4.1.248.11.40.0.1'
+RING_OPER = '1.3.6.1.4.1.248.11.40.1.1.1.1.23.1'
+REDUNDANCY_OPER = '1.3.6.1.4.1.248.11.40.1.1.1.1.24.1'
+
+
+def _trap(trap_oid, **varbinds):
+    vbs = {OID_sysUpTime_0: TimeTicks(4200),
+           OID_snmpTrapOID_0: ObjectIdentifier(trap_oid)}
+    vbs.update(varbinds)
+    return vbs
+
+
+class TestDecodeNotification(unittest.TestCase):
+    """Test event classification and field extraction."""
+
+    def test_link_down(self):
+        event = decode_notification('10.0.0.1', _trap(LINK_DOWN, **{
+            '1.3.6.1.2.1.2.2.1.1.5': Integer32(5),
+            f'{OID_ifOperStatus}.5': Integer32(2),
+        }))
+        self.assertEqual(event['type'], 'link_down')
+        self.assertEqual(event['source'], '10.0.0.1')
+        self.assertEqual(event['uptime'], 4200)
+        self.assertEqual(event['ifindex'], '5')
+        self.assertEqual(event['oper_status'], 'down')
+        self.assertNotIn(OID_snmpTrapOID_0, event['varbinds'])
+
+    def test_link_up_ifindex_from_oper_status_row(self):
+        event = decode_notification('10.0.0.1', _trap(
+            '1.3.6.1.6.3.1.1.5.4', **{f'{OID_ifOperStatus}.7': Integer32(1)}))
+        self.assertEqual((event['type'], event['ifindex'], event['oper_status']),
+                         ('link_up', '7', 'up'))
+
+    def test_mrp_ring_state(self):
+        event = decode_notification('10.0.0.1', _trap(MRP_TRAP, **{
+            RING_OPER: Integer32(1), REDUNDANCY_OPER: Integer32(2)}))
+        self.assertEqual(event['type'], 'mrp')
+        self.assertEqual(event['ring_state'], 'open')
+        self.assertFalse(event['redundancy'])
+
+    def test_classification(self):
+        for trap_oid, expected in [
+            ('1.3.6.1.6.3.1.1.5.1', 'restart'),
+            ('1.3.6.1.6.3.1.1.5.2', 'restart'),
+            ('1.3.6.1.4.1.248.11.21.0.2', 'config_change'),
+            ('1.3.6.1.4.1.248.11.400.0.1', 'trap'),
+            ('1.3.6.1.6.3.1.1.5.5', 'trap'),
+        ]:
+            with self.subTest(trap_oid=trap_oid):
+                event = decode_notification('10.0.0.1', _trap(trap_oid))
+                self.assertEqual(event['type'], expected)
+                self.assertEqual(event['trap_oid'], trap_oid)
+
+
+class TestTrapDispatch(unittest.TestCase):
+    """Test cache invalidation, callbacks and wait_for()."""
+
+    def setUp(self):
+        self.receiver = TrapReceiver()
+        self.snmp = SNMPHIOS('10.0.0.1', 'admin', 'private', 10)
+        self.snmp._ifindex_map = {'5': '1/5'}
+        expires = time.monotonic() + 300
+        self.snmp._walk_cache = {
+            OID_ifName: (expires, {}),
+            OID_dot1dBasePortIfIndex: (expires, {}),
+            RING_OPER[:-2]: (expires, {}),
+        }
+
+    def _link_down(self, source='10.0.0.1'):
+        return decode_notification(source, _trap(LINK_DOWN, **{
+            f'{OID_ifOperStatus}.5': Integer32(2)}))
+
+    def test_link_event_invalidates_interface_tables(self):
+        self.receiver.attach(self.snmp)
+        event = self._link_down()
+        self.receiver.dispatch(event)
+        self.assertEqual(event['interface'], '1/5')
+        self.assertEqual(set(self.snmp._walk_cache),
+                         {RING_OPER[:-2], OID_dot1dBasePortIfIndex})
+
+    def test_mrp_event_keeps_walk_cache(self):
+        self.receiver.attach(self.snmp)
+        self.receiver.dispatch(decode_notification('10.0.0.1', _trap(MRP_TRAP)))
+        self.assertEqual(len(self.snmp._walk_cache), 3)
+        self.assertEqual(self.snmp._ifindex_map, {'5': '1/5'})
+
+    def test_config_change_invalidates_everything(self):
+        self.receiver.attach(self.snmp)
+        self.receiver.dispatch(decode_notification(
+            '10.0.0.1', _trap('1.3.6.1.4.1.248.11.21.0.1')))
+        self.assertEqual(self.snmp._walk_cache, {})
+
+    def test_restart_resets_port_maps(self):
+        self.snmp._bp_map = {'5': '5'}
+        self.receiver.attach(self.snmp)
+        self.receiver.dispatch(decode_notification('10.0.0.1', _trap(COLD_START)))
+        self.assertIsNone(self.snmp._ifindex_map)
+        self.assertIsNone(self.snmp._bp_map)
+
+    def test_other_sources_untouched(self):
+        self.receiver.attach(self.snmp)
+        self.receiver.dispatch(self._link_down('10.0.0.2'))
+        self.assertEqual(len(self.snmp._walk_cache), 3)
+
+    def test_attach_driver_uses_snmp_backend(self):
+        driver = Mock(hostname='10.0.0.1', snmp=self.snmp)
+        self.receiver.attach(driver)
+        self.receiver.dispatch(self._link_down())
+        self.assertNotIn(OID_ifName, self.snmp._walk_cache)
+
+    def test_attach_driver_on_mops(self):
+        mops = MOPSHIOS('10.0.0.1', 'admin', 'private', 10)
+        mops._ifindex_map = {'5': '1/5'}
+        self.receiver.attach(Mock(hostname='10.0.0.1', snmp=None, mops=mops))
+        event = self._link_down()
+        self.receiver.dispatch(event)
+        self.assertEqual(event['interface'], '1/5')
+        self.assertEqual(mops._ifindex_map, {'5': '1/5'})
+        self.receiver.dispatch(decode_notification('10.0.0.1', _trap(COLD_START)))
+        self.assertIsNone(mops._ifindex_map)
+
+    def test_attach_driver_without_cached_backend(self):
+        self.receiver.attach(Mock(hostname='10.0.0.1', snmp=None, mops=None))
+        with self.assertLogs('napalm_hios.trap_receiver', level='DEBUG'):
+            self.receiver.dispatch(self._link_down())   # nothing to invalidate
+
+    def test_callbacks(self):
+        seen = []
+        self.receiver.subscribe(seen.append)
+        failing = self.receiver.subscribe(Mock(side_effect=RuntimeError))
+        with self.assertLogs('napalm_hios.trap_receiver', level='WARNING'):
+            self.receiver.dispatch(self._link_down())
+        self.assertEqual(len(seen), 1)
+        self.receiver.unsubscribe(failing)
+
+    def test_wait_for_filters(self):
+        async def scenario():
+            waiter = asyncio.ensure_future(self.receiver.wait_for(
+                'mrp', source='10.0.0.1', timeout=1,
+                predicate=lambda e: e.get('ring_state') == 'closed'))
+            await asyncio.sleep(0)
+            self.receiver.dispatch(self._link_down())
+            self.receiver.dispatch(decode_notification(
+                '10.0.0.1', _trap(MRP_TRAP, **{RING_OPER: Integer32(1)})))
+            self.receiver.dispatch(decode_notification(
+                '10.0.0.2', _trap(MRP_TRAP, **{RING_OPER: Integer32(2)})))
+            self.receiver.dispatch(decode_notification(
+                '10.0.0.1', _trap(MRP_TRAP, **{RING_OPER: Integer32(2)})))
+            return await waiter
+        event = asyncio.run(scenario())
+        self.assertEqual((event['source'], event['ring_state']), ('10.0.0.1', 'closed'))
+        self.assertEqual(self.receiver._waiters, [])
+
+    def test_wait_for_timeout(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(self.receiver.wait_for('mrp', timeout=0.01))
+
+    def test_add_v3_user_validates(self):
+        with self.assertRaises(ValueError):
+            self.receiver.add_v3_user('admin', 'private', auth_protocol='sha256')
+        with self.assertRaises(ValueError):
+            self.receiver.add_v3_user('admin', 'private', priv_protocol='3des')
+
+
+class TestTrapReceiverLoopback(unittest.TestCase):
+    """Receive real notifications over loopback UDP."""
+
+    def _send(self, auth, kind, trap_oid, *varbinds):
+        async def scenario():
+            async with TrapReceiver(host='127.0.0.1', port=0) as receiver:
+                receiver.add_v3_user('admin', 'private')
+                waiter = asyncio.ensure_future(receiver.wait_for(timeout=5))
+                sender = SnmpEngine()
+                try:
+                    await send_notification(
+                        sender, auth,
+                        await UdpTransportTarget.create(('127.0.0.1', receiver.port)),
+                        ContextData(), kind,
+                        NotificationType(ObjectIdentity(trap_oid)).add_varbinds(*varbinds),
+                    )
+                    return await waiter
+                finally:
+                    sender.close_dispatcher()
+        return asyncio.run(scenario())
+
+    def test_v2c_trap(self):
+        event = self._send(CommunityData('public'), 'trap', LINK_DOWN,
+                           (f'{OID_ifOperStatus}.3', Integer32(2)))
+        self.assertEqual((event['type'], event['ifindex'], event['source']),
+                         ('link_down', '3', '127.0.0.1'))
+
+    def test_v3_inform_short_password(self):
+        key = _master_key('private')
+        auth = UsmUserData('admin', authKey=key, privKey=key,
+                           authKeyType=config.USM_KEY_TYPE_MASTER,
+                           privKeyType=config.USM_KEY_TYPE_MASTER)
+        event = self._send(auth, 'inform', MRP_TRAP, (RING_OPER, Integer32(2)))
+        self.assertEqual((event['type'], event['ring_state']), ('mrp', 'closed'))
+
+    def test_busy_port_raises(self):
+        async def scenario():
+            async with TrapReceiver(host='127.0.0.1', port=0) as receiver:
+                await TrapReceiver(host='127.0.0.1', port=receiver.port).start()
+        with self.assertRaisesRegex(OSError, 'Cannot listen for traps'):
+            asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()